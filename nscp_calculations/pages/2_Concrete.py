@@ -1,13 +1,13 @@
 import streamlit as st
-from src.concrete import rc_anchorage, rc_beam, rc_beamcolumnjoint, rc_column, rc_footing, rc_onewayslab, rc_pilecap, rc_twowayslab, rc_walls
+from src.concrete import rc_anchorage, rc_beam, rc_beamcolumnjoint, rc_column, rc_footing, rc_onewayslab, rc_pilecap, rc_twowayslab, rc_walls, rc_bbs
 
 # Page Configuration
 st.set_page_config(layout="wide")
 
 st.title("Structural Concrete")
 
-tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = st.tabs(
-    ["RC Anchorage", "RC Beam", "RC Beam Column Joint", "RC Column", "RC Footing", "RC One Way SLab", "RC Pile Cap", "RC Two Way SLab", "RC Walls"]
+tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10 = st.tabs(
+    ["RC Anchorage", "RC Beam", "RC Beam Column Joint", "RC Column", "RC Footing", "RC One Way SLab", "RC Pile Cap", "RC Two Way SLab", "RC Walls", "Bar Bending Schedule"]
     )
 
 with tab1:
@@ -35,4 +35,8 @@ with tab8:
     rc_twowayslab.display()
     
 with tab9:
-    rc_walls.display()
\ No newline at end of file
+    rc_walls.display()
+
+# BBS runs last so it sees the bar marks registered by the tabs above
+with tab10:
+    rc_bbs.display()
\ No newline at end of file
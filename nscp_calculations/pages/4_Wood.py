@@ -1,12 +1,12 @@
 import streamlit as st
-from src.wood import wood_beam, wood_column, wood_flooring
+from src.wood import span_tables, wood_beam, wood_column, wood_flooring, wood_stability
 
 # Page Configuration
 st.set_page_config(layout="wide")
 
 st.title("Wood")
 
-tab1, tab2, tab3 = st.tabs(["Wood Beam", "Wood Post", "Wood Flooring"])
+tab1, tab2, tab3, tab4, tab5 = st.tabs(["Wood Beam", "Wood Post", "Wood Flooring", "Span Tables", "Stability & Schedules"])
 
 with tab1:
     wood_beam.display()
@@ -15,4 +15,10 @@ with tab2:
     wood_column.display()
     
 with tab3:
-    wood_flooring.display()
\ No newline at end of file
+    wood_flooring.display()
+
+with tab4:
+    span_tables.display()
+
+with tab5:
+    wood_stability.display()
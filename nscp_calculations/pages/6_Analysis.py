@@ -0,0 +1,15 @@
+import streamlit as st
+from src.analysis import frame_2d, truss_3d
+
+# Page Configuration
+st.set_page_config(layout="wide")
+
+st.title("Structural Analysis")
+
+tab1, tab2 = st.tabs(["2-D Frame", "3-D Truss"])
+
+with tab1:
+    frame_2d.display()
+
+with tab2:
+    truss_3d.display()
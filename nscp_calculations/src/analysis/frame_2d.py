@@ -0,0 +1,157 @@
+import streamlit as st
+import pandas as pd
+from src.calculations.analysis.frame_2d import DIRECTIONS, LOAD_TYPES, SUPPORTS, analyse_frame, member_envelope
+from src.calculations.analysis.second_order import analyse_second_order
+from src.components.frame_forces import register_frame_forces
+
+def display():
+    st.header("📐 2-D Frame Analysis (direct stiffness)")
+
+    st.markdown(r"""
+    Linear elastic plane frame of beams, columns and braces with moment releases, nodal loads and member
+    UDL / point loads. The global stiffness \( K \) is assembled sparse after reverse Cuthill–McKee renumbering,
+    factorized once and every load case is solved by back-substitution; combinations superpose the cases.
+    Member forces are passed on to the **RC Beam, RC Column, SS Beam** and **SS Column** tabs.
+    """)
+
+    c0, c01, c02 = st.columns(3)
+    with c0:
+        E = st.number_input("Default elastic modulus E (MPa)", min_value=1000.0, value=200000.0, step=1000.0, key="frame_E")
+    with c01:
+        second_order = st.checkbox("Second-order analysis (P-Δ)", value=False, key="frame_second_order",
+                                   help="Iterates K + K_G(P) per combination; reports amplified forces and B1 / B2.")
+    with c02:
+        stiffness_factor = st.number_input("Stiffness factor on EA, EI (0.8 for direct analysis)", min_value=0.1, max_value=1.0,
+                                           value=1.0, step=0.05, key="frame_stiffness_factor", disabled=not second_order)
+
+    # ----------------------------
+    # Model
+    # ----------------------------
+    st.markdown("### Nodes & Members")
+    c1, c2 = st.columns(2)
+    with c1:
+        nodes = st.data_editor(
+            pd.DataFrame({
+                "Node": ["N1", "N2", "N3", "N4", "N5", "N6"],
+                "X (m)": [0.0, 0.0, 0.0, 6.0, 6.0, 6.0],
+                "Y (m)": [0.0, 3.5, 7.0, 0.0, 3.5, 7.0],
+                "Support": ["Fixed", "Free", "Free", "Fixed", "Free", "Free"],
+            }),
+            num_rows="dynamic", key="frame_nodes", use_container_width=True,
+            column_config={"Support": st.column_config.SelectboxColumn(options=list(SUPPORTS))},
+        ).dropna(subset=["Node", "X (m)", "Y (m)"])
+    with c2:
+        members = st.data_editor(
+            pd.DataFrame({
+                "Member": ["C1", "C2", "C3", "C4", "B1", "B2"],
+                "Start": ["N1", "N2", "N4", "N5", "N2", "N3"],
+                "End": ["N2", "N3", "N5", "N6", "N5", "N6"],
+                "Section": ["W250x49", "W250x49", "W250x49", "W250x49", "W310x60", "W310x60"],
+                "Release start": [False] * 6,
+                "Release end": [False] * 6,
+            }),
+            num_rows="dynamic", key="frame_members", use_container_width=True,
+        ).dropna(subset=["Member", "Start", "End"])
+        st.caption("Non-catalogue members (e.g. concrete) need extra columns \"A (mm²)\" and \"I (mm⁴)\"; \"E (MPa)\" overrides E.")
+
+    # ----------------------------
+    # Loads & combinations
+    # ----------------------------
+    st.markdown("### Load cases")
+    c3, c4 = st.columns(2)
+    with c3:
+        nodal_loads = st.data_editor(
+            pd.DataFrame({
+                "Case": ["W", "W"],
+                "Node": ["N2", "N3"],
+                "Fx (kN)": [20.0, 10.0],
+                "Fy (kN)": [0.0, 0.0],
+                "Mz (kN·m)": [0.0, 0.0],
+            }),
+            num_rows="dynamic", key="frame_nodal_loads", use_container_width=True,
+        ).dropna(subset=["Case", "Node"])
+    with c4:
+        member_loads = st.data_editor(
+            pd.DataFrame({
+                "Case": ["D", "D", "L", "L"],
+                "Member": ["B1", "B2", "B1", "B2"],
+                "Type": ["UDL", "UDL", "UDL", "Point"],
+                "Direction": ["Global Y"] * 4,
+                "w or P": [-18.0, -12.0, -9.0, -30.0],
+                "a (m)": [0.0, 0.0, 0.0, 3.0],
+            }),
+            num_rows="dynamic", key="frame_member_loads", use_container_width=True,
+            column_config={
+                "Type": st.column_config.SelectboxColumn(options=list(LOAD_TYPES)),
+                "Direction": st.column_config.SelectboxColumn(options=list(DIRECTIONS)),
+            },
+        ).dropna(subset=["Case", "Member", "w or P"])
+    st.caption("Loads in kN, kN/m and kN·m; Fy and Global Y loads positive upward, moments counter-clockwise.")
+
+    st.markdown("### Load combinations (factor per case)")
+    combo_table = st.data_editor(
+        pd.DataFrame({
+            "Combo": ["1.4D", "1.2D+1.6L", "1.2D+1.0W+L", "0.9D+1.0W"],
+            "D": [1.4, 1.2, 1.2, 0.9],
+            "L": [0.0, 1.6, 1.0, 0.0],
+            "W": [0.0, 0.0, 1.0, 1.0],
+        }),
+        num_rows="dynamic", key="frame_combos", use_container_width=True,
+    ).dropna(subset=["Combo"])
+    combos = {str(row["Combo"]): {c: float(v) for c, v in row.drop("Combo").items() if pd.notna(v)}
+              for _, row in combo_table.iterrows()}
+
+    # ----------------------------
+    # Analysis
+    # ----------------------------
+    if len(nodes) == 0 or len(members) == 0:
+        st.info("Define nodes and members to run the analysis.")
+        return
+    try:
+        if second_order:
+            res = analyse_second_order(nodes, members, nodal_loads, member_loads, combos or None, E, stiffness_factor)
+        else:
+            res = analyse_frame(nodes, members, nodal_loads, member_loads, combos or None, E)
+    except (KeyError, ValueError) as exc:
+        st.error(str(exc.args[0]))
+        return
+
+    design = res["design"].merge(members[["Member", "Section"]].astype(str), on="Member", how="left") \
+        if "Section" in members else res["design"]
+    design = design.dropna(subset=["Mu (kN·m)"])  # combinations without second-order equilibrium
+    register_frame_forces(design)
+
+    before, after = res["bandwidth"]
+    st.success(f"✅ Solved {len(nodes)} nodes, {len(members)} members and {len(combos) or 'all'} combinations "
+               f"(stiffness half-bandwidth {before} → {after} after renumbering).")
+
+    if second_order:
+        st.markdown("### 🔁 Second-order analysis")
+        st.dataframe(res["status"], use_container_width=True)
+        unstable = ~res["status"]["Status"].str.startswith("Converged")
+        if unstable.any():
+            st.error(f"No second-order equilibrium for: {', '.join(res['status']['Combo'][unstable])} — their forces are left blank.")
+        st.markdown(r"""
+        Storey amplification (AISC 360 Appendix 8): \( B_2 = 1/(1 - ΣP_{story}/P_{e,story}) \),
+        \( P_{e,story} = R_M H L/Δ_H \), next to the drift ratio of the analysis itself.
+        The analysis is P-Δ only: members are single elements, so member curvature (P-δ) is not in these moments
+        and is covered by \( B_1 = C_m/(1 - P_r/P_{e1}) \) in the column checks.
+        """)
+        st.dataframe(res["storeys"].round(3), use_container_width=True)
+        st.dataframe(design[["Member", "Combo", "Pu (kN)", "Mu 1st (kN·m)", "Mu (kN·m)", "Amplification", "Cm", "B1", "B2"]].round(3),
+                     use_container_width=True)
+
+    st.markdown("### 🧾 Member envelope (sent to the design tabs)")
+    st.dataframe(member_envelope(design).round(2), use_container_width=True)
+
+    with st.expander("Member design forces — every combination"):
+        st.dataframe(design.round(3), use_container_width=True)
+    with st.expander("Member end forces (local axes)"):
+        st.dataframe(res["end_forces"].round(3), use_container_width=True)
+    with st.expander("Support reactions"):
+        st.dataframe(res["reactions"].round(3), use_container_width=True)
+    with st.expander("Nodal displacements"):
+        st.dataframe(res["displacements"].round(4), use_container_width=True)
+
+    st.markdown("---")
+    st.caption("Sign convention: member local x from Start to End, sagging moments positive, axial compression positive in the design forces.")
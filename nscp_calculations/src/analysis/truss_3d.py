@@ -0,0 +1,176 @@
+import streamlit as st
+import pandas as pd
+from src.calculations.analysis.truss_3d import (SELF_WEIGHT, TRUSS_SUPPORTS, analyse_truss, auto_groups, check_members,
+                                                design_forces, design_groups, double_layer_grid)
+from src.components.frame_forces import register_frame_forces
+from src.components.section_picker import section_picker
+
+def display():
+    st.header("🔺 3-D Space / Roof Truss Analysis")
+
+    st.markdown(r"""
+    Pin-jointed truss with three translations per node: \( k = \frac{EA}{L}\begin{bmatrix} nn^T & -nn^T \\ -nn^T & nn^T \end{bmatrix} \)
+    assembled sparse, factorized once and solved for every load case (nodal loads, self-weight, support settlements).
+    A model lying in one plane (e.g. a roof truss in X–Z) is restrained out of its plane.
+    Member forces are checked in batch for tension (yielding / fracture) and compression (flexural buckling, \( K = 1 \)),
+    the lightest section is selected per member group, and the envelope is passed to the **SS Tension** and **SS Column** tabs.
+    """)
+
+    c0, c01, c02 = st.columns(3)
+    with c0:
+        E = st.number_input("Elastic modulus E (MPa)", min_value=1000.0, value=200000.0, step=1000.0, key="truss_E")
+    with c01:
+        self_weight = st.checkbox(f"Add member self-weight as case \"{SELF_WEIGHT}\"", value=True, key="truss_self_weight")
+    with c02:
+        source = st.radio("Model", ["Table", "Double-layer grid generator"], horizontal=True, key="truss_source")
+
+    # ----------------------------
+    # Model
+    # ----------------------------
+    if source == "Table":
+        st.markdown("### Nodes & Members (Z up)")
+        c1, c2 = st.columns(2)
+        with c1:
+            nodes = st.data_editor(
+                pd.DataFrame({
+                    "Node": ["B0", "B1", "B2", "B3", "B4", "B5", "B6", "T1", "T2", "T3", "T4", "T5"],
+                    "X (m)": [0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 2.0, 4.0, 6.0, 8.0, 10.0],
+                    "Y (m)": [0.0] * 12,
+                    "Z (m)": [0.0] * 7 + [0.667, 1.333, 2.0, 1.333, 0.667],
+                    "Support": ["Pinned"] + ["Free"] * 5 + ["Slide X"] + ["Free"] * 5,
+                }),
+                num_rows="dynamic", key="truss_nodes", use_container_width=True,
+                column_config={"Support": st.column_config.SelectboxColumn(options=list(TRUSS_SUPPORTS))},
+            ).dropna(subset=["Node", "X (m)", "Y (m)", "Z (m)"])
+        with c2:
+            top = ["B0", "T1", "T2", "T3", "T4", "T5", "B6"]
+            bottom = ["B0", "B1", "B2", "B3", "B4", "B5", "B6"]
+            starts = top[:-1] + bottom[:-1] + ["B1", "B2", "B3", "B4", "B5", "T1", "T2", "T4", "T5"]
+            ends = top[1:] + bottom[1:] + ["T1", "T2", "T3", "T4", "T5", "B2", "B3", "B3", "B4"]
+            members = st.data_editor(
+                pd.DataFrame({
+                    "Member": [f"TR{k + 1}" for k in range(len(starts))],
+                    "Start": starts,
+                    "End": ends,
+                    "Section": ["HSS100x100x4.5"] * 6 + ["HSS75x75x4.5"] * 6 + ["L65x65x6"] * 9,
+                    "Group": ["Top chord"] * 6 + ["Bottom chord"] * 6 + ["Web"] * 9,
+                }),
+                num_rows="dynamic", key="truss_members", use_container_width=True,
+            ).dropna(subset=["Member", "Start", "End"])
+            st.caption("Non-catalogue members need an extra \"A (mm²)\" column; \"E (MPa)\" overrides E. Blank groups are assigned automatically.")
+
+        st.markdown("### Load cases")
+        c3, c4 = st.columns(2)
+        with c3:
+            nodal_loads = st.data_editor(
+                pd.DataFrame({
+                    "Case": ["D"] * 5 + ["L"] * 5 + ["W"] * 5,
+                    "Node": ["T1", "T2", "T3", "T4", "T5"] * 3,
+                    "Fx (kN)": [0.0] * 15,
+                    "Fy (kN)": [0.0] * 15,
+                    "Fz (kN)": [-4.0] * 5 + [-3.0] * 5 + [5.0] * 5,
+                }),
+                num_rows="dynamic", key="truss_nodal_loads", use_container_width=True,
+            ).dropna(subset=["Case", "Node"])
+            st.caption("Purlin reactions on the top-chord panel points (kN, Z up).")
+        with c4:
+            settlements = st.data_editor(
+                pd.DataFrame({
+                    "Case": pd.Series(dtype=str), "Node": pd.Series(dtype=str),
+                    "dx (mm)": pd.Series(dtype=float), "dy (mm)": pd.Series(dtype=float), "dz (mm)": pd.Series(dtype=float),
+                }),
+                num_rows="dynamic", key="truss_settlements", use_container_width=True,
+            ).dropna(subset=["Case", "Node"])
+            st.caption("Support settlements (only on restrained directions); reference the case in the combinations.")
+    else:
+        st.markdown("### Square-on-square double-layer grid")
+        g1, g2, g3 = st.columns(3)
+        with g1:
+            Lx = st.number_input("Span Lx (m)", min_value=1.0, value=30.0, step=1.0, key="truss_grid_Lx")
+            Ly = st.number_input("Span Ly (m)", min_value=1.0, value=30.0, step=1.0, key="truss_grid_Ly")
+            depth = st.number_input("Grid depth (m)", min_value=0.1, value=1.5, step=0.1, key="truss_grid_depth")
+        with g2:
+            nx = st.number_input("Modules along X", min_value=2, max_value=60, value=12, step=1, key="truss_grid_nx")
+            ny = st.number_input("Modules along Y", min_value=2, max_value=60, value=12, step=1, key="truss_grid_ny")
+            q_dead = st.number_input("Roof dead load (kPa)", min_value=0.0, value=0.5, step=0.1, key="truss_grid_qD")
+            q_live = st.number_input("Roof live load (kPa)", min_value=0.0, value=0.75, step=0.05, key="truss_grid_qL")
+        with g3:
+            top, _ = section_picker("Top chords", "truss_grid_top", ["HSS", "L"], default="HSS100x100x4.5")
+            bottom, _ = section_picker("Bottom chords", "truss_grid_bottom", ["HSS", "L"], default="HSS75x75x4.5")
+            web, _ = section_picker("Diagonals", "truss_grid_web", ["HSS", "L"], default="L65x65x6")
+        nodes, members, nodal_loads = double_layer_grid(Lx, Ly, int(nx), int(ny), depth, top, bottom, web,
+                                                        {"D": q_dead, "L": q_live})
+        settlements = None
+        st.caption(f"{len(nodes):,} nodes and {len(members):,} members; the top perimeter nodes are pinned.")
+
+    st.markdown("### Load combinations (factor per case)")
+    combo_table = st.data_editor(
+        pd.DataFrame({
+            "Combo": ["1.4D", "1.2D+1.6L", "0.9D+1.0W"],
+            "D": [1.4, 1.2, 0.9],
+            "L": [0.0, 1.6, 0.0],
+            "W": [0.0, 0.0, 1.0],
+            SELF_WEIGHT: [1.4, 1.2, 0.9],
+        }),
+        num_rows="dynamic", key="truss_combos", use_container_width=True,
+    ).dropna(subset=["Combo"])
+    combos = {str(row["Combo"]): {c: float(v) for c, v in row.drop("Combo").items() if pd.notna(v)}
+              for _, row in combo_table.iterrows()}
+
+    st.markdown("### Member design")
+    d1, d2, d3 = st.columns(3)
+    with d1:
+        Fy = st.number_input("Fy (MPa)", min_value=200.0, value=345.0, step=5.0, key="truss_Fy")
+        Fu = st.number_input("Fu (MPa)", min_value=300.0, value=450.0, step=5.0, key="truss_Fu")
+    with d2:
+        U = st.number_input("Effective net area ratio Ae/Ag (shear lag × holes)", min_value=0.3, max_value=1.0,
+                            value=0.85, step=0.05, key="truss_U")
+        kinds = st.multiselect("Section types for group design", ["L", "HSS", "C", "W"], default=["L", "HSS"], key="truss_kinds")
+    with d3:
+        grouping = st.radio("Member groups", ["Group column (blanks automatic)", "Automatic force bands"], key="truss_grouping")
+        band_ratio = st.number_input("Force ratio within an automatic group", min_value=1.2, value=2.0, step=0.1, key="truss_band")
+
+    # ----------------------------
+    # Analysis
+    # ----------------------------
+    if len(nodes) == 0 or len(members) == 0:
+        st.info("Define nodes and members to run the analysis.")
+        return
+    try:
+        res = analyse_truss(nodes, members, nodal_loads, settlements, combos or None, E, self_weight)
+    except (KeyError, ValueError) as exc:
+        st.error(str(exc.args[0]))
+        return
+
+    envelope = res["envelope"]
+    if grouping == "Automatic force bands":
+        envelope = envelope.drop(columns="Group")
+    envelope["Group"] = auto_groups(envelope, band_ratio)
+    checks = check_members(envelope, Fy, Fu, U, E=E)
+    register_frame_forces(design_forces(envelope), source="3-D truss")
+
+    stats = res["stats"]
+    st.success(f"✅ Solved {len(nodes):,} nodes, {len(members):,} members and {len(combos) or 'all'} combinations — "
+               f"{stats['dofs']:,} free dofs, {stats['nnz']:,} stiffness non-zeros, truss mass {stats['mass'] / 1000.0:,.2f} t.")
+    failed = checks["Status"] != "OK"
+    if failed.any():
+        st.error(f"{int(failed.sum())} member(s) fail in their current section — see the group design below.")
+
+    st.markdown("### 🧾 Member checks (current sections)")
+    st.dataframe(checks, use_container_width=True)
+
+    st.markdown("### 🏷️ Lightest section per group")
+    if kinds:
+        st.dataframe(design_groups(envelope, envelope["Group"], Fy, Fu, U, kinds=tuple(kinds), E=E), use_container_width=True)
+    else:
+        st.info("Select at least one section type.")
+
+    with st.expander("Member axial forces — every combination (tension +)"):
+        st.dataframe(res["forces"].round(3), use_container_width=True)
+    with st.expander("Support reactions"):
+        st.dataframe(res["reactions"].round(3), use_container_width=True)
+    with st.expander("Nodal displacements"):
+        st.dataframe(res["displacements"].round(3), use_container_width=True)
+
+    st.markdown("---")
+    st.caption("Members are assumed concentric and pin-ended (K = 1); check connection eccentricity and purlin bending of the top chord separately.")
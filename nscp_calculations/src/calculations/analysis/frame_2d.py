@@ -0,0 +1,398 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+from scipy.sparse.linalg import splu
+from src.calculations.steel.sections import load_catalogue, name_index
+
+SUPPORTS = {  # restrained (ux, uy, rz)
+    "Free": (False, False, False),
+    "Fixed": (True, True, True),
+    "Pinned": (True, True, False),
+    "Roller": (False, True, False),
+    "Roller X": (True, False, False),
+}
+LOAD_TYPES = ("UDL", "Point")
+DIRECTIONS = ("Global Y", "Local y")
+STATIONS = 21  # points per member for the internal force diagrams
+
+
+# ----------------------------
+# Member properties and matrices (kN, m)
+# ----------------------------
+def member_properties(members: pd.DataFrame, E: float = 200000.0) -> tuple:
+    """
+    A (m²), I (m⁴), E (kN/m²) per member. Catalogue sections give A and Ix; other members
+    (e.g. concrete) need "A (mm²)" and "I (mm⁴)" columns. Optional "E (MPa)" overrides E.
+    """
+    index = name_index()
+    catalogue = load_catalogue()
+    names = members["Section"].astype(str) if "Section" in members else pd.Series([""] * len(members))
+    A = members["A (mm²)"].to_numpy(float) if "A (mm²)" in members else np.full(len(members), np.nan)
+    I = members["I (mm⁴)"].to_numpy(float) if "I (mm⁴)" in members else np.full(len(members), np.nan)
+    in_cat = names.isin(list(index)).to_numpy()
+    rows = [index[n] for n in names[in_cat]]
+    A = np.where(in_cat, 0.0, A)
+    I = np.where(in_cat, 0.0, I)
+    A[in_cat] = catalogue["A"][rows]
+    I[in_cat] = catalogue["Ix"][rows]
+    bad = ~(np.isfinite(A) & np.isfinite(I) & (A > 0.0) & (I > 0.0))
+    if bad.any():
+        raise KeyError(f"Members without a catalogue section or A / I: {', '.join(members['Member'].astype(str)[bad])}")
+    Em = members["E (MPa)"].to_numpy(float) if "E (MPa)" in members else np.full(len(members), E)
+    return A * 1e-6, I * 1e-12, Em * 1e3
+
+
+def local_stiffness(E, A, I, L) -> np.ndarray:
+    """Local 6×6 stiffness matrices (m, 6, 6) of plane frame members, dofs (u, v, θ) at each end."""
+    E, A, I, L = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (E, A, I, L)))
+    a, b, c, d, e = E * A / L, 12.0 * E * I / L ** 3, 6.0 * E * I / L ** 2, 4.0 * E * I / L, 2.0 * E * I / L
+    k = np.zeros(L.shape + (6, 6))
+    k[..., 0, 0] = k[..., 3, 3] = a
+    k[..., 0, 3] = k[..., 3, 0] = -a
+    k[..., 1, 1] = k[..., 4, 4] = b
+    k[..., 1, 4] = k[..., 4, 1] = -b
+    k[..., 1, 2] = k[..., 2, 1] = k[..., 1, 5] = k[..., 5, 1] = c
+    k[..., 2, 4] = k[..., 4, 2] = k[..., 4, 5] = k[..., 5, 4] = -c
+    k[..., 2, 2] = k[..., 5, 5] = d
+    k[..., 2, 5] = k[..., 5, 2] = e
+    return k
+
+
+def rotation(c, s) -> np.ndarray:
+    """Global → local transformation matrices (m, 6, 6)."""
+    c, s = np.broadcast_arrays(np.asarray(c, dtype=float), np.asarray(s, dtype=float))
+    T = np.zeros(c.shape + (6, 6))
+    for o in (0, 3):
+        T[..., o, o] = T[..., o + 1, o + 1] = c
+        T[..., o, o + 1] = s
+        T[..., o + 1, o] = -s
+        T[..., o + 2, o + 2] = 1.0
+    return T
+
+
+def fixed_end_forces(L, wx, wy, Px, Py, a) -> np.ndarray:
+    """
+    Local fixed-end forces (…, 6) on the member for full-length UDL (wx, wy kN/m) and a point load
+    (Px, Py kN) at a (m) from the start, loads positive along local +x / +y.
+    """
+    L, wx, wy, Px, Py, a = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (L, wx, wy, Px, Py, a)))
+    b = L - a
+    q = np.zeros(L.shape + (6,))
+    q[..., 0] = -wx * L / 2.0 - Px * b / L
+    q[..., 3] = -wx * L / 2.0 - Px * a / L
+    q[..., 1] = -wy * L / 2.0 - Py * b ** 2 * (3.0 * a + b) / L ** 3
+    q[..., 4] = -wy * L / 2.0 - Py * a ** 2 * (a + 3.0 * b) / L ** 3
+    q[..., 2] = -wy * L ** 2 / 12.0 - Py * a * b ** 2 / L ** 2
+    q[..., 5] = wy * L ** 2 / 12.0 + Py * a ** 2 * b / L ** 2
+    return q
+
+
+def condense(k: np.ndarray, q: np.ndarray, released) -> tuple:
+    """
+    Static condensation of released end rotations (local dofs 2 and / or 5) out of one member's
+    stiffness k (6, 6) and fixed-end forces q (6, n_cases); released rows and columns become zero.
+    """
+    r = [i for i, flag in zip((2, 5), released) if flag]
+    if not r:
+        return k, q
+    c = [i for i in range(6) if i not in r]
+    krr_inv = np.linalg.inv(k[np.ix_(r, r)])
+    kc, qc = np.zeros_like(k), np.zeros_like(q)
+    kc[np.ix_(c, c)] = k[np.ix_(c, c)] - k[np.ix_(c, r)] @ krr_inv @ k[np.ix_(r, c)]
+    qc[c] = q[c] - k[np.ix_(c, r)] @ krr_inv @ q[r]
+    return kc, qc
+
+
+def half_bandwidth(i_node, j_node) -> int:
+    """Half-bandwidth of the assembled stiffness for 3 dofs per node numbered node by node."""
+    return int(3 * np.abs(np.asarray(i_node) - np.asarray(j_node)).max(initial=0) + 2)
+
+
+# ----------------------------
+# Model assembly
+# ----------------------------
+def assembly_map(dofs, free, perm=None) -> dict:
+    """
+    Scatter pattern of the member 6×6 matrices into the free-dof CSC stiffness, computed once per model
+    and reused for every matrix with the same sparsity (linear K, tangent K + Kg of each iteration).
+    perm[i] is the position of free dof i in the assembled matrix (e.g. a fill-reducing ordering).
+    """
+    index = np.full(dofs.max() + 1, -1)
+    index[free] = np.arange(free.size) if perm is None else np.asarray(perm)
+    rows = index[np.repeat(dofs, 6, axis=1).ravel()]
+    cols = index[np.tile(dofs, (1, 6)).ravel()]
+    keep = (rows >= 0) & (cols >= 0)
+    key = cols[keep] * free.size + rows[keep]                    # column-major position
+    unique, slot = np.unique(key, return_inverse=True)
+    col = unique // free.size
+    return {"keep": keep, "slot": slot, "indices": unique % free.size,
+            "indptr": np.searchsorted(col, np.arange(free.size + 1)), "n": free.size, "index": index}
+
+
+def assemble(pattern: dict, kg: np.ndarray):
+    """Free-dof CSC matrix of the global member matrices kg (m, 6, 6) on a precomputed pattern."""
+    data = np.bincount(pattern["slot"], kg.reshape(-1)[pattern["keep"]], minlength=pattern["indices"].size)
+    return sp.csc_matrix((data, pattern["indices"], pattern["indptr"]), shape=(pattern["n"], pattern["n"]))
+
+
+def build_model(nodes: pd.DataFrame, members: pd.DataFrame, nodal_loads: pd.DataFrame = None,
+                member_loads: pd.DataFrame = None, combos: dict = None, E: float = 200000.0) -> dict:
+    """
+    Numbered plane frame model: geometry, renumbered dofs (reverse Cuthill–McKee), local stiffness and
+    fixed-end forces before release condensation, nodal load vectors per case and restrained dofs.
+    Input tables as for analyse_frame.
+    """
+    nodal_loads = nodal_loads if nodal_loads is not None else pd.DataFrame(columns=["Case", "Node"])
+    member_loads = member_loads if member_loads is not None else pd.DataFrame(columns=["Case", "Member"])
+    node_ids = nodes["Node"].astype(str).to_numpy()
+    node_of = {n: i for i, n in enumerate(node_ids)}
+    member_ids = members["Member"].astype(str).to_numpy()
+    member_of = {m: i for i, m in enumerate(member_ids)}
+    for label, refs, known in (("Members", pd.concat([members["Start"], members["End"]]), node_of),
+                               ("Nodal loads", nodal_loads["Node"], node_of),
+                               ("Member loads", member_loads["Member"], member_of)):
+        missing = sorted(set(refs.astype(str)) - set(known))
+        if missing:
+            raise KeyError(f"{label} reference unknown nodes / members: {', '.join(missing)}")
+
+    cases = list(dict.fromkeys(list(nodal_loads["Case"].astype(str)) + list(member_loads["Case"].astype(str))))
+    if not cases:
+        raise ValueError("No loads given.")
+    case_of = {c: i for i, c in enumerate(cases)}
+    combos = combos or {c: {c: 1.0} for c in cases}
+    n_nodes, n_members, n_cases = len(node_ids), len(member_ids), len(cases)
+
+    # geometry
+    xy = nodes[["X (m)", "Y (m)"]].to_numpy(float)
+    i_node = np.array([node_of[n] for n in members["Start"].astype(str)])
+    j_node = np.array([node_of[n] for n in members["End"].astype(str)])
+    dx, dy = (xy[j_node] - xy[i_node]).T
+    L = np.hypot(dx, dy)
+    if np.any(L <= 0.0):
+        raise ValueError(f"Zero-length members: {', '.join(member_ids[L <= 0.0])}")
+    c, s = dx / L, dy / L
+
+    # bandwidth-reducing renumbering of the nodes
+    graph = sp.coo_matrix((np.ones(n_members), (i_node, j_node)), shape=(n_nodes, n_nodes))
+    order = reverse_cuthill_mckee((graph + graph.T).tocsr(), symmetric_mode=True)
+    new_of = np.empty(n_nodes, dtype=int)
+    new_of[order] = np.arange(n_nodes)
+    if half_bandwidth(new_of[i_node], new_of[j_node]) > half_bandwidth(i_node, j_node):
+        new_of = np.arange(n_nodes)  # the input numbering is already tighter
+    dofs = np.column_stack([3 * new_of[i_node] + k for k in range(3)] + [3 * new_of[j_node] + k for k in range(3)])
+
+    # member loads resolved on the member axes, fixed-end forces per case (local)
+    load = member_load_arrays(member_loads, member_of, case_of, L, c, s)
+    q = np.zeros((n_members, 6, n_cases))
+    if load["member"].size:
+        point = load["point"]
+        qe = fixed_end_forces(L[load["member"]], np.where(point, 0.0, load["wx"]), np.where(point, 0.0, load["wy"]),
+                              np.where(point, load["wx"], 0.0), np.where(point, load["wy"], 0.0), load["a"])
+        np.add.at(q, (load["member"], slice(None), load["case"]), qe)
+
+    A, I, Em = member_properties(members, E)
+    rel_i = members["Release start"].fillna(False).astype(bool).to_numpy() if "Release start" in members else np.zeros(n_members, bool)
+    rel_j = members["Release end"].fillna(False).astype(bool).to_numpy() if "Release end" in members else np.zeros(n_members, bool)
+
+    n_dof = 3 * n_nodes
+    F = np.zeros((n_dof, n_cases))
+    if len(nodal_loads):
+        n = new_of[[node_of[x] for x in nodal_loads["Node"].astype(str)]]
+        cc = np.array([case_of[x] for x in nodal_loads["Case"].astype(str)])
+        for k_dof, col in enumerate(("Fx (kN)", "Fy (kN)", "Mz (kN·m)")):
+            if col in nodal_loads:
+                np.add.at(F, (3 * n + k_dof, cc), nodal_loads[col].fillna(0.0).to_numpy(float))
+
+    # supports; rotations left without stiffness (all members hinged there) are fixed as well
+    support = nodes["Support"].fillna("Free").replace("", "Free") if "Support" in nodes else pd.Series(["Free"] * n_nodes)
+    unknown = sorted(set(support) - set(SUPPORTS))
+    if unknown:
+        raise KeyError(f"Unknown support types: {', '.join(unknown)}")
+    fixed = np.zeros(n_dof, bool)
+    fixed[(3 * new_of[:, None] + np.arange(3)).ravel()] = np.array([SUPPORTS[t] for t in support]).ravel()
+    rigid = np.zeros(n_dof, bool)
+    rigid[dofs[:, 2][~rel_i]] = True
+    rigid[dofs[:, 5][~rel_j]] = True
+    fixed[2::3] |= ~rigid[2::3]
+
+    return {
+        "node_ids": node_ids, "member_ids": member_ids, "support": support.to_numpy(), "xy": xy,
+        "i_node": i_node, "j_node": j_node, "new_of": new_of, "dofs": dofs, "L": L, "c": c, "s": s,
+        "A": A, "I": I, "E": Em, "k": local_stiffness(Em, A, I, L), "T": rotation(c, s), "q": q, "load": load,
+        "rel_i": rel_i, "rel_j": rel_j, "F": F, "fixed": fixed, "free": np.flatnonzero(~fixed),
+        "cases": cases, "combos": list(combos),
+        "factors": np.array([[combos[cb].get(case, 0.0) for cb in combos] for case in cases]),  # (cases, combos)
+    }
+
+
+def condensed_members(model: dict, k: np.ndarray, q: np.ndarray) -> tuple:
+    """Release condensation of local stiffness k (m, 6, 6) / fixed-end forces q (m, 6, n) for hinged members."""
+    k, q = k.copy(), q.copy()
+    rel_i, rel_j = model["rel_i"], model["rel_j"]
+    for idx in np.flatnonzero(rel_i | rel_j):
+        k[idx], q[idx] = condense(k[idx], q[idx], (rel_i[idx], rel_j[idx]))
+    return k, q
+
+
+def factorize(K):
+    """SuperLU factorization of the free-dof stiffness; a singular matrix means a mechanism."""
+    try:
+        return splu(K)
+    except RuntimeError as exc:
+        raise ValueError("The frame is unstable (singular stiffness matrix) — check supports and releases.") from exc
+
+
+def collect(model: dict, U, f) -> dict:
+    """
+    Result tables for displacements U (n_dof, combos) and local member end forces f (m, 6, combos):
+    reactions are the member end forces gathered at the restrained dofs minus the nodal loads there.
+    """
+    names, node_ids, member_ids = model["combos"], model["node_ids"], model["member_ids"]
+    n_comb, n_nodes, n_members = len(names), len(node_ids), len(member_ids)
+    node_dofs = 3 * model["new_of"][:, None] + np.arange(3)
+    R = np.zeros_like(U)
+    np.add.at(R, model["dofs"], np.einsum("mji,mjc->mic", model["T"], f))
+    R -= model["F"] @ model["factors"]
+    disp, reac = U[node_dofs], R[node_dofs]            # (nodes, 3, combos)
+    restrained = model["fixed"][node_dofs]
+    supported = np.flatnonzero(model["support"] != "Free")
+    return {
+        "displacements": pd.DataFrame({
+            "Node": np.repeat(node_ids, n_comb), "Combo": np.tile(names, n_nodes),
+            "ux (mm)": disp[:, 0].ravel() * 1e3, "uy (mm)": disp[:, 1].ravel() * 1e3, "rz (rad)": disp[:, 2].ravel(),
+        }),
+        "reactions": pd.DataFrame({
+            "Node": np.repeat(node_ids[supported], n_comb), "Combo": np.tile(names, supported.size),
+            **{col: np.where(restrained[supported, k_dof, None], reac[supported, k_dof], 0.0).ravel()
+               for k_dof, col in enumerate(("Rx (kN)", "Ry (kN)", "Mz (kN·m)"))},
+        }),
+        "end_forces": pd.DataFrame({
+            "Member": np.repeat(member_ids, n_comb), "Combo": np.tile(names, n_members),
+            **{col: f[:, k_dof].ravel() for k_dof, col in enumerate(("Ni (kN)", "Vi (kN)", "Mi (kN·m)", "Nj (kN)", "Vj (kN)", "Mj (kN·m)"))},
+        }),
+        "design": design_forces(member_ids, model["L"], model["load"], f, names, model["factors"]),
+        "bandwidth": (half_bandwidth(model["i_node"], model["j_node"]),
+                      half_bandwidth(model["new_of"][model["i_node"]], model["new_of"][model["j_node"]])),
+    }
+
+
+# ----------------------------
+# Linear solver
+# ----------------------------
+def analyse_frame(nodes: pd.DataFrame, members: pd.DataFrame, nodal_loads: pd.DataFrame = None,
+                  member_loads: pd.DataFrame = None, combos: dict = None, E: float = 200000.0) -> dict:
+    """
+    Linear elastic direct-stiffness analysis of a plane frame for every load case at once.
+
+    nodes: "Node", "X (m)", "Y (m)", optional "Support" (SUPPORTS).
+    members: "Member", "Start", "End", "Section" (catalogue) or "A (mm²)" / "I (mm⁴)",
+    optional "E (MPa)", "Release start" / "Release end" (moment hinges).
+    nodal_loads: "Case", "Node", "Fx (kN)", "Fy (kN)", "Mz (kN·m)" (global, ccw moment positive).
+    member_loads: "Case", "Member", "Type" (UDL / Point), "Direction" (Global Y / Local y),
+    "w or P" (kN/m or kN, + up / + local y) and "a (m)" for point loads.
+    combos: {combination: {case: factor}}; by default every load case is its own combination.
+
+    Nodes are renumbered by reverse Cuthill–McKee, K is assembled into scipy.sparse, factorized once
+    (SuperLU) and all cases are solved by back-substitution. Combinations superpose the case results.
+    """
+    model = build_model(nodes, members, nodal_loads, member_loads, combos, E)
+    k, q = condensed_members(model, model["k"], model["q"])
+    T, dofs, free = model["T"], model["dofs"], model["free"]
+    K = assemble(assembly_map(dofs, free), np.einsum("mji,mjk,mkl->mil", T, k, T))
+
+    # load vectors: nodal loads minus the global fixed-end forces
+    F = model["F"].copy()
+    np.add.at(F, dofs, -np.einsum("mji,mjc->mic", T, q))
+    U = np.zeros_like(F)
+    U[free] = factorize(K).solve(F[free])
+    if not np.all(np.isfinite(U)):
+        raise ValueError("The frame is unstable (singular stiffness matrix) — check supports and releases.")
+
+    # member end forces (local), superposed into the combinations
+    f = np.einsum("mij,mjk,mkc->mic", k, T, U[dofs]) + q
+    factors = model["factors"]
+    return collect(model, U @ factors, f @ factors)
+
+
+# ----------------------------
+# Internal forces for member design
+# ----------------------------
+def member_load_arrays(member_loads: pd.DataFrame, member_of: dict, case_of: dict, L, c, s) -> dict:
+    """Member loads as arrays: member / case index, local components wx, wy, point-load flag and position a."""
+    n = len(member_loads)
+    if n == 0:
+        return {k: np.zeros(0, dtype=int if k in ("member", "case") else bool if k == "point" else float)
+                for k in ("member", "case", "wx", "wy", "point", "a")}
+    m = np.array([member_of[x] for x in member_loads["Member"].astype(str)])
+    w = member_loads["w or P"].to_numpy(float)
+    point = (member_loads["Type"] == "Point").to_numpy() if "Type" in member_loads else np.zeros(n, bool)
+    local = (member_loads["Direction"] == "Local y").to_numpy() if "Direction" in member_loads else np.zeros(n, bool)
+    a = member_loads["a (m)"].fillna(0.0).to_numpy(float) if "a (m)" in member_loads else np.zeros(n)
+    a = np.where(point, a, 0.0)
+    if np.any(point & ((a < 0.0) | (a > L[m]))):
+        raise ValueError("Point loads must lie on their member (0 ≤ a ≤ L).")
+    return {
+        "member": m,
+        "case": np.array([case_of[x] for x in member_loads["Case"].astype(str)]),
+        "wx": np.where(local, 0.0, w * s[m]),   # global Y load resolved on the member axes
+        "wy": np.where(local, w, w * c[m]),
+        "point": point,
+        "a": a,
+    }
+
+
+def design_forces(member_ids, L, load: dict, f_c, names, factors) -> pd.DataFrame:
+    """
+    Per member and combination: axial force (compression positive), largest |V| and |M| along the
+    member, and the end moments M1 (smaller) / M2 (larger) with M1/M2 > 0 in reverse curvature (AISC).
+    Internal forces are sampled at STATIONS points plus every point-load position (sagging positive).
+    """
+    n_members, n_comb = len(member_ids), len(names)
+    m, pt = load["member"], load["point"]
+    # stations: uniform points plus the point-load positions of each member (padded with L)
+    extra = np.full((n_members, max(int(np.bincount(m[pt], minlength=n_members).max(initial=0)), 0)), 1.0)
+    for idx in np.flatnonzero(pt):
+        row = extra[m[idx]]
+        row[np.argmax(row == 1.0)] = load["a"][idx] / L[m[idx]]
+    x = np.concatenate([np.broadcast_to(np.linspace(0.0, 1.0, STATIONS), (n_members, STATIONS)), extra], axis=1) * L[:, None]
+
+    Ni, Vi, Mi, Mj = f_c[:, 0], f_c[:, 1], f_c[:, 2], f_c[:, 5]  # (members, combos)
+    V = np.repeat(Vi[:, None, :], x.shape[1], axis=1)
+    M = Vi[:, None, :] * x[..., None] - Mi[:, None, :]
+    P = np.repeat(Ni[:, None, :], x.shape[1], axis=1)
+    fac = factors[load["case"]]                                              # (loads, combos)
+    xm = x[m]                                                                # (loads, stations)
+    reach = np.where(pt[:, None], (xm >= load["a"][:, None]).astype(float), xm)   # point: step, UDL: length
+    lever = np.where(pt[:, None], np.clip(xm - load["a"][:, None], 0.0, None), xm ** 2 / 2.0)
+    np.add.at(V, m, load["wy"][:, None, None] * reach[..., None] * fac[:, None, :])
+    np.add.at(M, m, load["wy"][:, None, None] * lever[..., None] * fac[:, None, :])
+    np.add.at(P, m, load["wx"][:, None, None] * reach[..., None] * fac[:, None, :])
+
+    mi, mj = -Mi, Mj                                   # internal (sagging positive) end moments
+    big = np.abs(mi) >= np.abs(mj)
+    M2 = np.where(big, mi, mj)
+    M1 = np.where(big, mj, mi)
+    ratio = np.divide(-M1, M2, out=np.zeros_like(M1), where=np.abs(M2) > 1e-9)
+    return pd.DataFrame({
+        "Member": np.repeat(np.asarray(member_ids), n_comb),
+        "Combo": np.tile(names, n_members),
+        "L (mm)": np.repeat(L * 1e3, n_comb),
+        "Pu (kN)": P.max(axis=1).clip(min=0.0).ravel(),
+        "Tu (kN)": (-P.min(axis=1)).clip(min=0.0).ravel(),
+        "Vu (kN)": np.abs(V).max(axis=1).ravel(),
+        "Mu (kN·m)": np.abs(M).max(axis=1).ravel(),
+        "M1 (kN·m)": np.abs(M1).ravel(),
+        "M2 (kN·m)": np.abs(M2).ravel(),
+        "M1/M2": ratio.ravel(),
+    })
+
+
+def member_envelope(design: pd.DataFrame) -> pd.DataFrame:
+    """Largest Pu, Tu, Vu and Mu of every member over all combinations, with the governing combinations."""
+    g = design.groupby("Member", sort=False)
+    out = g[["L (mm)", "Pu (kN)", "Tu (kN)", "Vu (kN)", "Mu (kN·m)"]].max()
+    out["Combo (P)"] = design.loc[g["Pu (kN)"].idxmax(), "Combo"].to_numpy()
+    out["Combo (M)"] = design.loc[g["Mu (kN·m)"].idxmax(), "Combo"].to_numpy()
+    out["M1/M2"] = design.loc[g["Mu (kN·m)"].idxmax(), "M1/M2"].to_numpy()
+    return out.reset_index()
@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+from scipy.sparse.linalg import splu
+from src.calculations.analysis.frame_2d import assemble, assembly_map, build_model, collect, condensed_members, factorize
+
+RM = 0.85            # AISC A-8-8: moment-frame columns present in the storey (0.85 is the lower bound)
+VERTICAL = 0.7       # |sin| of members treated as storey columns
+TOL = 1e-6
+MAX_ITER = 30
+
+
+def geometric_stiffness(P, L) -> np.ndarray:
+    """
+    Consistent local geometric stiffness (m, 6, 6) of beam-column members with axial force P
+    (kN, tension positive), cubic displacement field. With one element per member this is a P-Δ
+    analysis: the sway stiffness is right, but moments between the member ends are not amplified
+    (P-δ is left to B1 in the member checks).
+    """
+    P, L = np.broadcast_arrays(np.asarray(P, dtype=float), np.asarray(L, dtype=float))
+    g = np.zeros(L.shape + (6, 6))
+    base = np.array([[36.0, 3.0, -36.0, 3.0], [3.0, 4.0, -3.0, -1.0], [-36.0, -3.0, 36.0, -3.0], [3.0, -1.0, -3.0, 4.0]])
+    powers = np.array([[0, 1, 0, 1], [1, 2, 1, 2], [0, 1, 0, 1], [1, 2, 1, 2]])
+    idx = np.array([1, 2, 4, 5])
+    g[..., idx[:, None], idx[None, :]] = (P / (30.0 * L))[..., None, None] * base * L[..., None, None] ** powers
+    return g
+
+
+def _tension(f) -> np.ndarray:
+    """Mean member axial force (kN, tension positive) from local end forces (m, 6)."""
+    return (f[:, 3] - f[:, 0]) / 2.0
+
+
+# ----------------------------
+# Iterative P-Δ solver
+# ----------------------------
+def analyse_second_order(nodes: pd.DataFrame, members: pd.DataFrame, nodal_loads: pd.DataFrame = None,
+                         member_loads: pd.DataFrame = None, combos: dict = None, E: float = 200000.0,
+                         stiffness_factor: float = 1.0, tol: float = TOL, max_iter: int = MAX_ITER) -> dict:
+    """
+    Second-order (P-Δ) elastic analysis of every load combination: K_T = K + K_G(P) iterated on the member
+    axial forces until the displacements converge (tables as for analyse_frame). Members are not
+    subdivided, so P-δ is not in the moments; the design table carries B1 for it.
+
+    The fill-reducing column ordering of the first-order factorization and the CSC assembly pattern
+    are computed once and reused for every iteration of every combination (only numeric refactorization).
+    stiffness_factor scales EA and EI (0.8 for the AISC direct analysis method).
+    Returns the analyse_frame tables (second-order forces) plus "first_order" tables, "storeys"
+    (B2 per storey and combination) and "status" per combination. The design table gains
+    "Mu 1st (kN·m)", "Amplification", "Pe1 (kN)", "Cm", "B1" and "B2".
+    """
+    model = build_model(nodes, members, nodal_loads, member_loads, combos, E)
+    k0 = model["k"] * stiffness_factor
+    T, dofs, free, L = model["T"], model["dofs"], model["free"], model["L"]
+    factors = model["factors"]
+    q_combo = model["q"] @ factors                     # (m, 6, combos)
+    F_combo = model["F"] @ factors                     # (n_dof, combos)
+
+    # first order, fixing the ordering for the whole run
+    k1, q1 = condensed_members(model, k0, q_combo)
+    K1 = assemble(assembly_map(dofs, free), np.einsum("mji,mjk,mkl->mil", T, k1, T))
+    order = factorize(K1).perm_c
+    pattern = assembly_map(dofs, free, perm=order)
+    pos = pattern["index"][free]                      # position of each free dof in the ordered matrix
+
+    def solve(kt, qt, F_cb):
+        """Factor the ordered tangent matrix (natural order, no row pivoting) and solve one combination."""
+        kc, qc = condensed_members(model, kt, qt[..., None])
+        Kt = assemble(pattern, np.einsum("mji,mjk,mkl->mil", T, kc, T))
+        F = F_cb.copy()
+        np.add.at(F, dofs, -np.einsum("mji,mj->mi", T, qc[..., 0]))
+        lu = splu(Kt, permc_spec="NATURAL", diag_pivot_thresh=0.0, options={"SymmetricMode": True})
+        U = np.zeros_like(F)
+        U[free] = lu.solve(F[free][np.argsort(pos)])[pos]
+        stable = bool(np.all(lu.U.diagonal() > 0.0))   # positive pivots ⇔ K_T positive definite
+        return U, np.einsum("mij,mjk,mk->mi", kc, T, U[dofs]) + qc[..., 0], stable
+
+    n_comb = factors.shape[1]
+    U1, f1 = np.zeros_like(F_combo), np.zeros_like(q_combo)
+    U2, f2 = np.full_like(F_combo, np.nan), np.full_like(q_combo, np.nan)
+    status = []
+    for cb in range(n_comb):
+        F_cb = F_combo[:, cb]
+        U1[:, cb], f1[..., cb], _ = solve(k0, q_combo[..., cb], F_cb)
+        U, f = U1[:, cb], f1[..., cb]
+        state = f"Not converged in {max_iter} iterations"
+        for it in range(1, max_iter + 1):
+            U_new, f_new, stable = solve(k0 + geometric_stiffness(_tension(f), L), q_combo[..., cb], F_cb)
+            if not stable:
+                state = "Unstable (P exceeds the elastic critical load)"
+                break
+            change = np.abs(U_new - U).max() / max(np.abs(U_new).max(), 1e-12)
+            U, f = U_new, f_new
+            if change <= tol:
+                state = f"Converged ({it} iterations)"
+                U2[:, cb], f2[..., cb] = U, f
+                break
+        status.append(state)
+
+    first = collect(model, U1, f1)
+    res = collect(model, np.nan_to_num(U2), np.nan_to_num(f2))
+    ok = np.array([s.startswith("Converged") for s in status])
+    storeys, member_b2 = storey_amplification(model, U1, f1, U2, ok)
+    res["design"] = amplification(model, res["design"], first["design"], member_b2, stiffness_factor)
+    res["design"].loc[np.tile(~ok, len(model["member_ids"])), res["design"].columns[2:]] = np.nan
+    res["first_order"] = first
+    res["storeys"] = storeys
+    res["status"] = pd.DataFrame({"Combo": model["combos"], "Status": status})
+    return res
+
+
+# ----------------------------
+# Amplification factors (AISC 360 Appendix 8)
+# ----------------------------
+def storey_amplification(model: dict, U1, f1, U2, ok) -> tuple:
+    """
+    Storeys from the near-vertical members grouped by their top level. Per storey and combination:
+    ΣP (first-order column compression), storey shear H and drift ΔH, Pe,story = RM·H·L/ΔH,
+    B2 = 1/(1 − ΣP/Pe,story) ≥ 1 and the analysis drift ratio Δ2nd/Δ1st. Also B2 per member × combo.
+    """
+    xy, i_node, j_node, s = model["xy"], model["i_node"], model["j_node"], model["s"]
+    n_members, n_comb = len(model["member_ids"]), len(model["combos"])
+    column = np.abs(s) >= VERTICAL
+    flip = s < 0.0                                   # bottom / top node of every column
+    bot = np.where(flip, j_node, i_node)
+    top = np.where(flip, i_node, j_node)
+    level_top = np.round(xy[top, 1], 3)
+    ux = lambda U, nodes: U[3 * model["new_of"][nodes]]          # (k, combos)
+    Fx = np.einsum("mji,mjc->mic", model["T"], f1)               # global end forces
+    shear_bottom = np.where(flip[:, None], Fx[:, 3], Fx[:, 0])   # x force on the member at its bottom end
+    P1 = (f1[:, 0] - f1[:, 3]) / 2.0
+
+    rows, member_b2 = [], np.ones((n_members, n_comb))
+    for level in np.unique(level_top[column]):
+        cols = np.flatnonzero(column & (level_top == level))
+        height = float(np.mean(xy[top[cols], 1] - xy[bot[cols], 1]))
+        drift1 = (ux(U1, top[cols]) - ux(U1, bot[cols])).mean(axis=0)
+        drift2 = (ux(U2, top[cols]) - ux(U2, bot[cols])).mean(axis=0)
+        H = np.abs(shear_bottom[cols].sum(axis=0))
+        P = P1[cols].sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            Pe = np.where(np.abs(drift1) > 1e-9, RM * H * height / np.abs(drift1), np.inf)
+            B2 = np.where(P < Pe, 1.0 / (1.0 - P / Pe), np.inf)
+            ratio = np.where(ok & (np.abs(drift1) > 1e-9), drift2 / drift1, np.nan)
+        B2 = np.maximum(B2, 1.0)
+        member_b2[cols] = B2
+        rows.append(pd.DataFrame({
+            "Storey top Y (m)": level, "Combo": model["combos"], "Columns": len(cols), "h (m)": height,
+            "ΣP (kN)": P, "H (kN)": H, "ΔH 1st (mm)": drift1 * 1e3, "Pe,story (kN)": Pe, "B2": B2,
+            "Δ2nd/Δ1st": ratio,
+        }))
+    storeys = pd.concat(rows, ignore_index=True) if rows else pd.DataFrame()
+    return storeys, member_b2
+
+
+def amplification(model: dict, design: pd.DataFrame, first: pd.DataFrame, member_b2, stiffness_factor: float = 1.0) -> pd.DataFrame:
+    """
+    Second-order design forces with the first-order moment, the analysis amplification Mu2/Mu1 and the
+    AISC factors: B1 = Cm/(1 − Pr/Pe1) ≥ 1 with Pe1 = π²EI/L² (K1 = 1; Cm = 1 for members with span loads)
+    and the storey B2 of each column (1.0 for beams and braces).
+    """
+    n_comb = len(model["combos"])
+    Pe1 = np.pi ** 2 * stiffness_factor * model["E"] * model["I"] / model["L"] ** 2
+    loaded = np.zeros(len(model["member_ids"]), bool)
+    loaded[model["load"]["member"]] = True
+    out = design.copy()
+    Pr = out["Pu (kN)"].to_numpy(float)
+    Cm = np.where(np.repeat(loaded, n_comb), 1.0, 0.6 - 0.4 * out["M1/M2"].to_numpy(float))
+    pe = np.repeat(Pe1, n_comb)
+    out["Mu 1st (kN·m)"] = first["Mu (kN·m)"].to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out["Amplification"] = np.where(first["Mu (kN·m)"] > 1e-9, out["Mu (kN·m)"] / first["Mu (kN·m)"], 1.0)
+        out["B1"] = np.where(Pr < pe, np.maximum(Cm / (1.0 - Pr / pe), 1.0), np.inf)
+    out["Pe1 (kN)"] = pe
+    out["Cm"] = Cm
+    out["B2"] = member_b2.ravel()
+    return out
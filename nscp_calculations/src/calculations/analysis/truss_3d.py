@@ -0,0 +1,386 @@
+import numpy as np
+import pandas as pd
+from scipy.sparse.linalg import splu
+from src.calculations.analysis.frame_2d import assemble, assembly_map
+from src.calculations.steel.compression import design_compression, minor_radius
+from src.calculations.steel.sections import STEEL_DENSITY, load_catalogue, name_index
+
+TRUSS_SUPPORTS = {  # restrained (ux, uy, uz)
+    "Free": (False, False, False),
+    "Pinned": (True, True, True),
+    "Roller Z": (False, False, True),
+    "Slide X": (False, True, True),
+    "Slide Y": (True, False, True),
+}
+GRAVITY = 9.81e-3          # kN per kg
+SELF_WEIGHT = "SW"         # load case added for the member self-weight (−Z)
+PHI_T_YIELD = 0.90
+PHI_T_RUPTURE = 0.75
+KL_R_COMPRESSION = 200.0   # AISC E2 recommendation
+L_R_TENSION = 300.0        # AISC D1 recommendation
+ZERO_FORCE = 0.01          # members below this share of the largest force form the zero-force group
+PIVOT_TOL = 1e-10
+
+
+# ----------------------------
+# Model generators
+# ----------------------------
+def double_layer_grid(Lx: float, Ly: float, nx: int, ny: int, depth: float, top: str, bottom: str, web: str,
+                      pressures: dict = None) -> tuple:
+    """
+    Square-on-square offset double-layer grid (m): nx × ny top squares, one bottom node under the centre of
+    each square joined to its four corners, bottom chords between neighbouring bottom nodes. The top
+    perimeter is pinned. pressures {case: kPa, downward} become nodal loads on the top nodes by tributary area.
+    Returns (nodes, members, nodal_loads) tables for analyse_truss.
+    """
+    ax, ay = Lx / nx, Ly / ny
+    ti, tj = np.meshgrid(np.arange(nx + 1), np.arange(ny + 1), indexing="ij")
+    bi, bj = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+    top_id = lambda i, j: i * (ny + 1) + j
+    bot_id = lambda i, j: (nx + 1) * (ny + 1) + i * ny + j
+    edge = (ti == 0) | (ti == nx) | (tj == 0) | (tj == ny)
+    names = np.array([f"T{i}-{j}" for i, j in zip(ti.ravel(), tj.ravel())] + [f"B{i}-{j}" for i, j in zip(bi.ravel(), bj.ravel())])
+    nodes = pd.DataFrame({
+        "Node": names,
+        "X (m)": np.concatenate([ti.ravel() * ax, (bi.ravel() + 0.5) * ax]),
+        "Y (m)": np.concatenate([tj.ravel() * ay, (bj.ravel() + 0.5) * ay]),
+        "Z (m)": np.concatenate([np.full(ti.size, depth), np.zeros(bi.size)]),
+        "Support": np.concatenate([np.where(edge.ravel(), "Pinned", "Free"), np.full(bi.size, "Free")]),
+    })
+
+    pairs, groups, sections = [], [], []
+    def add(start, end, group, section):
+        pairs.append(np.column_stack([start.ravel(), end.ravel()]))
+        groups.append(np.full(start.size, group))
+        sections.append(np.full(start.size, section))
+    add(top_id(ti[:-1], tj[:-1]), top_id(ti[1:], tj[1:]), "Top chord", top)            # along X
+    add(top_id(ti[:, :-1], tj[:, :-1]), top_id(ti[:, 1:], tj[:, 1:]), "Top chord", top)  # along Y
+    add(bot_id(bi[:-1], bj[:-1]), bot_id(bi[1:], bj[1:]), "Bottom chord", bottom)
+    add(bot_id(bi[:, :-1], bj[:, :-1]), bot_id(bi[:, 1:], bj[:, 1:]), "Bottom chord", bottom)
+    for di, dj in ((0, 0), (1, 0), (0, 1), (1, 1)):
+        add(bot_id(bi, bj), top_id(bi + di, bj + dj), "Diagonal", web)
+    ends = np.concatenate(pairs)
+    members = pd.DataFrame({
+        "Member": [f"M{k + 1}" for k in range(len(ends))],
+        "Start": names[ends[:, 0]],
+        "End": names[ends[:, 1]],
+        "Section": np.concatenate(sections),
+        "Group": np.concatenate(groups),
+    })
+
+    # tributary area of the top nodes: (ax or ax/2) × (ay or ay/2)
+    trib = (np.where((ti == 0) | (ti == nx), 0.5, 1.0) * np.where((tj == 0) | (tj == ny), 0.5, 1.0)).ravel() * ax * ay
+    loads = [pd.DataFrame({"Case": case, "Node": names[:ti.size], "Fx (kN)": 0.0, "Fy (kN)": 0.0, "Fz (kN)": -q * trib})
+             for case, q in (pressures or {}).items()]
+    nodal_loads = pd.concat(loads, ignore_index=True) if loads else pd.DataFrame(columns=["Case", "Node", "Fx (kN)", "Fy (kN)", "Fz (kN)"])
+    return nodes, members, nodal_loads
+
+
+# ----------------------------
+# Linear solver
+# ----------------------------
+def member_areas(members: pd.DataFrame) -> np.ndarray:
+    """Areas (mm²) from the catalogue "Section", else from an "A (mm²)" column."""
+    index = name_index()
+    catalogue = load_catalogue()
+    names = members["Section"].astype(str) if "Section" in members else pd.Series([""] * len(members))
+    A = members["A (mm²)"].to_numpy(float) if "A (mm²)" in members else np.full(len(members), np.nan)
+    in_cat = names.isin(list(index)).to_numpy()
+    A = np.where(in_cat, 0.0, A)
+    A[in_cat] = catalogue["A"][[index[n] for n in names[in_cat]]]
+    bad = ~(np.isfinite(A) & (A > 0.0))
+    if bad.any():
+        raise KeyError(f"Members without a catalogue section or A: {', '.join(members['Member'].astype(str)[bad])}")
+    return A
+
+
+def member_unit_masses(members: pd.DataFrame, A) -> np.ndarray:
+    """Mass per metre (kg/m): the catalogue mass of catalogue sections, A·ρ for areas given directly."""
+    index = name_index()
+    names = members["Section"].astype(str) if "Section" in members else pd.Series([""] * len(members))
+    in_cat = names.isin(list(index)).to_numpy()
+    unit = np.asarray(A, dtype=float) * 1e-6 * STEEL_DENSITY
+    unit[in_cat] = load_catalogue()["mass"][[index[n] for n in names[in_cat]]]
+    return unit
+
+
+def analyse_truss(nodes: pd.DataFrame, members: pd.DataFrame, nodal_loads: pd.DataFrame = None,
+                  settlements: pd.DataFrame = None, combos: dict = None, E: float = 200000.0,
+                  self_weight: bool = False) -> dict:
+    """
+    Linear elastic pin-jointed space truss, every load case solved on one sparse factorization.
+
+    nodes: "Node", "X (m)", "Y (m)", "Z (m)", optional "Support" (TRUSS_SUPPORTS).
+    members: "Member", "Start", "End", "Section" (catalogue) or "A (mm²)", optional "E (MPa)" and "Group".
+    nodal_loads: "Case", "Node", "Fx (kN)", "Fy (kN)", "Fz (kN)" (global, Z up).
+    settlements: "Case", "Node", "dx (mm)", "dy (mm)", "dz (mm)" imposed on restrained directions.
+    combos: {combination: {case: factor}}; by default every case is its own combination.
+    self_weight adds the case SELF_WEIGHT (catalogue mass or A·ρ, half to each end node); given combos
+    must then factor it in at least one combination (ValueError otherwise).
+
+    A model lying in one coordinate plane is restrained out of that plane. The member 6×6 matrices
+    are scattered with the frame CSC assembly pattern; K_ff is factorized once (SuperLU), imposed
+    settlements enter as −K_fr·u_r. A zero pivot reports the node of the mechanism.
+    """
+    nodal_loads = nodal_loads if nodal_loads is not None else pd.DataFrame(columns=["Case", "Node"])
+    settlements = settlements if settlements is not None else pd.DataFrame(columns=["Case", "Node"])
+    node_ids = nodes["Node"].astype(str).to_numpy()
+    node_of = {n: i for i, n in enumerate(node_ids)}
+    member_ids = members["Member"].astype(str).to_numpy()
+    for label, refs in (("Members", pd.concat([members["Start"], members["End"]])), ("Nodal loads", nodal_loads["Node"]),
+                        ("Settlements", settlements["Node"])):
+        missing = sorted(set(refs.astype(str)) - set(node_of))
+        if missing:
+            raise KeyError(f"{label} reference unknown nodes: {', '.join(missing)}")
+
+    cases = list(dict.fromkeys(list(nodal_loads["Case"].astype(str)) + list(settlements["Case"].astype(str))
+                               + ([SELF_WEIGHT] if self_weight else [])))
+    if not cases:
+        raise ValueError("No loads given.")
+    case_of = {c: i for i, c in enumerate(cases)}
+    if combos and self_weight and not any(combo.get(SELF_WEIGHT, 0.0) for combo in combos.values()):
+        raise ValueError(f"Self-weight is on but no combination includes the case \"{SELF_WEIGHT}\".")
+    combos = combos or {c: {c: 1.0} for c in cases}
+    n_nodes, n_members, n_cases = len(node_ids), len(member_ids), len(cases)
+    n_dof = 3 * n_nodes
+
+    # geometry and axial stiffness
+    xyz = nodes[["X (m)", "Y (m)", "Z (m)"]].to_numpy(float)
+    i_node = np.array([node_of[n] for n in members["Start"].astype(str)], dtype=int)
+    j_node = np.array([node_of[n] for n in members["End"].astype(str)], dtype=int)
+    d = xyz[j_node] - xyz[i_node]
+    L = np.linalg.norm(d, axis=1)
+    if np.any(L <= 0.0):
+        raise ValueError(f"Zero-length members: {', '.join(member_ids[L <= 0.0])}")
+    n = d / L[:, None]
+    A = member_areas(members)
+    Em = members["E (MPa)"].fillna(E).to_numpy(float) if "E (MPa)" in members else np.full(n_members, E)
+    EA_L = Em * 1e3 * A * 1e-6 / L                                        # kN/m
+    nn = np.einsum("mi,mj->mij", n, n)
+    kg = (EA_L[:, None, None, None, None] * np.array([[1.0, -1.0], [-1.0, 1.0]])[None, :, None, :, None]
+          * nn[:, None, :, None, :]).reshape(n_members, 6, 6)
+    dofs = np.column_stack([3 * i_node + k for k in range(3)] + [3 * j_node + k for k in range(3)])
+
+    # supports (plus out-of-plane restraint of planar models) and imposed displacements
+    support = nodes["Support"].fillna("Free").replace("", "Free") if "Support" in nodes else pd.Series(["Free"] * n_nodes)
+    unknown = sorted(set(support) - set(TRUSS_SUPPORTS))
+    if unknown:
+        raise KeyError(f"Unknown support types: {', '.join(unknown)}")
+    fixed = np.array([TRUSS_SUPPORTS[t] for t in support], dtype=bool).reshape(n_nodes, 3)
+    planar = np.ptp(xyz, axis=0) < 1e-9
+    fixed[:, planar] = True
+    fixed = fixed.ravel()
+    free = np.flatnonzero(~fixed)
+
+    U = np.zeros((n_dof, n_cases))
+    if len(settlements):
+        nd = np.array([node_of[x] for x in settlements["Node"].astype(str)], dtype=int)
+        cc = np.array([case_of[x] for x in settlements["Case"].astype(str)], dtype=int)
+        for k, col in enumerate(("dx (mm)", "dy (mm)", "dz (mm)")):
+            if col in settlements:
+                value = settlements[col].fillna(0.0).to_numpy(float) / 1e3
+                if np.any((value != 0.0) & ~fixed[3 * nd + k]):
+                    raise ValueError(f"Settlement {col[:2]} given on an unrestrained direction.")
+                U[3 * nd + k, cc] = value
+
+    F = np.zeros((n_dof, n_cases))
+    if len(nodal_loads):
+        nd = np.array([node_of[x] for x in nodal_loads["Node"].astype(str)], dtype=int)
+        cc = np.array([case_of[x] for x in nodal_loads["Case"].astype(str)], dtype=int)
+        for k, col in enumerate(("Fx (kN)", "Fy (kN)", "Fz (kN)")):
+            if col in nodal_loads:
+                np.add.at(F, (3 * nd + k, cc), nodal_loads[col].fillna(0.0).to_numpy(float))
+    mass = member_unit_masses(members, A) * L                              # kg per member
+    if self_weight:
+        np.add.at(F, (3 * i_node + 2, case_of[SELF_WEIGHT]), -mass * GRAVITY / 2.0)
+        np.add.at(F, (3 * j_node + 2, case_of[SELF_WEIGHT]), -mass * GRAVITY / 2.0)
+
+    # solve K_ff u_f = F_f − K_fr u_r for all cases
+    K = assemble(assembly_map(dofs, np.arange(n_dof)), kg)
+    K_ff = K[free][:, free]
+    rhs = F[free] - (K[free] @ U if np.any(U) else 0.0)
+    try:
+        lu = splu(K_ff.tocsc())
+    except RuntimeError as exc:
+        raise ValueError("The truss is a mechanism (singular stiffness matrix) — check supports and bracing.") from exc
+    pivots = np.abs(lu.U.diagonal())
+    weak = pivots < PIVOT_TOL * pivots.max(initial=1.0)
+    if weak.any():
+        # L·U = K_ff[argsort(perm_r)][:, argsort(perm_c)]: pivot j belongs to free dof argsort(perm_c)[j]
+        node = node_ids[free[np.argsort(lu.perm_c)[np.flatnonzero(weak)[0]]] // 3]
+        raise ValueError(f"The truss is a mechanism at node {node} — check supports and bracing.")
+    U[free] = lu.solve(rhs)
+
+    # axial forces (tension positive) and reactions, superposed into the combinations
+    factors = np.array([[combos[cb].get(case, 0.0) for cb in combos] for case in cases])
+    N = EA_L[:, None] * np.einsum("mi,mic->mc", n, U[3 * j_node[:, None] + np.arange(3)] - U[3 * i_node[:, None] + np.arange(3)])
+    Uc, Nc, Fc = U @ factors, N @ factors, F @ factors
+    R = -Fc
+    np.add.at(R, dofs[:, :3], -n[..., None] * Nc[:, None, :])
+    np.add.at(R, dofs[:, 3:], n[..., None] * Nc[:, None, :])
+
+    names = list(combos)
+    n_comb = len(names)
+    disp = Uc.reshape(n_nodes, 3, n_comb)
+    reac = R.reshape(n_nodes, 3, n_comb)
+    restrained = fixed.reshape(n_nodes, 3)
+    supported = np.flatnonzero(restrained.any(axis=1) & (support.to_numpy() != "Free"))
+    groups = members["Group"].fillna("").astype(str).to_numpy() if "Group" in members else np.full(n_members, "")
+    sections = members["Section"].fillna("").astype(str).to_numpy() if "Section" in members else np.full(n_members, "")
+    forces = pd.DataFrame({
+        "Member": np.repeat(member_ids, n_comb), "Combo": np.tile(names, n_members), "N (kN)": Nc.ravel(),
+    })
+    return {
+        "displacements": pd.DataFrame({
+            "Node": np.repeat(node_ids, n_comb), "Combo": np.tile(names, n_nodes),
+            **{col: disp[:, k].ravel() * 1e3 for k, col in enumerate(("ux (mm)", "uy (mm)", "uz (mm)"))},
+        }),
+        "reactions": pd.DataFrame({
+            "Node": np.repeat(node_ids[supported], n_comb), "Combo": np.tile(names, supported.size),
+            **{col: np.where(restrained[supported, k, None], reac[supported, k], 0.0).ravel()
+               for k, col in enumerate(("Rx (kN)", "Ry (kN)", "Rz (kN)"))},
+        }),
+        "forces": forces,
+        "envelope": truss_envelope(member_ids, sections, groups, L, A, mass, Nc, names),
+        "stats": {"dofs": free.size, "nnz": K_ff.nnz, "fill": lu.L.nnz + lu.U.nnz, "mass": mass.sum()},
+    }
+
+
+def truss_envelope(member_ids, sections, groups, L, A, mass, Nc, names) -> pd.DataFrame:
+    """Largest compression Pu and tension Tu (kN) of every member with their combinations."""
+    names = np.asarray(names)
+    ic, it = Nc.argmin(axis=1), Nc.argmax(axis=1)
+    rows = np.arange(len(member_ids))
+    return pd.DataFrame({
+        "Member": member_ids, "Section": sections, "Group": groups, "L (mm)": L * 1e3, "A (mm²)": A, "Mass (kg)": mass,
+        "Pu (kN)": (-Nc[rows, ic]).clip(min=0.0), "Combo (C)": names[ic],
+        "Tu (kN)": Nc[rows, it].clip(min=0.0), "Combo (T)": names[it],
+    })
+
+
+# ----------------------------
+# Member grouping and batch design
+# ----------------------------
+def auto_groups(envelope: pd.DataFrame, band_ratio: float = 2.0, max_bands: int = 4) -> np.ndarray:
+    """
+    Group names from the force envelope: tension- or compression-governed members binned in geometric
+    force bands (largest force / band_ratio^k, at most max_bands per sign), near-zero members apart.
+    Members with a given "Group" keep it.
+    """
+    Pu = envelope["Pu (kN)"].to_numpy(float)
+    Tu = envelope["Tu (kN)"].to_numpy(float)
+    compression = Pu >= Tu
+    force = np.maximum(Pu, Tu)
+    out = np.full(len(envelope), "Zero-force", dtype=object)
+    for mask, prefix in ((compression, "C"), (~compression, "T")):
+        top = force[mask].max(initial=0.0)
+        if top <= 0.0:
+            continue
+        with np.errstate(divide="ignore"):
+            band = np.floor(np.log(top / force[mask]) / np.log(band_ratio)).clip(0, max_bands - 1)
+        label = np.array([f"{prefix}{int(b) + 1}" for b in band], dtype=object)
+        out[mask] = np.where(force[mask] >= ZERO_FORCE * force.max(), label, "Zero-force")
+    given = envelope["Group"].fillna("").astype(str).to_numpy() if "Group" in envelope else np.full(len(envelope), "")
+    return np.where(given != "", given, out).astype(str)
+
+
+def member_strengths(sec, rows, L, Fy: float, Fu: float, U: float = 0.85, K: float = 1.0, E: float = 200000.0) -> dict:
+    """
+    Design strengths (kN) of catalogue rows against members of length L (mm), arrays broadcast
+    (members × sections): φPn from the capacity table at K·L about the least radius, tension
+    min(0.90FyAg, 0.75FuAe) with Ae = U·Ag, and the slenderness KL/r.
+    """
+    r = minor_radius(sec)
+    KL = np.broadcast_to(K * np.asarray(L, dtype=float), np.broadcast_shapes(np.shape(L), np.shape(rows)))
+    A = np.asarray(sec["A"], dtype=float)
+    return {
+        "compression": design_compression(rows, KL, Fy, E),
+        "tension": np.minimum(PHI_T_YIELD * Fy * A, PHI_T_RUPTURE * Fu * U * A) / 1000.0,
+        "KL/r": KL / r,
+    }
+
+
+def _ratio(Pu, Tu, caps):
+    """Governing demand / capacity and the slenderness check of each member × section."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.maximum(Pu / caps["compression"], Tu / caps["tension"])
+    slender = np.where(Pu > 0.0, caps["KL/r"] <= KL_R_COMPRESSION, caps["KL/r"] <= L_R_TENSION)
+    return ratio, slender
+
+
+def check_members(envelope: pd.DataFrame, Fy: float = 345.0, Fu: float = 450.0, U: float = 0.85, K: float = 1.0,
+                  E: float = 200000.0) -> pd.DataFrame:
+    """Tension / compression checks of every member in its own catalogue section, in one vectorized pass."""
+    index = name_index()
+    catalogue = load_catalogue()
+    in_cat = envelope["Section"].isin(list(index)).to_numpy()
+    rows = np.array([index.get(s, 0) for s in envelope["Section"]], dtype=int)
+    sec = catalogue[rows]
+    Pu = envelope["Pu (kN)"].to_numpy(float)
+    Tu = envelope["Tu (kN)"].to_numpy(float)
+    caps = member_strengths(sec, rows, envelope["L (mm)"].to_numpy(float), Fy, Fu, U, K, E)
+    ratio, slender = _ratio(Pu, Tu, caps)
+    out = envelope.copy()
+    out["KL/r"] = caps["KL/r"]
+    out["φPn (kN)"] = caps["compression"]
+    out["φTn (kN)"] = caps["tension"]
+    out["Ratio"] = ratio
+    out["Status"] = np.where(~in_cat, "Not in catalogue",
+                             np.where(~slender, "Too slender", np.where(ratio <= 1.0, "OK", "FAIL")))
+    out.loc[~in_cat, ["KL/r", "φPn (kN)", "φTn (kN)", "Ratio"]] = np.nan
+    return out.round(3)
+
+
+def design_groups(envelope: pd.DataFrame, groups, Fy: float = 345.0, Fu: float = 450.0, U: float = 0.85,
+                  K: float = 1.0, kinds=("L", "HSS"), E: float = 200000.0) -> pd.DataFrame:
+    """
+    Lightest catalogue section per member group passing every member of the group: members × sections
+    ratios in one pass, reduced over each group with logical_and.reduceat on the group-sorted rows.
+    """
+    table = load_catalogue()
+    rows = np.flatnonzero(np.isin(table["type"], list(kinds)))
+    rows = rows[np.argsort(table["mass"][rows], kind="stable")]
+    sec = table[rows]
+
+    groups = np.asarray(groups).astype(str)
+    order = np.argsort(groups, kind="stable")
+    names, start = np.unique(groups[order], return_index=True)
+    L = envelope["L (mm)"].to_numpy(float)[order]
+    Pu = envelope["Pu (kN)"].to_numpy(float)[order, None]
+    Tu = envelope["Tu (kN)"].to_numpy(float)[order, None]
+    caps = member_strengths(sec, rows[None, :], L[:, None], Fy, Fu, U, K, E)
+    ratio, slender = _ratio(Pu, Tu, caps)
+    ok = np.logical_and.reduceat((ratio <= 1.0) & slender, start, axis=0)        # (groups, sections)
+    worst = np.maximum.reduceat(np.nan_to_num(ratio, nan=np.inf), start, axis=0)
+    best = np.argmax(ok, axis=1)
+    found = ok.any(axis=1)
+    g = np.arange(names.size)
+    count = np.diff(np.append(start, order.size))
+    length = np.add.reduceat(L, start) / 1e3
+
+    out = pd.DataFrame({
+        "Group": names,
+        "Members": count,
+        "Max Pu (kN)": np.maximum.reduceat(Pu[:, 0], start),
+        "Max Tu (kN)": np.maximum.reduceat(Tu[:, 0], start),
+        "Longest L (mm)": np.maximum.reduceat(L, start),
+        "Lightest section": np.where(found, sec["name"][best].astype(str), "None passes"),
+        "Mass (kg/m)": sec["mass"][best],
+        "Group mass (kg)": sec["mass"][best] * length,
+        "Max ratio": worst[g, best],
+    })
+    out.loc[~found, ["Mass (kg/m)", "Group mass (kg)", "Max ratio"]] = np.nan
+    return out.round(3)
+
+
+def design_forces(envelope: pd.DataFrame) -> pd.DataFrame:
+    """
+    Envelope in the frame design-force layout (one row per member, no bending) for the design tabs;
+    Cm = 1.0 for the pin-ended axial members so beam-column checks keep the rows.
+    """
+    return pd.DataFrame({
+        "Member": envelope["Member"], "Combo": envelope["Combo (C)"].where(envelope["Pu (kN)"] >= envelope["Tu (kN)"], envelope["Combo (T)"]),
+        "L (mm)": envelope["L (mm)"], "Pu (kN)": envelope["Pu (kN)"], "Tu (kN)": envelope["Tu (kN)"],
+        "Vu (kN)": 0.0, "Mu (kN·m)": 0.0, "M1 (kN·m)": 0.0, "M2 (kN·m)": 0.0, "M1/M2": 0.0, "Cm": 1.0,
+        "Section": envelope["Section"],
+    })
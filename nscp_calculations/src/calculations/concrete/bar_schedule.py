@@ -0,0 +1,192 @@
+import math
+import numpy as np
+import pandas as pd
+
+# ----------------------------
+# Constants
+# ----------------------------
+STOCK_LENGTHS_MM = (6000.0, 9000.0, 12000.0)  # commercial rebar lengths (6 m / 9 m / 12 m)
+STEEL_DENSITY = 7850.0  # kg/m³
+
+
+# ----------------------------
+# Bar marks
+# ----------------------------
+def bar_mass_per_m(dia: float) -> float:
+    """Unit mass of a deformed bar (kg/m) = ρ·π·d²/4."""
+    return STEEL_DENSITY * math.pi * (dia / 1000.0) ** 2 / 4.0
+
+
+def make_mark(mark: str, member: str, dia: float, length_mm: float, qty: int, shape: str = "Straight") -> dict:
+    """Build one bar mark row (length in mm, qty per member)."""
+    return {
+        "Mark": mark,
+        "Member": member,
+        "Shape": shape,
+        "Dia (mm)": float(dia),
+        "Cut length (mm)": round(float(length_mm)),
+        "Qty": int(max(qty, 0)),
+    }
+
+
+def hook_extension(dia: float, bend: int = 135) -> float:
+    """Tail extension of a stirrup/tie hook (mm): 6db ≥ 75 mm for 135°, 12db for 90°."""
+    if bend == 90:
+        return 12.0 * dia
+    return max(6.0 * dia, 75.0)
+
+
+def stirrup_cut_length(b: float, h: float, cover: float, dia: float) -> float:
+    """Closed stirrup/tie cut length (mm) = centreline perimeter + two 135° hooks."""
+    inner_b = b - 2.0 * cover - dia
+    inner_h = h - 2.0 * cover - dia
+    return 2.0 * (inner_b + inner_h) + 2.0 * hook_extension(dia)
+
+
+def count_at_spacing(length_mm: float, spacing_mm: float) -> int:
+    """Number of bars at spacing s over a length (both ends included)."""
+    if spacing_mm <= 0 or not math.isfinite(spacing_mm):
+        return 0
+    return int(math.ceil(length_mm / spacing_mm)) + 1
+
+
+def marks_to_dataframe(marks: list, members: dict = None) -> pd.DataFrame:
+    """Tabulate bar marks; `members` maps Member → number of identical members."""
+    df = pd.DataFrame(marks, columns=["Mark", "Member", "Shape", "Dia (mm)", "Cut length (mm)", "Qty"])
+    members = members or {}
+    df["No. of members"] = df["Member"].map(lambda m: int(members.get(m, 1)))
+    df["Total pieces"] = df["Qty"] * df["No. of members"]
+    df["Total length (m)"] = df["Total pieces"] * df["Cut length (mm)"] / 1000.0
+    df["Mass (kg)"] = df["Total length (m)"] * df["Dia (mm)"].map(bar_mass_per_m)
+    return df
+
+
+# ----------------------------
+# Cutting-stock optimization
+# ----------------------------
+def split_long_piece(length_mm: float, max_stock_mm: float, lap_mm: float) -> list:
+    """Split a piece longer than the longest stock bar into lapped segments."""
+    if length_mm <= max_stock_mm:
+        return [length_mm]
+    if lap_mm >= max_stock_mm:
+        raise ValueError("Lap length must be shorter than the stock length.")
+    segments = []
+    remaining = length_mm
+    while remaining > max_stock_mm:
+        segments.append(max_stock_mm)
+        remaining -= max_stock_mm - lap_mm
+    segments.append(remaining)
+    return segments
+
+
+def _best_pattern(lengths: np.ndarray, counts: np.ndarray, stock: np.ndarray, kerf: float):
+    """
+    First-fit-decreasing fill of one bar for every stock length at once.
+    Returns (stock index, pieces per length) of the stock with the least waste ratio.
+    """
+    remaining = stock.astype(float).copy()
+    take = np.zeros((stock.size, lengths.size), dtype=np.int64)
+    descending = -lengths  # ascending keys for searchsorted
+    i = 0
+    while i < lengths.size:
+        # jump straight to the longest piece that still fits in some bar
+        i = max(i, int(np.searchsorted(descending, -remaining.max(), side="left")))
+        if i >= lengths.size:
+            break
+        piece = lengths[i]
+        fit = np.floor((remaining + kerf) / (piece + kerf)).astype(np.int64)
+        k = np.minimum(fit, counts[i])
+        take[:, i] = k
+        remaining -= k * (piece + kerf)
+        i += 1
+    used = take.sum(axis=1) > 0
+    waste_ratio = np.where(used, np.maximum(remaining, 0.0) / stock, np.inf)
+    # ties go to the longer bar (fewer pieces to handle and splice)
+    best = np.lexsort((-stock, waste_ratio))[0]
+    return best, take[best]
+
+
+def optimize_cutting(pieces_mm, quantities, stock_lengths=STOCK_LENGTHS_MM, kerf: float = 0.0) -> list:
+    """
+    Solve the 1-D cutting-stock problem for one bar diameter.
+
+    Pieces are grouped by length and packed first-fit-decreasing; each bar
+    pattern found is repeated as many times as the remaining quantities
+    allow, so the work grows with the number of distinct lengths rather
+    than with the number of pieces.
+    Returns a list of {"Stock (mm)", "Pattern", "Bars", "Waste (mm)"}.
+    """
+    stock = np.sort(np.asarray(stock_lengths, dtype=float))
+    lengths = np.asarray(pieces_mm, dtype=float)
+    counts = np.asarray(quantities, dtype=np.int64)
+    if lengths.size == 0:
+        return []
+    if np.any(lengths <= 0):
+        raise ValueError("Piece lengths must be positive.")
+    if np.any(lengths > stock[-1]):
+        raise ValueError("Piece longer than the longest stock bar — split it with split_long_piece() first.")
+
+    # merge duplicate lengths, sort decreasing
+    uniq, inv = np.unique(lengths, return_inverse=True)
+    merged = np.bincount(inv, weights=counts, minlength=uniq.size).astype(np.int64)
+    order = np.argsort(-uniq)
+    lengths, counts = uniq[order], merged[order]
+    lengths, counts = lengths[counts > 0], counts[counts > 0]
+
+    plan = []
+    while counts.size:
+        s_idx, k = _best_pattern(lengths, counts, stock, kerf)
+        used = k > 0
+        repeats = int(np.min(counts[used] // k[used]))
+        counts = counts - repeats * k
+        cut = float(np.sum(k * (lengths + kerf)))
+        plan.append({
+            "Stock (mm)": float(stock[s_idx]),
+            "Pattern": {float(L): int(n) for L, n in zip(lengths[used], k[used])},
+            "Bars": repeats,
+            "Waste (mm)": max(float(stock[s_idx]) - cut, 0.0),
+        })
+        # drop exhausted lengths so later patterns only scan what is left
+        left = counts > 0
+        lengths, counts = lengths[left], counts[left]
+    return plan
+
+
+def cutting_schedule(bbs: pd.DataFrame, stock_lengths=STOCK_LENGTHS_MM, lap_mm: dict = None, kerf: float = 0.0):
+    """
+    Optimize stock bars for a whole bar bending schedule (all diameters).
+    Pieces longer than the longest stock are lapped by lap_mm[dia] (default 40·db).
+    Returns (patterns DataFrame, order-quantity DataFrame).
+    """
+    lap_mm = lap_mm or {}
+    max_stock = max(stock_lengths)
+    pattern_rows = []
+    order_rows = []
+    for dia, group in bbs.groupby("Dia (mm)"):
+        lengths = []
+        qtys = []
+        for L, n in zip(group["Cut length (mm)"], group["Total pieces"]):
+            for seg in split_long_piece(float(L), max_stock, lap_mm.get(dia, 40.0 * dia)):
+                lengths.append(seg)
+                qtys.append(int(n))
+        plan = optimize_cutting(lengths, qtys, stock_lengths, kerf)
+        for p in plan:
+            pattern_rows.append({
+                "Dia (mm)": dia,
+                "Stock (mm)": p["Stock (mm)"],
+                "Cuts": " + ".join(f"{n}×{L:.0f}" for L, n in p["Pattern"].items()),
+                "Bars": p["Bars"],
+                "Waste per bar (mm)": round(p["Waste (mm)"]),
+            })
+        for stock_len in sorted({p["Stock (mm)"] for p in plan}):
+            bars = sum(p["Bars"] for p in plan if p["Stock (mm)"] == stock_len)
+            waste = sum(p["Bars"] * p["Waste (mm)"] for p in plan if p["Stock (mm)"] == stock_len)
+            order_rows.append({
+                "Dia (mm)": dia,
+                "Stock (m)": stock_len / 1000.0,
+                "Bars to order": bars,
+                "Mass (kg)": round(bars * stock_len / 1000.0 * bar_mass_per_m(dia), 1),
+                "Waste (m)": round(waste / 1000.0, 2),
+                "Yield (%)": round(100.0 * (1.0 - waste / (bars * stock_len)), 1) if bars else 0.0,
+            })
+    return pd.DataFrame(pattern_rows), pd.DataFrame(order_rows)
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+# ----------------------------
+# Modifier tables (NSCP 2015 §425.4)
+# ----------------------------
+# Index order: [casting position, coating, bar size, concrete]
+POSITIONS = ("Other", "Top bar")                   # ψt = 1.0 / 1.3
+COATINGS = ("Uncoated", "Epoxy", "Epoxy, cover < 3db or spacing < 6db")  # ψe = 1.0 / 1.2 / 1.5
+SIZES = ("No. 20 and smaller", "No. 22 and larger")  # ψs = 0.8 / 1.0
+CONCRETES = ("Normalweight", "Lightweight")          # λ = 1.0 / 0.75
+
+PSI_T = np.array([1.0, 1.3])
+PSI_E = np.array([1.0, 1.2, 1.5])
+PSI_S = np.array([0.8, 1.0])
+LAMBDA = np.array([1.0, 0.75])
+
+# (ψt·ψe capped at 1.7) · ψs / λ for every combination, shape (2, 3, 2, 2)
+STRAIGHT_MODIFIERS = (
+    np.minimum(PSI_T[:, None] * PSI_E[None, :], 1.7)[:, :, None, None]
+    * PSI_S[None, None, :, None]
+    / LAMBDA[None, None, None, :]
+)
+# ψe / λ for standard hooks, shape (3, 2)
+HOOK_MODIFIERS = PSI_E[:, None] / LAMBDA[None, :]
+
+LAP_CLASS = {"A": 1.0, "B": 1.3}
+STANDARD_BARS = (10.0, 12.0, 16.0, 20.0, 25.0, 28.0, 32.0, 36.0)
+
+
+# ----------------------------
+# Helper Functions
+# ----------------------------
+def _out(value):
+    """Return a float for scalar inputs, an ndarray otherwise."""
+    value = np.asarray(value, dtype=float)
+    return float(value) if value.ndim == 0 else value
+
+
+def _sqrt_fc(fc):
+    """√f'c capped at 8.3 MPa (§425.4.1.4)."""
+    return np.minimum(np.sqrt(np.asarray(fc, dtype=float)), 8.3)
+
+
+def size_index(db):
+    """ψs row: 0 for db ≤ 20 mm (No. 20 and smaller), 1 for db > 20 mm (No. 22 and larger)."""
+    return (np.asarray(db, dtype=float) > 20.0).astype(int)
+
+
+def confinement_term(db, cb, Atr=0.0, s=1.0, n=1):
+    """(cb + Ktr)/db capped at 2.5, with Ktr = 40·Atr/(s·n); Atr is the area of all legs within s (mm²)."""
+    db = np.asarray(db, dtype=float)
+    Ktr = 40.0 * np.asarray(Atr, dtype=float) / (np.asarray(s, dtype=float) * np.asarray(n, dtype=float))
+    return _out(np.minimum((np.asarray(cb, dtype=float) + Ktr) / db, 2.5))
+
+
+def development_length(db, fy, fc, position=0, coating=0, lightweight=0, cb_ktr_db=1.5):
+    """
+    Tension development length ld (mm) of straight deformed bars (§425.4.2.3):
+    ld = fy / (1.1 λ √f'c) · ψtψeψs / ((cb + Ktr)/db) · db ≥ 300 mm.
+    position / coating / lightweight are indexes into POSITIONS / COATINGS / CONCRETES;
+    every argument broadcasts, so one call covers all bar sizes and cases.
+    """
+    db = np.asarray(db, dtype=float)
+    modifier = STRAIGHT_MODIFIERS[position, coating, size_index(db), lightweight]
+    conf = np.clip(np.asarray(cb_ktr_db, dtype=float), 1e-6, 2.5)
+    ld = np.asarray(fy, dtype=float) / (1.1 * _sqrt_fc(fc)) * modifier / conf * db
+    return _out(np.maximum(ld, 300.0))
+
+
+def hooked_development_length(db, fy, fc, coating=0, lightweight=0, psi_c=1.0, psi_r=1.0):
+    """
+    Development length ldh (mm) of standard hooks (§425.4.3):
+    ldh = 0.24 fy ψe ψc ψr / (λ √f'c) · db ≥ max(8db, 150 mm).
+    """
+    db = np.asarray(db, dtype=float)
+    modifier = HOOK_MODIFIERS[coating, lightweight]
+    ldh = 0.24 * np.asarray(fy, dtype=float) * modifier * psi_c * psi_r / _sqrt_fc(fc) * db
+    return _out(np.maximum(ldh, np.maximum(8.0 * db, 150.0)))
+
+
+def compression_development_length(db, fy, fc, lightweight=0):
+    """Compression development length ldc (mm) = max(0.24 fy/(λ√f'c), 0.043 fy)·db ≥ 200 mm (§425.4.9)."""
+    db = np.asarray(db, dtype=float)
+    fy = np.asarray(fy, dtype=float)
+    ldc = np.maximum(0.24 * fy / (LAMBDA[lightweight] * _sqrt_fc(fc)), 0.043 * fy) * db
+    return _out(np.maximum(ldc, 200.0))
+
+
+def tension_lap_length(db, fy, fc, lap_class="B", **kwargs):
+    """Tension lap splice (mm): Class A = 1.0 ld, Class B = 1.3 ld, ≥ 300 mm (§425.5.2)."""
+    ld = np.asarray(development_length(db, fy, fc, **kwargs))
+    return _out(np.maximum(LAP_CLASS[lap_class] * ld, 300.0))
+
+
+def compression_lap_length(db, fy, fc):
+    """Compression lap splice (mm): 0.071 fy db (fy ≤ 420) or (0.13 fy − 24) db, ≥ 300 mm (§425.5.5)."""
+    db = np.asarray(db, dtype=float)
+    fy = np.asarray(fy, dtype=float)
+    lap = np.where(fy <= 420.0, 0.071 * fy, 0.13 * fy - 24.0) * db
+    # f'c < 21 MPa: increase by one-third
+    lap = np.where(np.asarray(fc, dtype=float) < 21.0, lap * 4.0 / 3.0, lap)
+    return _out(np.maximum(lap, 300.0))
+
+
+def development_table(fy, fc, bars=STANDARD_BARS, position=0, coating=0, lightweight=0, cb_ktr_db=1.5) -> pd.DataFrame:
+    """Tabulate ld, ldh, ldc and lap lengths (mm) for a range of bar sizes in one vectorized pass."""
+    db = np.asarray(bars, dtype=float)
+    kwargs = dict(position=position, coating=coating, lightweight=lightweight, cb_ktr_db=cb_ktr_db)
+    ld = development_length(db, fy, fc, **kwargs)
+    return pd.DataFrame({
+        "Bar (mm)": db,
+        "ld straight (mm)": np.round(ld),
+        "ldh hooked (mm)": np.round(hooked_development_length(db, fy, fc, coating, lightweight)),
+        "ldc compression (mm)": np.round(compression_development_length(db, fy, fc, lightweight)),
+        "Class A lap (mm)": np.round(np.maximum(LAP_CLASS["A"] * ld, 300.0)),
+        "Class B lap (mm)": np.round(np.maximum(LAP_CLASS["B"] * ld, 300.0)),
+        "Compression lap (mm)": np.round(compression_lap_length(db, fy, fc)),
+    })
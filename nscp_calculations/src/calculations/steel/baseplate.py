@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+from src.calculations.steel.sections import STEEL_DENSITY, get_section
+
+PHI_BEARING = 0.65  # concrete bearing (AISC J8)
+PHI_ROD = 0.75      # anchor rod tension (AISC J3.6)
+
+PLATE_THICKNESSES = np.array([10.0, 12.0, 16.0, 20.0, 25.0, 28.0, 32.0, 36.0, 40.0, 45.0, 50.0, 56.0, 63.0, 70.0, 80.0, 90.0, 100.0])
+ROD_DIAMETERS = np.array([16.0, 20.0, 24.0, 30.0, 36.0, 42.0, 48.0])
+RODS_PER_SIDE = (2, 3, 4)
+PLATE_STEP = 25.0  # mm, plan-size increment of the sizing grid
+
+
+# ----------------------------
+# Bearing and cantilevers (AISC Design Guide 1)
+# ----------------------------
+def bearing_stress(fc: float, A2_A1: float = 1.0) -> float:
+    """Design bearing stress φc·fp(max) = φc·0.85f'c·√(A2/A1) ≤ φc·1.7f'c (MPa)."""
+    return PHI_BEARING * 0.85 * fc * min(np.sqrt(max(A2_A1, 1.0)), 2.0)
+
+
+def cantilevers(Pu, B, N, d, bf, fp_max) -> tuple:
+    """
+    Plate cantilevers m = (N − 0.95d)/2, n = (B − 0.8bf)/2 and λn′ = λ√(d·bf)/4 (mm),
+    with λ from X = 4d·bf/(d + bf)² · Pu/(φcPp), φcPp = φc·fp(max)·B·N.
+    """
+    m = (N - 0.95 * d) / 2.0
+    n = (B - 0.8 * bf) / 2.0
+    X = np.clip(4.0 * d * bf / (d + bf) ** 2 * np.maximum(Pu, 0.0) * 1e3 / (fp_max * B * N), 0.0, 1.0)
+    lam = np.minimum(2.0 * np.sqrt(X) / (1.0 + np.sqrt(1.0 - X)), 1.0)
+    return m, n, lam * np.sqrt(d * bf) / 4.0
+
+
+# ----------------------------
+# Axial load + moment
+# ----------------------------
+def solve_baseplate(Pu, Mu, B, N, f, d, bf, tf, fp_max: float, Fy: float) -> dict:
+    """
+    Design Guide 1 solution of a base plate under axial compression Pu (kN) and moment Mu (kN·m).
+
+    e ≤ e_crit = N/2 − Pu/(2q_max): uniform bearing over Y = N − 2e, no rod tension.
+    e > e_crit: bearing at q_max = φc·fp(max)·B over Y = (f + N/2) − √((f + N/2)² − 2(M + Pu·f)/q_max)
+    and rod tension T = q_max·Y − Pu, f being the rod offset from the plate centre; written with M + Pu·f
+    instead of Pu(e + f) the quadratic holds for pure moment and net uplift too (Pu ≤ 0).
+    Only a plate in tension everywhere (M + Pu·f ≤ 0) is carried by the rods alone, T = M/(2f) − Pu/2.
+    All arguments broadcast; lengths in mm.
+    Returns e, e_crit, Y (mm), bearing stress (MPa), T (kN), cantilevers, required thickness (mm), "ok" and "rods_only".
+    """
+    Pu, Mu, B, N, f, d, bf, tf = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (Pu, Mu, B, N, f, d, bf, tf)))
+    P = Pu * 1e3                      # N
+    M = np.abs(Mu) * 1e6              # N·mm
+    q_max = fp_max * B                # N/mm
+    rods_only = M + P * f <= 0.0      # plate in tension everywhere: no bearing
+    with np.errstate(divide="ignore", invalid="ignore"):
+        e = np.where(P > 0.0, M / np.where(P > 0.0, P, 1.0), np.inf)
+        e_crit = N / 2.0 - np.maximum(P, 0.0) / (2.0 * q_max)
+        small = (e <= e_crit) & (P > 0.0)
+        disc = (f + N / 2.0) ** 2 - 2.0 * (M + P * f) / q_max
+        Y_large = (f + N / 2.0) - np.sqrt(np.maximum(disc, 0.0))
+        Y = np.where(small, N - 2.0 * np.where(small, e, 0.0), np.where(rods_only, 0.0, Y_large))
+        T = np.where(small, 0.0, np.where(rods_only, -P / 2.0 + M / (2.0 * f), q_max * Y_large - P))
+        fp = np.where(Y > 0.0, np.where(small, P / (Y * B), fp_max), 0.0)
+        ok = (e_crit >= 0.0) & (small | rods_only | (disc >= 0.0))
+
+        # plate bending at the compression interface (m along N, n and λn′ across B); 1.5 ≈ √(2/0.9), 2.11 ≈ √(4/0.9)
+        m, n, ln = cantilevers(Pu, B, N, d, bf, fp_max)
+        t_m = np.where(Y >= m, 1.5 * m * np.sqrt(fp / Fy),
+                       2.11 * np.sqrt(np.maximum(fp * Y * (m - Y / 2.0), 0.0) / Fy))
+        t_n = 1.5 * np.maximum(n, ln) * np.sqrt(fp / Fy)
+        # plate bending at the tension interface: rod tension over the lever x to the flange centreline
+        x = f - d / 2.0 + tf / 2.0
+        t_t = 2.11 * np.sqrt(np.maximum(T * x, 0.0) / (B * Fy))
+    t_req = np.maximum(np.maximum(np.where(m > 0, t_m, 0.0), np.where(n > 0, t_n, 0.0)), t_t)
+    return {
+        "e": e, "e_crit": e_crit, "Y": Y, "fp": fp, "T": T / 1e3,
+        "m": m, "n": n, "lambda_n": ln, "t_compression": np.maximum(t_m, t_n), "t_tension": t_t,
+        "t_req": t_req, "ok": ok, "rods_only": rods_only,
+    }
+
+
+def rod_strength(d_rod, Fu_rod: float = 400.0):
+    """Design tension per anchor rod φ·0.75Fu·Ab (kN)."""
+    return PHI_ROD * 0.75 * Fu_rod * np.pi * np.asarray(d_rod, dtype=float) ** 2 / 4.0 / 1e3
+
+
+def standard_thickness(t_req):
+    """Smallest stocked plate thickness ≥ t_req (NaN when thicker than the largest stocked plate)."""
+    i = np.searchsorted(PLATE_THICKNESSES, np.asarray(t_req, dtype=float) - 1e-9)
+    return np.where(i < PLATE_THICKNESSES.size, PLATE_THICKNESSES[np.minimum(i, PLATE_THICKNESSES.size - 1)], np.nan)
+
+
+# ----------------------------
+# Batch sizing over column base reactions
+# ----------------------------
+def size_baseplates(reactions: pd.DataFrame, fc: float = 21.0, Fy: float = 248.0, A2_A1: float = 1.0,
+                    Fu_rod: float = 400.0, rod_edge: float = 50.0, rod_length: float = 0.6,
+                    max_size: float = 1200.0) -> pd.DataFrame:
+    """
+    Lightest base plate (B, N, t) and anchor rods for every column base reaction.
+
+    reactions columns: "Column", "Section" (catalogue designation), "Pu (kN)" (compression +), "Mu (kN·m)".
+    Every B × N on a PLATE_STEP grid is solved for all reactions at once; rods sit rod_edge from the
+    plate ends and must clear the column flange by rod_edge. Cost = plate mass + rod mass over rod_length (m).
+    """
+    secs = [get_section(s) for s in reactions["Section"]]
+    d = np.array([s["d"] for s in secs])[:, None]
+    bf = np.array([s["bf"] for s in secs])[:, None]
+    tf = np.array([s["tf"] for s in secs])[:, None]
+    Pu = reactions["Pu (kN)"].to_numpy(float)[:, None]
+    Mu = reactions["Mu (kN·m)"].to_numpy(float)[:, None]
+    fp_max = bearing_stress(fc, A2_A1)
+
+    sizes = np.arange(200.0, max_size + PLATE_STEP, PLATE_STEP)
+    BB, NN = (g.ravel()[None, :] for g in np.meshgrid(sizes, sizes))
+    f = NN / 2.0 - rod_edge
+    res = solve_baseplate(Pu, Mu, BB, NN, f, d, bf, tf, fp_max, Fy)
+    t = standard_thickness(res["t_req"])
+    fits = (BB >= bf + 2.0 * rod_edge) & (f >= d / 2.0 + rod_edge)
+    feasible = res["ok"] & fits & ~np.isnan(t)
+
+    # rods: every (rods per side × diameter) option that carries T and fits across B at 4d spacing
+    counts = np.repeat(RODS_PER_SIDE, ROD_DIAMETERS.size)
+    dia = np.tile(ROD_DIAMETERS, len(RODS_PER_SIDE))
+    rod_mass = 2 * counts * np.pi * dia ** 2 / 4.0 * STEEL_DENSITY * 1e-6 * rod_length
+    carries = counts * rod_strength(dia, Fu_rod) >= res["T"][..., None] - 1e-9
+    spaced = (counts - 1) * 4.0 * dia <= BB[..., None] - 2.0 * rod_edge
+    rod_cost = np.where(carries & spaced, rod_mass, np.inf)
+    rod_pick = np.argmin(rod_cost, axis=-1)
+    rod_best = np.take_along_axis(rod_cost, rod_pick[..., None], axis=-1)[..., 0]
+
+    plate_mass = BB * NN * np.nan_to_num(t) * STEEL_DENSITY * 1e-9
+    cost = np.where(feasible, plate_mass + rod_best, np.inf)
+    best = np.argmin(cost, axis=1)
+    rows = np.arange(len(reactions))
+    found = np.isfinite(cost[rows, best])
+
+    def pick(a):
+        return np.broadcast_to(a, cost.shape)[rows, best]
+
+    out = reactions[["Column", "Section", "Pu (kN)", "Mu (kN·m)"]].copy()
+    out["B (mm)"] = pick(BB)
+    out["N (mm)"] = pick(NN)
+    out["t (mm)"] = pick(t)
+    out["Rods / side"] = counts[pick(rod_pick)]
+    out["Rod Ø (mm)"] = dia[pick(rod_pick)]
+    out["e (mm)"] = pick(res["e"])
+    out["Y (mm)"] = pick(res["Y"])
+    out["T (kN)"] = pick(res["T"])
+    out["Governing t (mm)"] = pick(res["t_req"])
+    out["Mass (kg)"] = pick(cost)
+    out["Status"] = np.where(found, np.where(pick(res["T"]) > 0, "OK (rods in tension)", "OK"), f"No plate ≤ {max_size:.0f} mm")
+    num = out.columns.drop(["Column", "Section", "Status"])
+    out.loc[~found, num[2:]] = np.nan
+    return out.round(2)
@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+from src.calculations.steel.compression import design_compression, equivalent_length, minor_radius
+from src.calculations.steel.flexure import PHI_B, flexural_strength, minor_axis_strength
+from src.calculations.steel.sections import load_catalogue, name_index
+
+PHI_T = 0.90  # tension yielding (AISC D2-1)
+
+FORCE_COLUMNS = ("Pnt (kN)", "Plt (kN)", "Mntx (kN·m)", "Mltx (kN·m)", "Mnty (kN·m)", "Mlty (kN·m)")
+
+
+# ----------------------------
+# Second-order amplification (AISC Appendix 8)
+# ----------------------------
+def cm_factor(M1, M2):
+    """Cm = 0.6 − 0.4 M1/M2 for members without transverse load (|M1| ≤ |M2|, + for reverse curvature)."""
+    M1 = np.asarray(M1, dtype=float)
+    M2 = np.asarray(M2, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(M2 != 0, 0.6 - 0.4 * M1 / M2, 1.0)
+
+
+def b1_factor(Cm, Pr, Pe1, alpha: float = 1.0):
+    """B1 = Cm / (1 − αPr/Pe1) ≥ 1; tension (Pr ≤ 0) gives B1 = max(Cm, 1) → 1. Returns inf past Pe1."""
+    Pr = np.maximum(np.asarray(Pr, dtype=float), 0.0)
+    denom = 1.0 - alpha * Pr / np.asarray(Pe1, dtype=float)
+    with np.errstate(divide="ignore"):
+        return np.where(denom > 0, np.maximum(np.asarray(Cm, dtype=float) / denom, 1.0), np.inf)
+
+
+def b2_factor(P_story, H, delta_H, L, Rm: float = 0.85, alpha: float = 1.0):
+    """
+    Story sway amplifier B2 = 1 / (1 − αPstory/Pe,story) ≥ 1 with Pe,story = Rm·H·L/ΔH (A-8-6, A-8-7).
+    H (kN) is the story shear producing the first-order drift ΔH (mm) over story height L (mm).
+    """
+    with np.errstate(divide="ignore"):
+        Pe_story = Rm * np.asarray(H, dtype=float) * np.asarray(L, dtype=float) / np.asarray(delta_H, dtype=float)
+        denom = 1.0 - alpha * np.asarray(P_story, dtype=float) / Pe_story
+        return np.where(denom > 0, np.maximum(1.0 / denom, 1.0), np.inf)
+
+
+# ----------------------------
+# Interaction (AISC H1-1a / H1-1b, H1-2)
+# ----------------------------
+def interaction_ratio(Pr_Pc, Mrx_Mcx, Mry_Mcy):
+    """Return (ratio, equation label): H1-1a when Pr/Pc ≥ 0.2, else H1-1b."""
+    Pr_Pc = np.asarray(Pr_Pc, dtype=float)
+    moments = np.asarray(Mrx_Mcx, dtype=float) + np.asarray(Mry_Mcy, dtype=float)
+    large = Pr_Pc >= 0.2
+    ratio = np.where(large, Pr_Pc + 8.0 / 9.0 * moments, Pr_Pc / 2.0 + moments)
+    return ratio, np.where(large, "H1-1a", "H1-1b")
+
+
+def member_capacities(members: pd.DataFrame, Fy: float = 345.0, E: float = 200000.0) -> pd.DataFrame:
+    """
+    ΦPn, ΦtPn, ΦMnx, ΦMny (kN, kN·m) and Pe1x, Pe1y (kN) for every member of a catalogue schedule.
+    members columns: "Member", "Section", "L (mm)", "Kx", "Ky" and optional "Lb (mm)" (defaults to L), "Cb".
+    """
+    table = load_catalogue()
+    index = name_index()
+    unknown = sorted(set(members["Section"]) - set(index))
+    if unknown:
+        raise KeyError(f"Sections not in catalogue: {', '.join(unknown)}")
+    rows = np.array([index[s] for s in members["Section"]], dtype=int)
+    sec = table[rows]
+
+    L = members["L (mm)"].to_numpy(float)
+    KL = equivalent_length(sec, members["Kx"].to_numpy(float) * L, members["Ky"].to_numpy(float) * L)
+    Lb = members["Lb (mm)"].to_numpy(float) if "Lb (mm)" in members else L
+    Cb = members["Cb"].to_numpy(float) if "Cb" in members else 1.0
+
+    # Pe1 uses K1 = 1 (no-translation member, AISC A-8-5)
+    with np.errstate(divide="ignore"):
+        Pe1x = np.pi ** 2 * E * sec["Ix"] / L ** 2 / 1000.0
+        Pe1y = np.pi ** 2 * E * sec["Iy"] / L ** 2 / 1000.0
+    return pd.DataFrame({
+        "Member": members["Member"].to_numpy(),
+        "Section": members["Section"].to_numpy(),
+        "KL/r": KL / minor_radius(sec),
+        "ΦPn (kN)": design_compression(rows, KL, Fy, E),
+        "ΦtPn (kN)": PHI_T * Fy * sec["A"] / 1000.0,
+        "ΦMnx (kN·m)": PHI_B * flexural_strength(sec, Fy, Lb, Cb, E),
+        "ΦMny (kN·m)": PHI_B * minor_axis_strength(sec, Fy, E),
+        "Pe1x (kN)": Pe1x,
+        "Pe1y (kN)": Pe1y,
+    })
+
+
+def check_beam_columns(members: pd.DataFrame, forces: pd.DataFrame, Fy: float = 345.0,
+                       E: float = 200000.0) -> tuple:
+    """
+    H1 check of every member under every load combination in one vectorized pass.
+
+    forces is a long frame-analysis table, one row per (member, combination), with columns
+    "Member", "Combo" and the no-translation / lateral-translation actions of FORCE_COLUMNS
+    (compression positive). Optional "Cmx", "Cmy" (default 1.0, conservative) and "B2" (default 1.0).
+    Pr = Pnt + B2·Plt, Mr = B1·Mnt + B2·Mlt (AISC A-8-1, A-8-2).
+    Returns (detail DataFrame per member × combination, summary DataFrame with the governing combination).
+    """
+    caps = member_capacities(members, Fy, E).set_index("Member")
+    missing = sorted(set(forces["Member"]) - set(caps.index))
+    if missing:
+        raise KeyError(f"Forces reference unknown members: {', '.join(map(str, missing))}")
+    cap = caps.loc[forces["Member"]]
+
+    f = {c: forces[c].to_numpy(float) if c in forces else np.zeros(len(forces)) for c in FORCE_COLUMNS}
+    Cmx = forces["Cmx"].to_numpy(float) if "Cmx" in forces else 1.0
+    Cmy = forces["Cmy"].to_numpy(float) if "Cmy" in forces else 1.0
+    B2 = forces["B2"].to_numpy(float) if "B2" in forces else 1.0
+
+    Pr = f["Pnt (kN)"] + B2 * f["Plt (kN)"]
+    B1x = b1_factor(Cmx, Pr, cap["Pe1x (kN)"].to_numpy())
+    B1y = b1_factor(Cmy, Pr, cap["Pe1y (kN)"].to_numpy())
+    Mrx = np.abs(B1x * f["Mntx (kN·m)"] + B2 * f["Mltx (kN·m)"])
+    Mry = np.abs(B1y * f["Mnty (kN·m)"] + B2 * f["Mlty (kN·m)"])
+
+    # compression uses ΦcPn (H1-1), tension ΦtPn (H1-2)
+    Pc = np.where(Pr >= 0, cap["ΦPn (kN)"].to_numpy(), cap["ΦtPn (kN)"].to_numpy())
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio, equation = interaction_ratio(np.abs(Pr) / Pc, Mrx / cap["ΦMnx (kN·m)"].to_numpy(),
+                                            Mry / cap["ΦMny (kN·m)"].to_numpy())
+    ratio = np.where(np.isfinite(B1x) & np.isfinite(B1y), ratio, np.inf)
+
+    detail = pd.DataFrame({
+        "Member": forces["Member"].to_numpy(),
+        "Combo": forces["Combo"].to_numpy(),
+        "Pr (kN)": Pr, "B1x": B1x, "B1y": B1y, "Mrx (kN·m)": Mrx, "Mry (kN·m)": Mry,
+        "Pc (kN)": Pc, "Equation": equation, "Ratio": ratio,
+    })
+    governing = detail.loc[detail.groupby("Member", sort=False)["Ratio"].idxmax()]
+    summary = caps.reset_index()[["Member", "Section", "KL/r", "ΦPn (kN)", "ΦMnx (kN·m)", "ΦMny (kN·m)"]] \
+        .merge(governing[["Member", "Combo", "Equation", "Ratio"]], on="Member", how="left") \
+        .rename(columns={"Combo": "Governing combo"})
+    summary["Status"] = np.select([summary["KL/r"] > 200.0, summary["Ratio"].isna(), summary["Ratio"] <= 1.0],
+                                  ["KL/r > 200", "No forces", "OK"], "FAIL")
+    return detail.round(3), summary.round(3)
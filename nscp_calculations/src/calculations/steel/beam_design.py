@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+from src.calculations.steel.flexure import PHI_B, flexural_strength, shear_strength
+from src.calculations.steel.sections import load_catalogue
+
+GRAVITY = 9.81e-3  # kN per kg
+
+
+def beam_demands(span_m, wD, wL, self_weight=0.0):
+    """
+    Simply supported beam under uniform load (kN/m): factored Mu (kN·m), Vu (kN) for
+    1.2D + 1.6L (or 1.4D) and service deflection loads. Self-weight (kN/m) is added to D.
+    """
+    wD_total = np.asarray(wD, dtype=float) + self_weight
+    wL = np.asarray(wL, dtype=float)
+    wu = np.maximum(1.2 * wD_total + 1.6 * wL, 1.4 * wD_total)
+    span_m = np.asarray(span_m, dtype=float)
+    return wu * span_m ** 2 / 8.0, wu * span_m / 2.0, wD_total + wL, wL
+
+
+def design_beams(schedule: pd.DataFrame, Fy: float = 345.0, E: float = 200000.0,
+                 live_limit: float = 360.0, total_limit: float = 240.0, kinds=("W",)):
+    """
+    Check every beam of a schedule against every catalogue section in one vectorized pass.
+
+    schedule columns: "Span (m)", "wD (kN/m)", "wL (kN/m)", "Lb (mm)" and optional "Cb".
+    Returns (utilization array beams × sections, sections, pass mask); section self-weight
+    is included in the dead load.
+    """
+    table = load_catalogue()
+    sections = np.asarray(table[np.isin(table["type"], list(kinds))])
+    sections = sections[np.argsort(sections["mass"], kind="stable")]
+
+    span = schedule["Span (m)"].to_numpy(float)[:, None]
+    wD = schedule["wD (kN/m)"].to_numpy(float)[:, None]
+    wL = schedule["wL (kN/m)"].to_numpy(float)[:, None]
+    Lb = schedule["Lb (mm)"].to_numpy(float)[:, None]
+    Cb = schedule["Cb"].to_numpy(float)[:, None] if "Cb" in schedule else 1.0
+
+    Mu, Vu, w_total, w_live = beam_demands(span, wD, wL, sections["mass"][None, :] * GRAVITY)
+
+    phiMn = PHI_B * flexural_strength(sections, Fy, Lb, Cb, E)
+    phi_v, Vn = shear_strength(sections, Fy, E)
+    phiVn = (phi_v * Vn)[None, :]
+
+    # service deflections (mm): 5 w L⁴ / (384 E I), w in N/mm, L in mm
+    L_mm = span * 1000.0
+    EI = E * sections["Ix"][None, :]
+    defl_total = 5.0 * w_total * L_mm ** 4 / (384.0 * EI)
+    defl_live = 5.0 * w_live * L_mm ** 4 / (384.0 * EI)
+
+    util = np.stack([
+        Mu / phiMn,
+        Vu / phiVn,
+        defl_live / (L_mm / live_limit),
+        defl_total / (L_mm / total_limit),
+    ])
+    return util, sections, np.all(util <= 1.0, axis=0)
+
+
+def select_beams(schedule: pd.DataFrame, n_alternatives: int = 5, **kwargs) -> tuple:
+    """
+    Lightest passing section for every beam in a schedule.
+    Returns (summary DataFrame, {beam index: ranked alternatives DataFrame}).
+    """
+    util, sections, ok = design_beams(schedule, **kwargs)
+    checks = ("Flexure", "Shear", "Live defl.", "Total defl.")
+    summary = []
+    alternatives = {}
+    for i in range(len(schedule)):
+        passing = np.flatnonzero(ok[i])  # sections are sorted by mass
+        rows = [{
+            "Section": str(sections["name"][j]),
+            "Mass (kg/m)": float(sections["mass"][j]),
+            **{f"{c} ratio": round(float(util[k, i, j]), 3) for k, c in enumerate(checks)},
+            "Governs": checks[int(np.argmax(util[:, i, j]))],
+        } for j in passing[:n_alternatives]]
+        alternatives[i] = pd.DataFrame(rows)
+        summary.append({
+            **schedule.iloc[i].to_dict(),
+            "Lightest section": rows[0]["Section"] if rows else "None passes",
+            "Mass (kg/m)": rows[0]["Mass (kg/m)"] if rows else np.nan,
+            "Max ratio": max(rows[0][f"{c} ratio"] for c in checks) if rows else np.nan,
+            "Governs": rows[0]["Governs"] if rows else "",
+        })
+    return pd.DataFrame(summary), alternatives
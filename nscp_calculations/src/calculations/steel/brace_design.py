@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+from src.calculations.steel.baseplate import PLATE_THICKNESSES
+from src.calculations.steel.compression import PHI_C, critical_stress, design_compression, minor_radius
+from src.calculations.steel.sections import load_catalogue
+
+PHI_T_YIELD = 0.90
+PHI_T_RUPTURE = 0.75
+SYSTEMS = ("OCBF", "SCBF")
+KL_R_LIMIT = 200.0
+# brace width-to-thickness limits × √(E/(Ry·Fy)) (AISC 341-16 Table D1.1: moderately / highly ductile)
+WIDTH_THICKNESS = {"OCBF": {"HSS": 0.76, "L": 0.40}, "SCBF": {"HSS": 0.65, "L": 0.32}}
+U_ANGLE = 0.80      # angles, AISC Table D3.1 case 8
+WHITMORE_TAN = np.tan(np.radians(30.0))
+K_GUSSET = 0.65     # Thornton column of the gusset below the Whitmore section
+
+
+def brace_envelope(forces: pd.DataFrame) -> pd.DataFrame:
+    """Largest compression and tension (kN) per brace with their combinations; "Pu (kN)" compression positive."""
+    P = forces["Pu (kN)"].astype(float)
+    g = forces.assign(_c=P.clip(lower=0.0), _t=(-P).clip(lower=0.0)).groupby("Brace", sort=False)
+    ic, it = g["_c"].idxmax(), g["_t"].idxmax()
+    return pd.DataFrame({
+        "Pc (kN)": forces.loc[ic, "Pu (kN)"].clip(lower=0.0).to_numpy(),
+        "Combo (C)": forces.loc[ic, "Combo"].to_numpy() if "Combo" in forces else "",
+        "Pt (kN)": (-forces.loc[it, "Pu (kN)"]).clip(lower=0.0).to_numpy(),
+        "Combo (T)": forces.loc[it, "Combo"].to_numpy() if "Combo" in forces else "",
+    }, index=ic.index)
+
+
+def brace_capacities(sec, Fy: float, Fu: float, Ry: float, KL, Lw: float, E: float = 200000.0,
+                     t_gusset=0.0) -> dict:
+    """
+    Design and expected strengths of brace sections (kN); KL (mm) and t_gusset (mm) broadcast against
+    the sections (tension depends only on t_gusset, the expected strengths stay one value per section).
+    Expected strengths for the connection: tension Ry·Fy·Ag, compression min(Ry·Fy·Ag, 1.14·Fcre·Ag)
+    with Fcre from Ry·Fy (AISC 341 F2.3). HSS rupture on the slotted section An = Ag − 2·t·t_gusset
+    with U = 1 − x̄/Lw (AISC Table D3.1 case 6).
+    """
+    kind = np.asarray(sec["type"])
+    A, d, bf, tw = (np.asarray(sec[k], dtype=float) for k in ("A", "d", "bf", "tw"))
+    r = minor_radius(sec)
+    KL = np.asarray(KL, dtype=float)
+    x_bar = (bf ** 2 + 2.0 * bf * d) / (4.0 * (bf + d))
+    U = np.where(kind == "HSS", np.clip(1.0 - x_bar / Lw, 0.0, 1.0), U_ANGLE)
+    An = np.where(kind == "HSS", A - 2.0 * tw * np.asarray(t_gusset, dtype=float), A)
+    with np.errstate(divide="ignore"):
+        Fe = np.pi ** 2 * E / (KL / r) ** 2
+    expected_yield = Ry * Fy * A / 1000.0
+    return {
+        "KL/r": KL / r,
+        "tension": np.minimum(PHI_T_YIELD * Fy * A, PHI_T_RUPTURE * Fu * U * An) / 1000.0,
+        "expected tension": expected_yield,
+        "expected compression": np.minimum(expected_yield, 1.14 * critical_stress(Ry * Fy, Fe) * A / 1000.0),
+    }
+
+
+def gusset_thickness(width, Lw: float, L1: float, Fyp: float, T_conn, C_conn, E: float = 200000.0):
+    """
+    Least stocked gusset thickness (mm) whose Whitmore section Ww = w + 2·Lw·tan30° carries
+    the expected tension (φ = 0.90 yielding) and compression (K = 0.65 over L1, r = t/√12).
+    """
+    Ww = np.asarray(width, dtype=float)[..., None] + 2.0 * Lw * WHITMORE_TAN
+    t = PLATE_THICKNESSES
+    Fe = np.pi ** 2 * E / (K_GUSSET * L1 / (t / np.sqrt(12.0))) ** 2
+    tension = PHI_T_YIELD * Fyp * Ww * t / 1000.0
+    compression = PHI_C * critical_stress(Fyp, Fe) * Ww * t / 1000.0
+    ok = (tension >= np.asarray(T_conn)[..., None]) & (compression >= np.asarray(C_conn)[..., None])
+    first = np.argmax(ok, axis=-1)
+    return np.where(ok.any(axis=-1), t[first], np.nan), Ww[..., 0]
+
+
+def design_braces(braces: pd.DataFrame, forces: pd.DataFrame, Fy: float = 345.0, Fu: float = 450.0,
+                  Ry: float = 1.4, system: str = "OCBF", kinds=("HSS", "L"), Lw: float = 200.0,
+                  L1: float = 150.0, Fyp: float = 250.0, E: float = 200000.0) -> pd.DataFrame:
+    """
+    Lightest passing HSS / angle for every brace of a building, checked braces × sections in one pass.
+
+    braces columns: "Brace", "L (mm)" and optional "K" (default 1.0); forces: "Brace", "Combo", "Pu (kN)"
+    (compression positive) for every brace and load combination. A section passes when ΦPn ≥ Pc,
+    ΦtPn ≥ Pt, KL/r ≤ 200 and its walls / legs meet the seismic width-thickness limit of the system.
+    Every candidate's gusset is sized for its expected strengths (capacity design) and that thickness
+    sets the slot deducted from the HSS net section (the thickest plate if none suffices).
+    """
+    env = brace_envelope(forces)
+    braces = braces.set_index("Brace")
+    missing = env.index.difference(braces.index)
+    if len(missing):
+        raise KeyError(f"Forces given for braces not in the brace list: {', '.join(map(str, missing))}")
+    env = env.reindex(braces.index).fillna({"Pc (kN)": 0.0, "Pt (kN)": 0.0, "Combo (C)": "", "Combo (T)": ""})
+
+    table = load_catalogue()
+    rows = np.flatnonzero(np.isin(table["type"], list(kinds)))
+    rows = rows[np.argsort(table["mass"][rows], kind="stable")]
+    sec = table[rows]
+
+    K = braces["K"].to_numpy(float) if "K" in braces else np.ones(len(braces))
+    KL = (K * braces["L (mm)"].to_numpy(float))[:, None]
+    caps = brace_capacities(sec, Fy, Fu, Ry, KL, Lw, E)
+    # HSS depth across the slotted gusset / connected angle leg
+    t_gusset, Ww = gusset_thickness(sec["d"], Lw, L1, Fyp, caps["expected tension"], caps["expected compression"], E)
+    t_slot = np.where(np.isnan(t_gusset), PLATE_THICKNESSES[-1], t_gusset)
+    tension = brace_capacities(sec, Fy, Fu, Ry, KL, Lw, E, t_slot)["tension"]
+    phiPn = design_compression(rows[None, :], KL, Fy, E)
+
+    kind = np.asarray(sec["type"])
+    # the longer wall governs rectangular HSS; the longer leg governs angles
+    long_side = np.maximum(sec["d"], sec["bf"])
+    b_t = np.where(kind == "HSS", (long_side - 3.0 * sec["tw"]) / sec["tw"], long_side / sec["tw"])
+    limit = np.where(kind == "HSS", WIDTH_THICKNESS[system]["HSS"], WIDTH_THICKNESS[system]["L"]) * np.sqrt(E / (Ry * Fy))
+
+    Pc = env["Pc (kN)"].to_numpy(float)[:, None]
+    Pt = env["Pt (kN)"].to_numpy(float)[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.maximum(Pc / phiPn, Pt / tension)
+    ok = (ratio <= 1.0) & (caps["KL/r"] <= KL_R_LIMIT) & (b_t <= limit)[None, :]
+
+    best = np.argmax(ok, axis=1)
+    found = ok.any(axis=1)
+    i = np.arange(len(braces))
+    T_conn = caps["expected tension"][best]
+    C_conn = caps["expected compression"][i, best]
+
+    out = pd.DataFrame({
+        "Brace": braces.index,
+        "L (mm)": braces["L (mm)"].to_numpy(float),
+        **{c: env[c].to_numpy() for c in ("Pc (kN)", "Combo (C)", "Pt (kN)", "Combo (T)")},
+        "Lightest section": np.where(found, sec["name"][best].astype(str), "None passes"),
+        "Mass (kg/m)": sec["mass"][best],
+        "KL/r": caps["KL/r"][i, best],
+        "ΦPn (kN)": phiPn[i, best],
+        "ΦtPn (kN)": tension[i, best],
+        "Ratio": ratio[i, best],
+        "RyFyAg (kN)": T_conn,
+        "Expected comp. (kN)": C_conn,
+        "Whitmore width (mm)": Ww[best],
+        "Gusset t (mm)": t_gusset[i, best],
+    })
+    out.loc[~found, out.columns[7:]] = np.nan
+    return out.round(2)
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+from src.calculations.steel.baseplate import standard_thickness
+from src.calculations.steel.sections import load_catalogue, name_index
+
+PHI_FLB = 0.90  # flange local bending (AISC J10.1)
+PHI_WLY = 1.00  # web local yielding (J10.2)
+PHI_WC = 0.75   # web crippling (J10.3)
+PHI_PZ = 0.90   # panel-zone shear (J10.6)
+PHI_ST = 0.90   # continuity plate yielding
+
+
+def _sections(names) -> np.ndarray:
+    index = name_index()
+    missing = sorted(set(names) - set(index))
+    if missing:
+        raise KeyError(f"Sections not in the catalogue: {', '.join(missing)}")
+    return load_catalogue()[[index[n] for n in names]]
+
+
+def standard_plate(t_req):
+    """Smallest stocked plate ≥ t_req (0 when none is needed, NaN beyond the largest plate)."""
+    t_req = np.asarray(t_req, dtype=float)
+    return np.where(t_req <= 0.0, 0.0, standard_thickness(t_req))
+
+
+# ----------------------------
+# Concentrated flange forces (AISC 360-10 J10)
+# ----------------------------
+def flange_force_strengths(col, tb, Fyc: float, at_end=False, E: float = 200000.0) -> dict:
+    """
+    Design strengths (kN) of an unstiffened column against a beam-flange force of bearing length tb (mm):
+    flange local bending 6.25·Fyf·tf², web local yielding Fyw·tw·(5k + lb) and web crippling.
+    k is taken as the flange thickness (catalogue fillets are neglected). Arrays broadcast.
+    """
+    d, tw, tf = (np.asarray(col[k], dtype=float) for k in ("d", "tw", "tf"))
+    tb = np.asarray(tb, dtype=float)
+    at_end = np.asarray(at_end, dtype=bool)
+    k = tf
+    flb = PHI_FLB * 6.25 * Fyc * tf ** 2 * np.where(at_end, 0.5, 1.0)
+    wly = PHI_WLY * Fyc * tw * (np.where(at_end, 2.5, 5.0) * k + tb)
+    crip = tw ** 2 * (1.0 + 3.0 * (tb / d) * (tw / tf) ** 1.5) * np.sqrt(E * Fyc * tf / tw)
+    wc = PHI_WC * np.where(at_end, 0.40, 0.80) * crip
+    return {"FLB": flb / 1e3, "WLY": wly / 1e3, "WC": wc / 1e3}
+
+
+def panel_zone_strength(col, Fyc: float, Pu):
+    """φRv (kN) of the column web panel, reduced by (1.4 − Pr/Pc) when Pr > 0.4Pc (J10-9, J10-10)."""
+    d, tw, A = (np.asarray(col[k], dtype=float) for k in ("d", "tw", "A"))
+    ratio = np.abs(np.asarray(Pu, dtype=float)) * 1e3 / (Fyc * A)
+    return PHI_PZ * 0.6 * Fyc * d * tw * np.where(ratio <= 0.4, 1.0, 1.4 - ratio) / 1e3
+
+
+# ----------------------------
+# All joints of a moment frame
+# ----------------------------
+def check_joints(joints: pd.DataFrame, Fyc: float = 345.0, Fyd: float = 345.0, Fyst: float = 250.0,
+                 E: float = 200000.0, plug_welded: bool = False) -> pd.DataFrame:
+    """
+    Column-side checks of welded moment joints in one vectorized pass.
+
+    joints columns: "Joint", "Column", "Beam" (catalogue W sections), "Mu left (kN·m)", "Mu right (kN·m)",
+    "Pu (kN)" (column axial), "Vc (kN)" (column storey shear) and optional "At column end" (bool).
+    Panel demand Σ Mu/(db − tbf) − Vc against φRv; the shortfall sets the doubler plate; the flange force
+    above min(FLB, WLY, WC) sets continuity plates. The AISC 341 E3.6e(2) limit t ≥ (dz + wz)/90 applies to
+    the column web and the doubler separately; only with plug_welded (doubler plug-welded to the web) may
+    their combined thickness meet it, and a web that fails alone then always gets a doubler.
+    """
+    col = _sections(joints["Column"])
+    beam = _sections(joints["Beam"])
+    db, tbf = (np.asarray(beam[k], dtype=float) for k in ("d", "tf"))
+    dc, twc, tcf, bcf = (np.asarray(col[k], dtype=float) for k in ("d", "tw", "tf", "bf"))
+    Ml = joints["Mu left (kN·m)"].to_numpy(float)
+    Mr = joints["Mu right (kN·m)"].to_numpy(float)
+    Pu = joints["Pu (kN)"].to_numpy(float)
+    Vc = joints["Vc (kN)"].to_numpy(float)
+    at_end = joints["At column end"].to_numpy(bool) if "At column end" in joints else np.zeros(len(joints), bool)
+
+    arm = db - tbf
+    Ff = np.maximum(np.abs(Ml), np.abs(Mr)) * 1e3 / arm        # largest single flange force (kN)
+    V_pz = (np.abs(Ml) + np.abs(Mr)) * 1e3 / arm - np.abs(Vc)  # panel shear, beams in double curvature (sway)
+
+    strengths = flange_force_strengths(col, tbf, Fyc, at_end, E)
+    tension = np.minimum(strengths["FLB"], strengths["WLY"])
+    compression = np.minimum(strengths["WLY"], strengths["WC"])
+    phiRv = panel_zone_strength(col, Fyc, Pu)
+
+    # doubler plate: carry the shortfall and meet the (dz + wz)/90 buckling limit, each plate on its own
+    # unless plug-welded to the web
+    td_shear = np.maximum(V_pz - phiRv, 0.0) * 1e3 / (PHI_PZ * 0.6 * Fyd * dc)
+    dz, wz = db - 2.0 * tbf, dc - 2.0 * tcf
+    t_limit = (dz + wz) / 90.0
+    web_thin = twc < t_limit
+    if plug_welded:
+        td_req = np.where((td_shear > 0.0) | web_thin, np.maximum(td_shear, t_limit - twc), 0.0)
+    else:
+        td_req = np.where(td_shear > 0.0, np.maximum(td_shear, t_limit), 0.0)
+
+    # continuity plates: a pair of stiffeners carries the flange-force excess
+    excess = np.maximum(Ff - np.minimum(tension, compression), 0.0)
+    bs = (bcf - twc) / 2.0
+    ts_req = np.where(excess > 0.0, np.maximum(excess * 1e3 / (PHI_ST * Fyst * 2.0 * bs), tbf / 2.0), 0.0)
+
+    out = joints.copy()
+    out["Ff (kN)"] = Ff
+    out["φRn FLB (kN)"] = strengths["FLB"]
+    out["φRn WLY (kN)"] = strengths["WLY"]
+    out["φRn WC (kN)"] = strengths["WC"]
+    out["Continuity plates"] = np.where(excess > 0.0, "Required", "Not required")
+    out["Stiffener t (mm)"] = standard_plate(ts_req)
+    out["Vpz (kN)"] = V_pz
+    out["φRv (kN)"] = phiRv
+    out["Panel ratio"] = V_pz / phiRv
+    out["(dz + wz)/90 (mm)"] = t_limit
+    out["Doubler t (mm)"] = standard_plate(td_req)
+    out["Status"] = np.where(np.isnan(out["Doubler t (mm)"]) | np.isnan(out["Stiffener t (mm)"]), "Column too weak",
+                             np.where(web_thin & (not plug_welded), "Web thinner than (dz + wz)/90",
+                                      np.where((excess > 0.0) | (td_req > 0.0), "OK with plates", "OK")))
+    return out.round(2)
@@ -0,0 +1,207 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from src.calculations.steel.sections import CACHE_NPY, DATA_DIR, load_catalogue, name_index
+
+# ----------------------------
+# Constants
+# ----------------------------
+PHI_C = 0.90  # compression (NSCP 2015 §505 / AISC 360 E1)
+KL_STEP = 50.0  # mm
+KL_GRID = np.arange(0.0, 20000.0 + KL_STEP, KL_STEP)  # effective length grid about the minor radius
+
+
+def _field(sec, name):
+    return np.asarray(sec[name], dtype=float)
+
+
+def minor_radius(sec) -> np.ndarray:
+    """Least radius of gyration (rz for angles, min(rx, ry) otherwise)."""
+    return np.minimum(np.minimum(_field(sec, "rx"), _field(sec, "ry")), _field(sec, "rz"))
+
+
+# ----------------------------
+# AISC E3 / E7
+# ----------------------------
+def critical_stress(Fy, Fe, Q=1.0):
+    """Fcr (MPa) = Q·0.658^(QFy/Fe)·Fy when QFy/Fe ≤ 2.25, else 0.877 Fe (E3-2/3, E7-2/3)."""
+    Fy = np.asarray(Fy, dtype=float)
+    Fe = np.asarray(Fe, dtype=float)
+    Q = np.asarray(Q, dtype=float)
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        ratio = np.where(Fe > 0, Q * Fy / Fe, np.inf)
+        return np.where(ratio <= 2.25, Q * 0.658 ** ratio * Fy, 0.877 * Fe)
+
+
+def _qs_unstiffened(b_t, Fy, E, k_lim=(0.56, 1.03), k_eq=(1.415, 0.74, 0.69)):
+    """Qs of unstiffened elements (E7-4 … E7-6; angles use E7-10 … E7-12 constants)."""
+    root = np.sqrt(E / Fy)
+    inelastic = k_eq[0] - k_eq[1] * b_t / root
+    with np.errstate(divide="ignore"):
+        elastic = k_eq[2] * E / (Fy * b_t ** 2)
+    return np.where(b_t <= k_lim[0] * root, 1.0, np.where(b_t <= k_lim[1] * root, inelastic, elastic))
+
+
+def _effective_width(b, t, f, E, c=0.34):
+    """be = 1.92 t √(E/f) [1 − c/(b/t) √(E/f)] ≤ b for stiffened elements (E7-17 / E7-18)."""
+    root = np.sqrt(E / f)
+    be = 1.92 * t * root * (1.0 - c / (b / t) * root)
+    return np.clip(be, 0.0, b)
+
+
+def slenderness_factor(sec, Fy: float, E: float = 200000.0, f=None) -> np.ndarray:
+    """
+    Q = Qs·Qa for slender-element sections (AISC 360-10 E7).
+    f is the stress used for effective widths (defaults to Fy, conservative); arrays broadcast.
+    """
+    kind = np.asarray(sec["type"])
+    d, bf, tw, tf = _field(sec, "d"), _field(sec, "bf"), _field(sec, "tw"), _field(sec, "tf")
+    h, lip, A = _field(sec, "h"), _field(sec, "lip"), _field(sec, "A")
+    f = Fy if f is None else np.asarray(f, dtype=float)
+    root = np.sqrt(E / Fy)
+
+    # unstiffened elements → Qs
+    flange_bt = np.where(kind == "C", bf / tf, bf / (2.0 * tf))
+    Qs_flange = _qs_unstiffened(flange_bt, Fy, E)
+    Qs_angle = _qs_unstiffened(np.maximum(d, bf) / tw, Fy, E, (0.45, 0.91), (1.34, 0.76, 0.53))
+    Qs_lip = _qs_unstiffened(lip / tw, Fy, E)
+    Qs = np.select([np.isin(kind, ["W", "C"]), kind == "L", np.isin(kind, ["CF-C", "CF-Z"])],
+                   [Qs_flange, Qs_angle, Qs_lip], 1.0)
+
+    # stiffened elements → Qa = Aeff / A
+    web_loss = np.where(h / tw > 1.49 * root, (h - _effective_width(h, tw, f, E)) * tw, 0.0)
+    hss_b = bf - 3.0 * tw
+    hss_loss = 2.0 * np.where(h / tw > 1.40 * root, (h - _effective_width(h, tw, f, E, 0.38)) * tw, 0.0) \
+        + 2.0 * np.where(hss_b / tw > 1.40 * root, (hss_b - _effective_width(hss_b, tw, f, E, 0.38)) * tw, 0.0)
+    cf_b = bf - 2.0 * tw
+    cf_loss = web_loss + 2.0 * np.where(cf_b / tw > 1.49 * root, (cf_b - _effective_width(cf_b, tw, f, E)) * tw, 0.0)
+    loss = np.select([np.isin(kind, ["W", "C"]), kind == "HSS", np.isin(kind, ["CF-C", "CF-Z"])],
+                     [web_loss, hss_loss, cf_loss], 0.0)
+    Qa = (A - loss) / A
+    return Qs * Qa
+
+
+def compressive_strength(sec, Fy: float, KL, E: float = 200000.0) -> np.ndarray:
+    """
+    Nominal Pn (kN) for flexural buckling about the least radius, including slender-element Q.
+    KL (mm) broadcasts against the sections, e.g. KL[:, None] → lengths × sections.
+    """
+    r = minor_radius(sec)
+    KL = np.asarray(KL, dtype=float)
+    with np.errstate(divide="ignore"):
+        Fe = np.pi ** 2 * E / (KL / r) ** 2
+    Fcr_q1 = critical_stress(Fy, Fe, 1.0)
+    Q = slenderness_factor(sec, Fy, E, np.maximum(Fcr_q1, 1e-6))
+    return critical_stress(Fy, Fe, Q) * _field(sec, "A") / 1000.0
+
+
+# ----------------------------
+# Persisted capacity table
+# ----------------------------
+def _table_path(Fy: float, E: float):
+    return DATA_DIR / f"column_capacity_Fy{Fy:g}_E{E:g}.npy"
+
+
+def build_capacity_table(Fy: float, E: float = 200000.0) -> np.ndarray:
+    """ΦPn (kN) for every catalogue section (rows) across KL_GRID (columns), float32."""
+    table = load_catalogue()
+    return (PHI_C * compressive_strength(table, Fy, KL_GRID[:, None], E)).T.astype(np.float32)
+
+
+@lru_cache(maxsize=8)
+def capacity_table(Fy: float, E: float = 200000.0) -> np.ndarray:
+    """Lazily build or memory-map the ΦPn table for one steel grade."""
+    catalogue = load_catalogue()
+    path = _table_path(Fy, E)
+    if path.exists() and CACHE_NPY.exists() and path.stat().st_mtime >= CACHE_NPY.stat().st_mtime:
+        cached = np.load(path, mmap_mode="r")
+        if cached.shape == (catalogue.size, KL_GRID.size):
+            return cached
+    data = build_capacity_table(Fy, E)
+    try:
+        tmp = path.with_suffix(f".{os.getpid()}.tmp.npy")
+        np.save(tmp, data)
+        os.replace(tmp, path)
+    except OSError:
+        return data
+    return np.load(path, mmap_mode="r")
+
+
+def _interp_rows(table: np.ndarray, rows, KL):
+    """Linear interpolation on the uniform KL grid for many (row, KL) pairs at once."""
+    pos = np.clip(np.asarray(KL, dtype=float) / KL_STEP, 0.0, KL_GRID.size - 1.0)
+    i0 = np.minimum(np.floor(pos).astype(int), KL_GRID.size - 2)
+    t = pos - i0
+    rows = np.broadcast_to(rows, pos.shape)
+    return (1.0 - t) * table[rows, i0] + t * table[rows, i0 + 1]
+
+
+def design_compression(rows, KL, Fy: float, E: float = 200000.0):
+    """
+    ΦPn (kN) of catalogue rows at KL (mm), arrays broadcast: interpolation on the cached table within
+    KL_GRID, closed-form E3 / E7 beyond it (never clamped to the last tabulated value).
+    """
+    rows, KL = np.broadcast_arrays(np.asarray(rows), np.asarray(KL, dtype=float))
+    phiPn = np.asarray(_interp_rows(capacity_table(float(Fy), float(E)), rows, KL), dtype=float)
+    beyond = KL > KL_GRID[-1]
+    if beyond.any():
+        phiPn = phiPn.copy()
+        phiPn[beyond] = PHI_C * compressive_strength(load_catalogue()[rows[beyond]], Fy, KL[beyond], E)
+    return phiPn
+
+
+def equivalent_length(sec, KxL, KyL):
+    """Effective length about the least radius that gives the governing KL/r."""
+    r = minor_radius(sec)
+    return np.maximum(np.asarray(KxL, dtype=float) * r / _field(sec, "rx"),
+                      np.asarray(KyL, dtype=float) * r / _field(sec, "ry"))
+
+
+def column_capacity(section: str, Fy: float, KxL, KyL, E: float = 200000.0):
+    """ΦPn (kN) of a catalogue section by table lookup (closed form beyond the grid)."""
+    table = load_catalogue()
+    row = name_index()[section]
+    KL = equivalent_length(table[row], KxL, KyL)
+    phiPn = design_compression(row, KL, Fy, E)
+    return float(phiPn) if np.ndim(phiPn) == 0 else phiPn
+
+
+def select_columns(schedule: pd.DataFrame, Fy: float = 345.0, E: float = 200000.0, kinds=("W",),
+                   n_alternatives: int = 5) -> tuple:
+    """
+    Lightest section for every column of a schedule in one call.
+    schedule columns: "Pu (kN)", "KxL (mm)", "KyL (mm)".
+    Returns (summary DataFrame, {column index: ranked alternatives DataFrame}).
+    """
+    table = load_catalogue()
+    rows = np.flatnonzero(np.isin(table["type"], list(kinds)))
+    rows = rows[np.argsort(table["mass"][rows], kind="stable")]
+    sec = table[rows]
+
+    Pu = schedule["Pu (kN)"].to_numpy(float)[:, None]
+    KL = equivalent_length(sec, schedule["KxL (mm)"].to_numpy(float)[:, None], schedule["KyL (mm)"].to_numpy(float)[:, None])
+    slender_ok = KL / minor_radius(sec) <= 200.0
+    phiPn = design_compression(rows[None, :], KL, Fy, E)
+    ratio = Pu / phiPn
+    ok = (ratio <= 1.0) & slender_ok
+
+    summary = []
+    alternatives = {}
+    for i in range(len(schedule)):
+        passing = np.flatnonzero(ok[i])[:n_alternatives]
+        alternatives[i] = pd.DataFrame({
+            "Section": [str(n) for n in sec["name"][passing]],
+            "Mass (kg/m)": sec["mass"][passing],
+            "ΦPn (kN)": np.round(phiPn[i, passing], 1),
+            "Pu/ΦPn": np.round(ratio[i, passing], 3),
+        })
+        best = passing[0] if passing.size else None
+        summary.append({
+            **schedule.iloc[i].to_dict(),
+            "Lightest section": str(sec["name"][best]) if best is not None else "None passes",
+            "ΦPn (kN)": round(float(phiPn[i, best]), 1) if best is not None else np.nan,
+            "Pu/ΦPn": round(float(ratio[i, best]), 3) if best is not None else np.nan,
+        })
+    return pd.DataFrame(summary), alternatives
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+from src.calculations.steel.compression import column_capacity
+from src.calculations.steel.sections import load_catalogue, name_index
+
+PHI_V_LINK = 0.90
+SHEAR_LINK = 1.6    # e ≤ 1.6 Mp/Vp: shear yielding governs
+FLEXURE_LINK = 2.6  # e ≥ 2.6 Mp/Vp: flexural yielding governs
+ROTATION_LIMITS = (0.08, 0.02)  # rad, shear / flexural links (AISC 341 F3.4a)
+OVERSTRENGTH = 1.25  # I-shaped links: adjusted link shear strength 1.25 Ry Vn (AISC 341 F3.3)
+BEAM_REDUCTION = 0.88  # beam outside the link may use 88 % of the adjusted link forces
+COLUMN_OVERSTRENGTH = 1.1
+
+
+# ----------------------------
+# Link strength and classification (AISC 341 F3.5b)
+# ----------------------------
+def link_strength(sec, Fy: float, Pu=0.0) -> dict:
+    """
+    Vp, Mp (kN, kN·m) with the axial reduction for Pr/Pc > 0.15 and the link length ratio limits.
+    sec may be one catalogue record or an array of them; Pu broadcasts.
+    """
+    d, tw, tf, Zx, A = (np.asarray(sec[k], dtype=float) for k in ("d", "tw", "tf", "Zx", "A"))
+    Alw = (d - 2.0 * tf) * tw
+    rho = np.abs(np.asarray(Pu, dtype=float)) / (Fy * A / 1000.0)
+    high = rho > 0.15
+    Vp = 0.6 * Fy * Alw / 1000.0 * np.where(high, np.sqrt(np.clip(1.0 - rho ** 2, 0.0, None)), 1.0)
+    Mp = Fy * Zx / 1e6 * np.where(high, np.clip((1.0 - rho) / 0.85, 0.0, 1.0), 1.0)
+    return {"Vp": Vp, "Mp": Mp, "ratio": Mp * 1000.0 / np.maximum(Vp, 1e-9), "rho": rho}
+
+
+def link_rotation_limit(e, Mp_Vp):
+    """0.08 rad for shear links, 0.02 rad for flexural links, linear between 1.6 and 2.6 Mp/Vp."""
+    x = np.asarray(e, dtype=float) / np.asarray(Mp_Vp, dtype=float)
+    return np.interp(x, [SHEAR_LINK, FLEXURE_LINK], ROTATION_LIMITS)
+
+
+def link_class(e, Mp_Vp):
+    """Shear (e ≤ 1.6Mp/Vp), intermediate or flexural (e ≥ 2.6Mp/Vp) link."""
+    x = np.asarray(e, dtype=float) / np.asarray(Mp_Vp, dtype=float)
+    return np.where(x <= SHEAR_LINK, "Shear", np.where(x >= FLEXURE_LINK, "Flexural", "Intermediate"))
+
+
+# ----------------------------
+# All links of an EBF system
+# ----------------------------
+def check_links(links: pd.DataFrame, Fy: float = 345.0, Ry: float = 1.1, Cd: float = 4.0,
+                E: float = 200000.0, kinds=("W",)) -> tuple:
+    """
+    Split-K (centred link) EBF: link checks and capacity-design forces for every link at once.
+
+    links columns: "Link", "Frame", "Storey" (1 = lowest), "Section", "e (mm)", "Bay (mm)", "h (mm)",
+    "Δe (mm)" (elastic storey drift), "Vu (kN)", "Pu (kN)" and optional "Brace section".
+    Link rotation γp = (Bay/e)·θp with θp = Cd·Δe/h. Braces and beams outside the link are designed
+    for the adjusted link shear 1.25·Ry·Vn (beam at 88 %), columns for Σ 1.1·Ry·Vn of the links above.
+    Returns (per-link results, lightest passing W link per row).
+    """
+    index = name_index()
+    missing = sorted(set(links["Section"]) - set(index))
+    if missing:
+        raise KeyError(f"Sections not in the catalogue: {', '.join(missing)}")
+    table = load_catalogue()
+    sec = table[[index[s] for s in links["Section"]]]
+
+    e = links["e (mm)"].to_numpy(float)
+    bay = links["Bay (mm)"].to_numpy(float)
+    h = links["h (mm)"].to_numpy(float)
+    Vu = links["Vu (kN)"].to_numpy(float)
+    Pu = links["Pu (kN)"].to_numpy(float)
+    theta_p = Cd * links["Δe (mm)"].to_numpy(float) / h
+    gamma = bay / e * theta_p
+
+    s = link_strength(sec, Fy, Pu)
+    Vn = np.minimum(s["Vp"], 2.0 * s["Mp"] / (e / 1000.0))
+    gamma_limit = link_rotation_limit(e, s["ratio"])
+    flange_limit = np.where(e <= SHEAR_LINK * s["ratio"], 0.40, 0.32) * np.sqrt(E / (Ry * Fy))
+    flange_ok = sec["bf"] / (2.0 * sec["tf"]) <= flange_limit
+
+    # capacity design from the adjusted link shear strength
+    V_adj = OVERSTRENGTH * Ry * Vn
+    M_adj = V_adj * e / 2000.0                       # kN·m, equal link end moments
+    half = (bay - e) / 2.0
+    alpha = np.arctan2(h, half)
+    brace_L = np.hypot(h, half)
+    P_brace = V_adj / np.sin(alpha)
+    out = links.copy()
+    out["Class"] = link_class(e, s["ratio"])
+    out["e / (Mp/Vp)"] = e / s["ratio"]
+    out["ΦVn (kN)"] = PHI_V_LINK * Vn
+    out["Vu/ΦVn"] = Vu / (PHI_V_LINK * Vn)
+    out["γp (rad)"] = gamma
+    out["γp limit (rad)"] = gamma_limit
+    out["Flange compact"] = flange_ok
+    out["Brace Pu (kN)"] = P_brace
+    out["Brace L (mm)"] = brace_L
+    out["Beam Pu (kN)"] = BEAM_REDUCTION * P_brace * np.cos(alpha)
+    out["Beam Mu (kN·m)"] = BEAM_REDUCTION * M_adj
+    if "Brace section" in links:
+        phiPn = np.array([column_capacity(b, Fy, L, L, E) if b in index else np.nan
+                          for b, L in zip(links["Brace section"], brace_L)])
+        out["Brace ΦPn (kN)"] = phiPn
+        out["Brace ratio"] = P_brace / phiPn
+
+    # columns: sum over the links at and above each storey of the same frame (both columns of the bay)
+    col_link = COLUMN_OVERSTRENGTH * Ry * Vn
+    order = links["Storey"].to_numpy(int)
+    frame = links["Frame"].astype(str).to_numpy()
+    out["Column Pu,E (kN)"] = [col_link[(frame == f) & (order >= k)].sum() for f, k in zip(frame, order)]
+
+    passes = (out["Vu/ΦVn"] <= 1.0) & (gamma <= gamma_limit) & flange_ok
+    if "Brace ratio" in out:
+        passes &= out["Brace ratio"].fillna(np.inf) <= 1.0
+    out["Status"] = np.where(passes, "OK", "FAIL")
+
+    # lightest W link per row: links × sections in one pass
+    rows = np.flatnonzero(np.isin(table["type"], list(kinds)))
+    rows = rows[np.argsort(table["mass"][rows], kind="stable")]
+    cand = table[rows]
+    sc = link_strength(cand[None, :], Fy, Pu[:, None])
+    Vn_c = np.minimum(sc["Vp"], 2.0 * sc["Mp"] / (e[:, None] / 1000.0))
+    ok = (Vu[:, None] <= PHI_V_LINK * Vn_c) & (gamma[:, None] <= link_rotation_limit(e[:, None], sc["ratio"])) \
+        & (cand["bf"] / (2.0 * cand["tf"]) <= np.where(e[:, None] <= SHEAR_LINK * sc["ratio"], 0.40, 0.32) * np.sqrt(E / (Ry * Fy)))
+    best = np.argmax(ok, axis=1)
+    found = ok.any(axis=1)
+    i = np.arange(len(links))
+    lightest = pd.DataFrame({
+        "Link": links["Link"].to_numpy(),
+        "Lightest link": np.where(found, cand["name"][best].astype(str), "None passes"),
+        "Mass (kg/m)": np.where(found, cand["mass"][best], np.nan),
+        "Class": np.where(found, link_class(e, sc["ratio"][i, best]), ""),
+        "ΦVn (kN)": np.where(found, PHI_V_LINK * Vn_c[i, best], np.nan),
+    })
+    return out.round(3), lightest.round(3)
@@ -0,0 +1,144 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from src.calculations.steel.baseplate import PLATE_THICKNESSES
+
+CONFIGS = ("4E", "4ES", "8ES")
+BOLT_DIAMETERS = np.array([16.0, 20.0, 22.0, 24.0, 27.0, 30.0, 36.0])
+PHI_B = 0.90  # plate / column flange yielding
+PHI_N = 0.75  # bolt rupture
+
+
+# ----------------------------
+# Geometry (AISC 358 Ch. 6 / Design Guide 4 notation)
+# ----------------------------
+def lever_arms(config: str, d: float, tf: float, pfo: float, pfi: float, pb: float = 0.0) -> tuple:
+    """Distances (mm) from the compression flange centre to each tension bolt row, outermost first."""
+    h_out = d - tf / 2.0 + pfo
+    h_in = d - 1.5 * tf - pfi
+    if config == "8ES":
+        return h_out + pb, h_out, h_in, h_in - pb
+    return h_out, h_in
+
+
+@lru_cache(maxsize=1024)
+def plate_yield_line(config: str, bp: float, g: float, pfo: float, pfi: float, de: float, pb: float,
+                     d: float, tf: float) -> float:
+    """End-plate yield-line parameter Yp (mm) for the 4E, 4ES and 8ES configurations (AISC 358 Tables 6.2-6.4)."""
+    s = 0.5 * np.sqrt(bp * g)
+    pfi = min(pfi, s)
+    if config == "4E":
+        h0, h1 = lever_arms(config, d, tf, pfo, pfi)
+        return float(bp / 2.0 * (h1 * (1.0 / pfi + 1.0 / s) + h0 / pfo - 0.5) + 2.0 / g * h1 * (pfi + s))
+    if config == "4ES":
+        h0, h1 = lever_arms(config, d, tf, pfo, pfi)
+        if de <= s:
+            return float(bp / 2.0 * (h1 * (1.0 / pfi + 1.0 / s) + h0 * (1.0 / pfo + 1.0 / (2.0 * de)))
+                         + 2.0 / g * (h1 * (pfi + s) + h0 * (de + pfo)))
+        return float(bp / 2.0 * (h1 * (1.0 / pfi + 1.0 / s) + h0 * (1.0 / s + 1.0 / pfo))
+                     + 2.0 / g * (h1 * (pfi + s) + h0 * (s + pfo)))
+    if config == "8ES":
+        h1, h2, h3, h4 = lever_arms(config, d, tf, pfo, pfi, pb)
+        edge, edge_len = (1.0 / (2.0 * de), de) if de <= s else (1.0 / s, s)
+        return float(bp / 2.0 * (h1 * edge + h2 / pfo + h3 / pfi + h4 / s)
+                     + 2.0 / g * (h1 * (edge_len + pb / 4.0) + h2 * (pfo + 0.75 * pb) + h3 * (pfi + pb / 4.0)
+                                  + h4 * (s + 0.75 * pb) + pb ** 2) + g)
+    raise ValueError(f"Unknown end-plate configuration: {config}")
+
+
+@lru_cache(maxsize=1024)
+def column_flange_yield_line(config: str, bcf: float, g: float, pfo: float, pfi: float, pb: float,
+                             d: float, tf: float) -> float:
+    """Unstiffened column-flange yield-line parameter Yc (mm) (AISC 358 Tables 6.5 / 6.6)."""
+    s = 0.5 * np.sqrt(bcf * g)
+    c = pfo + pfi + tf
+    if config == "8ES":
+        h1, h2, h3, h4 = lever_arms(config, d, tf, pfo, pfi, pb)
+        return float(bcf / 2.0 * (h1 / s + h4 / s)
+                     + 2.0 / g * (h1 * (pb + c / 2.0 + s) + h2 * (pb / 2.0 + c / 4.0) + h3 * (pb / 2.0 + c / 2.0) + h4 * s)
+                     + g / 2.0)
+    h0, h1 = lever_arms(config, d, tf, pfo, pfi)
+    return float(bcf / 2.0 * (h1 / s + h0 / s) + 2.0 / g * (h1 * (s + 0.75 * c) + h0 * (s + c / 4.0) + c ** 2 / 2.0) + g / 2.0)
+
+
+# ----------------------------
+# Bolts with prying (AISC Manual Part 9, T-stub per bolt row)
+# ----------------------------
+def prying_factor(t, d_bolt, b, a, p, Fu_plate: float, phi_rn):
+    """
+    Q = available / full bolt tension for plate thickness t (mm) and bolt design tension φrn (kN).
+    b: bolt to flange face, a: bolt to plate edge (≤ 1.25b), p: tributary width per bolt (mm).
+    """
+    t, d_bolt, phi_rn = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (t, d_bolt, phi_rn)))
+    b_ = b - d_bolt / 2.0
+    a_ = np.minimum(a, 1.25 * b) + d_bolt / 2.0
+    delta = 1.0 - (d_bolt + np.where(d_bolt <= 22.0, 2.0, 3.0)) / p  # standard holes
+    rho = b_ / a_
+    tc = np.sqrt(4.0 * phi_rn * 1e3 * b_ / (PHI_B * p * Fu_plate))
+    alpha = ((tc / t) ** 2 - 1.0) / (delta * (1.0 + rho))
+    Q = np.where(alpha < 0.0, 1.0, (t / tc) ** 2 * (1.0 + delta * np.clip(alpha, 0.0, 1.0)))
+    return np.minimum(Q, 1.0)
+
+
+# ----------------------------
+# Connection strength and auto-sizing
+# ----------------------------
+def endplate_strength(config: str, tp, d_bolt, bp: float, g: float, pfo: float, pfi: float, de: float,
+                      pb: float, d: float, tf: float, Fyp: float, Fup: float, Fnt: float) -> dict:
+    """
+    Design moments (kN·m) of an extended end plate for arrays of plate thickness tp and bolt diameter:
+    plate yielding φb·Fyp·tp²·Yp and bolt rupture Σ 2·φ·Fnt·Ab·Q·h over the tension rows with prying.
+    """
+    Yp = plate_yield_line(config, bp, g, pfo, pfi, de, pb, d, tf)
+    h = lever_arms(config, d, tf, pfo, pfi, pb)
+    tp = np.asarray(tp, dtype=float)
+    d_bolt = np.asarray(d_bolt, dtype=float)
+    phi_rn = PHI_N * Fnt * np.pi * d_bolt ** 2 / 4.0 / 1e3
+    p = bp / 2.0
+    # extended rows pry against the plate edge, rows inside the flanges against the web zone
+    Q_out = prying_factor(tp, d_bolt, pfo, de, p, Fup, phi_rn)
+    Q_in = prying_factor(tp, d_bolt, pfi, 1.25 * pfi, p, Fup, phi_rn)
+    n_out = len(h) // 2
+    bolts = sum(2.0 * phi_rn * (Q_out if i < n_out else Q_in) * hi for i, hi in enumerate(h)) / 1e3
+    return {
+        "Yp": Yp,
+        "plate": PHI_B * Fyp * tp ** 2 * Yp / 1e6,
+        "bolts": bolts,
+        "bolts (no prying)": 2.0 * phi_rn * sum(h) / 1e3,
+        "Q": np.minimum(Q_out, Q_in),
+    }
+
+
+def column_flange_strength(config: str, bcf: float, tcf: float, twc: float, Fyc: float, g: float, pfo: float,
+                           pfi: float, pb: float, d: float, tf: float, tp) -> dict:
+    """Unstiffened column flange flexure φ·Fyc·tcf²·Yc (kN·m) and web local yielding at the beam flange (kN)."""
+    Yc = column_flange_yield_line(config, bcf, g, pfo, pfi, pb, d, tf)
+    return {
+        "Yc": Yc,
+        "flange": PHI_B * Fyc * tcf ** 2 * Yc / 1e6,
+        "web yielding": 1.0 * Fyc * twc * (6.0 * tcf + tf + 2.0 * np.asarray(tp, dtype=float)) / 1e3,
+    }
+
+
+def size_endplate(Mu: float, Vu: float, config: str, bp: float, g: float, pfo: float, pfi: float, de: float,
+                  pb: float, d: float, tf: float, Fyp: float, Fup: float, Fnt: float, Fnv: float) -> pd.DataFrame:
+    """
+    Every stocked plate thickness × bolt diameter checked in one vectorized pass (Yp is cached per geometry).
+    Shear is taken by the compression-side bolts (as many as in tension). Sorted thinnest plate, smallest bolt.
+    """
+    tp, db = np.meshgrid(PLATE_THICKNESSES, BOLT_DIAMETERS, indexing="ij")
+    res = endplate_strength(config, tp, db, bp, g, pfo, pfi, de, pb, d, tf, Fyp, Fup, Fnt)
+    n_shear = 2 * len(lever_arms(config, d, tf, pfo, pfi, pb))
+    phi_vn = PHI_N * Fnv * np.pi * db ** 2 / 4.0 / 1e3 * n_shear
+    grid = pd.DataFrame({
+        "tp (mm)": tp.ravel(),
+        "Bolt Ø (mm)": db.ravel(),
+        "φMpl (kN·m)": res["plate"].ravel(),
+        "φMnp (kN·m)": res["bolts"].ravel(),
+        "Q": res["Q"].ravel(),
+        "φVn (kN)": phi_vn.ravel(),
+    })
+    grid["Ratio"] = np.maximum.reduce([Mu / grid["φMpl (kN·m)"], Mu / grid["φMnp (kN·m)"], Vu / grid["φVn (kN)"]])
+    grid["Passes"] = grid["Ratio"] <= 1.0
+    return grid.sort_values(["Passes", "tp (mm)", "Bolt Ø (mm)"], ascending=[False, True, True], ignore_index=True).round(3)
@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+
+PHI_T_RUPTURE = 0.75  # tensile rupture and block shear (AISC D2-2, J4.3)
+PHI_T_YIELD = 0.90
+
+
+# ----------------------------
+# Holes & bolt layouts
+# ----------------------------
+def hole_diameter(d_bolt: float, damage: float = 2.0) -> float:
+    """Standard hole (d + 2 mm up to M22, d + 3 mm above) plus the 2 mm damage allowance of AISC B4.3b."""
+    return d_bolt + (2.0 if d_bolt <= 22.0 else 3.0) + damage
+
+
+def bolt_grid(n_rows: int, n_cols: int, pitch: float, gauge: float, end_dist: float, edge_dist: float,
+              stagger: float = 0.0) -> tuple:
+    """
+    Bolt coordinates of a rectangular (optionally staggered) layout and the plate width.
+    x runs along the load from the loaded end of the plate, y across from one side edge.
+    Rows are gauge lines; alternate gauge lines are shifted by `stagger` along x.
+    """
+    y = edge_dist + np.arange(n_rows) * gauge
+    x = end_dist + np.arange(n_cols) * pitch
+    xx = x[None, :] + (np.arange(n_rows) % 2)[:, None] * stagger
+    yy = np.repeat(y[:, None], n_cols, axis=1)
+    width = 2.0 * edge_dist + (n_rows - 1) * gauge
+    return np.column_stack([xx.ravel(), yy.ravel()]), width
+
+
+# ----------------------------
+# Net section (AISC B4.3b, s²/4g)
+# ----------------------------
+def critical_net_width(xy, width: float, d_hole: float) -> tuple:
+    """
+    Least net width W − Σd + Σs²/4g over all edge-to-edge fracture paths.
+
+    Paths cross the plate through holes of increasing y; dynamic programming over the holes sorted by y
+    keeps only the best partial path ending at each hole, so the search is O(n²) instead of exponential.
+    Returns (net width mm, hole indices on the governing path).
+    """
+    xy = np.asarray(xy, dtype=float)
+    order = np.argsort(xy[:, 1], kind="stable")
+    x, y = xy[order, 0], xy[order, 1]
+    n = len(x)
+    best = np.full(n, d_hole)       # greatest width reduction of a path ending at each hole
+    prev = np.full(n, -1)
+    for j in range(n):
+        g = y[j] - y[:j]
+        ok = g > 1e-9
+        if not ok.any():
+            continue
+        gain = np.where(ok, best[:j] - (x[j] - x[:j]) ** 2 / (4.0 * np.where(ok, g, 1.0)), -np.inf)
+        i = int(np.argmax(gain))
+        if gain[i] > 0.0:
+            best[j] = d_hole + gain[i]
+            prev[j] = i
+    end = int(np.argmax(best)) if n else -1
+    path = []
+    while end >= 0:
+        path.append(int(order[end]))
+        end = prev[end]
+    reduction = best.max() if n else 0.0
+    return width - reduction, path[::-1]
+
+
+# ----------------------------
+# Block shear (AISC J4.3)
+# ----------------------------
+def _gauge_lines(xy):
+    """Gauge lines sorted by y with their innermost hole x and number of holes."""
+    xy = np.asarray(xy, dtype=float)
+    y_lines, inverse = np.unique(np.round(xy[:, 1], 6), return_inverse=True)
+    x_inner = np.zeros(y_lines.size)
+    np.maximum.at(x_inner, inverse, xy[:, 0])
+    count = np.bincount(inverse, minlength=y_lines.size)
+    return y_lines, x_inner, count
+
+
+def block_shear_paths(xy, width: float, t: float, d_hole: float, Fy: float, Fu: float, Ubs: float = 1.0) -> pd.DataFrame:
+    """
+    Every block-shear tear-out of a bolt layout: interior blocks between gauge lines a < b
+    (two shear planes) and edge blocks between a side edge and one line (one shear plane).
+    Shear planes run from the loaded end to the innermost hole of their gauge line; the tension plane
+    links the innermost holes of lines a…b with s²/4g stagger terms. Prefix sums make each block O(1).
+    Returns one row per block with areas (mm²) and φRn (kN), sorted weakest first.
+    """
+    y_lines, x_inner, count = _gauge_lines(xy)
+    g = np.diff(y_lines)
+    s = np.diff(x_inner)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        step = np.where(g > 0, g + s ** 2 / (4.0 * g), 0.0)
+    tension_cum = np.concatenate([[0.0], np.cumsum(step)])  # tension length from line 0 to line k
+
+    Agv_line = x_inner * t
+    Anv_line = (x_inner - (count - 0.5) * d_hole) * t
+
+    # interior blocks between gauge lines a < b: shear along both lines, tension across a…b
+    a, b = np.triu_indices(y_lines.size, k=1)
+    Agv = Agv_line[a] + Agv_line[b]
+    Anv = Anv_line[a] + Anv_line[b]
+    Ant = (tension_cum[b] - tension_cum[a] - (b - a) * d_hole) * t
+    # edge blocks: lower edge (y = 0) → line k, and line k → upper edge (one shear plane each)
+    idx = np.arange(y_lines.size)
+    edge_low_Ant = (y_lines[0] + tension_cum - (idx + 0.5) * d_hole) * t
+    edge_high_Ant = (width - y_lines[-1] + tension_cum[-1] - tension_cum - (y_lines.size - idx - 0.5) * d_hole) * t
+
+    blocks = pd.DataFrame({
+        "Block": [f"Lines {i + 1}–{j + 1}" for i, j in zip(a, b)] +
+                 [f"Edge → line {j + 1}" for j in idx] + [f"Line {i + 1} → edge" for i in idx],
+        "Type": ["Interior"] * a.size + ["Edge"] * (2 * idx.size),
+        "Agv (mm²)": np.concatenate([Agv, Agv_line, Agv_line]),
+        "Anv (mm²)": np.concatenate([Anv, Anv_line, Anv_line]),
+        "Ant (mm²)": np.concatenate([Ant, edge_low_Ant, edge_high_Ant]),
+    })
+    blocks["Ant (mm²)"] = blocks["Ant (mm²)"].clip(lower=0.0)
+    rupture = 0.6 * Fu * blocks["Anv (mm²)"] + Ubs * Fu * blocks["Ant (mm²)"]
+    yielding = 0.6 * Fy * blocks["Agv (mm²)"] + Ubs * Fu * blocks["Ant (mm²)"]
+    blocks["φRn (kN)"] = PHI_T_RUPTURE * np.minimum(rupture, yielding) / 1000.0
+    return blocks.sort_values("φRn (kN)", ignore_index=True).round(1)
+
+
+# ----------------------------
+# Tension member / splice plate
+# ----------------------------
+def plate_tension_check(xy, width: float, t: float, d_hole: float, Fy: float, Fu: float, U: float = 1.0,
+                        splice: bool = False, Ubs: float = 1.0) -> dict:
+    """Gross yielding, net-section fracture on the governing path and governing block shear (kN)."""
+    Ag = width * t
+    net_width, path = critical_net_width(xy, width, d_hole)
+    An = net_width * t
+    if splice:
+        An = min(An, 0.85 * Ag)  # bolted splice plates (AISC J4.1b)
+    blocks = block_shear_paths(xy, width, t, d_hole, Fy, Fu, Ubs)
+    return {
+        "Ag": Ag, "An": An, "path": path,
+        "yield": PHI_T_YIELD * Fy * Ag / 1000.0,
+        "fracture": PHI_T_RUPTURE * Fu * U * An / 1000.0,
+        "block": float(blocks["φRn (kN)"].iloc[0]),
+        "block_path": str(blocks["Block"].iloc[0]),
+        "blocks": blocks,
+    }
@@ -0,0 +1,180 @@
+from functools import lru_cache
+
+import numpy as np
+from src.calculations.steel.sections import get_section
+
+# ----------------------------
+# Resistance factors (NSCP 2015 §506 / AISC 360 LRFD)
+# ----------------------------
+PHI_B = 0.90
+PHI_V_ROLLED = 1.00  # rolled I-shapes with h/tw ≤ 2.24√(E/Fy)
+PHI_V = 0.90
+
+
+def _field(sec, name):
+    return np.asarray(sec[name], dtype=float)
+
+
+# ----------------------------
+# Flexure — doubly/singly symmetric I and channel shapes (AISC F2, F3)
+# ----------------------------
+def ltb_parameters(sec, Fy: float, E: float = 200000.0) -> dict:
+    """Lp, Lr (mm), rts (mm), c and Mp (N·mm) for each section (AISC F2-5 … F2-8)."""
+    Zx, Sx, ry = _field(sec, "Zx"), _field(sec, "Sx"), _field(sec, "ry")
+    Iy, Cw, J, ho = _field(sec, "Iy"), _field(sec, "Cw"), _field(sec, "J"), _field(sec, "ho")
+    is_channel = np.isin(np.asarray(sec["type"]), ["C", "CF-C"])
+    Cw_safe = np.where(Cw > 0, Cw, np.nan)
+    c = np.where(is_channel, ho / 2.0 * np.sqrt(Iy / Cw_safe), 1.0)
+    rts = np.sqrt(np.sqrt(Iy * Cw_safe) / Sx)
+    jc = J * c / (Sx * ho)
+    Lp = 1.76 * ry * np.sqrt(E / Fy)
+    Lr = 1.95 * rts * E / (0.7 * Fy) * np.sqrt(jc + np.sqrt(jc ** 2 + 6.76 * (0.7 * Fy / E) ** 2))
+    return {"Mp": Fy * Zx, "Lp": Lp, "Lr": Lr, "rts": rts, "jc": jc}
+
+
+def ltb_moment(sec, Fy: float, Lb, Cb=1.0, E: float = 200000.0) -> np.ndarray:
+    """Lateral-torsional buckling moment (N·mm, ≤ Mp) per AISC F2-1 … F2-4."""
+    p = ltb_parameters(sec, Fy, E)
+    Sx = _field(sec, "Sx")
+    Mp, Lp, Lr, rts, jc = p["Mp"], p["Lp"], p["Lr"], p["rts"], p["jc"]
+    Lb = np.asarray(Lb, dtype=float)
+    Cb = np.asarray(Cb, dtype=float)
+
+    M_inelastic = Cb * (Mp - (Mp - 0.7 * Fy * Sx) * (Lb - Lp) / (Lr - Lp))
+    slender = (Lb / rts) ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Fcr = Cb * np.pi ** 2 * E / slender * np.sqrt(1.0 + 0.078 * jc * slender)
+    M_ltb = np.where(Lb <= Lp, Mp, np.where(Lb <= Lr, M_inelastic, Fcr * Sx))
+    M_ltb = np.where(np.isnan(rts), Mp, M_ltb)  # sections without warping data: yielding only
+    return np.minimum(M_ltb, Mp)
+
+
+def flb_moment(sec, Fy: float, E: float = 200000.0) -> np.ndarray:
+    """Compression flange local buckling moment (N·mm, ≤ Mp) per AISC F3-1 / F3-2."""
+    Mp = Fy * _field(sec, "Zx")
+    Sx = _field(sec, "Sx")
+    # channels use the full flange width, I-shapes half of it
+    lam = _field(sec, "bf") / _field(sec, "tf")
+    lam = np.where(np.isin(np.asarray(sec["type"]), ["C", "CF-C", "CF-Z"]), lam, lam / 2.0)
+    lam_p = 0.38 * np.sqrt(E / Fy)
+    lam_r = 1.0 * np.sqrt(E / Fy)
+    kc = np.clip(4.0 / np.sqrt(_field(sec, "h") / _field(sec, "tw")), 0.35, 0.76)
+    M_noncompact = Mp - (Mp - 0.7 * Fy * Sx) * (lam - lam_p) / (lam_r - lam_p)
+    M_slender = 0.9 * E * kc * Sx / lam ** 2
+    M_flb = np.where(lam <= lam_p, Mp, np.where(lam <= lam_r, M_noncompact, M_slender))
+
+    # lipped cold-formed flanges are edge-stiffened: stiffened-element limits and Se (AISC F7)
+    t = _field(sec, "tf")
+    b = _field(sec, "bf") - 2.0 * t
+    lam_s = b / t
+    root = np.sqrt(E / Fy)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        be = np.clip(1.92 * t * root * (1.0 - 0.38 / lam_s * root), 0.0, b)
+        Se = Sx - (b - be) * t * (_field(sec, "ho") / 2.0) ** 2 / (_field(sec, "d") / 2.0)
+    M_stiffened = np.where(lam_s <= 1.12 * root, Mp, np.where(
+        lam_s <= 1.40 * root, Mp - (Mp - Fy * Sx) * (3.57 * lam_s / root - 4.0), Fy * Se))
+    lipped = np.isin(np.asarray(sec["type"]), ["CF-C", "CF-Z"]) & (_field(sec, "lip") > 0)
+    return np.minimum(np.where(lipped, M_stiffened, M_flb), Mp)
+
+
+def flexural_strength(sec, Fy: float, Lb, Cb=1.0, E: float = 200000.0) -> np.ndarray:
+    """
+    Nominal Mn (kN·m) about the strong axis: yielding, LTB (F2) and flange local buckling (F3).
+    Lb (mm) and Cb broadcast against the sections, e.g. Lb[:, None] gives a lengths × sections grid.
+    """
+    return np.minimum(ltb_moment(sec, Fy, Lb, Cb, E), flb_moment(sec, Fy, E)) / 1e6
+
+
+def minor_axis_strength(sec, Fy: float, E: float = 200000.0) -> np.ndarray:
+    """Nominal Mny (kN·m): yielding min(Fy·Zy, 1.6 Fy·Sy) and flange local buckling (AISC F6)."""
+    Sy = _field(sec, "Sy")
+    Mp = np.minimum(Fy * _field(sec, "Zy"), 1.6 * Fy * Sy)
+    lam = _field(sec, "bf") / _field(sec, "tf")
+    lam = np.where(np.isin(np.asarray(sec["type"]), ["C", "CF-C", "CF-Z"]), lam, lam / 2.0)
+    lam_p = 0.38 * np.sqrt(E / Fy)
+    lam_r = 1.0 * np.sqrt(E / Fy)
+    M_noncompact = Mp - (Mp - 0.7 * Fy * Sy) * (lam - lam_p) / (lam_r - lam_p)
+    M_slender = 0.69 * E * Sy / lam ** 2
+    flb = np.where(np.isin(np.asarray(sec["type"]), ["W", "C", "CF-C", "CF-Z"]),
+                   np.where(lam <= lam_p, Mp, np.where(lam <= lam_r, M_noncompact, M_slender)), Mp)
+    return np.minimum(flb, Mp) / 1e6
+
+
+# ----------------------------
+# Moment gradient (AISC F1-1)
+# ----------------------------
+def moment_gradient_factor(M_max, M_A, M_B, M_C):
+    """Cb = 12.5 Mmax / (2.5 Mmax + 3 MA + 4 MB + 3 MC) from absolute quarter-point moments."""
+    M_max, M_A, M_B, M_C = (np.abs(np.asarray(m, dtype=float)) for m in (M_max, M_A, M_B, M_C))
+    denom = 2.5 * M_max + 3.0 * M_A + 4.0 * M_B + 3.0 * M_C
+    with np.errstate(invalid="ignore", divide="ignore"):
+        Cb = np.where(denom > 0, 12.5 * M_max / denom, 1.0)
+    return float(Cb) if Cb.ndim == 0 else Cb
+
+
+def cb_from_diagram(x, M, x_start, x_end, n: int = 101):
+    """
+    Cb for the unbraced segment [x_start, x_end] of a sampled moment diagram M(x).
+    Segment bounds may be arrays, giving Cb for every segment in one call.
+    """
+    x = np.asarray(x, dtype=float)
+    M = np.asarray(M, dtype=float)
+    x_start = np.asarray(x_start, dtype=float)[..., None]
+    x_end = np.asarray(x_end, dtype=float)[..., None]
+    t = np.linspace(0.0, 1.0, n)
+    samples = np.abs(np.interp(x_start + (x_end - x_start) * t, x, M))
+    q = (n - 1) // 4
+    return moment_gradient_factor(samples.max(axis=-1), samples[..., q], samples[..., 2 * q], samples[..., 3 * q])
+
+
+# ----------------------------
+# Cached ΦMn(Lb) curves
+# ----------------------------
+@lru_cache(maxsize=512)
+def ltb_curve(section: str, Fy: float, E: float = 200000.0, n: int = 400) -> tuple:
+    """
+    Memoized strength curve of one catalogue section at Cb = 1.
+    Returns (Lb grid mm, Mn_ltb kN·m, Mn_cap kN·m, Lp, Lr); Mn_cap = min(Mp, FLB).
+    Lp and Lr are grid points, so linear interpolation is exact on the inelastic branch.
+    """
+    sec = get_section(section)
+    p = ltb_parameters(sec, Fy, E)
+    Lp, Lr = float(p["Lp"]), float(p["Lr"])
+    if not np.isfinite(Lr):
+        Lr = Lp
+    L_end = max(10.0 * Lr, 60000.0)
+    grid = np.unique(np.concatenate([
+        np.linspace(0.0, Lp, 8),
+        np.linspace(Lp, Lr, 16),
+        np.geomspace(max(Lr, 1.0), L_end, n),
+    ]))
+    Mn_ltb = ltb_moment(sec, Fy, grid, 1.0, E) / 1e6
+    Mn_cap = float(flb_moment(sec, Fy, E)) / 1e6
+    grid.setflags(write=False)
+    Mn_ltb.setflags(write=False)
+    return grid, Mn_ltb, Mn_cap, Lp, Lr
+
+
+def design_flexural_strength(section: str, Fy: float, Lb, Cb=1.0, E: float = 200000.0):
+    """ΦMn (kN·m) of a catalogue section by interpolation on its cached curve: Φ·min(Cb·Mn(Lb), Mcap)."""
+    grid, Mn_ltb, Mn_cap, _, _ = ltb_curve(section, float(Fy), float(E))
+    Lb = np.asarray(Lb, dtype=float)
+    Mn1 = np.interp(Lb, grid, Mn_ltb)
+    if np.any(Lb > grid[-1]):  # beyond the tabulated range: evaluate exactly
+        Mn1 = np.where(Lb > grid[-1], ltb_moment(get_section(section), Fy, Lb, 1.0, E) / 1e6, Mn1)
+    Mn = np.minimum(np.asarray(Cb, dtype=float) * Mn1, Mn_cap)
+    return PHI_B * (float(Mn) if np.ndim(Mn) == 0 else Mn)
+
+
+# ----------------------------
+# Shear (AISC G2.1)
+# ----------------------------
+def shear_strength(sec, Fy: float, E: float = 200000.0):
+    """Return (φv, Vn in kN) for each section, Vn = 0.6 Fy Aw Cv1."""
+    h_tw = _field(sec, "h") / _field(sec, "tw")
+    rolled = (np.asarray(sec["type"]) == "W") & (h_tw <= 2.24 * np.sqrt(E / Fy))
+    kv = 5.34
+    limit = 1.10 * np.sqrt(kv * E / Fy)
+    Cv1 = np.where(rolled | (h_tw <= limit), 1.0, limit / h_tw)
+    phi_v = np.where(rolled, PHI_V_ROLLED, PHI_V)
+    return phi_v, 0.6 * Fy * _field(sec, "Aw") * Cv1 / 1000.0
@@ -0,0 +1,274 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from src.calculations.steel.flexure import PHI_B, design_flexural_strength, shear_strength
+from src.calculations.steel.sections import get_section
+
+# ----------------------------
+# Load combinations (NSCP 2015 §203.3.1) — factors on D, Lr (patterned) and W (net uplift)
+# ----------------------------
+COMBOS = {
+    "1.4D": (1.4, 0.0, 0.0),
+    "1.2D + 1.6Lr": (1.2, 1.6, 0.0),
+    "1.2D + 1.0W + 0.5Lr": (1.2, 0.5, 1.0),
+    "0.9D + 1.0W": (0.9, 0.0, 1.0),
+}
+SERVICE_COMBOS = {
+    "D + Lr": (1.0, 1.0, 0.0),
+    "W − D": (-1.0, 0.0, -1.0),  # net uplift deflection (sign flipped so uplift is positive)
+}
+RESTRAINTS = ("Through-fastened sheeting (top flange restrained)", "Standing seam / free (sag rods only)")
+ELEMENTS_PER_SPAN = 40
+
+
+# ----------------------------
+# Influence coefficients (unit span, unit EI)
+# ----------------------------
+def _beam_stiffness(le: np.ndarray, EI: np.ndarray) -> np.ndarray:
+    """Euler–Bernoulli element stiffness matrices (elements × 4 × 4), dofs [v1, θ1, v2, θ2]."""
+    k = np.empty((le.size, 4, 4))
+    L, L2, L3 = le, le ** 2, le ** 3
+    k[:, 0] = np.stack([12 / L3, 6 / L2, -12 / L3, 6 / L2], axis=1)
+    k[:, 1] = np.stack([6 / L2, 4 / L, -6 / L2, 2 / L], axis=1)
+    k[:, 2] = -k[:, 0]
+    k[:, 3] = np.stack([6 / L2, 2 / L, -6 / L2, 4 / L], axis=1)
+    return k * EI[:, None, None]
+
+
+@lru_cache(maxsize=64)
+def influence_coefficients(n_spans: int, lap_ratio: float = 0.0, lap_stiffness: float = 1.0) -> dict:
+    """
+    Response of an n-span continuous beam (unit spans, EI = 1) to a unit downward UDL on each span.
+
+    Laps extend lap_ratio·L each side of every interior support with EI × lap_stiffness.
+    Returns x (element-end stations), M and V (spans × stations, sagging / upward-left positive),
+    x_nodes and defl (spans × nodes, downward positive) and the lap mask of the stations.
+    Scale by w·L² (M), w·L (V) and w·L⁴/EI (deflection).
+    """
+    supports = np.arange(n_spans + 1, dtype=float)
+    lap_ends = np.concatenate([supports[1:-1] - lap_ratio, supports[1:-1] + lap_ratio]) if lap_ratio > 0 else []
+    x = np.unique(np.round(np.concatenate([np.linspace(0.0, n_spans, n_spans * ELEMENTS_PER_SPAN + 1), lap_ends]), 12))
+    le = np.diff(x)
+    mid = (x[:-1] + x[1:]) / 2.0
+    in_lap = np.abs(mid - np.round(mid)) < lap_ratio
+    in_lap &= (np.round(mid) > 0) & (np.round(mid) < n_spans)
+    EI = np.where(in_lap, lap_stiffness, 1.0)
+
+    n_el, n_dof = le.size, 2 * x.size
+    k = _beam_stiffness(le, EI)
+    dofs = np.stack([2 * np.arange(n_el), 2 * np.arange(n_el) + 1, 2 * np.arange(n_el) + 2, 2 * np.arange(n_el) + 3], axis=1)
+    K = np.zeros((n_dof, n_dof))
+    np.add.at(K, (dofs[:, :, None], dofs[:, None, :]), k)
+
+    # consistent loads of a unit downward UDL, one column per loaded span
+    span_of = np.minimum(np.floor(mid).astype(int), n_spans - 1)
+    fe = -np.stack([le / 2.0, le ** 2 / 12.0, le / 2.0, -le ** 2 / 12.0], axis=1)  # elements × 4
+    loaded = span_of[:, None] == np.arange(n_spans)[None, :]                         # elements × spans
+    F = np.zeros((n_dof, n_spans))
+    np.add.at(F, dofs, fe[:, :, None] * loaded[:, None, :])
+
+    support_dofs = 2 * np.searchsorted(x, supports)
+    free = np.setdiff1d(np.arange(n_dof), support_dofs)
+    U = np.zeros((n_dof, n_spans))
+    U[free] = np.linalg.solve(K[np.ix_(free, free)], F[free])
+
+    # element end forces f = k·u − f_eq (elements × 4 × spans)
+    ue = U[dofs]
+    f_end = np.einsum("eij,ejs->eis", k, ue) - fe[:, :, None] * loaded[:, None, :]
+    M = np.stack([-f_end[:, 1], f_end[:, 3]], axis=1).reshape(-1, n_spans).T
+    V = np.stack([f_end[:, 0], -f_end[:, 2]], axis=1).reshape(-1, n_spans).T
+    stations = np.stack([x[:-1], x[1:]], axis=1).reshape(-1)
+    lap_stations = np.repeat(in_lap, 2)
+    out = {
+        "x": stations, "M": M, "V": V, "lap": lap_stations,
+        "x_nodes": x, "defl": -U[0::2].T,
+    }
+    for a in out.values():
+        a.setflags(write=False)
+    return out
+
+
+def hogging_length(inf: dict) -> float:
+    """
+    Longest distance (unit spans) from an interior support to the inflection point of its hogging region,
+    under all spans loaded and under each pair of spans adjacent to a support (largest support moment).
+    This is the unbraced length of the bottom flange over the support under gravity; 0 for one span.
+    """
+    n_spans = inf["M"].shape[0]
+    if n_spans < 2:
+        return 0.0
+    x, M = inf["x"], inf["M"]
+    supports = range(1, n_spans)
+    cases = [(M.sum(axis=0), k) for k in supports] + [(M[k - 1] + M[k], k) for k in supports]
+    longest = 0.0
+    for Mp, k in cases:
+        for side in ((x <= k) & (x >= k - 1), (x >= k) & (x <= k + 1)):
+            order = np.flatnonzero(side)
+            order = order[np.argsort(np.abs(x[order] - k), kind="stable")]
+            run = np.logical_and.accumulate(Mp[order] < 0.0)
+            # first station past the hogging run (one element resolution, on the long side)
+            end = order[min(int(run.sum()), order.size - 1)]
+            longest = max(longest, abs(float(x[end]) - k))
+    return longest
+
+
+# ----------------------------
+# Section capacities by flange restraint
+# ----------------------------
+def uplift_r_factor(kind: str, depth: float, continuous: bool) -> float:
+    """AISI S100 I6.2.1 R factor for through-fastened C/Z purlins under uplift."""
+    if continuous:
+        return 0.60 if kind in ("C", "CF-C") else 0.70
+    if depth <= 165.0:
+        return 0.70
+    if depth <= 216.0:
+        return 0.65
+    if depth <= 292.0:
+        return 0.50 if kind == "CF-Z" else 0.40
+    return 0.40
+
+
+def restrained_capacities(section: str, Fy: float, restraint: str, sag_spacing: float, span: float,
+                          continuous: bool, E: float = 200000.0, hog_length: float = None) -> dict:
+    """
+    ΦMn (kN·m) for top-flange compression (sagging), bottom-flange compression under gravity and
+    under uplift, and ΦVn (kN). Capacities are limited to first yield Fy·Sx (cold-formed practice).
+    Unrestrained flanges use LTB over the sag-rod spacing with Cb = 1.0; under gravity the bottom flange
+    of a continuous line is compressed only from the support to the inflection point, so hog_length (mm,
+    from hogging_length) caps its unbraced length.
+    """
+    sec = get_section(section)
+    M_yield = PHI_B * Fy * sec["Sx"] / 1e6
+    Lb = sag_spacing if sag_spacing > 0 else span
+    M_free = min(design_flexural_strength(section, Fy, Lb, 1.0, E), M_yield)
+    Lb_hog = min(Lb, hog_length) if continuous and hog_length else Lb
+    M_hog = min(design_flexural_strength(section, Fy, Lb_hog, 1.0, E), M_yield)
+    M_full = min(design_flexural_strength(section, Fy, 0.0, 1.0, E), M_yield)
+    phi_v, Vn = shear_strength(sec, Fy, E)
+    if restraint == RESTRAINTS[0]:
+        R = uplift_r_factor(sec["type"], sec["d"], continuous)
+        top, bottom_uplift = M_full, R * M_yield
+    else:
+        top, bottom_uplift = M_free, M_free
+    return {"top": top, "bottom_gravity": M_hog, "bottom_uplift": bottom_uplift, "shear": float(phi_v * Vn)}
+
+
+# ----------------------------
+# Purlin lines
+# ----------------------------
+def _envelopes(coef: np.ndarray, D, Lr, W, factors) -> np.ndarray:
+    """
+    Max / min response (2 × combos × lines × stations) by superposing span coefficients:
+    D and W act on every span, Lr is patterned span by span to maximise each sign.
+    """
+    total = coef.sum(axis=0)
+    pos, neg = np.clip(coef, 0.0, None).sum(axis=0), np.clip(coef, None, 0.0).sum(axis=0)
+    fd, fl, fw = (np.asarray(f, dtype=float)[:, None, None] for f in zip(*factors))
+    base = (fd * D[None, :, None] - fw * W[None, :, None]) * total
+    return np.stack([base + fl * Lr[None, :, None] * pos, base + fl * Lr[None, :, None] * neg])
+
+
+def check_continuous(inf: dict, L, D, Lr, W, caps: dict, EI, deflection_limit: float = 180.0,
+                     lap_capacity: float = 1.0) -> dict:
+    """
+    Vectorized checks of many purlin lines sharing one bay count.
+
+    L (m), D, Lr, W (kN/m) and EI (kN·m²) are per-line arrays; caps holds per-line arrays "top",
+    "bottom_gravity", "bottom_uplift" (ΦMn kN·m) and "shear" (ΦVn kN).
+    Within laps ΦMn and ΦVn are multiplied by lap_capacity: 1.0 takes the single section alone; up to 2.0
+    (two nested sections acting together) only when the lap bolts are designed to share the moment and shear.
+    Lap ends are always checked on the single section.
+    Returns per-line flexure / shear / deflection ratios with the governing combination and station.
+    """
+    L, D, Lr, W, EI = (np.asarray(a, dtype=float) for a in (L, D, Lr, W, EI))
+    M = _envelopes(inf["M"], D, Lr, W, COMBOS.values()) * L[None, None, :, None] ** 2
+    V = np.abs(_envelopes(inf["V"], D, Lr, W, COMBOS.values())) * L[None, None, :, None]
+    defl = _envelopes(inf["defl"], D, Lr, W, SERVICE_COMBOS.values()) * (L ** 4 / EI)[None, None, :, None] * 1000.0
+
+    # capacity by compression flange: sagging → top, hogging → bottom, by the sign of the factored net load.
+    # A span without its patterned live load is in uplift when D·fd < W·fw; with it, in gravity when the
+    # net load stays downward. When both can occur, the lower bottom-flange capacity governs.
+    def per_line(key):
+        return np.asarray(caps[key], dtype=float)[None, None, :, None]
+    fd, fl, fw = (np.array(f, dtype=float)[:, None] for f in zip(*COMBOS.values()))
+    net_unloaded = fd * D[None, :] - fw * W[None, :]              # combos × lines
+    uplift = (net_unloaded < 0.0)[None, :, :, None]
+    gravity = (net_unloaded + fl * Lr[None, :] > 0.0)[None, :, :, None]
+    up, down = per_line("bottom_uplift"), per_line("bottom_gravity")
+    bottom = np.where(uplift & gravity, np.minimum(up, down), np.where(uplift, up, down))
+    lap_gain = np.where(inf["lap"], lap_capacity, 1.0)
+    phiMn = np.where(M >= 0.0, per_line("top"), bottom) * lap_gain
+    phiVn = per_line("shear") * lap_gain
+
+    n = L.size
+    flex_line = (np.abs(M) / phiMn).transpose(2, 0, 1, 3).reshape(n, -1)
+    worst = np.argmax(flex_line, axis=1)
+    defl_max = np.abs(defl).max(axis=(0, 1, 3))
+    return {
+        "M max": np.abs(M).max(axis=(0, 1, 3)),
+        "flexure": flex_line[np.arange(n), worst],
+        "combo": (worst // inf["x"].size) % len(COMBOS),
+        "station": inf["x"][worst % inf["x"].size] * L,
+        "shear": (V / phiVn).max(axis=(0, 1, 3)),
+        "deflection": defl_max,
+        "deflection ratio": defl_max / (L * 1000.0 / deflection_limit),
+    }
+
+
+def design_purlin_lines(lines: pd.DataFrame, section: str, Fy: float = 250.0, dead: float = 0.25, live: float = 0.5,
+                        lap_ratio: float = 0.1, lap_stiffness: float = 1.5, restraint: str = RESTRAINTS[0],
+                        sag_spacing: float = 0.0, deflection_limit: float = 180.0, E: float = 200000.0,
+                        lap_capacity: float = 1.0) -> pd.DataFrame:
+    """
+    Check every purlin line of a roof under the factored and service combinations.
+
+    lines columns: "Line", "Bays", "Span (m)", "Tributary (m)", "Uplift (kPa)" (net wind uplift, + upward).
+    dead / live are roof area loads (kPa); purlin self-weight is added to the dead load.
+    Laps extend lap_ratio·L each side of interior supports; lap_capacity is passed to check_continuous.
+    """
+    sec = get_section(section)
+    self_weight = sec["mass"] * 9.81e-3
+    EI = E * sec["Ix"] * 1e-12 * 1e3  # kN·m²
+
+    out = []
+    combo_names = list(COMBOS)
+    for n_bays, group in lines.groupby("Bays", sort=False):
+        n_bays = int(n_bays)
+        lap = lap_ratio if n_bays > 1 else 0.0
+        inf = influence_coefficients(n_bays, lap, lap_stiffness if lap > 0 else 1.0)
+        L = group["Span (m)"].to_numpy(float)
+        trib = group["Tributary (m)"].to_numpy(float)
+        hog = hogging_length(inf)
+        caps = [restrained_capacities(section, Fy, restraint, sag_spacing, float(l) * 1000.0, n_bays > 1, E,
+                                      hog * float(l) * 1000.0) for l in L]
+        res = check_continuous(inf, L, dead * trib + self_weight, live * trib,
+                               group["Uplift (kPa)"].to_numpy(float) * trib,
+                               {k: [c[k] for c in caps] for k in caps[0]}, np.full(L.size, EI), deflection_limit,
+                               lap_capacity)
+        out.append(pd.DataFrame({
+            "Line": group["Line"].to_numpy(),
+            "Bays": n_bays,
+            "Span (m)": L,
+            "Max |Mu| (kN·m)": res["M max"],
+            "Flexure ratio": res["flexure"],
+            "Governing combo": [combo_names[c] for c in res["combo"]],
+            "At (m)": res["station"],
+            "Shear ratio": res["shear"],
+            "Deflection (mm)": res["deflection"],
+            "Deflection ratio": res["deflection ratio"],
+        }, index=group.index))
+    summary = pd.concat(out).loc[lines.index]
+    summary["Status"] = np.where(summary[["Flexure ratio", "Shear ratio", "Deflection ratio"]].max(axis=1) <= 1.0,
+                                 "OK", "FAIL")
+    return summary.round(3)
+
+
+def line_envelope(n_bays: int, span: float, D: float, Lr: float, W: float, lap_ratio: float = 0.1,
+                  lap_stiffness: float = 1.5) -> pd.DataFrame:
+    """Factored moment envelope (kN·m) of one purlin line along its length (m) for charting."""
+    lap = lap_ratio if n_bays > 1 else 0.0
+    inf = influence_coefficients(int(n_bays), lap, lap_stiffness if lap > 0 else 1.0)
+    M = _envelopes(inf["M"], np.array([D]), np.array([Lr]), np.array([W]), COMBOS.values())[:, :, 0] * span ** 2
+    return pd.DataFrame({"Max M (kN·m)": M.max(axis=(0, 1)), "Min M (kN·m)": M.min(axis=(0, 1))},
+                        index=pd.Index(inf["x"] * span, name="x (m)"))
@@ -0,0 +1,107 @@
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from src.calculations.steel.purlin_continuous import (COMBOS, RESTRAINTS, check_continuous, hogging_length, influence_coefficients,
+                                                      restrained_capacities)
+from src.calculations.steel.sections import get_section, section_names
+
+SAG_ROD_MASS = 0.888          # kg/m, 12 mm round bar
+POOL_STARTUP = {"fork": 0.02, "forkserver": 0.3, "spawn": 0.5}  # s, measured cost of starting a process pool
+
+
+def _evaluate_chunk(args) -> pd.DataFrame:
+    """
+    Evaluate one chunk of sections over every (line count × sag-rod count) pair.
+    Top-level so that it can be shipped to worker processes.
+    """
+    (sections, line_counts, sag_counts, roof, loads, options) = args
+    rafter, span, bays = roof
+    dead, live, uplift = loads
+    Fy, E, restraint, lap_ratio, lap_stiffness, lap_capacity, deflection_limit = options
+    lap = lap_ratio if bays > 1 else 0.0
+    inf = influence_coefficients(int(bays), lap, lap_stiffness if lap > 0 else 1.0)
+    combo_names = list(COMBOS)
+    hog = hogging_length(inf) * span * 1000.0
+
+    props = [get_section(s) for s in sections]
+    mass = np.array([p["mass"] for p in props])
+    EI = E * np.array([p["Ix"] for p in props]) * 1e-9  # kN·m²
+    line_counts = np.asarray(line_counts)
+    spacing = rafter / (line_counts - 1.0)
+
+    out = []
+    for n_sag in sag_counts:
+        sag_spacing = span * 1000.0 / (n_sag + 1)
+        caps = [restrained_capacities(s, Fy, restraint, sag_spacing if n_sag > 0 else 0.0, span * 1000.0, bays > 1, E, hog)
+                for s in sections]
+        # candidates flattened as (line count, section)
+        s_i = np.tile(np.arange(len(sections)), line_counts.size)
+        trib = np.repeat(spacing, len(sections))
+        res = check_continuous(
+            inf, np.full(trib.size, span), dead * trib + mass[s_i] * 9.81e-3, live * trib, uplift * trib,
+            {k: np.array([c[k] for c in caps])[s_i] for k in caps[0]}, EI[s_i], deflection_limit, lap_capacity,
+        )
+        n_lines = np.repeat(line_counts, len(sections))
+        purlin_length = bays * span * (1.0 + 2.0 * lap * (bays - 1) / bays)  # lapped length per line
+        steel = n_lines * purlin_length * mass[s_i] + n_sag * bays * rafter * SAG_ROD_MASS
+        out.append(pd.DataFrame({
+            "Section": np.asarray(sections)[s_i],
+            "Purlin lines": n_lines,
+            "Spacing (m)": trib,
+            "Sag rods / bay": n_sag,
+            "Steel mass (kg)": steel,
+            "Flexure ratio": res["flexure"],
+            "Shear ratio": res["shear"],
+            "Deflection ratio": res["deflection ratio"],
+            "Governing combo": [combo_names[c] for c in res["combo"]],
+        }))
+    return pd.concat(out, ignore_index=True)
+
+
+def optimize_layout(rafter_length: float, span: float, bays: int, dead: float = 0.25, live: float = 0.5,
+                    uplift: float = 0.8, Fy: float = 250.0, restraint: str = RESTRAINTS[0], lap_ratio: float = 0.1,
+                    lap_stiffness: float = 1.5, spacing_range=(0.6, 2.0), sag_counts=(0, 1, 2, 3),
+                    kinds=("CF-C", "CF-Z"), deflection_limit: float = 180.0, E: float = 200000.0,
+                    lap_capacity: float = 1.0, workers: int = None) -> pd.DataFrame:
+    """
+    Grid search of purlin spacing × catalogue section × sag-rod count for one roof slope.
+
+    rafter_length (m) is the sloping length covered by purlins, span (m) the bay length and bays the
+    number of continuous bays. Spacings are evenly distributed line counts within spacing_range.
+    The first of workers + 1 section chunks is timed in-process; the other chunks go to a process pool
+    only when their serial cost exceeds the pool start-up (POOL_STARTUP) plus one chunk (workers=1 forces
+    a serial run).
+    Returns every candidate sorted by steel mass, with a "Passes" column.
+    """
+    n_min = max(2, math.ceil(rafter_length / spacing_range[1]) + 1)
+    n_max = max(n_min, math.floor(rafter_length / spacing_range[0]) + 1)
+    line_counts = tuple(range(n_min, n_max + 1))
+    sections = section_names(kinds)
+    args = ((rafter_length, span, int(bays)), (dead, live, uplift),
+            (Fy, E, restraint, lap_ratio, lap_stiffness, lap_capacity, deflection_limit))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        parts = [_evaluate_chunk((sections, line_counts, sag_counts, *args))]
+    else:
+        chunks = [list(c) for c in np.array_split(sections, min(workers + 1, len(sections))) if len(c)]
+        start = time.perf_counter()
+        parts = [_evaluate_chunk((chunks[0], line_counts, sag_counts, *args))]
+        chunk_cost = time.perf_counter() - start
+        rest = [(c, line_counts, sag_counts, *args) for c in chunks[1:]]
+        startup = POOL_STARTUP.get(multiprocessing.get_start_method(), max(POOL_STARTUP.values()))
+        if len(rest) * chunk_cost > startup + chunk_cost:
+            with ProcessPoolExecutor(max_workers=len(rest)) as pool:
+                parts += list(pool.map(_evaluate_chunk, rest))
+        else:
+            parts += [_evaluate_chunk(a) for a in rest]
+
+    grid = pd.concat(parts, ignore_index=True)
+    grid["Max ratio"] = grid[["Flexure ratio", "Shear ratio", "Deflection ratio"]].max(axis=1)
+    grid["Passes"] = grid["Max ratio"] <= 1.0
+    return grid.sort_values(["Passes", "Steel mass (kg)"], ascending=[False, True], ignore_index=True).round(3)
@@ -0,0 +1,228 @@
+import math
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ----------------------------
+# Catalogue files
+# ----------------------------
+DATA_DIR = Path(__file__).resolve().parents[3] / "data"
+SOURCE_CSV = DATA_DIR / "steel_sections.csv"   # section dimensions (editable source)
+CACHE_NPY = DATA_DIR / "steel_sections.npy"    # binary catalogue, memory-mapped at load
+
+STEEL_DENSITY = 7850.0  # kg/m³
+SECTION_TYPES = ("W", "C", "L", "HSS", "CF-C", "CF-Z")
+
+# Columnar layout of the catalogue (mm, mm², mm³, mm⁴, mm⁶, kg/m)
+SECTION_DTYPE = np.dtype([
+    ("name", "U24"), ("type", "U5"),
+    ("d", "f8"), ("bf", "f8"), ("tw", "f8"), ("tf", "f8"), ("lip", "f8"), ("h", "f8"), ("ho", "f8"),
+    ("A", "f8"), ("mass", "f8"), ("Aw", "f8"),
+    ("Ix", "f8"), ("Sx", "f8"), ("Zx", "f8"), ("rx", "f8"),
+    ("Iy", "f8"), ("Sy", "f8"), ("Zy", "f8"), ("ry", "f8"),
+    ("rz", "f8"), ("J", "f8"), ("Cw", "f8"),
+])
+NUMERIC_FIELDS = SECTION_DTYPE.names[2:]
+
+
+# ----------------------------
+# Geometry → properties
+# ----------------------------
+def _rectangles(kind: str, d: float, bf: float, tw: float, tf: float, lip: float) -> list:
+    """Plate idealisation of a section as (x centre, y centre, width, height) rectangles (fillets neglected)."""
+    if kind == "W":
+        yf = d / 2.0 - tf / 2.0
+        return [(0.0, yf, bf, tf), (0.0, -yf, bf, tf), (0.0, 0.0, tw, d - 2.0 * tf)]
+    if kind == "C":
+        yf = d / 2.0 - tf / 2.0
+        return [(bf / 2.0, yf, bf, tf), (bf / 2.0, -yf, bf, tf), (tw / 2.0, 0.0, tw, d - 2.0 * tf)]
+    if kind == "L":
+        t = tw
+        return [(t / 2.0, d / 2.0, t, d), (t + (bf - t) / 2.0, t / 2.0, bf - t, t)]
+    if kind == "HSS":
+        t = tw
+        return [(0.0, d / 2.0 - t / 2.0, bf, t), (0.0, -(d / 2.0 - t / 2.0), bf, t),
+                (bf / 2.0 - t / 2.0, 0.0, t, d - 2.0 * t), (-(bf / 2.0 - t / 2.0), 0.0, t, d - 2.0 * t)]
+    if kind == "CF-C":
+        t = tw
+        yf = d / 2.0 - t / 2.0
+        yl = d / 2.0 - t - (lip - t) / 2.0
+        return [(t / 2.0, 0.0, t, d), (t + (bf - t) / 2.0, yf, bf - t, t), (t + (bf - t) / 2.0, -yf, bf - t, t),
+                (bf - t / 2.0, yl, t, lip - t), (bf - t / 2.0, -yl, t, lip - t)]
+    if kind == "CF-Z":
+        t = tw
+        yf = d / 2.0 - t / 2.0
+        yl = d / 2.0 - t - (lip - t) / 2.0
+        # point-symmetric about the web centre
+        return [(0.0, 0.0, t, d), (bf / 2.0, yf, bf - t, t), (-bf / 2.0, -yf, bf - t, t),
+                (bf - t, yl, t, lip - t), (-(bf - t), -yl, t, lip - t)]
+    raise ValueError(f"Unknown section type: {kind}")
+
+
+def _plastic_modulus(rects: np.ndarray, axis: int) -> float:
+    """Plastic modulus about the equal-area axis (axis 1 → about x, 0 → about y)."""
+    c, size = rects[:, axis], rects[:, axis + 2]
+    other = rects[:, 3 - axis]
+    lo, hi = c - size / 2.0, c + size / 2.0
+    half = np.sum(size * other) / 2.0
+    a, b = lo.min(), hi.max()
+    for _ in range(60):  # bisection for the plastic neutral axis
+        p = 0.5 * (a + b)
+        below = np.sum(np.clip(p - lo, 0.0, size) * other)
+        a, b = (p, b) if below < half else (a, p)
+    p = 0.5 * (a + b)
+    # first moments of the parts below and above the PNA
+    lo_b, hi_b = lo, np.minimum(hi, p)
+    lo_a, hi_a = np.maximum(lo, p), hi
+    z_below = np.sum(np.clip(hi_b - lo_b, 0.0, None) * other * (p - (lo_b + hi_b) / 2.0) * (hi_b > lo_b))
+    z_above = np.sum(np.clip(hi_a - lo_a, 0.0, None) * other * ((lo_a + hi_a) / 2.0 - p) * (hi_a > lo_a))
+    return float(z_below + z_above)
+
+
+def section_properties(kind: str, name: str, d: float, bf: float, tw: float, tf: float, lip: float = 0.0) -> dict:
+    """Compute catalogue properties of one section from its plate dimensions."""
+    t_design = 0.93 * tw if kind == "HSS" else tw  # HSS design wall thickness (AISC B4.2)
+    rects = np.array(_rectangles(kind, d, bf, t_design, t_design if kind == "HSS" else tf, lip), dtype=float)
+    x, y, w, h = rects.T
+    area = w * h
+    A = area.sum()
+    xc, yc = np.sum(area * x) / A, np.sum(area * y) / A
+    Ix = np.sum(w * h ** 3 / 12.0 + area * (y - yc) ** 2)
+    Iy = np.sum(h * w ** 3 / 12.0 + area * (x - xc) ** 2)
+    Ixy = np.sum(area * (x - xc) * (y - yc))
+    Imin = (Ix + Iy) / 2.0 - math.sqrt(((Ix - Iy) / 2.0) ** 2 + Ixy ** 2)
+    c_y = max(np.max(y + h / 2.0) - yc, yc - np.min(y - h / 2.0))
+    c_x = max(np.max(x + w / 2.0) - xc, xc - np.min(x - w / 2.0))
+
+    if kind == "HSS":
+        t = t_design
+        h_web = d - 3.0 * t
+        Aw = 2.0 * h_web * t
+        J = 4.0 * ((bf - t) * (d - t)) ** 2 * t / (2.0 * ((bf - t) + (d - t)))
+        Cw = 0.0
+        ho = d - t
+        mass = (bf * d - (bf - 2.0 * tw) * (d - 2.0 * tw)) * STEEL_DENSITY * 1e-6
+    else:
+        h_web = d - 2.0 * tf
+        Aw = h_web * tw if kind.startswith("CF") else d * tw
+        J = float(np.sum(np.maximum(w, h) * np.minimum(w, h) ** 3 / 3.0))
+        ho = d - tf
+        if kind == "W":
+            Cw = Iy * ho ** 2 / 4.0
+        elif kind in ("C", "CF-C"):
+            b1 = bf - tw / 2.0
+            Cw = (tf * b1 ** 3 * ho ** 2 / 12.0) * (3.0 * b1 * tf + 2.0 * ho * tw) / (6.0 * b1 * tf + ho * tw)
+        elif kind == "CF-Z":
+            b1 = bf - tw / 2.0
+            Cw = (tw * b1 ** 3 * ho ** 2 / 12.0) * (b1 + 2.0 * ho) / (2.0 * b1 + ho)
+        else:
+            Cw = 0.0
+        # rolled shapes carry their nominal mass in the designation (e.g. W250x33)
+        mass = float(name.split("x")[-1]) if kind in ("W", "C") else A * STEEL_DENSITY * 1e-6
+
+    return {
+        "name": name, "type": kind,
+        "d": d, "bf": bf, "tw": t_design, "tf": t_design if kind == "HSS" else tf, "lip": lip, "h": h_web, "ho": ho,
+        "A": A, "mass": mass, "Aw": Aw,
+        "Ix": Ix, "Sx": Ix / c_y, "Zx": _plastic_modulus(rects, 1), "rx": math.sqrt(Ix / A),
+        "Iy": Iy, "Sy": Iy / c_x, "Zy": _plastic_modulus(rects, 0), "ry": math.sqrt(Iy / A),
+        "rz": math.sqrt(Imin / A), "J": J, "Cw": Cw,
+    }
+
+
+def build_catalogue(csv_path=SOURCE_CSV) -> np.ndarray:
+    """Build the structured section array from the dimensions CSV."""
+    dims = pd.read_csv(csv_path)
+    rows = [
+        section_properties(r.Type, r.Name, float(r.d), float(r.bf), float(r.tw), float(r.tf), float(r.lip))
+        for r in dims.itertuples(index=False)
+    ]
+    return np.array([tuple(row[f] for f in SECTION_DTYPE.names) for row in rows], dtype=SECTION_DTYPE)
+
+
+# ----------------------------
+# Loading & indexes
+# ----------------------------
+@lru_cache(maxsize=1)
+def load_catalogue() -> np.ndarray:
+    """
+    Return the section catalogue as a read-only memory-mapped structured array.
+    The .npy cache is rebuilt whenever the CSV is newer; all sessions map the same file.
+    """
+    stale = not CACHE_NPY.exists() or CACHE_NPY.stat().st_mtime < SOURCE_CSV.stat().st_mtime
+    if not stale:
+        table = np.load(CACHE_NPY, mmap_mode="r")
+        if table.dtype == SECTION_DTYPE:
+            return table
+    table = build_catalogue()
+    try:
+        # write-then-rename so concurrent sessions never map a half-written file
+        tmp = CACHE_NPY.with_suffix(f".{os.getpid()}.tmp.npy")
+        np.save(tmp, table)
+        os.replace(tmp, CACHE_NPY)
+    except OSError:
+        return table  # read-only deployment: keep the in-memory copy
+    return np.load(CACHE_NPY, mmap_mode="r")
+
+
+@lru_cache(maxsize=1)
+def name_index() -> dict:
+    """Section name → row number (O(1) lookup)."""
+    return {str(n): i for i, n in enumerate(load_catalogue()["name"])}
+
+
+@lru_cache(maxsize=None)
+def sorted_index(field: str) -> np.ndarray:
+    """Row numbers ordered by one numeric property (for range queries)."""
+    if field not in NUMERIC_FIELDS:
+        raise KeyError(f"Unknown section property: {field}")
+    return np.argsort(load_catalogue()[field], kind="stable")
+
+
+def get_section(name: str) -> dict:
+    """Properties of one section as a plain dict; raises KeyError if not catalogued."""
+    row = load_catalogue()[name_index()[name]]
+    return {f: (str(row[f]) if f in ("name", "type") else float(row[f])) for f in SECTION_DTYPE.names}
+
+
+def section_names(kinds=None) -> list:
+    """Catalogue designations, optionally limited to some section types."""
+    table = load_catalogue()
+    if kinds is None:
+        return [str(n) for n in table["name"]]
+    mask = np.isin(table["type"], list(kinds))
+    return [str(n) for n in table["name"][mask]]
+
+
+def query(kinds=None, order_by: str = "mass", **limits) -> np.ndarray:
+    """
+    Sections satisfying range limits, sorted by `order_by`.
+    Limits are written <field>_min / <field>_max, e.g. query(["W"], Zx_min=5e5, d_max=400).
+    The first limit is resolved by binary search on its sorted index.
+    """
+    table = load_catalogue()
+    rows = np.arange(table.size)
+    for i, (key, bound) in enumerate(limits.items()):
+        field, side = key.rsplit("_", 1)
+        if side not in ("min", "max"):
+            raise KeyError(f"Limit must end in _min or _max: {key}")
+        if i == 0:
+            order = sorted_index(field)
+            values = table[field][order]
+            rows = order[np.searchsorted(values, bound, side="left"):] if side == "min" \
+                else order[:np.searchsorted(values, bound, side="right")]
+        else:
+            values = table[field][rows]
+            rows = rows[values >= bound] if side == "min" else rows[values <= bound]
+    if kinds is not None:
+        rows = rows[np.isin(table["type"][rows], list(kinds))]
+    rows = rows[np.argsort(table[order_by][rows], kind="stable")]
+    return np.asarray(table[rows])
+
+
+def to_dataframe(sections: np.ndarray) -> pd.DataFrame:
+    """Structured section rows → DataFrame."""
+    return pd.DataFrame.from_records(np.asarray(sections))
@@ -0,0 +1,177 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from src.calculations.steel.bolt_group import pattern_coefficient
+from src.calculations.steel.sections import STEEL_DENSITY, load_catalogue, name_index
+
+PHI_BOLT = 0.75     # bolt shear, bearing / tearout (AISC J3.6, J3.10)
+PHI_YIELD = 1.00    # shear yielding of the plate / angles (J4.2a)
+PHI_RUPTURE = 0.75  # shear rupture and block shear (J4.2b, J4.3)
+CONNECTION_TYPES = ("Shear tab", "Double angle")
+BOLT_GRADES = {"A325-N": 372.0, "A490-N": 457.0}  # nominal shear stress Fnv (MPa), threads included
+BOLT_DIAMETERS = (16.0, 20.0, 22.0, 24.0)
+BOLT_ROWS = tuple(range(2, 11))
+TAB_THICKNESSES = (6.0, 8.0, 10.0, 12.0, 16.0)
+ANGLE_THICKNESSES = (6.0, 8.0, 10.0, 12.0)
+BOLT_COST_KG = 1.5  # installed bolt priced as this much fabricated plate (kg) when ranking configurations
+
+
+def _hole(d_bolt):
+    """Standard hole: d + 2 mm up to M22, d + 3 mm above."""
+    d_bolt = np.asarray(d_bolt, dtype=float)
+    return d_bolt + np.where(d_bolt <= 22.0, 2.0, 3.0)
+
+
+def tab_eccentricity(n, a, slotted: bool = False):
+    """
+    Bolt-group eccentricity of a conventional shear tab (AISC Manual Table 10-9): e = a/2 for
+    2–5 rows or short-slotted holes, e = a for 6–12 rows in standard holes (a = weld to bolt line).
+    """
+    n = np.asarray(n)
+    return np.where((n <= 5) | slotted, a / 2.0, float(a))
+
+
+# ----------------------------
+# Catalogue of standard configurations
+# ----------------------------
+def _configurations() -> pd.DataFrame:
+    """
+    Every type × bolt grade × diameter × rows × thickness. Shear tabs keep t ≤ d/2 + 2 mm
+    (AISC Manual Part 10 conventional configuration, so the bolts govern over plate rotation).
+    """
+    rows = []
+    for kind, thicknesses in zip(CONNECTION_TYPES, (TAB_THICKNESSES, ANGLE_THICKNESSES)):
+        for grade in BOLT_GRADES:
+            for d in BOLT_DIAMETERS:
+                for n in BOLT_ROWS:
+                    for t in thicknesses:
+                        if kind == "Shear tab" and t > d / 2.0 + 2.0:
+                            continue
+                        rows.append((kind, grade, d, n, t))
+    return pd.DataFrame(rows, columns=["Type", "Grade", "Bolt Ø (mm)", "Rows", "t (mm)"])
+
+
+@lru_cache(maxsize=8)
+def connection_table(Fy: float = 250.0, Fu: float = 400.0, Fu_beam: float = 450.0, pitch: float = 75.0,
+                     end_dist: float = 40.0, edge_dist: float = 40.0, a: float = 75.0) -> pd.DataFrame:
+    """
+    All limit states (kN) of every standard shear tab and bolted double angle, computed once per
+    material / geometry and ordered by cost index (steel kg + BOLT_COST_KG per bolt).
+
+    Shear tab: single shear, bolt group coefficient C at the Table 10-9 eccentricity (standard holes).
+    Double angle: web bolts in double shear at e = 0, two angles with 75 mm legs (90 mm for M24).
+    "Web bearing (kN/mm)" is the beam-web bearing strength per mm of web thickness.
+    """
+    cfg = _configurations()
+    tab = (cfg["Type"] == "Shear tab").to_numpy()
+    d = cfg["Bolt Ø (mm)"].to_numpy(float)
+    n = cfg["Rows"].to_numpy(int)
+    t = cfg["t (mm)"].to_numpy(float)
+    Fnv = cfg["Grade"].map(BOLT_GRADES).to_numpy(float)
+    dh = _hole(d)
+    L = (n - 1) * pitch + 2.0 * end_dist          # plate / angle length
+    plies = np.where(tab, 1.0, 2.0)               # shear planes per bolt = connected plies
+
+    C = np.where(tab, [pattern_coefficient(k, 1, pitch, 0.0, float(tab_eccentricity(k, a))) for k in n], n)
+    Ab = np.pi * d ** 2 / 4.0
+    bolt_shear = PHI_BOLT * Fnv * Ab * plies * C / 1e3
+
+    # bearing / tearout per ply: end bolt on the clear end distance, the rest on the clear pitch
+    lc_end, lc_int = end_dist - dh / 2.0, pitch - dh
+    per_bolt = np.minimum(1.2 * np.stack([lc_end, lc_int]), 2.4 * d) * t * Fu
+    bearing_sum = per_bolt[0] + (n - 1) * per_bolt[1]
+    bearing = PHI_BOLT * plies * bearing_sum * C / n / 1e3
+
+    Agv = L * t
+    Anv = (L - n * dh) * t
+    yielding = PHI_YIELD * 0.6 * Fy * Agv * plies / 1e3
+    rupture = PHI_RUPTURE * 0.6 * Fu * Anv * plies / 1e3
+    # block shear: vertical plane from the bottom edge through the bolts, tension plane to the side edge
+    Agv_b = (L - end_dist) * t
+    Anv_b = Agv_b - (n - 0.5) * dh * t
+    Ant = (edge_dist - dh / 2.0) * t
+    block = PHI_RUPTURE * np.minimum(0.6 * Fu * Anv_b + Fu * Ant, 0.6 * Fy * Agv_b + Fu * Ant) * plies / 1e3
+
+    leg = np.where(d >= 24.0, 90.0, 75.0)
+    width = np.where(tab, a + edge_dist, 2.0 * leg - t)
+    mass = plies * width * t * L * STEEL_DENSITY * 1e-9
+    bolts = n * plies  # double angles also bolt both legs to the support
+
+    out = cfg.assign(**{
+        "L (mm)": L,
+        "Bolts": bolts,
+        "Mass (kg)": mass,
+        "Cost index": mass + BOLT_COST_KG * bolts,
+        "C": C,
+        "Bolt shear (kN)": bolt_shear,
+        "Bearing (kN)": bearing,
+        "Shear yield (kN)": yielding,
+        "Shear rupture (kN)": rupture,
+        "Block shear (kN)": block,
+        "Web bearing (kN/mm)": PHI_BOLT * 2.4 * d * Fu_beam * C / 1e3,
+    })
+    out["φRn (kN)"] = out[["Bolt shear (kN)", "Bearing (kN)", "Shear yield (kN)", "Shear rupture (kN)",
+                           "Block shear (kN)"]].min(axis=1)
+    out["Governs"] = out[["Bolt shear (kN)", "Bearing (kN)", "Shear yield (kN)", "Shear rupture (kN)",
+                          "Block shear (kN)"]].idxmin(axis=1).str.replace(" (kN)", "", regex=False)
+    return out.sort_values(["Cost index", "Mass (kg)"], kind="stable", ignore_index=True)
+
+
+# ----------------------------
+# Cheapest connection for many beam ends
+# ----------------------------
+def select_connections(reactions: pd.DataFrame, table: pd.DataFrame, types=CONNECTION_TYPES,
+                       grades=tuple(BOLT_GRADES)) -> pd.DataFrame:
+    """
+    Cheapest prequalified connection for every beam end reaction.
+
+    reactions columns: "Mark", "Beam" (catalogue W section) and "Vu (kN)". Per beam section the
+    configurations that fit between the flanges (L ≤ h) are capped by the beam-web bearing; the
+    running maximum of that capacity in cost order then turns the choice into a searchsorted lookup.
+    """
+    index = name_index()
+    missing = sorted(set(reactions["Beam"]) - set(index))
+    if missing:
+        raise KeyError(f"Sections not in the catalogue: {', '.join(missing)}")
+    catalogue = load_catalogue()
+    table = table[table["Type"].isin(types) & table["Grade"].isin(grades)].reset_index(drop=True)
+    L = table["L (mm)"].to_numpy(float)
+    base = table["φRn (kN)"].to_numpy(float)
+    web = table["Web bearing (kN/mm)"].to_numpy(float)
+
+    Vu = reactions["Vu (kN)"].to_numpy(float)
+    pick = np.full(len(reactions), -1)
+    capacity = np.full(len(reactions), np.nan)
+    beams = reactions["Beam"].to_numpy()
+    for beam in np.unique(beams):
+        sec = catalogue[index[beam]]
+        rows = np.flatnonzero(L <= sec["h"])
+        if rows.size == 0:
+            continue
+        cap = np.minimum(base[rows], web[rows] * sec["tw"])
+        best_so_far = np.maximum.accumulate(cap)
+        here = np.flatnonzero(beams == beam)
+        k = np.searchsorted(best_so_far, Vu[here], side="left")
+        found = k < rows.size
+        pick[here[found]] = rows[k[found]]
+        capacity[here[found]] = cap[k[found]]
+
+    found = pick >= 0
+    chosen = table.iloc[np.where(found, pick, 0)].reset_index(drop=True)
+    out = pd.DataFrame({
+        "Mark": reactions["Mark"].to_numpy(),
+        "Beam": beams,
+        "Vu (kN)": Vu,
+        "Connection": np.where(found, chosen["Type"] + " " + chosen["Rows"].astype(str) + "-M"
+                               + chosen["Bolt Ø (mm)"].map("{:g}".format) + " " + chosen["Grade"]
+                               + " t" + chosen["t (mm)"].map("{:g}".format), "None fits"),
+        "L (mm)": chosen["L (mm)"].to_numpy(),
+        "Cost index": chosen["Cost index"].to_numpy(),
+        "φRn (kN)": capacity,
+        "Governs": np.where(found, np.where(capacity < chosen["φRn (kN)"].to_numpy() - 1e-9, "Beam web bearing",
+                                            chosen["Governs"]), ""),
+    })
+    out["Ratio"] = Vu / out["φRn (kN)"]
+    out.loc[~found, ["L (mm)", "Cost index"]] = np.nan
+    return out.round(3)
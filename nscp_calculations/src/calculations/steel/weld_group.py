@@ -0,0 +1,234 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# ----------------------------
+# Constants
+# ----------------------------
+PHI_W = 0.75                 # fillet welds (AISC J2.4)
+ELEMENT_LENGTH = 1.0 / 80.0  # element length as a fraction of the longest line
+SHAPES = ("Line", "Parallel", "C", "L", "Box")
+A_GRID = np.concatenate([[0.0], np.geomspace(0.01, 10.0, 90)])  # e / L of the cached coefficient tables
+
+
+# ----------------------------
+# Weld geometry
+# ----------------------------
+def weld_shape(kind: str, L: float, b: float = 0.0) -> list:
+    """
+    Line segments ((x1, y1), (x2, y2)) of a standard weld group: L vertical, b horizontal (mm).
+    C and L shapes have their horizontal legs pointing towards +x, i.e. towards the load.
+    """
+    h = L / 2.0
+    if kind == "Line":
+        return [((0.0, -h), (0.0, h))]
+    if kind == "Parallel":
+        return [((0.0, -h), (0.0, h)), ((b, -h), (b, h))]
+    if kind == "C":
+        return [((0.0, -h), (0.0, h)), ((0.0, h), (b, h)), ((0.0, -h), (b, -h))]
+    if kind == "L":
+        return [((0.0, -h), (0.0, h)), ((0.0, -h), (b, -h))]
+    if kind == "Box":
+        return [((0.0, -h), (0.0, h)), ((b, -h), (b, h)), ((0.0, h), (b, h)), ((0.0, -h), (b, -h))]
+    raise ValueError(f"Unknown weld shape: {kind}")
+
+
+def discretize(lines, element_length: float = None) -> tuple:
+    """Split weld lines into elements; returns centres (n × 2), lengths (n) and unit axes (n × 2)."""
+    lines = np.asarray(lines, dtype=float)
+    seg = lines[:, 1] - lines[:, 0]
+    seg_len = np.hypot(seg[:, 0], seg[:, 1])
+    step = element_length or ELEMENT_LENGTH * seg_len.max()
+    counts = np.maximum(np.ceil(seg_len / step).astype(int), 1)
+    owner = np.repeat(np.arange(len(lines)), counts)
+    t = (np.concatenate([np.arange(c) for c in counts]) + 0.5) / counts[owner]
+    centres = lines[owner, 0] + seg[owner] * t[:, None]
+    return centres, seg_len[owner] / counts[owner], seg[owner] / seg_len[owner, None]
+
+
+# ----------------------------
+# AISC J2.4 directional strength and deformation limits (per unit throat, 0.6 FEXX = 1)
+# ----------------------------
+def directional_factor(theta_deg):
+    """1.0 + 0.5 sin^1.5 θ."""
+    return 1.0 + 0.5 * np.abs(np.sin(np.radians(theta_deg))) ** 1.5
+
+
+def _deformations(theta_deg, w: float = 1.0):
+    """(Δm, Δu) of a fillet weld element loaded at θ (AISC J2-6 commentary)."""
+    delta_m = 0.209 * (theta_deg + 2.0) ** -0.32 * w
+    delta_u = np.minimum(1.087 * (theta_deg + 6.0) ** -0.65 * w, 0.17 * w)
+    return delta_m, delta_u
+
+
+def _element_strength(theta_deg, delta, w: float = 1.0):
+    """R/(0.6 FEXX Aw) = (1 + 0.5 sin^1.5 θ)·[p(1.9 − 0.9p)]^0.3, p = Δ/Δm."""
+    delta_m, _ = _deformations(theta_deg, w)
+    p = np.clip(delta / delta_m, 0.0, 1.9 / 0.9)
+    return directional_factor(theta_deg) * (p * (1.9 - 0.9 * p)) ** 0.3
+
+
+def _pad(groups) -> tuple:
+    """Discretize and stack weld groups (batch × nmax) about their length-weighted centroids."""
+    parts = [discretize(g) for g in groups]
+    n_max = max(len(p[1]) for p in parts)
+    xy = np.zeros((len(groups), n_max, 2))
+    length = np.zeros((len(groups), n_max))
+    axis = np.zeros((len(groups), n_max, 2))
+    for i, (c, l, a) in enumerate(parts):
+        xy[i, :len(l)] = c - np.sum(c * l[:, None], axis=0) / l.sum()
+        length[i, :len(l)] = l
+        axis[i, :len(l)] = a
+    return xy, length, axis
+
+
+def _theta(force_dir, axis):
+    """Angle (degrees, 0–90) between element force directions and weld axes."""
+    cos = np.abs(np.sum(force_dir * axis, axis=-1))
+    return np.degrees(np.arccos(np.clip(cos, 0.0, 1.0)))
+
+
+def _residuals(c, xy, length, axis, e):
+    """Force residuals and load P (per 0.6 FEXX × throat) for trial instantaneous centres c."""
+    dx = xy[..., 0] - c[:, :1]
+    dy = xy[..., 1] - c[:, 1:]
+    r = np.hypot(dx, dy)
+    valid = length > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        force_dir = np.stack([-dy, dx], axis=-1) / r[..., None]
+    theta = _theta(force_dir, axis)
+    _, delta_u = _deformations(theta)
+    # the element reaching Δu first at the smallest Δu/r governs the rotation
+    rot = np.min(np.where(valid, delta_u / r, np.inf), axis=1, keepdims=True)
+    R = np.where(valid, _element_strength(theta, rot * r) * length, 0.0)
+    P = np.sum(R * r, axis=1) / (e - c[:, 0])
+    Fx = np.sum(np.where(valid, R * force_dir[..., 0], 0.0), axis=1)
+    Fy = np.sum(np.where(valid, R * force_dir[..., 1], 0.0), axis=1)
+    return np.stack([Fx, Fy - P], axis=1), P
+
+
+def _concentric(length, axis):
+    """Pure translation along the (vertical) load: every element shares the critical Δ."""
+    theta = _theta(np.array([0.0, -1.0]), axis)
+    _, delta_u = _deformations(theta)
+    delta = np.min(np.where(length > 0, delta_u, np.inf), axis=1, keepdims=True)
+    return np.sum(_element_strength(theta, delta) * length, axis=1)
+
+
+def icr_coefficients(groups, e, angle=0.0, tol: float = 1e-9, max_iter: int = 60) -> np.ndarray:
+    """
+    Strength coefficient K = Pn / (0.6 FEXX · throat · ΣL) of many weld groups (ICR method).
+
+    groups: list of weld line lists (see weld_shape); e: perpendicular distance from the weld centroid to
+    the line of action (mm); angle: load inclination from vertical (degrees). A concentric longitudinal
+    weld gives K = 1.0, a transverse one K = 1.5.
+    """
+    xy, length, axis = _pad(groups)
+    batch = len(groups)
+    e = np.broadcast_to(np.abs(np.asarray(e, dtype=float)), (batch,)).copy()
+    theta_load = np.radians(np.broadcast_to(np.asarray(angle, dtype=float), (batch,)))
+    total = length.sum(axis=1)
+
+    # rotate so that the load acts vertically along x = e
+    cos, sin = np.cos(theta_load)[:, None], np.sin(theta_load)[:, None]
+    x = xy[..., 0] * cos + xy[..., 1] * sin
+    y = -xy[..., 0] * sin + xy[..., 1] * cos
+    ax = axis[..., 0] * cos + axis[..., 1] * sin
+    ay = -axis[..., 0] * sin + axis[..., 1] * cos
+    xy_r, axis_r = np.stack([x, y], axis=-1), np.stack([ax, ay], axis=-1)
+
+    Ip = np.sum(length * (x ** 2 + y ** 2), axis=1)
+    scale = np.sqrt(Ip / total) + 1e-9
+    concentric = e < 1e-6 * scale
+    e_safe = np.where(concentric, 1.0, e)
+    c = np.stack([-Ip / (total * e_safe), np.zeros(batch)], axis=1)
+
+    active = ~concentric
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        g, _ = _residuals(c, xy_r, length, axis_r, e_safe)
+        h = 1e-6 * scale
+        J = np.empty((batch, 2, 2))
+        for k in range(2):
+            dc = np.zeros_like(c)
+            dc[:, k] = h
+            J[:, :, k] = (_residuals(c + dc, xy_r, length, axis_r, e_safe)[0] - g) / h[:, None]
+        step = np.linalg.solve(J + 1e-12 * np.eye(2), -g[..., None])[..., 0]
+        step = np.clip(step, -5.0 * scale[:, None], 5.0 * scale[:, None])
+        c_new = c + step
+        c_new[:, 0] = np.minimum(c_new[:, 0], e_safe - 1e-3 * scale)
+        c = np.where(active[:, None], c_new, c)
+        active &= np.max(np.abs(g), axis=1) > tol * total
+
+    _, P = _residuals(c, xy_r, length, axis_r, e_safe)
+    P_conc = _concentric(length, axis_r)
+    return np.where(concentric, P_conc, np.minimum(P, P_conc)) / total
+
+
+def elastic_coefficient(lines, e, angle=0.0) -> float:
+    """K by the elastic method (no directional increase): 1 / (ΣL · max |P/ΣL + P·e·r/Ip|) per unit P."""
+    centres, length, axis = discretize(lines)
+    xy = centres - np.sum(centres * length[:, None], axis=0) / length.sum()
+    total = length.sum()
+    own = np.sum(length ** 3 / 12.0)  # element inertia about its own centre
+    Ip = np.sum(length * np.sum(xy ** 2, axis=1)) + own
+    theta = np.radians(angle)
+    direct = np.array([np.sin(theta), -np.cos(theta)]) / total
+    torsion = e / Ip * np.column_stack([-xy[:, 1], xy[:, 0]])
+    return float(1.0 / (total * np.max(np.hypot(*(direct + torsion).T))))
+
+
+# ----------------------------
+# Cached coefficient tables for standard shapes
+# ----------------------------
+@lru_cache(maxsize=256)
+def coefficient_table(kind: str, k: float, angle: float = 0.0) -> np.ndarray:
+    """
+    K over A_GRID (a = e/L) for a shape with L = 1 and b = k·L (read-only).
+    The table is made non-increasing in a: the directional increase can otherwise lift K slightly
+    above the concentric value at small eccentricities.
+    """
+    groups = [weld_shape(kind, 1.0, k)] * A_GRID.size
+    K = np.minimum.accumulate(icr_coefficients(groups, A_GRID, angle))
+    K.setflags(write=False)
+    return K
+
+
+def shape_coefficient(kind: str, L: float, b: float, e, angle: float = 0.0):
+    """K of a standard weld shape by table lookup; k = b/L is rounded to 0.05 and angle to 15°."""
+    k = round(b / L / 0.05) * 0.05 if kind != "Line" else 0.0
+    angle = round(angle / 15.0) * 15.0
+    a = np.abs(np.asarray(e, dtype=float)) / L
+    K = np.interp(a, A_GRID, coefficient_table(kind, float(k), float(angle)))
+    if np.any(a > A_GRID[-1]):
+        far = np.atleast_1d(a > A_GRID[-1])
+        K = np.atleast_1d(K).copy()
+        K[far] = icr_coefficients([weld_shape(kind, L, b)] * int(far.sum()), np.atleast_1d(e)[far], angle)
+    return float(K) if np.ndim(K) == 0 else K
+
+
+def weld_group_strength(kind: str, L: float, b: float, w: float, FEXX: float, e=0.0, angle: float = 0.0):
+    """Design strength φRn (kN) = φ · K · 0.6 FEXX · 0.707 w · ΣL of a standard fillet weld group."""
+    total = sum(np.hypot(x2 - x1, y2 - y1) for (x1, y1), (x2, y2) in weld_shape(kind, L, b))
+    return PHI_W * shape_coefficient(kind, L, b, e, angle) * 0.6 * FEXX * 0.707 * w * total / 1000.0
+
+
+def check_weld_groups(schedule: pd.DataFrame) -> pd.DataFrame:
+    """
+    ICR check of a weld schedule. Columns: "Shape", "L (mm)", "b (mm)", "w (mm)", "FEXX (MPa)",
+    "e (mm)", "Pu (kN)" and optional "Angle (deg)".
+    """
+    angle = schedule["Angle (deg)"].to_numpy(float) if "Angle (deg)" in schedule else np.zeros(len(schedule))
+    phiRn = np.array([
+        weld_group_strength(s, L, b, w, f, e, a) for s, L, b, w, f, e, a in zip(
+            schedule["Shape"], schedule["L (mm)"].astype(float), schedule["b (mm)"].astype(float),
+            schedule["w (mm)"].astype(float), schedule["FEXX (MPa)"].astype(float),
+            schedule["e (mm)"].astype(float), angle)
+    ])
+    out = schedule.copy()
+    out["φRn (kN)"] = phiRn
+    out["Ratio"] = schedule["Pu (kN)"].to_numpy(float) / phiRn
+    out["Status"] = np.where(out["Ratio"] <= 1.0, "OK", "FAIL")
+    return out.round(3)
@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+from src.calculations.wood.species import PROPERTIES, species_rows
+
+# ----------------------------
+# NDS 2015 adjustment factors (ASD, Table 4.3.1)
+# ----------------------------
+FACTORS = ("CD", "CM", "Ct", "CL", "CF", "Cfu", "Ci", "Cr", "CP")
+LABELS = {"Fb": "Fb", "Ft": "Ft", "Fv": "Fv", "Fc_perp": "Fc⊥", "Fc": "Fc", "E": "E", "Emin": "Emin"}
+LOAD_DURATION = {  # CD, NDS Table 2.3.2
+    "Permanent (dead)": 0.9,
+    "Ten years (occupancy live)": 1.0,
+    "Two months (snow)": 1.15,
+    "Seven days (construction / roof live)": 1.25,
+    "Ten minutes (wind / earthquake)": 1.6,
+    "Impact": 2.0,
+}
+# factor × property applicability (rows FACTORS, columns PROPERTIES)
+APPLIES = np.array([
+    # Fb  Ft  Fv  Fc⊥ Fc  E   Emin
+    [1, 1, 1, 0, 1, 0, 0],   # CD
+    [1, 1, 1, 1, 1, 1, 1],   # CM
+    [1, 1, 1, 1, 1, 1, 1],   # Ct
+    [1, 0, 0, 0, 0, 0, 0],   # CL
+    [1, 1, 0, 0, 1, 0, 0],   # CF
+    [1, 0, 0, 0, 0, 0, 0],   # Cfu
+    [1, 1, 1, 1, 1, 1, 1],   # Ci
+    [1, 0, 0, 0, 0, 0, 0],   # Cr
+    [0, 0, 0, 0, 1, 0, 0],   # CP
+], dtype=bool)
+
+DIMENSION_THICKNESS = 89.0  # mm, 4" nominal: thicker sawn members are timbers
+# size factor CF of dimension lumber (Table 4A) by actual depth: 2"–4", 5", 6", 8", 10", 12", 14"+ nominal
+CF_DEPTHS = np.array([90.0, 115.0, 140.0, 185.0, 235.0, 286.0])
+CF_FB = np.array([[1.5, 1.4, 1.3, 1.2, 1.1, 1.0, 0.9],    # 2" & 3" thick
+                  [1.5, 1.4, 1.3, 1.3, 1.2, 1.1, 1.0]])   # 4" thick
+CF_FT = np.array([1.5, 1.4, 1.3, 1.2, 1.1, 1.0, 0.9])
+CF_FC = np.array([1.15, 1.1, 1.1, 1.05, 1.0, 1.0, 0.9])
+# Stud grade (Table 4A): 2"–4" and 5"–6" nominal depths; deeper studs take the No.3 values and size factors
+STUD_GRADE = "Stud"
+STUD_DEPTHS = np.array([90.0, 140.0])
+CF_STUD_FB_FT = np.array([1.1, 1.0])
+CF_STUD_FC = np.array([1.05, 1.0])
+# flat use factor Cfu (Table 4A) by actual width: 2"&3", 4", 5", 6", 8", 10"+ nominal
+CFU_WIDTHS = np.array([64.0, 90.0, 115.0, 140.0, 185.0])
+CFU = np.array([[1.0, 1.1, 1.1, 1.15, 1.15, 1.2],
+                [1.0, 1.0, 1.05, 1.05, 1.05, 1.1]])
+# wet service factor CM (Tables 4A / 4D): dimension lumber and timbers
+CM_DIMENSION = np.array([0.85, 1.0, 0.97, 0.67, 0.8, 0.9, 0.9])
+CM_TIMBER = np.array([1.0, 1.0, 1.0, 0.67, 0.91, 1.0, 1.0])
+CM_FB_LIMIT = 7.93   # MPa (1150 psi): CM = 1.0 when Fb·CF is at most this
+CM_FC_LIMIT = 5.17   # MPa (750 psi): CM = 1.0 when Fc·CF is at most this
+# temperature factor Ct (Table 2.3.3) for T ≤ 38, ≤ 52, ≤ 66 °C
+CT_STIFF = np.array([1.0, 0.9, 0.9])   # Ft, E, Emin, wet or dry
+CT_DRY = np.array([1.0, 0.8, 0.7])
+CT_WET = np.array([1.0, 0.7, 0.5])
+CI = np.array([0.8, 0.8, 0.8, 1.0, 0.8, 0.95, 0.95])   # incising (4.3.8)
+CR = 1.15                                              # repetitive members (4.3.9)
+
+
+def adjust(ref, b, d, CD=1.0, wet=False, temperature=38.0, incised=False, repetitive=False, flat=False,
+           CL=1.0, CP=1.0) -> dict:
+    """
+    Adjusted design values F' = F × CD·CM·Ct·CL·CF·Cfu·Ci·Cr·CP for many members at once.
+
+    ref: species rows (structured array from the species table); b (thickness) and d (depth) in mm;
+    the conditions and the stability factors CL / CP (computed by the caller) broadcast against the members.
+    Incising, repetitive member and flat use apply to dimension-size members (b ≤ 89 mm) only.
+    Returns "reference" and "adjusted" (members × PROPERTIES, MPa) and "factors" (members × FACTORS × PROPERTIES).
+    """
+    ref = np.atleast_1d(ref)
+    row, b, d, CD, wet, temperature, incised, repetitive, flat, CL, CP = np.broadcast_arrays(
+        np.arange(ref.size), *(np.asarray(v, dtype=float) for v in (b, d, CD)), np.asarray(wet, dtype=bool),
+        np.asarray(temperature, dtype=float), *(np.asarray(v, dtype=bool) for v in (incised, repetitive, flat)),
+        np.asarray(CL, dtype=float), np.asarray(CP, dtype=float))
+    row, b, d = row.ravel(), b.ravel(), d.ravel()
+    ref = ref[row]
+    wide_stud = (ref["grade"] == STUD_GRADE) & (ref["rule"] == "Dimension") & (d > STUD_DEPTHS[-1])
+    if wide_stud.any():  # Stud is tabulated to 6" nominal; wider members take the No.3 grade (Table 4A)
+        ref = ref.copy()
+        ref[wide_stud] = species_rows([f"{sp} No.3" for sp in ref["species"][wide_stud]])
+    F = np.column_stack([ref[p] for p in PROPERTIES])
+    rule = ref["rule"]
+    dimension = (rule != "Timber") & (b <= DIMENSION_THICKNESS)
+    nds_dimension = (rule == "Dimension") & (b <= DIMENSION_THICKNESS)
+    thick = (b > 64.0).astype(int)
+
+    C = np.ones((row.size, len(FACTORS), len(PROPERTIES)))
+    C[:, 0] = np.where(APPLIES[0], CD.ravel()[:, None], 1.0)
+
+    # size factor: Table 4A for dimension lumber (own row for Stud grade), (d0/d)^(1/9) on Fb of deeper members
+    k = np.searchsorted(CF_DEPTHS, d)
+    d0 = np.where(rule == "NSCP", 300.0, 305.0)
+    depth_effect = np.minimum((d0 / d) ** (1.0 / 9.0), 1.0)
+    C[:, 4, 0] = np.where(nds_dimension, CF_FB[thick, k], depth_effect)
+    C[:, 4, 1] = np.where(nds_dimension, CF_FT[k], 1.0)
+    C[:, 4, 4] = np.where(nds_dimension, CF_FC[k], 1.0)
+    stud = nds_dimension & (ref["grade"] == STUD_GRADE) & (d <= STUD_DEPTHS[-1])
+    j = np.minimum(np.searchsorted(STUD_DEPTHS, d), STUD_DEPTHS.size - 1)
+    C[:, 4, 0] = np.where(stud, CF_STUD_FB_FT[j], C[:, 4, 0])
+    C[:, 4, 1] = np.where(stud, CF_STUD_FB_FT[j], C[:, 4, 1])
+    C[:, 4, 4] = np.where(stud, CF_STUD_FC[j], C[:, 4, 4])
+
+    # wet service
+    CM = np.where(dimension[:, None], CM_DIMENSION, CM_TIMBER)
+    CM[:, 0] = np.where(dimension & (F[:, 0] * C[:, 4, 0] <= CM_FB_LIMIT), 1.0, CM[:, 0])
+    CM[:, 4] = np.where(dimension & (F[:, 4] * C[:, 4, 4] <= CM_FC_LIMIT), 1.0, CM[:, 4])
+    C[:, 1] = np.where(wet.ravel()[:, None], CM, 1.0)
+
+    # temperature
+    band = np.searchsorted([38.0, 52.0], temperature.ravel(), side="left")
+    stiff = CT_STIFF[band]
+    strength = np.where(wet.ravel(), CT_WET[band], CT_DRY[band])
+    C[:, 2] = np.where(np.isin(np.arange(len(PROPERTIES)), [1, 5, 6]), stiff[:, None], strength[:, None])
+
+    C[:, 3, 0] = CL.ravel()
+    w = np.searchsorted(CFU_WIDTHS, d)
+    C[:, 5, 0] = np.where(flat.ravel() & dimension, CFU[thick, w], 1.0)
+    C[:, 6] = np.where((incised.ravel() & dimension)[:, None], CI, 1.0)
+    C[:, 7, 0] = np.where(repetitive.ravel() & dimension, CR, 1.0)
+    C[:, 8, 4] = CP.ravel()
+
+    return {"names": ref["name"], "reference": F, "factors": C, "adjusted": F * C.prod(axis=1)}
+
+
+def starred(result: dict, prop: str, exclude=("CL", "CP", "Cfu")) -> np.ndarray:
+    """
+    Reference value times every factor except `exclude`: Fb* (without CL, Cfu) for the beam stability
+    factor, Fc* (without CP) for the column stability factor (NDS 3.3.3.8, 3.7.1.5).
+    """
+    p = PROPERTIES.index(prop)
+    keep = [i for i, f in enumerate(FACTORS) if f not in exclude]
+    return result["reference"][:, p] * result["factors"][:, keep, p].prod(axis=1)
+
+
+# ----------------------------
+# Tables
+# ----------------------------
+def factor_table(result: dict, i: int = 0) -> pd.DataFrame:
+    """Reference value, every factor and the adjusted value of each property for member i."""
+    table = pd.DataFrame(result["factors"][i].T, columns=FACTORS, index=[LABELS[p] for p in PROPERTIES])
+    table.insert(0, "Reference (MPa)", result["reference"][i])
+    table["Adjusted (MPa)"] = result["adjusted"][i]
+    return table
+
+
+def adjusted_frame(result: dict) -> pd.DataFrame:
+    """Adjusted design values of every member (MPa)."""
+    return pd.DataFrame(result["adjusted"], columns=[f"{LABELS[p]}' (MPa)" for p in PROPERTIES])
+
+
+def adjust_members(members: pd.DataFrame) -> pd.DataFrame:
+    """
+    Batch adjustment of a member schedule. Columns: "Species" (species / grade name), "b (mm)", "d (mm)",
+    optional "CD", "Wet", "Temperature (°C)", "Incised", "Repetitive", "Flat", "CL" and "CP".
+    Returns the schedule with the adjusted design values appended.
+    """
+    def column(name, default):
+        return np.asarray(members[name].fillna(default).to_numpy() if name in members else default)
+
+    result = adjust(species_rows(members["Species"]), members["b (mm)"].to_numpy(float), members["d (mm)"].to_numpy(float),
+                    column("CD", 1.0).astype(float), column("Wet", False).astype(bool),
+                    column("Temperature (°C)", 38.0).astype(float), column("Incised", False).astype(bool),
+                    column("Repetitive", False).astype(bool), column("Flat", False).astype(bool),
+                    column("CL", 1.0).astype(float), column("CP", 1.0).astype(float))
+    return pd.concat([members.reset_index(drop=True), adjusted_frame(result)], axis=1)
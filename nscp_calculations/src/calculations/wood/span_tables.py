@@ -0,0 +1,145 @@
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from src.calculations.wood.adjustment import adjust
+from src.calculations.wood.species import DATA_DIR, SOURCE_CSV, species_rows
+from src.calculations.wood.vibration import CRITERIA, SHEATHING_E, vibration_span
+
+# ----------------------------
+# Standard details
+# ----------------------------
+NOMINAL_SIZES = {  # dressed sizes b × d (mm)
+    "2x6": (38.0, 140.0), "2x8": (38.0, 184.0), "2x10": (38.0, 235.0), "2x12": (38.0, 286.0),
+    "3x8": (64.0, 184.0), "3x10": (64.0, 235.0), "3x12": (64.0, 286.0),
+    "4x8": (89.0, 184.0), "4x10": (89.0, 235.0), "4x12": (89.0, 286.0),
+}
+SPACINGS = (300.0, 400.0, 600.0)    # mm on centre
+LIMIT_STATES = ("Bending", "Shear", "Deflection (live)", "Deflection (total)", "Bearing", "Vibration")
+REPETITIVE_SPACING = 610.0          # mm, Cr for three or more members at most 24" apart
+WOOD_UNIT_WEIGHT = 9.81e-3          # kN/m³ per kg/m³; density taken as 1000·G
+
+
+def max_spans(ref, b, d, spacing, dead, live, bearing: float = 38.0, live_limit: float = 360.0,
+              total_limit: float = 240.0, CD: float = 1.0, wet: bool = False, temperature: float = 38.0,
+              incised: bool = False, vibration: str = CRITERIA[0], sheathing_t: float = 18.0,
+              sheathing_E: float = SHEATHING_E, gamma: float = 0.0) -> np.ndarray:
+    """
+    Longest simple span (m) of uniformly loaded joists / beams for each limit state (last axis, LIMIT_STATES).
+
+    ref: species rows; b, d (mm), spacing (mm), dead and live (kPa) broadcast against each other.
+    Every limit state has a closed form: bending √(8F'b·S/w), shear at d from the support 2(F'v·bd/1.5/w + d),
+    deflection ∛(384E'I/(5w·n)) for live / total load and bearing 2F'c⊥·b·lb/w. Self-weight (ρ = 1000·G)
+    is added to the dead load; Cr applies at spacings up to REPETITIVE_SPACING. The vibration span follows the
+    chosen floor vibration criterion with the sheathing (vibration=None skips it).
+    """
+    ref, b, d, spacing, dead, live = np.broadcast_arrays(np.atleast_1d(ref), *(np.asarray(v, dtype=float)
+                                                                              for v in (b, d, spacing, dead, live)))
+    shape = b.shape
+    values = adjust(ref.ravel(), b.ravel(), d.ravel(), CD, wet, temperature, incised,
+                    repetitive=spacing.ravel() <= REPETITIVE_SPACING)["adjusted"]
+    Fb, Fv, Fc_perp, E = (values[:, i].reshape(shape) for i in (0, 2, 3, 5))
+
+    S, I = b * d ** 2 / 6.0, b * d ** 3 / 12.0
+    w_self = 1000.0 * ref["G"] * WOOD_UNIT_WEIGHT * b * d * 1e-6          # kN/m = N/mm
+    w_total = (dead + live) * spacing / 1000.0 + w_self
+    w_live = live * spacing / 1000.0
+    with np.errstate(divide="ignore"):
+        spans = np.stack([
+            np.sqrt(8.0 * Fb * S / w_total),
+            2.0 * (Fv * b * d / 1.5 / w_total + d),
+            np.cbrt(384.0 * E * I / (5.0 * w_live * live_limit)),
+            np.cbrt(384.0 * E * I / (5.0 * w_total * total_limit)),
+            2.0 * Fc_perp * b * bearing / w_total,
+        ], axis=-1) / 1000.0
+    if vibration is None:
+        vib = np.full(shape, np.inf)
+    else:
+        vib = vibration_span(E, b, d, spacing, dead, ref["G"], sheathing_t, sheathing_E, gamma, vibration)
+    return np.concatenate([spans, vib[..., None]], axis=-1)
+
+
+# ----------------------------
+# Grid generator with disk cache
+# ----------------------------
+def _code_stamp() -> str:
+    """Hash of the modules the spans are computed from, so cached grids expire with formula changes."""
+    digest = hashlib.sha1()
+    for name in ("adjustment.py", "species.py", "vibration.py", "span_tables.py"):
+        digest.update(Path(__file__).with_name(name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+CODE_STAMP = _code_stamp()
+
+
+def _cache_path(params: tuple):
+    key = hashlib.sha1(repr(params).encode("utf-8")).hexdigest()[:16]
+    return DATA_DIR / f"span_table_{key}.npy"
+
+
+def span_grid(species: tuple, sizes: tuple, spacings: tuple, loads: tuple, **options) -> np.ndarray:
+    """
+    Spans (m) over species × sizes × spacings × loads × LIMIT_STATES, loads being (dead, live) kPa pairs.
+    Stored in data/ under a hash of the inputs and CODE_STAMP; rebuilt when the species table is newer.
+    """
+    params = (CODE_STAMP, species, sizes, spacings, loads, tuple(sorted(options.items())))
+    path = _cache_path(params)
+    shape = (len(species), len(sizes), len(spacings), len(loads), len(LIMIT_STATES))
+    if path.exists() and path.stat().st_mtime >= SOURCE_CSV.stat().st_mtime:
+        cached = np.load(path)
+        if cached.shape == shape:
+            return cached
+    ref = species_rows(species)
+    bd = np.array([NOMINAL_SIZES[s] for s in sizes])
+    dl = np.array(loads, dtype=float).reshape(-1, 2)
+    data = max_spans(ref[:, None, None, None], bd[None, :, None, None, 0], bd[None, :, None, None, 1],
+                     np.asarray(spacings, dtype=float)[None, None, :, None], dl[None, None, None, :, 0],
+                     dl[None, None, None, :, 1], **options)
+    try:
+        tmp = path.with_suffix(f".{os.getpid()}.tmp.npy")
+        np.save(tmp, data)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # read-only deployment: the in-memory lru_cache still serves repeats
+    return data
+
+
+@lru_cache(maxsize=16)
+def span_table(species: tuple, sizes: tuple = tuple(NOMINAL_SIZES), spacings: tuple = SPACINGS,
+               loads: tuple = ((0.5, 1.9),), bearing: float = 38.0, live_limit: float = 360.0,
+               total_limit: float = 240.0, CD: float = 1.0, wet: bool = False, temperature: float = 38.0,
+               incised: bool = False, vibration: str = CRITERIA[0], sheathing_t: float = 18.0,
+               sheathing_E: float = SHEATHING_E, gamma: float = 0.0) -> pd.DataFrame:
+    """Long table of the maximum span and the governing limit state of every grid point."""
+    spans = span_grid(species, sizes, spacings, loads, bearing=bearing, live_limit=live_limit, total_limit=total_limit,
+                      CD=CD, wet=wet, temperature=temperature, incised=incised, vibration=vibration,
+                      sheathing_t=sheathing_t, sheathing_E=sheathing_E, gamma=gamma)
+    grid = np.meshgrid(np.arange(len(species)), np.arange(len(sizes)), np.arange(len(spacings)), np.arange(len(loads)),
+                       indexing="ij")
+    i_sp, i_sz, i_s, i_l = (g.ravel() for g in grid)
+    flat = spans.reshape(-1, len(LIMIT_STATES))
+    loads = np.array(loads, dtype=float).reshape(-1, 2)
+    out = pd.DataFrame({
+        "Species": np.asarray(species, dtype=object)[i_sp],
+        "Size": np.asarray(sizes, dtype=object)[i_sz],
+        "Spacing (mm)": np.asarray(spacings, dtype=float)[i_s],
+        "Dead (kPa)": loads[i_l, 0],
+        "Live (kPa)": loads[i_l, 1],
+        **{f"{name} (m)": flat[:, k] for k, name in enumerate(LIMIT_STATES)},
+    })
+    out["Max span (m)"] = flat.min(axis=1)
+    out["Governs"] = np.asarray(LIMIT_STATES, dtype=object)[flat.argmin(axis=1)]
+    return out
+
+
+def span_pivot(table: pd.DataFrame, species: str, dead: float, live: float) -> pd.DataFrame:
+    """Printed layout: sizes down, spacings across, maximum spans (m) for one species and load."""
+    rows = table[(table["Species"] == species) & np.isclose(table["Dead (kPa)"], dead) & np.isclose(table["Live (kPa)"], live)]
+    pivot = rows.pivot(index="Size", columns="Spacing (mm)", values="Max span (m)")
+    pivot = pivot.reindex(pd.unique(rows["Size"]))
+    pivot.columns = [f"{s:g} mm o.c." for s in pivot.columns]
+    return pivot
@@ -0,0 +1,90 @@
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ----------------------------
+# Species / grade table
+# ----------------------------
+DATA_DIR = Path(__file__).resolve().parents[3] / "data"
+SOURCE_CSV = DATA_DIR / "wood_species.csv"   # reference design values (editable source)
+
+# Philippine species: representative 80 % stress-grade values (NSCP 2015 Section 6); NDS groups: NDS Supplement
+# Tables 4A (dimension lumber, 2"–4" thick) and 4D (timbers, 5" and thicker), converted to MPa.
+# Rule selects the size / wet-service factor set: "Dimension", "Timber" or "NSCP".
+PROPERTIES = ("Fb", "Ft", "Fv", "Fc_perp", "Fc", "E", "Emin")
+RULES = ("Dimension", "Timber", "NSCP")
+EMIN_RATIO = 0.3654  # Emin / E for visually graded lumber, COV_E = 0.25 (NDS Appendix D)
+
+SPECIES_DTYPE = np.dtype([
+    ("name", "U64"), ("group", "U32"), ("species", "U32"), ("grade", "U32"), ("rule", "U10"),
+    ("Fb", "f8"), ("Ft", "f8"), ("Fv", "f8"), ("Fc_perp", "f8"), ("Fc", "f8"), ("E", "f8"), ("Emin", "f8"), ("G", "f8"),
+])
+
+
+@lru_cache(maxsize=1)
+def load_species() -> np.ndarray:
+    """Species / grade table as a structured array (MPa); a blank Emin is taken as EMIN_RATIO·E."""
+    data = pd.read_csv(SOURCE_CSV)
+    unknown = sorted(set(data["Rule"]) - set(RULES))
+    if unknown:
+        raise KeyError(f"Unknown size-factor rules in {SOURCE_CSV.name}: {', '.join(unknown)}")
+    data["Emin"] = data["Emin"].fillna(EMIN_RATIO * data["E"])
+    names = data["Species"] + " " + data["Grade"]
+    table = np.empty(len(data), dtype=SPECIES_DTYPE)
+    table["name"] = names
+    for field, col in (("group", "Group"), ("species", "Species"), ("grade", "Grade"), ("rule", "Rule"), ("G", "G")):
+        table[field] = data[col].to_numpy()
+    for field in PROPERTIES:
+        table[field] = data[field].to_numpy(float)
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=1)
+def species_index() -> dict:
+    """Species / grade name → row number (O(1) lookup)."""
+    return {str(n): i for i, n in enumerate(load_species()["name"])}
+
+
+def get_species(name: str) -> dict:
+    """Reference values of one species / grade as a plain dict; raises KeyError if not tabulated."""
+    row = load_species()[species_index()[name]]
+    return {f: (float(row[f]) if row.dtype[f].kind == "f" else str(row[f])) for f in SPECIES_DTYPE.names}
+
+
+def species_names(groups=None) -> list:
+    """Tabulated species / grades, optionally limited to some groups."""
+    table = load_species()
+    if groups is None:
+        return [str(n) for n in table["name"]]
+    return [str(n) for n in table["name"][np.isin(table["group"], list(groups))]]
+
+
+def species_rows(names) -> np.ndarray:
+    """Rows of many species / grades at once (batch runs); raises KeyError listing unknown names."""
+    index = species_index()
+    names = [str(n) for n in names]
+    missing = sorted(set(names) - set(index))
+    if missing:
+        raise KeyError(f"Species / grades not in the table: {', '.join(missing)}")
+    return load_species()[[index[n] for n in names]]
+
+
+def custom_species(Fb: float, Ft: float, Fv: float, Fc_perp: float, Fc: float, E: float, Emin: float = None,
+                   rule: str = "NSCP", name: str = "Custom") -> np.ndarray:
+    """
+    One-row species table for user-entered reference values (Emin defaults to EMIN_RATIO·E).
+    A tabulated name keeps the group, species, grade and G of that row.
+    """
+    if rule not in RULES:
+        raise KeyError(f"Unknown size-factor rule: {rule}")
+    row = np.zeros(1, dtype=SPECIES_DTYPE)
+    row["name"], row["group"], row["species"], row["grade"], row["rule"] = name, "Custom", name, "", rule
+    if name in species_index():  # edited values of a tabulated grade keep its species / grade (grade-keyed factors)
+        tabulated = load_species()[species_index()[name]]
+        row["group"], row["species"], row["grade"], row["G"] = tabulated["group"], tabulated["species"], tabulated["grade"], tabulated["G"]
+    for field, value in zip(PROPERTIES, (Fb, Ft, Fv, Fc_perp, Fc, E, EMIN_RATIO * E if Emin is None else Emin)):
+        row[field] = value
+    return row
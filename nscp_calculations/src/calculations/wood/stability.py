@@ -0,0 +1,215 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from src.calculations.wood.adjustment import adjust, starred
+from src.calculations.wood.species import PROPERTIES, species_rows
+
+# ----------------------------
+# NDS 2015 stability factors (3.7.1 columns, 3.3.3 beams)
+# ----------------------------
+C_COLUMN = {"Sawn lumber": 0.8, "Round timber poles / piles": 0.85, "Structural glued laminated": 0.9}
+C_BEAM = 0.95
+K_CE = 0.822              # FcE = 0.822·Emin' / (le/d)²
+K_BE = 1.20               # FbE = 1.20·Emin' / RB²
+MAX_SLENDERNESS = 50.0    # le/d (3.7.1.4) and RB (3.3.3.7)
+CURVE_POINTS = 201
+CURVE_COLUMNS = ("Length (m)", "le/d", "CP", "P' (kN)", "RB", "CL", "M' (kN·m)")
+# effective length le of bending members (Table 3.3.3): (lu/d < 7, 7 ≤ lu/d ≤ 14.3, lu/d > 14.3) as (a, b·d) in a·lu + b·d
+BEAM_LOADING = {
+    "Single span, uniform load": ((2.06, 0.0), (1.63, 3.0), (1.63, 3.0)),
+    "Single span, concentrated load at midspan": ((1.80, 0.0), (1.37, 3.0), (1.37, 3.0)),
+    "Single span, load at midspan braced there": ((1.11, 0.0), (1.11, 0.0), (1.11, 0.0)),
+    "Single span, equal loads at 1/3 points braced there": ((1.68, 0.0), (1.68, 0.0), (1.68, 0.0)),
+    "Cantilever, uniform load": ((1.33, 0.0), (0.90, 3.0), (0.90, 3.0)),
+    "Cantilever, load at free end": ((1.87, 0.0), (1.44, 3.0), (1.44, 3.0)),
+    "Other (conservative)": ((2.06, 0.0), (1.63, 3.0), (1.84, 0.0)),
+}
+
+
+def stability_factor(F_star, F_E, c):
+    """
+    NDS 3.7-1 / 3.3-6 form: (1 + α)/(2c) − √[((1 + α)/(2c))² − α/c], α = F_E / F*. Vectorized;
+    returns 1 where F* ≤ 0 and 0 where F_E = 0.
+    """
+    F_star, F_E, c = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (F_star, F_E, c)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = F_E / F_star
+        half = (1.0 + alpha) / (2.0 * c)
+        factor = half - np.sqrt(half ** 2 - alpha / c)
+    return np.where(F_star > 0.0, np.clip(np.nan_to_num(factor, nan=1.0), 0.0, 1.0), 1.0)
+
+
+def column_stability(Fc_star, Emin, slenderness, c: float = C_COLUMN["Sawn lumber"]) -> dict:
+    """CP and FcE (MPa) for column slenderness le/d (arrays broadcast); le/d = 0 gives CP = 1."""
+    slenderness = np.asarray(slenderness, dtype=float)
+    with np.errstate(divide="ignore"):
+        FcE = K_CE * np.asarray(Emin, dtype=float) / slenderness ** 2
+    return {"CP": stability_factor(Fc_star, FcE, c), "FcE": FcE}
+
+
+def beam_effective_length(lu, d, loading: str = "Single span, uniform load"):
+    """Effective length le (mm) of the compression edge for an unbraced length lu (mm), NDS Table 3.3.3."""
+    if loading not in BEAM_LOADING:
+        raise KeyError(f"Unknown beam loading: {loading}")
+    lu, d = np.broadcast_arrays(np.asarray(lu, dtype=float), np.asarray(d, dtype=float))
+    band = (lu / d >= 7.0).astype(int) + (lu / d > 14.3)
+    coef = np.array(BEAM_LOADING[loading])[band]
+    return coef[..., 0] * lu + coef[..., 1] * d
+
+
+def beam_slenderness(le, b, d):
+    """RB = √(le·d / b²)."""
+    return np.sqrt(np.asarray(le, dtype=float) * np.asarray(d, dtype=float) / np.asarray(b, dtype=float) ** 2)
+
+
+def beam_stability(Fb_star, Emin, RB, b=None, d=None) -> dict:
+    """
+    CL and FbE (MPa) for beam slenderness RB (arrays broadcast). When b and d are given, CL = 1 where
+    d ≤ b (no tendency to buckle laterally, 3.3.3.1).
+    """
+    RB = np.asarray(RB, dtype=float)
+    with np.errstate(divide="ignore"):
+        FbE = K_BE * np.asarray(Emin, dtype=float) / RB ** 2
+    CL = stability_factor(Fb_star, FbE, C_BEAM)
+    if b is not None and d is not None:
+        CL = np.where(np.asarray(d, dtype=float) <= np.asarray(b, dtype=float), 1.0, CL)
+    return {"CL": CL, "FbE": FbE}
+
+
+def combined_ratio(fc, Fc_adj, fb, Fb_adj, FcE):
+    """NDS 3.9-3, uniaxial: (fc/F'c)² + fb / [F'b(1 − fc/FcE)]; inf when fc ≥ FcE."""
+    fc, Fc_adj, fb, Fb_adj, FcE = (np.asarray(v, dtype=float) for v in (fc, Fc_adj, fb, Fb_adj, FcE))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        amplified = np.where(fb > 0.0, fb / (Fb_adj * (1.0 - fc / FcE)), 0.0)
+    return np.where(fc < FcE, (fc / Fc_adj) ** 2 + amplified, np.inf)
+
+
+# ----------------------------
+# Cached capacity-vs-length curves
+# ----------------------------
+@lru_cache(maxsize=256)
+def _curve_arrays(species: str, b: float, d: float, max_length: float, K: float, loading: str, CD: float,
+                  wet: bool, temperature: float, incised: bool, c: float) -> tuple:
+    """Memoized (length, le/d, CP, P', RB, CL, M') arrays of stability_curves, read-only."""
+    b, d = min(b, d), max(b, d)
+    result = adjust(species_rows([species]), b, d, CD, wet, temperature, incised)
+    Fc_star, Fb_star = float(starred(result, "Fc")[0]), float(starred(result, "Fb")[0])
+    Emin = float(result["adjusted"][0, PROPERTIES.index("Emin")])
+    length = np.linspace(0.0, max_length, CURVE_POINTS)
+    le_d = K * length * 1000.0 / b
+    RB = beam_slenderness(beam_effective_length(length * 1000.0, d, loading), b, d)
+    CP = np.where(le_d > MAX_SLENDERNESS, np.nan, column_stability(Fc_star, Emin, le_d, c)["CP"])
+    CL = np.where(RB > MAX_SLENDERNESS, np.nan, beam_stability(Fb_star, Emin, RB, b, d)["CL"])
+    arrays = (length, le_d, CP, CP * Fc_star * b * d / 1000.0, RB, CL, CL * Fb_star * b * d ** 2 / 6.0 / 1e6)
+    for a in arrays:
+        a.setflags(write=False)
+    return arrays
+
+
+def stability_curves(species: str, b: float, d: float, max_length: float = 6.0, K: float = 1.0,
+                     loading: str = "Single span, uniform load", CD: float = 1.0, wet: bool = False,
+                     temperature: float = 38.0, incised: bool = False, c: float = C_COLUMN["Sawn lumber"]) -> pd.DataFrame:
+    """
+    Column and beam capacity of one species / grade and size over lengths 0…max_length (m):
+    CP and P' (kN) for buckling about the least dimension with le = K·L, CL and M' (kN·m) about the strong
+    axis with the compression edge unbraced over L. Points beyond slenderness 50 are NaN.
+    The curves are cached as read-only arrays; every call returns a fresh DataFrame.
+    """
+    arrays = _curve_arrays(species, float(b), float(d), float(max_length), float(K), loading, float(CD),
+                           bool(wet), float(temperature), bool(incised), float(c))
+    return pd.DataFrame(dict(zip(CURVE_COLUMNS, arrays)))
+
+
+# ----------------------------
+# Batch schedules
+# ----------------------------
+def _conditions(schedule: pd.DataFrame) -> dict:
+    def column(name, default):
+        return np.asarray(schedule[name].fillna(default).to_numpy() if name in schedule else default)
+
+    return {"CD": column("CD", 1.0).astype(float), "wet": column("Wet", False).astype(bool),
+            "temperature": column("Temperature (°C)", 38.0).astype(float), "incised": column("Incised", False).astype(bool)}
+
+
+def check_columns(schedule: pd.DataFrame, c: float = C_COLUMN["Sawn lumber"]) -> pd.DataFrame:
+    """
+    Batch check of rectangular posts. Columns: "Member", "Species", "b (mm)", "d (mm)", "Length (m)", "Ke",
+    "P (kN)", optional "M (kN·m)" about the strong axis (compression edge unbraced over the length) and the
+    service-condition columns of adjust_members. Buckling is checked about both axes.
+    """
+    b0, d0 = schedule["b (mm)"].to_numpy(float), schedule["d (mm)"].to_numpy(float)
+    b, d = np.minimum(b0, d0), np.maximum(b0, d0)
+    L = schedule["Length (m)"].to_numpy(float) * 1000.0
+    Ke = schedule["Ke"].fillna(1.0).to_numpy(float) if "Ke" in schedule else np.ones(len(schedule))
+    P = schedule["P (kN)"].fillna(0.0).to_numpy(float) * 1000.0
+    M = schedule["M (kN·m)"].fillna(0.0).to_numpy(float) * 1e6 if "M (kN·m)" in schedule else np.zeros(len(schedule))
+
+    result = adjust(species_rows(schedule["Species"]), b, d, **_conditions(schedule))
+    Fc_star, Fb_star = starred(result, "Fc"), starred(result, "Fb")
+    Emin = result["adjusted"][:, PROPERTIES.index("Emin")]
+    minor = column_stability(Fc_star, Emin, Ke * L / b, c)
+    strong = column_stability(Fc_star, Emin, Ke * L / d, c)
+    CP = np.minimum(minor["CP"], strong["CP"])
+    CL = beam_stability(Fb_star, Emin, beam_slenderness(beam_effective_length(L, d, "Other (conservative)"), b, d), b, d)["CL"]
+    Fc_adj, Fb_adj = CP * Fc_star, CL * result["adjusted"][:, 0]
+    fc, fb = P / (b * d), M / (b * d ** 2 / 6.0)
+    ratio = combined_ratio(fc, Fc_adj, fb, Fb_adj, strong["FcE"])
+    slenderness = Ke * L / b
+    status = np.where(slenderness > MAX_SLENDERNESS, "le/d > 50", np.where(ratio <= 1.0, "OK", "FAIL"))
+    return pd.DataFrame({
+        "Member": schedule["Member"].to_numpy() if "Member" in schedule else np.arange(1, len(schedule) + 1),
+        "Species": schedule["Species"].to_numpy(),
+        "le/d": slenderness,
+        "CP": CP,
+        "F'c (MPa)": Fc_adj,
+        "P' (kN)": Fc_adj * b * d / 1000.0,
+        "CL": CL,
+        "F'b (MPa)": Fb_adj,
+        "fc (MPa)": fc,
+        "fb (MPa)": fb,
+        "Ratio (NDS 3.9-3)": ratio,
+        "Status": status,
+    })
+
+
+def check_beams(schedule: pd.DataFrame) -> pd.DataFrame:
+    """
+    Batch bending / shear check of rectangular beams. Columns: "Member", "Species", "b (mm)", "d (mm)",
+    "lu (m)" (unbraced compression edge, 0 = continuously braced), "Loading" (BEAM_LOADING), "M (kN·m)",
+    "V (kN)", optional "Repetitive" and the service-condition columns of adjust_members.
+    """
+    b, d = schedule["b (mm)"].to_numpy(float), schedule["d (mm)"].to_numpy(float)
+    lu = schedule["lu (m)"].fillna(0.0).to_numpy(float) * 1000.0
+    loading = schedule["Loading"].fillna("Other (conservative)").to_numpy() if "Loading" in schedule \
+        else np.full(len(schedule), "Other (conservative)")
+    repetitive = schedule["Repetitive"].fillna(False).to_numpy(bool) if "Repetitive" in schedule else False
+    M = schedule["M (kN·m)"].fillna(0.0).to_numpy(float) * 1e6
+    V = schedule["V (kN)"].fillna(0.0).to_numpy(float) * 1000.0
+
+    result = adjust(species_rows(schedule["Species"]), b, d, repetitive=repetitive, **_conditions(schedule))
+    Emin = result["adjusted"][:, PROPERTIES.index("Emin")]
+    le = np.zeros(len(schedule))
+    for name in pd.unique(loading):
+        rows = loading == name
+        le[rows] = beam_effective_length(lu[rows], d[rows], name)
+    RB = beam_slenderness(le, b, d)
+    CL = beam_stability(starred(result, "Fb"), Emin, RB, b, d)["CL"]
+    Fb_adj = result["adjusted"][:, 0] * CL
+    Fv_adj = result["adjusted"][:, PROPERTIES.index("Fv")]
+    fb, fv = M / (b * d ** 2 / 6.0), 1.5 * V / (b * d)
+    ratio = np.maximum(fb / Fb_adj, fv / Fv_adj)
+    status = np.where(RB > MAX_SLENDERNESS, "RB > 50", np.where(ratio <= 1.0, "OK", "FAIL"))
+    return pd.DataFrame({
+        "Member": schedule["Member"].to_numpy() if "Member" in schedule else np.arange(1, len(schedule) + 1),
+        "Species": schedule["Species"].to_numpy(),
+        "le (mm)": le,
+        "RB": RB,
+        "CL": CL,
+        "F'b (MPa)": Fb_adj,
+        "fb (MPa)": fb,
+        "F'v (MPa)": Fv_adj,
+        "fv (MPa)": fv,
+        "Ratio": ratio,
+        "Status": status,
+    })
@@ -0,0 +1,95 @@
+import numpy as np
+
+# ----------------------------
+# Floor vibration (EC5 7.3 with the UK National Annex; Hu & Chui criterion)
+# ----------------------------
+CRITERIA = ("EC5 (UK NA)", "Hu & Chui")
+GRAVITY = 9.81
+MIN_FREQUENCY = 8.0       # Hz, EC5 7.3.3: lower fundamental frequencies need a special investigation
+POINT_LOAD = 1000.0       # N
+K_AMP = 1.05              # amplification for simply supported solid timber joists (UK NA.2.6)
+K_DIST_MIN = 0.30
+DEFLECTION_LIMIT = 1.8    # mm/kN for spans up to DEFLECTION_SPAN; 16500 / L^1.1 beyond
+DEFLECTION_SPAN = 4000.0  # mm
+HU_CHUI = 18.7            # f1 / w^0.44 ≥ 18.7 (w in mm under 1 kN)
+HU_CHUI_EXPONENT = 0.44
+SHEATHING_E = 7000.0      # MPa, plywood along the face grain
+SHEATHING_DENSITY = 600.0 # kg/m³
+
+
+def floor_stiffness(E, b, d, spacing, sheathing_t: float = 18.0, sheathing_E: float = SHEATHING_E,
+                    gamma: float = 0.0) -> dict:
+    """
+    Stiffness of a joist floor, every argument broadcasting (mm, MPa).
+
+    EI_joist: bare joist (N·mm²); EI_l: joist with its width of sheathing by the γ-method (EC5 Annex B,
+    γ = 0 no composite action, 1 glued), per metre width (N·mm²/m); EI_b: sheathing across the joists (N·mm²/m).
+    """
+    E, b, d, spacing, t, Es, gamma = np.broadcast_arrays(*(np.asarray(v, dtype=float)
+                                                          for v in (E, b, d, spacing, sheathing_t, sheathing_E, gamma)))
+    EI_joist = E * b * d ** 3 / 12.0
+    EA_s, EA_j = Es * spacing * t, E * b * d
+    h = (t + d) / 2.0
+    a_j = gamma * EA_s * h / (gamma * EA_s + EA_j)
+    a_s = h - a_j
+    EI_composite = EI_joist + Es * spacing * t ** 3 / 12.0 + gamma * EA_s * a_s ** 2 + EA_j * a_j ** 2
+    return {"EI_joist": EI_joist, "EI_l": EI_composite * 1000.0 / spacing, "EI_b": Es * t ** 3 / 12.0 * 1000.0}
+
+
+def floor_mass(b, d, spacing, dead, G, sheathing_t: float = 18.0) -> np.ndarray:
+    """Vibrating mass (kg/m²): permanent load plus joists (ρ = 1000·G) and sheathing."""
+    b, d, spacing, dead, G, t = (np.asarray(v, dtype=float) for v in (b, d, spacing, dead, G, sheathing_t))
+    return dead * 1000.0 / GRAVITY + 1000.0 * G * b * d / spacing * 1e-3 + SHEATHING_DENSITY * t * 1e-3
+
+
+def _coefficients(E, b, d, spacing, dead, G, sheathing_t, sheathing_E, gamma):
+    """A and c of f1 = A / L² (L in m) and w = c·L³ (L in mm) for every floor."""
+    k = floor_stiffness(E, b, d, spacing, sheathing_t, sheathing_E, gamma)
+    m = floor_mass(b, d, spacing, dead, G, sheathing_t)
+    A = np.pi / 2.0 * np.sqrt(k["EI_l"] * 1e-6 / m)
+    k_dist = np.maximum(0.38 - 0.08 * np.log(14.0 * k["EI_b"] / np.asarray(spacing, dtype=float) ** 4), K_DIST_MIN)
+    c = POINT_LOAD * k_dist * K_AMP / (48.0 * k["EI_joist"])
+    return A, c
+
+
+def deflection_limit(span) -> np.ndarray:
+    """EC5 / UK NA limit a (mm/kN) of the 1 kN point-load deflection; span in mm."""
+    span = np.asarray(span, dtype=float)
+    return np.where(span <= DEFLECTION_SPAN, DEFLECTION_LIMIT, 16500.0 / span ** 1.1)
+
+
+def floor_vibration(E, b, d, spacing, span, dead, G, sheathing_t: float = 18.0, sheathing_E: float = SHEATHING_E,
+                    gamma: float = 0.0) -> dict:
+    """
+    Vibration of simply supported joist floors, vectorized over every argument.
+
+    E: joist modulus (MPa), b, d, spacing, span (mm), dead: permanent load (kPa), G: specific gravity.
+    f1 = π/(2L²)·√(EI_l/m); 1 kN deflection w = 1000·k_dist·L³·k_amp/(48·EI_joist) with
+    k_dist = max(0.38 − 0.08·ln(14·EI_b/s⁴), 0.30). Acceptable (EC5) when f1 ≥ 8 Hz and w ≤ a;
+    Hu & Chui when f1 / w^0.44 ≥ 18.7.
+    """
+    A, c = _coefficients(E, b, d, spacing, dead, G, sheathing_t, sheathing_E, gamma)
+    span = np.asarray(span, dtype=float)
+    f1 = A / (span / 1000.0) ** 2
+    w = c * span ** 3
+    limit = deflection_limit(span)
+    ratio = f1 / w ** HU_CHUI_EXPONENT
+    return {"f1": f1, "w": w, "limit": limit, "hu_chui": ratio,
+            "EC5 (UK NA)": (f1 >= MIN_FREQUENCY) & (w <= limit), "Hu & Chui": ratio >= HU_CHUI}
+
+
+def vibration_span(E, b, d, spacing, dead, G, sheathing_t: float = 18.0, sheathing_E: float = SHEATHING_E,
+                   gamma: float = 0.0, criterion: str = CRITERIA[0]) -> np.ndarray:
+    """
+    Longest simple span (m) meeting the vibration criterion, in closed form: f1 ∝ L⁻² and w ∝ L³,
+    so each condition bounds the span directly (the EC5 deflection limit is continuous at 4 m).
+    """
+    if criterion not in CRITERIA:
+        raise KeyError(f"Unknown vibration criterion: {criterion}")
+    A, c = _coefficients(E, b, d, spacing, dead, G, sheathing_t, sheathing_E, gamma)
+    if criterion == "Hu & Chui":
+        return (A / (HU_CHUI * (c * 1e9) ** HU_CHUI_EXPONENT)) ** (1.0 / (2.0 + 3.0 * HU_CHUI_EXPONENT))
+    frequency = np.sqrt(A / MIN_FREQUENCY)
+    short = np.cbrt(DEFLECTION_LIMIT / c)
+    deflection = np.where(short <= DEFLECTION_SPAN, short, (16500.0 / c) ** (1.0 / 4.1))
+    return np.minimum(frequency, deflection / 1000.0)
@@ -0,0 +1,39 @@
+import streamlit as st
+import pandas as pd
+from src.calculations.analysis.frame_2d import member_envelope
+
+SESSION_KEY = "frame_design_forces"
+SOURCES_KEY = "analysis_design_forces"
+MANUAL = "Manual input"
+
+
+def register_frame_forces(design, source: str = "2-D frame"):
+    """
+    Store the member design forces of the latest analysis of one source (2-D frame, 3-D truss)
+    for the design tabs; the tabs see the members of every source together.
+    """
+    sources = st.session_state.setdefault(SOURCES_KEY, {})
+    sources[source] = design
+    st.session_state[SESSION_KEY] = pd.concat(list(sources.values()), ignore_index=True)
+
+
+def frame_forces():
+    """Member × combination design forces of the latest frame analysis, or None."""
+    return st.session_state.get(SESSION_KEY)
+
+
+def frame_member_picker(label: str, key: str, prefix: str = None):
+    """
+    Member selectbox fed by the Analysis page. Returns (member name, envelope dict or None for
+    manual input). Use the returned name in the keys of the force inputs, as with section_picker.
+    prefix limits the list to members whose names start with it (e.g. "B" for beams).
+    """
+    design = frame_forces()
+    if design is None or len(design) == 0:
+        return MANUAL, None
+    envelope = member_envelope(design).set_index("Member")
+    members = [m for m in envelope.index if prefix is None or str(m).startswith(prefix)]
+    name = st.selectbox(label, [MANUAL] + members, key=key)
+    if name == MANUAL:
+        return name, None
+    return name, envelope.loc[name].to_dict()
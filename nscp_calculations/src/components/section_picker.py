@@ -0,0 +1,25 @@
+import streamlit as st
+from src.calculations.steel.sections import get_section, section_names
+
+CUSTOM = "Custom (enter properties)"
+
+
+def section_picker(label: str, key: str, kinds=None, default: str = None):
+    """
+    Catalogue selectbox. Returns (name, properties dict or None for custom input).
+    Use the returned name in the keys of dependent inputs so they reset to the
+    catalogue values whenever another section is picked.
+    """
+    options = [CUSTOM] + section_names(kinds)
+    index = options.index(default) if default in options else 0
+    name = st.selectbox(label, options, index=index, key=key)
+    if name == CUSTOM:
+        return name, None
+    return name, get_section(name)
+
+
+def prop_default(props, field: str, fallback: float, scale: float = 1.0) -> float:
+    """Catalogue value of one property (× scale), or the fallback for custom sections."""
+    if props is None:
+        return float(fallback)
+    return float(props[field]) * scale
@@ -0,0 +1,37 @@
+import streamlit as st
+from src.calculations.wood.adjustment import LOAD_DURATION
+from src.calculations.wood.species import get_species, species_names
+
+CUSTOM = "Custom (enter values)"
+
+
+def species_picker(label: str, key: str, default: str = "Apitong 80% stress grade"):
+    """
+    Species / grade selectbox. Returns (name, reference values dict or None for custom input).
+    Use the returned name in the keys of the stress inputs, as with section_picker.
+    """
+    options = [CUSTOM] + species_names()
+    index = options.index(default) if default in options else 0
+    name = st.selectbox(label, options, index=index, key=key)
+    if name == CUSTOM:
+        return name, None
+    return name, get_species(name)
+
+
+def service_conditions(prefix: str, duration: str = "Ten years (occupancy live)", repetitive: bool = False,
+                       flat: bool = False) -> dict:
+    """Load duration and service inputs shared by the wood tabs; returns keyword arguments for adjust()."""
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        load = st.selectbox("Load duration (C_D)", list(LOAD_DURATION), index=list(LOAD_DURATION).index(duration),
+                            key=f"{prefix}_duration")
+        wet = st.checkbox("Wet service (MC > 19 %) (C_M)", value=False, key=f"{prefix}_wet")
+    with c2:
+        temperature = st.number_input("Sustained temperature (°C) (C_t)", min_value=0.0, max_value=66.0, value=38.0,
+                                      step=1.0, key=f"{prefix}_temperature")
+        incised = st.checkbox("Incised for preservative (C_i)", value=False, key=f"{prefix}_incised")
+    with c3:
+        repetitive = st.checkbox("Repetitive members ≤ 610 mm o.c. (C_r)", value=repetitive, key=f"{prefix}_repetitive")
+        flat = st.checkbox("Loaded on the wide face (C_fu)", value=flat, key=f"{prefix}_flat")
+    return {"CD": LOAD_DURATION[load], "wet": wet, "temperature": temperature, "incised": incised,
+            "repetitive": repetitive, "flat": flat}
@@ -0,0 +1,86 @@
+import streamlit as st
+import numpy as np
+from src.calculations.concrete.bar_schedule import STOCK_LENGTHS_MM, marks_to_dataframe, cutting_schedule
+from src.calculations.concrete.development_length import tension_lap_length
+
+SESSION_KEY = "bbs_marks"
+
+
+def register_marks(source: str, marks: list):
+    """Store the latest bar marks of a concrete module for the bar bending schedule."""
+    if SESSION_KEY not in st.session_state:
+        st.session_state[SESSION_KEY] = {}
+    st.session_state[SESSION_KEY][source] = marks
+
+
+def display():
+    st.header("📋 Bar Bending Schedule & Cutting List")
+
+    st.markdown(r"""
+    Collects the bar marks produced by the **RC Beam, RC Column, RC One-Way Slab, RC Two-Way Slab** and
+    **RC Footing** tabs, then optimizes the cutting of commercial stock bars (first-fit-decreasing patterns)
+    to minimize offcut waste. Set how many identical members each tab represents.
+    """)
+
+    collected = st.session_state.get(SESSION_KEY, {})
+    marks = [m for source_marks in collected.values() for m in source_marks]
+    if not marks:
+        st.info("No bar marks yet — open the concrete design tabs first.")
+        return
+
+    # ----------------------------
+    # Member multipliers & stock options
+    # ----------------------------
+    st.markdown("### Members & Stock")
+    members = sorted({m["Member"] for m in marks})
+    cols = st.columns(len(members))
+    n_members = {}
+    for col, member in zip(cols, members):
+        with col:
+            n_members[member] = st.number_input(f"No. of {member}", min_value=0, value=1, step=1, key=f"bbs_n_{member}")
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        stock_m = st.multiselect("Stock lengths available (m)", [s / 1000.0 for s in STOCK_LENGTHS_MM],
+                                 default=[s / 1000.0 for s in STOCK_LENGTHS_MM], key="bbs_stock")
+        kerf = st.number_input("Cutting allowance per cut (mm)", min_value=0.0, value=0.0, step=1.0, key="bbs_kerf")
+    with c2:
+        fck = st.number_input("Concrete f'c for lap splices (MPa)", min_value=10.0, value=28.0, step=1.0, key="bbs_fck")
+        fy = st.number_input("Steel fy for lap splices (MPa)", min_value=200.0, value=420.0, step=10.0, key="bbs_fy")
+    with c3:
+        lap_class = st.selectbox("Tension lap class for bars longer than stock", ["B", "A"], index=0, key="bbs_lap_class")
+
+    if not stock_m:
+        st.error("Select at least one stock length.")
+        return
+
+    # ----------------------------
+    # Schedule & optimization
+    # ----------------------------
+    bbs = marks_to_dataframe(marks, n_members)
+    dias = bbs["Dia (mm)"].unique()
+    laps = dict(zip(dias, np.atleast_1d(tension_lap_length(dias, fy, fck, lap_class))))
+    patterns, order = cutting_schedule(bbs, [s * 1000.0 for s in stock_m], laps, kerf)
+
+    st.markdown("---")
+    st.markdown("### 🧾 Bar Bending Schedule")
+    st.dataframe(bbs, use_container_width=True)
+
+    st.markdown("### ✂️ Cutting Patterns")
+    st.dataframe(patterns, use_container_width=True)
+
+    st.markdown("### 📦 Order Quantities")
+    st.dataframe(order, use_container_width=True)
+
+    c4, c5, c6 = st.columns(3)
+    with c4:
+        st.metric("Net bar mass (kg)", f"{bbs['Mass (kg)'].sum():,.1f}")
+    with c5:
+        st.metric("Stock ordered (kg)", f"{order['Mass (kg)'].sum():,.1f}" if not order.empty else "0.0")
+    with c6:
+        st.metric("Total offcut (m)", f"{order['Waste (m)'].sum():,.2f}" if not order.empty else "0.00")
+
+    st.download_button("Download schedule (CSV)", bbs.to_csv(index=False).encode("utf-8"), "bar_bending_schedule.csv", "text/csv")
+    st.download_button("Download order quantities (CSV)", order.to_csv(index=False).encode("utf-8"), "rebar_order.csv", "text/csv")
+
+    st.caption("Cut lengths are straight-bar/centreline estimates with standard hooks; verify bends and laps against NSCP 425 detailing.")
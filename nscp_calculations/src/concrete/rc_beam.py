@@ -1,10 +1,15 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.calculations.concrete.bar_schedule import make_mark, stirrup_cut_length, count_at_spacing
+from src.calculations.concrete.development_length import COATINGS, CONCRETES, confinement_term, development_length, development_table
+from src.concrete.rc_bbs import register_marks
+from src.components.frame_forces import frame_member_picker
+from src.components.section_picker import prop_default
 
 def display():
     st.header("🧱 RC Beam Design (NSCP-style) — Quick Check")
-    st.markdown("Automatic checks for **flexure**, **shear**, and **approx. development length**. Adjust inputs and results update immediately.")
+    st.markdown("Automatic checks for **flexure**, **shear**, and **development length**. Adjust inputs and results update immediately.")
 
     # ----------------------------
     # Inputs
@@ -25,13 +30,14 @@ def display():
         phi_flex = st.number_input("φ (flexure)", min_value=0.5, max_value=1.0, value=0.9, step=0.01, key="rc_phif")
 
     st.markdown("### Loads / Design actions")
+    member, actions = frame_member_picker("Member from frame analysis", "rc_frame_member")
     c4, c5, c6 = st.columns(3)
     with c4:
-        Mu_req = st.number_input("Factored moment required, M_u (kN·m)", min_value=0.0, value=150.0, step=1.0, key="rc_Mu")
+        Mu_req = st.number_input("Factored moment required, M_u (kN·m)", min_value=0.0, value=prop_default(actions, "Mu (kN·m)", 150.0), step=1.0, key=f"rc_Mu_{member}")
     with c5:
-        Vu_req = st.number_input("Factored shear required, V_u (kN)", min_value=0.0, value=120.0, step=1.0, key="rc_Vu")
+        Vu_req = st.number_input("Factored shear required, V_u (kN)", min_value=0.0, value=prop_default(actions, "Vu (kN)", 120.0), step=1.0, key=f"rc_Vu_{member}")
     with c6:
-        comb_note = st.text_input("Load combo note (e.g. 1.2D+1.6L)", value="1.2D + 1.6L", key="rc_note")
+        comb_note = st.text_input("Load combo note (e.g. 1.2D+1.6L)", value=actions["Combo (M)"] if actions else "1.2D + 1.6L", key=f"rc_note_{member}")
 
     # Additional choices / defaults
     st.markdown("### Design options / defaults")
@@ -44,6 +50,14 @@ def display():
     with colPhi:
         phi_shear = st.number_input("φ (shear)", min_value=0.5, max_value=1.0, value=0.75, step=0.01, key="rc_phis")
 
+    colCoat, colConc, colLen = st.columns(3)
+    with colCoat:
+        coating = st.selectbox("Bar coating (ψe)", COATINGS, index=0, key="rc_coating")
+    with colConc:
+        concrete_type = st.selectbox("Concrete (λ)", CONCRETES, index=0, key="rc_lambda")
+    with colLen:
+        beam_length = st.number_input("Beam clear span for bar schedule, L (mm)", min_value=500.0, value=6000.0, step=100.0, key="rc_bbs_L")
+
     # ----------------------------
     # Internal calculations
     # ----------------------------
@@ -92,9 +106,28 @@ def display():
         s_used_mm = s_limit_mm
         stirrup_required = False
 
-    # Approximate development length (ACI-based rough estimate) in mm:
-    # ld = (fy * db) / (4 * sqrt(f'c))  (simple, does not include coatings or epoxy)
-    ld_mm = (fy * bar_dia) / (4.0 * math.sqrt(max(fck, 1.0)))
+    # Development length (NSCP 425.4.2.3) — bottom bars and top bars (ψt = 1.3)
+    # cb = lesser of cover to bar centre and half the c/c bar spacing; Ktr from the stirrups
+    cb_cover = cover + stirrup_dia + 0.5 * bar_dia
+    def cb_spacing(n):
+        return 0.5 * (b - 2.0 * (cover + stirrup_dia) - bar_dia) / (n - 1) if n > 1 else cb_cover
+    # Atr counts every stirrup leg crossing the splitting plane: Ktr = 40·Atr/(s·n) (§425.4.2.4);
+    # each layer uses its own bar count for cb and n
+    Atr_mm2 = legs * math.pi * stirrup_dia ** 2 / 4.0
+    cb_ktr_db = confinement_term(bar_dia, min(cb_cover, cb_spacing(n_bars)), Atr_mm2, s_used_mm, n_bars)
+    cb_ktr_db_top = confinement_term(bar_dia, min(cb_cover, cb_spacing(top_bars)), Atr_mm2, s_used_mm, max(top_bars, 1))
+    coating_idx = COATINGS.index(coating)
+    lambda_idx = CONCRETES.index(concrete_type)
+    ld_mm = development_length(bar_dia, fy, fck, 0, coating_idx, lambda_idx, cb_ktr_db)
+    ld_top_mm = development_length(bar_dia, fy, fck, 1, coating_idx, lambda_idx, cb_ktr_db_top)
+
+    # Bar marks for the bar bending schedule (bars anchored ld into each support)
+    register_marks("RC Beam", [
+        make_mark("B1", "RC Beam", bar_dia, beam_length + 2.0 * ld_mm, n_bars),
+        make_mark("B2", "RC Beam", bar_dia, beam_length + 2.0 * ld_top_mm, top_bars),
+        make_mark("S1", "RC Beam", stirrup_dia, stirrup_cut_length(b, h, cover, stirrup_dia),
+                  count_at_spacing(beam_length, s_used_mm), shape="Stirrup"),
+    ])
 
     # Interaction / checks
     flexure_ok = phiMn_kNm >= Mu_req
@@ -163,14 +196,18 @@ def display():
         "Parameter": [
             "Required shear res. spacing s_req (mm)",
             "Stirrup single-leg area Av (mm²)",
-            "Approx development length ld (mm)",
+            "(cb + Ktr)/db bottom / top (≤ 2.5)",
+            "Development length ld, bottom bars (mm)",
+            "Development length ld, top bars (mm)",
             "Flexure margin (φMn / Mu)",
             "Shear margin (available / required)"
         ],
         "Value": [
             f"{s_req_mm:.1f}" if s_req_mm != float("inf") else "N/A",
             f"{Av_single_mm2:.2f}",
+            f"{cb_ktr_db:.2f} / {cb_ktr_db_top:.2f}",
             f"{ld_mm:.1f}",
+            f"{ld_top_mm:.1f}",
             f"{flex_margin:.3f}",
             f"{shear_margin:.3f}"
         ]
@@ -186,6 +223,10 @@ def display():
     - **Shear:** approximate \(V_c = 0.17 \\sqrt{f'_c} b d\) (N) → /1000 to convert to kN.  
       If \(V_u > \\phi V_c\) then required shear reinforcement \(V_s = V_u - \\phi V_c\).  
       Use \(A_v\) of stirrups and compute spacing \(s \\approx \\dfrac{0.87 f_y A_v d}{V_s}\\).
-    - **Development length (approx.):** \(l_d \\approx \\dfrac{f_y d_b}{4 \\sqrt{f'_c}}\\) (mm) — ACI-style estimate.
+    - **Development length (NSCP 425.4.2.3):** \(l_d = \\dfrac{f_y}{1.1 \\lambda \\sqrt{f'_c}} \\dfrac{\\psi_t \\psi_e \\psi_s}{(c_b + K_{tr})/d_b} d_b \\ge 300\\) mm, with \(K_{tr} = 40 A_{tr}/(s n)\).
     """)
+
+    with st.expander("Development & lap lengths for all bar sizes"):
+        st.dataframe(development_table(fy, fck, coating=coating_idx, lightweight=lambda_idx, cb_ktr_db=cb_ktr_db), use_container_width=True)
+
     st.warning("This tool gives approximate checks. Use NSCP 2015 (Section 10x/20x) for exact expressions, and consult a licensed engineer for final design.")
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.calculations.concrete.development_length import development_length, hooked_development_length
 
 def display():
 
@@ -118,13 +119,21 @@ def display():
     joint_trans_ok = Vs_available_kN >= V_short_kN if V_short_kN > 0 else True
 
     # ----------------------------
-    # Beam bar anchorage / development checks (approx)
-    # use simple ACI-like ld = (fy * db) / (4 * sqrt(f'c))  (mm)
-    # required embedment into column = max(ld, 12*db) etc. We'll show ld and compare to user-provided embed.
+    # Beam bar anchorage / development checks (NSCP 425.4)
+    # hooked bars: ldh (425.4.3); straight bars through the joint: ld (425.4.2.3)
+    # ψc = 0.7 when side cover ≥ 65 mm, ψr = 0.8 when hooks are enclosed by joint ties
     # ----------------------------
-    ld_mm = (fy * bar_dia) / (4.0 * math.sqrt(max(fck,1.0)))
-    # ask user for provided embedment
-    embed = st.number_input("Provided embedment of beam bars into column (mm)", value=300.0, min_value=0.0, step=10.0, key="jc_embed")
+    an1, an2 = st.columns(2)
+    with an1:
+        anchorage = st.selectbox("Beam bar anchorage in column", ["Standard hook", "Straight"], index=0, key="jc_anchorage")
+    with an2:
+        embed = st.number_input("Provided embedment of beam bars into column (mm)", value=300.0, min_value=0.0, step=10.0, key="jc_embed")
+    if anchorage == "Standard hook":
+        psi_c = 0.7 if col_cover >= 65.0 else 1.0
+        psi_r = 0.8 if jt_spacing <= 3.0 * bar_dia else 1.0
+        ld_mm = hooked_development_length(bar_dia, fy, fck, psi_c=psi_c, psi_r=psi_r)
+    else:
+        ld_mm = development_length(bar_dia, fy, fck, position=1 if top_bars > 0 else 0)
     embed_ok = embed >= ld_mm
 
     # ----------------------------
@@ -171,7 +180,7 @@ def display():
         "Parameter": [
             "Beam bars area As (mm²)",
             "Bar dia (mm)",
-            "Calculated development length l_d (mm) (approx.)",
+            "Required development length (mm) — " + ("l_dh" if anchorage == "Standard hook" else "l_d"),
             "Provided embedment (mm)",
             "Embedment sufficient?"
         ],
@@ -192,5 +201,6 @@ def display():
     - **Design φ·V_{c,j}:** use φ for shear (typical 0.75).
     - **Shortfall:** \(V_{short} = V_j - \phi V_{c,j}\). If > 0, provide transverse joint reinforcement so that \(V_s \ge V_{short}\).
     - **Transverse reinforcement capacity:** \(V_s = 0.87 f_y A_v (d_j / s)\). Solve for spacing s or required Av.
-    - **Development length (approx):** \(l_d \approx \dfrac{f_y d_b}{4 \sqrt{f'_c}}\) (mm). Use code for adjustments (coatings, confinement, hooks).
+    - **Hooked bars (NSCP 425.4.3):** \(l_{dh} = \dfrac{0.24 f_y \psi_e \psi_c \psi_r}{\lambda \sqrt{f'_c}} d_b \ge \max(8 d_b, 150)\) mm.
+    - **Straight bars (NSCP 425.4.2.3):** \(l_d = \dfrac{f_y}{1.1 \lambda \sqrt{f'_c}} \dfrac{\psi_t \psi_e \psi_s}{(c_b + K_{tr})/d_b} d_b\) (mm).
     """)
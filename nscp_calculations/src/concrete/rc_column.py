@@ -1,6 +1,11 @@
 import streamlit as st
 import math
 import pandas as pd
+from src.calculations.concrete.bar_schedule import make_mark, stirrup_cut_length, count_at_spacing
+from src.calculations.concrete.development_length import compression_lap_length
+from src.concrete.rc_bbs import register_marks
+from src.components.frame_forces import frame_member_picker
+from src.components.section_picker import prop_default
 
 def display():
     st.header("🏗️ RC Column Design (NSCP-style)")
@@ -29,10 +34,11 @@ def display():
     # Actions (factored)
     # ----------------------------
     st.subheader("Factored Actions (from frame analysis)")
+    member, actions = frame_member_picker("Member from frame analysis", "col_frame_member")
     a1, a2 = st.columns(2)
     with a1:
-        Pu = st.number_input("Axial factored load, P_u (kN) (compressive >0)", value=1200.0, min_value=0.0, step=10.0, key="col_Pu")
-        Mu_x = st.number_input("Factored moment about strong axis M_x (kN·m)", value=60.0, step=1.0, key="col_Mx")
+        Pu = st.number_input("Axial factored load, P_u (kN) (compressive >0)", value=prop_default(actions, "Pu (kN)", 1200.0), min_value=0.0, step=10.0, key=f"col_Pu_{member}")
+        Mu_x = st.number_input("Factored moment about strong axis M_x (kN·m)", value=prop_default(actions, "Mu (kN·m)", 60.0), step=1.0, key=f"col_Mx_{member}")
     with a2:
         Mu_y = st.number_input("Factored moment about weak axis M_y (kN·m) — optional", value=20.0, step=1.0, key="col_My")
         note = st.text_input("Note / load combo", "1.2D + 1.6L", key="col_note")
@@ -60,6 +66,27 @@ def display():
     K = st.number_input("Effective length factor K (default 1.0)", min_value=0.5, value=1.0, step=0.05, key="col_K")
     KL_over_r = (K * col_height) / r_x if r_x > 0 else float("inf")
 
+    # ----------------------------
+    # Slenderness: non-sway moment magnification (NSCP 406.6.4.5)
+    # δ = Cm / (1 - Pu / 0.75Pc) ≥ 1, Pc = π² EI_eff / (k lu)², EI_eff = 0.4 Ec Ig / (1 + βdns)
+    # sway effects come from the frame analysis (second-order forces on the Analysis page)
+    s1, s2 = st.columns(2)
+    with s1:
+        end_ratio = st.number_input("End moment ratio M1/M2 (− single, + double curvature)", min_value=-1.0, max_value=1.0,
+                                    value=prop_default(actions, "M1/M2", -1.0), step=0.1, key=f"col_M1M2_{member}")
+    with s2:
+        beta_dns = st.number_input("Sustained load ratio βdns", min_value=0.0, max_value=1.0, value=0.6, step=0.05, key="col_beta_dns")
+    slender_limit = min(34.0 + 12.0 * end_ratio, 40.0)
+    Ec = 4700.0 * math.sqrt(fck)
+    EI_eff = 0.4 * Ec * I_x / (1.0 + beta_dns)                 # N·mm²
+    Pc_kN = math.pi ** 2 * EI_eff / (K * col_height) ** 2 / 1000.0
+    Cm = max(0.6 - 0.4 * end_ratio, 0.4)
+    M2_min = Pu * (15.0 + 0.03 * h) / 1000.0                   # kN·m
+    slender = KL_over_r > slender_limit
+    buckled = slender and Pu >= 0.75 * Pc_kN
+    delta_ns = max(Cm / (1.0 - Pu / (0.75 * Pc_kN)), 1.0) if slender and not buckled else 1.0
+    Mc_x = delta_ns * max(Mu_x, M2_min) if slender else Mu_x
+
     # ----------------------------
     # Axial capacity (tied column approx)
     # Pn = 0.85 f'c (Ag - As) + fy As  (units N)
@@ -87,7 +114,7 @@ def display():
     if phiPn_kN > 0:
         interaction_ratio_x += Pu / phiPn_kN
     if phiMn_kNm > 0:
-        interaction_ratio_x += Mu_x / phiMn_kNm
+        interaction_ratio_x += Mc_x / phiMn_kNm
 
     # For bi-axial moment a simple conservative extension:
     # Add contribution of M_y normalized by φMn about y using same As (very conservative)
@@ -110,6 +137,18 @@ def display():
     As_min_mm2 = max(As_min1, As_min2)
     As_ok = As_total_mm2 >= As_min_mm2
 
+    # ----------------------------
+    # Bar marks for the bar bending schedule
+    # vertical bars lapped into the storey above (compression lap, NSCP 425.5.5),
+    # ties at s = min(16 db, 48 d_tie, least column dimension)
+    lap_mm = compression_lap_length(bar_dia, fy, fck)
+    tie_spacing = min(16.0 * bar_dia, 48.0 * tie_dia, min(b, h))
+    register_marks("RC Column", [
+        make_mark("C1", "RC Column", bar_dia, col_height + lap_mm, n_bars),
+        make_mark("T1", "RC Column", tie_dia, stirrup_cut_length(b, h, cover, tie_dia),
+                  count_at_spacing(col_height, tie_spacing), shape="Tie"),
+    ])
+
     # ----------------------------
     # Results presentation
     # ----------------------------
@@ -121,14 +160,20 @@ def display():
             "Total long. steel A_s (mm²)",
             "Effective depth d (mm)",
             "Radius of gyration r_x (mm)",
-            "KL/r (unitless)"
+            "KL/r (unitless)",
+            "Slenderness limit 34 + 12 M1/M2 (≤ 40)",
+            "Critical load Pc (kN)",
+            "Magnifier δns = Cm / (1 - Pu/0.75Pc)"
         ],
         "Value": [
             f"{Ag_mm2:.0f}",
             f"{As_total_mm2:.1f}",
             f"{d_mm:.1f}",
             f"{r_x:.2f}",
-            f"{KL_over_r:.2f}"
+            f"{KL_over_r:.2f}",
+            f"{slender_limit:.1f}",
+            f"{Pc_kN:.1f}",
+            f"{delta_ns:.3f} (Cm = {Cm:.2f})"
         ]
     })
 
@@ -141,8 +186,8 @@ def display():
             "Axial check (Pu ≤ φPn)?",
             "Nominal moment capacity Mn about strong axis (kN·m)",
             "Design moment capacity φMn (kN·m)",
-            "Applied moment Mx (kN·m)",
-            "Flexure check (Mx ≤ φMn)?",
+            "Design moment Mc = δns·Mx (kN·m)",
+            "Flexure check (Mc ≤ φMn)?",
             "Axial+moment interaction (ratio ≤ 1?)",
             "Minimum reinforcement As_min (mm²)",
             "Provided As ≥ As_min?"
@@ -154,8 +199,8 @@ def display():
             "PASS" if Pu <= phiPn_kN else "FAIL",
             f"{Mn_kNm:.2f}",
             f"{phiMn_kNm:.2f}",
-            f"{Mu_x:.2f}",
-            "PASS" if Mu_x <= phiMn_kNm else "FAIL",
+            f"{Mc_x:.2f}",
+            "PASS" if Mc_x <= phiMn_kNm else "FAIL",
             f"{interaction_ratio_x:.3f}  (≤1 OK)",
             f"{As_min_mm2:.1f}",
             "PASS" if As_ok else "FAIL"
@@ -164,8 +209,11 @@ def display():
 
     st.markdown("---")
     st.subheader("⚠️ Notes & Warnings")
-    if KL_over_r > 12:
-        st.warning("KL/r > 12 — column may be slender. Check slender-column provisions in NSCP (second-order effects, reduced capacities).")
+    if buckled:
+        st.error(f"Pu ≥ 0.75Pc = {0.75 * Pc_kN:.0f} kN — the column buckles; enlarge the section or reduce k·lu.")
+    elif slender:
+        st.warning(f"k·lu/r = {KL_over_r:.1f} > {slender_limit:.1f} — slender column: Mx magnified by δns = {delta_ns:.3f} "
+                   f"(M2,min = {M2_min:.1f} kN·m). Sway effects: use second-order forces from the Analysis page.")
     if Pu > phiPn_kN:
         st.error("Applied axial load Pu exceeds design axial capacity φPn — revise section or reinforcement.")
     if interaction_ratio_x > 1.0:
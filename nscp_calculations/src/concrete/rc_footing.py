@@ -1,6 +1,8 @@
 import streamlit as st
 import math
 import pandas as pd
+from src.calculations.concrete.bar_schedule import make_mark
+from src.concrete.rc_bbs import register_marks
 
 def display():
     st.header("🧱 RC Isolated Footing Design (NSCP 2015 — Section 418)")
@@ -32,6 +34,12 @@ def display():
     with col8:
         column_length = st.number_input("Column Length (m)", min_value=0.0, value=0.4, step=0.05, key="footing_col_l")
 
+    col9, col10 = st.columns(2)
+    with col9:
+        bar_dia = st.number_input("Bottom bar diameter (mm)", min_value=10.0, value=16.0, step=2.0, key="footing_bar")
+    with col10:
+        footing_cover = st.number_input("Concrete cover (mm)", min_value=50.0, value=75.0, step=5.0, key="footing_cover")
+
     st.subheader("Design Calculation")
 
     # Factored load (1.5 DL + 1.5 LL)
@@ -70,6 +78,14 @@ def display():
 
     punching_ok = v_actual <= v_allow
 
+    # Bar marks for the bar bending schedule: As_provided each way, bars with 90° hooks
+    n_bars = max(math.ceil(As_provided / (math.pi * bar_dia ** 2 / 4.0)), 2)
+    hook = 12.0 * bar_dia
+    register_marks("RC Footing", [
+        make_mark("F1", "RC Footing", bar_dia, footing_length * 1000.0 - 2.0 * footing_cover + 2.0 * hook, n_bars, shape="Hooked"),
+        make_mark("F2", "RC Footing", bar_dia, footing_width * 1000.0 - 2.0 * footing_cover + 2.0 * hook, n_bars, shape="Hooked"),
+    ])
+
     # Summary Table
     results = {
         "Parameter": [
@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.calculations.concrete.bar_schedule import make_mark, count_at_spacing
+from src.concrete.rc_bbs import register_marks
 
 def display():
     st.header("🧱 RC One-Way Slab Design (NSCP 2015 Section 421)")
@@ -54,6 +56,11 @@ def display():
     spacing = bar_area / (As_req * 1e6 / 1000) * 1000  # mm
     spacing = max(100, min(spacing, 300))  # NSCP range check
 
+    # Bar marks for the bar bending schedule (main bars across the design width)
+    register_marks("RC One-Way Slab", [
+        make_mark("S1", "RC One-Way Slab", bar_dia, span * 1000.0, count_at_spacing(width * 1000.0, spacing)),
+    ])
+
     # ----------------------------
     # RESULTS
     # ----------------------------
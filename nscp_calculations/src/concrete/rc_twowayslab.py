@@ -1,6 +1,8 @@
 import streamlit as st
 import math
 import pandas as pd
+from src.calculations.concrete.bar_schedule import make_mark, count_at_spacing
+from src.concrete.rc_bbs import register_marks
 
 def display():
     st.header("🟦 RC Two-Way Slab Design (NSCP-style)")
@@ -171,6 +173,17 @@ def display():
     my_neg_ok = As_prov_my_neg >= max(As_my_neg, As_min_mm2_per_m)
     my_pos_ok = As_prov_my_pos >= max(As_my_pos, As_min_mm2_per_m)
 
+    # Bar marks for the bar bending schedule: bottom mesh full span, top bars L/3 past each support face
+    def bar_count(length_m, s_used):
+        return count_at_spacing(length_m * 1000.0, s_used) if not isinstance(s_used, str) else 0
+
+    register_marks("RC Two-Way Slab", [
+        make_mark("X1", "RC Two-Way Slab", bar_dia, Lx * 1000.0, bar_count(Ly, s_mx_pos_used)),
+        make_mark("Y1", "RC Two-Way Slab", bar_dia, Ly * 1000.0, bar_count(Lx, s_my_pos_used)),
+        make_mark("X2", "RC Two-Way Slab", bar_dia, Lx * 1000.0 / 3.0, 2 * bar_count(Ly, s_mx_neg_used)),
+        make_mark("Y2", "RC Two-Way Slab", bar_dia, Ly * 1000.0 / 3.0, 2 * bar_count(Lx, s_my_neg_used)),
+    ])
+
     # ----------------------------
     # Output tables and metrics
     # ----------------------------
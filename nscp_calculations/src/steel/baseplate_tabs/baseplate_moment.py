@@ -1,67 +1,64 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.calculations.steel.baseplate import PHI_BEARING, bearing_stress, rod_strength, size_baseplates, solve_baseplate, standard_thickness
 
 def display():
     st.header("🟦 Base Plate Moment Connection Design (NSCP 2015)")
 
     st.markdown(r"""
     ### Overview  
-    This calculator follows the **NSCP 2015 Section 421 & 425** provisions for base plate design  
-    under **axial load + bending moment**.  
-    The base plate must be checked for bearing pressure and bending capacity.
+    This calculator follows the **NSCP 2015 Section 421 & 425** provisions and **AISC Design Guide 1**  
+    for base plates under **axial load + bending moment**.  
+    Small eccentricity gives uniform bearing over \( Y = N - 2e \); beyond \( e_{crit} = N/2 - P_u/(2q_{max}) \)
+    the bearing stress reaches \( q_{max} \) and the anchor rods carry \( T = q_{max}Y - P_u \).
     """)
 
     # --- Input Section ---
     st.subheader("Input Parameters")
 
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns(3)
     with col1:
         Pu = st.number_input("Factored Axial Load, Pu (kN)", value=800.0, key="pu")
         Mu = st.number_input("Factored Moment, Mu (kN·m)", value=120.0, key="mu")
         fy = st.number_input("Steel Yield Strength Fy (MPa)", value=248.0, key="baseplate_fy")
         fc_prime = st.number_input("Concrete Compressive Strength f'c (MPa)", value=21.0, key="fc_prime")
-        B = st.number_input("Base Plate Width, B (mm)", value=400.0, key="bp_width")
-    
     with col2:
+        B = st.number_input("Base Plate Width, B (mm)", value=400.0, key="bp_width")
         N = st.number_input("Base Plate Length, N (mm)", value=400.0, key="bp_length")
-        Col_w = st.number_input("Column Width, bc (mm)", value=250.0, key="col_width")
-        Col_t = st.number_input("Column Thickness, tc (mm)", value=250.0, key="col_thick")
-        phi = st.number_input("Resistance Factor φ", value=0.9, key="phi_bp")
-
-    # --- Derived Parameters ---
-    # Concrete bearing strength (NSCP 425.2)
-    q_allow = 0.85 * fc_prime
+        Col_w = st.number_input("Column Flange Width, bf (mm)", value=250.0, key="col_width")
+        Col_t = st.number_input("Column Depth, d (mm)", value=250.0, key="col_thick")
+        Col_tf = st.number_input("Column Flange Thickness, tf (mm)", value=14.0, key="col_tf")
+    with col3:
+        A2_A1 = st.number_input("Support / plate area ratio A2/A1", min_value=1.0, value=1.0, key="bp_a2_a1")
+        rod_edge = st.number_input("Anchor rod edge distance (mm)", value=50.0, key="bp_rod_edge")
+        n_rods = st.number_input("Anchor rods per side", min_value=1, value=2, step=1, key="bp_rods")
+        d_rod = st.number_input("Anchor rod diameter (mm)", value=24.0, key="bp_rod_d")
+        Fu_rod = st.number_input("Anchor rod Fu (MPa)", value=400.0, key="bp_rod_fu")
 
-    # Area of base plate and column
-    Abp = B * N
-    Ac = Col_w * Col_t
+    # --- Design Guide 1 solution ---
+    fp_max = bearing_stress(fc_prime, A2_A1)  # φc·fp(max), MPa
+    f = N / 2 - rod_edge                      # rod offset from the plate centre
+    res = {k: float(v) for k, v in solve_baseplate(Pu, Mu, B, N, f, Col_t, Col_w, Col_tf, fp_max, fy).items()}
+    e, e_crit, Y, T = res["e"], res["e_crit"], res["Y"], res["T"]
+    t_req = res["t_req"]
+    t_std = float(standard_thickness(t_req))
+    rod_capacity = n_rods * float(rod_strength(d_rod, Fu_rod))
 
-    # Eccentricity
-    e = Mu * 1e6 / (Pu * 1e3) if Pu > 0 else 0  # in mm
-
-    # Compute bearing pressure distribution
-    if e <= (N / 6):
-        # full bearing (rectangular distribution)
-        q_max = Pu * 1e3 / Abp * (1 + 6 * e / N)
-        q_min = Pu * 1e3 / Abp * (1 - 6 * e / N)
+    if res["rods_only"]:
+        regime = "Net uplift — rods only"
+    elif e <= e_crit:
+        regime = "Small eccentricity (no rod tension)"
     else:
-        # partial bearing (triangular distribution)
-        a = N - 2 * e
-        q_max = 2 * Pu * 1e3 / (a * B)
-        q_min = 0
-
-    # Plate bending check (assume cantilever projection beyond column)
-    m = (B - Col_w) / 2  # mm
-    q_u = q_max  # worst-case pressure on projection
-    M_req = q_u * m**2 / 2 / 1e6  # kN·m per mm width
-
-    # Required thickness (mm)
-    t_req = math.sqrt((6 * M_req * 1e6) / (fy * 1e6))
-
-    # Check status
-    safe_bearing = q_max <= q_allow * 1e3
-    safe_status = "✅ Safe" if safe_bearing else "⚠️ Overstressed (Reduce load or increase plate size)"
+        regime = "Large eccentricity (rods in tension)"
+    safe_bearing = res["ok"]
+    safe_rods = T <= rod_capacity + 1e-9
+    if not safe_bearing:
+        safe_status = "⚠️ Bearing cannot be developed (increase B, N or A2/A1)"
+    elif not safe_rods:
+        safe_status = "⚠️ Anchor rods overstressed (add or enlarge rods)"
+    else:
+        safe_status = "✅ Safe"
 
     # --- Display Results ---
     st.markdown("---")
@@ -74,9 +71,16 @@ def display():
             "Base Plate Width B (mm)",
             "Base Plate Length N (mm)",
             "Eccentricity e (mm)",
-            "Max Bearing Pressure qmax (MPa)",
-            "Min Bearing Pressure qmin (MPa)",
-            "Allowable Concrete Bearing (MPa)",
+            "Critical Eccentricity e_crit (mm)",
+            "Bearing Regime",
+            "Bearing Length Y (mm)",
+            "Bearing Stress fp (MPa)",
+            f"Design Bearing φc·fp(max) (MPa), φc = {PHI_BEARING}",
+            "Anchor Rod Tension T (kN)",
+            "Anchor Rod Capacity φRn (kN)",
+            "Cantilevers m / n / λn′ (mm)",
+            "Required t — compression side (mm)",
+            "Required t — tension side (mm)",
             "Required Plate Thickness (mm)",
             "Safety Status"
         ],
@@ -85,14 +89,44 @@ def display():
             f"{Mu:.2f}",
             f"{B:.2f}",
             f"{N:.2f}",
-            f"{e:.2f}",
-            f"{q_max/1e6:.3f}",
-            f"{q_min/1e6:.3f}",
-            f"{q_allow:.3f}",
-            f"{t_req:.2f}",
+            f"{e:.2f}" if math.isfinite(e) else "∞",
+            f"{e_crit:.2f}",
+            regime,
+            f"{Y:.2f}",
+            f"{res['fp']:.3f}",
+            f"{fp_max:.3f}",
+            f"{T:.2f}",
+            f"{rod_capacity:.2f}",
+            f"{res['m']:.1f} / {res['n']:.1f} / {res['lambda_n']:.1f}",
+            f"{res['t_compression']:.2f}",
+            f"{res['t_tension']:.2f}",
+            f"{t_req:.2f}" + (f" → use {t_std:.0f}" if math.isfinite(t_std) else ""),
             safe_status
         ]
     }
     st.table(pd.DataFrame(results))
 
-    st.info(f"**Required Plate Thickness:** {t_req:.2f} mm\n\n**Maximum Bearing Pressure:** {q_max/1e6:.3f} MPa\n\n{safe_status}")
+    st.info(f"**Required Plate Thickness:** {t_req:.2f} mm\n\n**Anchor Rod Tension:** {T:.2f} kN of {rod_capacity:.2f} kN\n\n{safe_status}")
+
+    # ----------------------------
+    # Batch sizing over column base reactions
+    # ----------------------------
+    st.markdown("---")
+    st.markdown("### 📋 Base plate sizing — all column base reactions")
+    st.markdown("Lightest B × N × t and anchor rods per reaction (f'c, Fy, A2/A1, rod Fu and edge distance from above).")
+    reactions = st.data_editor(
+        pd.DataFrame({
+            "Column": ["C1", "C2", "C3"],
+            "Section": ["W250x49", "W310x60", "W310x97"],
+            "Pu (kN)": [800.0, 450.0, 1500.0],
+            "Mu (kN·m)": [120.0, 180.0, 40.0],
+        }),
+        num_rows="dynamic", key="bp_reactions", use_container_width=True,
+    ).dropna()
+    if len(reactions) > 0:
+        try:
+            sized = size_baseplates(reactions, fc=fc_prime, Fy=fy, A2_A1=A2_A1, Fu_rod=Fu_rod, rod_edge=rod_edge)
+        except KeyError as exc:
+            st.error(f"Unknown section: {exc}")
+        else:
+            st.dataframe(sized, use_container_width=True)
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.calculations.steel.baseplate import PHI_BEARING, bearing_stress, cantilevers, standard_thickness
 
 def display():
     st.header("🟩 Base Plate Pinned Connection Design (NSCP 2015)")
@@ -25,23 +26,20 @@ def display():
     with col2:
         B = st.number_input("Base Plate Width, B (mm)", value=400.0, key="bp_width_pinned")
         N = st.number_input("Base Plate Length, N (mm)", value=400.0, key="bp_length_pinned")
-        Col_w = st.number_input("Column Width, bc (mm)", value=250.0, key="col_width_pinned")
-        Col_t = st.number_input("Column Thickness, tc (mm)", value=250.0, key="col_thick_pinned")
+        Col_w = st.number_input("Column Flange Width, bf (mm)", value=250.0, key="col_width_pinned")
+        Col_t = st.number_input("Column Depth, d (mm)", value=250.0, key="col_thick_pinned")
+        A2_A1 = st.number_input("Support / plate area ratio A2/A1", min_value=1.0, value=1.0, key="a2_a1_pinned")
 
     # --- Bearing pressure check ---
     Abp = B * N  # mm²
     q_u = (Pu * 1e3) / Abp  # N/mm² = MPa
-    q_allow = 0.85 * fc_prime  # MPa
+    q_allow = bearing_stress(fc_prime, A2_A1)  # φc·0.85f'c·√(A2/A1), MPa
 
-    # --- Plate bending check (projection) ---
-    m1 = (B - Col_w) / 2  # mm
-    m2 = (N - Col_t) / 2  # mm
-
-    # Use the larger projection for conservative thickness
-    m = max(m1, m2)
-    q = q_u * 1e6  # N/m²
-    M_per_mm = q * m**2 / 2 / 1e6  # kN·m per mm width
-    t_req = math.sqrt((6 * M_per_mm * 1e6) / (fy * 1e6))  # mm
+    # --- Plate bending check (AISC Design Guide 1 cantilevers m, n, λn′) ---
+    m1, m2, lambda_n = cantilevers(Pu, B, N, Col_t, Col_w, q_allow)
+    m = max(float(m1), float(m2), float(lambda_n), 0.0)
+    t_req = m * math.sqrt(2 * Pu * 1e3 / (phi * fy * B * N)) if Pu > 0 else 0.0  # mm
+    t_std = float(standard_thickness(t_req))
 
     safe_bearing = q_u <= q_allow
     status = "✅ Safe" if safe_bearing else "⚠️ Overstressed"
@@ -54,8 +52,9 @@ def display():
     
             "Axial Load Pu (kN)",
             "Bearing Pressure q (MPa)",
-            "Allowable Bearing (MPa)",
-            "Plate Projection m (mm)",
+            f"Design Bearing φc·fp(max) (MPa), φc = {PHI_BEARING}",
+            "Cantilevers m / n / λn′ (mm)",
+            "Governing Projection ℓ (mm)",
             "Required Thickness (mm)",
             "Status"
         ],
@@ -63,8 +62,9 @@ def display():
             f"{Pu:.2f}",
             f"{q_u:.3f}",
             f"{q_allow:.3f}",
+            f"{float(m1):.1f} / {float(m2):.1f} / {float(lambda_n):.1f}",
             f"{m:.1f}",
-            f"{t_req:.2f}",
+            f"{t_req:.2f}" + (f" → use {t_std:.0f}" if math.isfinite(t_std) else ""),
             status
         ]
     })
@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.calculations.steel.brace_design import SYSTEMS, design_braces
+from src.components.frame_forces import frame_forces
 
 def display():
     st.header("🔩 Concentric Brace Connection Design (NSCP 2015 §424)")
@@ -23,7 +25,8 @@ def display():
         Fu = st.number_input("Brace Ultimate Strength Fu (MPa)", min_value=200.0, value=450.0, step=5.0, key="brace_fu")
         r = st.number_input("Radius of Gyration, r (mm)", min_value=10.0, value=25.0, step=1.0, key="brace_r")
         L = st.number_input("Brace Length, L (mm)", min_value=500.0, value=3000.0, step=50.0, key="brace_L")
-        A = st.number_input("Brace Cross-Sectional Area (mm²)", min_value=1000.0, value=3000.0, step=50.0, key="brace_A")
+        A = st.number_input("Brace Cross-Sectional Area (mm²)", min_value=100.0, value=3000.0, step=50.0, key="brace_A")
+        E = st.number_input("Modulus of Elasticity E (MPa)", min_value=1000.0, value=200000.0, step=1000.0, key="brace_E")
         phi = st.number_input("Resistance Factor φ", min_value=0.5, max_value=1.0, value=0.9, step=0.05, key="brace_phi")
 
     with col2:
@@ -47,7 +50,7 @@ def display():
         return
 
     # Euler buckling factor
-    Fe = (math.pi ** 2 * 200000) / (KLr ** 2)  # MPa
+    Fe = (math.pi ** 2 * E) / (KLr ** 2)  # MPa
     Fy_ratio = Fy / Fe
 
     # Compression strength per AISC Eq. E3-2/E3-3
@@ -96,6 +99,63 @@ def display():
     else:
         st.warning("⚠️ Gusset plate is undersized — increase plate thickness or width.")
 
+    # -------------------------------------------------
+    # BUILDING BRACE SCHEDULE (frame analysis results)
+    # -------------------------------------------------
+    st.markdown("---")
+    st.markdown("### 📋 Brace schedule — lightest HSS / angle per brace")
+    st.markdown(
+        "Brace lengths and axial forces come from the latest analysis (Analysis page) when one has been run; "
+        "otherwise paste them (one row per brace and combination, compression positive). Gussets are sized for "
+        "the expected brace strengths RyFyAg and min(RyFyAg, 1.14FcreAg) over the Whitmore section, and HSS "
+        "rupture is checked on the slotted net section."
+    )
+    b1, b2, b3 = st.columns(3)
+    with b1:
+        system = st.selectbox("Braced frame system", SYSTEMS, key="cbf_system")
+        Ry = st.number_input("Ry (expected / specified yield)", min_value=1.0, value=1.4, step=0.05, key="cbf_ry")
+    with b2:
+        kinds = st.multiselect("Brace shapes", ["HSS", "L"], default=["HSS", "L"], key="cbf_kinds")
+        Lw = st.number_input("Brace-to-gusset connection length Lw (mm)", min_value=50.0, value=200.0, step=10.0, key="cbf_lw")
+    with b3:
+        L1 = st.number_input("Gusset unbraced length L1 (mm)", min_value=10.0, value=150.0, step=10.0, key="cbf_l1")
+        prefix = st.text_input("Brace member prefix (analysis tables)", value="BR", key="cbf_prefix")
+    frame = frame_forces()
+    if frame is not None and len(frame) > 0:
+        picked = frame[frame["Member"].astype(str).str.startswith(prefix)]
+        if len(picked) == 0:
+            picked = frame
+        st.caption(f"Tables prefilled from the latest analysis (Analysis page): {picked['Member'].nunique()} member(s)"
+                   + (f" named {prefix}…" if picked is not frame else "; no member matches the prefix, all are listed") + ".")
+        member_rows = picked.drop_duplicates("Member")
+        brace_default = pd.DataFrame({"Brace": member_rows["Member"], "L (mm)": member_rows["L (mm)"], "K": 1.0})
+        force_default = pd.DataFrame({
+            "Brace": picked["Member"],
+            "Combo": picked["Combo"],
+            "Pu (kN)": picked["Pu (kN)"].where(picked["Pu (kN)"] > 0.0, -picked["Tu (kN)"]),
+        })
+        table_key = f"_frame_{prefix}"
+    else:
+        brace_default = pd.DataFrame({"Brace": ["BR1", "BR2", "BR3"], "L (mm)": [5000.0, 6500.0, 4000.0], "K": [1.0, 1.0, 1.0]})
+        force_default = pd.DataFrame({
+            "Brace": ["BR1", "BR1", "BR2", "BR2", "BR3", "BR3"],
+            "Combo": ["1.2D+1.0E+L", "0.9D-1.0E", "1.2D+1.0E+L", "0.9D-1.0E", "1.2D+1.0E+L", "0.9D-1.0E"],
+            "Pu (kN)": [300.0, -350.0, 150.0, -200.0, 400.0, -380.0],
+        })
+        table_key = ""
+    braces = st.data_editor(brace_default, num_rows="dynamic", key=f"cbf_braces{table_key}", use_container_width=True).dropna()
+    forces = st.data_editor(force_default, num_rows="dynamic", key=f"cbf_forces{table_key}", use_container_width=True).dropna()
+    if len(braces) > 0 and len(forces) > 0 and kinds:
+        try:
+            schedule = design_braces(braces, forces, Fy=Fy, Fu=Fu, Ry=Ry, system=system, kinds=kinds,
+                                     Lw=Lw, L1=L1, Fyp=Fyp, E=E)
+        except KeyError as exc:
+            st.error(str(exc))
+        else:
+            st.dataframe(schedule, use_container_width=True)
+            if (schedule["Lightest section"] == "None passes").any():
+                st.warning("Some braces have no passing catalogue section — check length, forces or width-thickness limits.")
+
     # -------------------------------------------------
     # REFERENCES
     # -------------------------------------------------
@@ -105,4 +165,5 @@ def display():
     - **NSCP 2015 Section 424.4** — Design of Braced Frames  
     - **AISC 360-10 Chapter E** — Compression Members  
     - **AISC 360-10 Chapter J** — Connections and Gusset Plates  
+    - **AISC 341-16 F1 / F2, Table D1.1** — OCBF / SCBF braces, expected strengths and width-thickness limits  
     """)
\ No newline at end of file
@@ -1,5 +1,8 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+from src.calculations.steel.ebf import PHI_V_LINK, check_links, link_class, link_rotation_limit
+from src.components.section_picker import section_picker, prop_default
 
 def display():
     st.header("🦾 Eccentric Brace Connection Design (NSCP 2015 / AISC 360-10)")
@@ -8,6 +11,7 @@ def display():
     # INPUT PARAMETERS
     # -----------------------------
     st.subheader("Input Parameters")
+    link_section, props = section_picker("Link section (catalogue)", "ebf_section", ["W"], default="W360x57")
     col1, col2, col3 = st.columns(3)
 
     with col1:
@@ -21,9 +25,20 @@ def display():
         e = st.number_input("Eccentricity (mm)", value=300.0)
 
     with col3:
-        Aw = st.number_input("Web Area Aw (mm²)", value=5000.0)
-        Zx = st.number_input("Plastic Modulus Zx (mm³)", value=3.5e6)
-        phi = 0.9
+        Aw = st.number_input("Web Area Aw (mm²)", value=prop_default(props, "Aw", 5000.0), key=f"ebf_Aw_{link_section}")
+        Zx = st.number_input("Plastic Modulus Zx (mm³)", value=prop_default(props, "Zx", 3.5e6), key=f"ebf_Zx_{link_section}")
+        phi = st.number_input("Link shear resistance factor φv", min_value=0.5, max_value=1.0, value=PHI_V_LINK, step=0.05, key="ebf_phi")
+
+    st.markdown("**Link rotation (split-K, centred link)**")
+    r1, r2, r3, r4 = st.columns(4)
+    with r1:
+        bay = st.number_input("Bay width L (mm)", min_value=100.0, value=6000.0, step=100.0, key="ebf_bay")
+    with r2:
+        h_storey = st.number_input("Storey height h (mm)", min_value=100.0, value=3500.0, step=100.0, key="ebf_h")
+    with r3:
+        drift_e = st.number_input("Elastic storey drift Δe (mm)", min_value=0.0, value=3.0, step=0.5, key="ebf_drift")
+    with r4:
+        Cd = st.number_input("Deflection amplification Cd", min_value=1.0, value=4.0, step=0.5, key="ebf_cd")
 
     # -----------------------------
     # DESIGN CALCULATIONS
@@ -35,9 +50,17 @@ def display():
     phiVn = phi * Vn
     phiMn = phi * Mn
 
+    # Link length classification and plastic rotation (AISC 341 F3.4a, F3.5b)
+    Mp_Vp = Mn / Vn * 1000          # mm
+    link_type = str(link_class(e, Mp_Vp))
+    phiVn_link = phi * min(Vn, 2 * Mn / (e / 1000)) if e > 0 else phiVn
+    gamma_p = bay / e * Cd * drift_e / h_storey if e > 0 else float("inf")
+    gamma_limit = float(link_rotation_limit(e, Mp_Vp))
+
     # Check conditions
-    shear_ok = phiVn >= Vu
+    shear_ok = phiVn_link >= Vu
     moment_ok = phiMn >= M_u
+    rotation_ok = gamma_p <= gamma_limit
 
     interaction_ratio = (Vu / phiVn) + (M_u / phiMn)
     # -------------------------------------------------
@@ -47,6 +70,7 @@ def display():
     st.markdown("### 🧾 Results Summary")
     df = pd.DataFrame({
         "Parameter": [
+            "Link Section",
             "Axial Force, Pᵤ (kN)",
             "Shear Force, Vᵤ (kN)",
             "Moment, Mᵤ (kN·m)",
@@ -59,9 +83,15 @@ def display():
             "Nominal Moment Strength, Mn (kN·m)",
             "Design Shear Strength, φVn (kN)",
             "Design Moment Strength, φMn (kN·m)",
-            "Interaction Ratio (Vu/φVn + Mu/φMn)"
+            "Interaction Ratio (Vu/φVn + Mu/φMn)",
+            "Mp/Vp (mm)",
+            "Link Classification",
+            "Link Design Shear, φ·min(Vp, 2Mp/e) (kN)",
+            "Link Rotation γp = (L/e)·Cd·Δe/h (rad)",
+            "Rotation Limit (rad)"
         ],
         "Value": [
+            link_section,
             f"{P_u:.2f}",
             f"{Vu:.2f}",
             f"{M_u:.2f}",
@@ -74,7 +104,12 @@ def display():
             f"{Mn:.2f}",
             f"{phiVn:.2f}",
             f"{phiMn:.2f}",
-            f"{interaction_ratio:.2f}"
+            f"{interaction_ratio:.2f}",
+            f"{Mp_Vp:.1f}  (1.6Mp/Vp = {1.6 * Mp_Vp:.0f}, 2.6Mp/Vp = {2.6 * Mp_Vp:.0f})",
+            link_type,
+            f"{phiVn_link:.2f}",
+            f"{gamma_p:.4f}",
+            f"{gamma_limit:.3f}"
         ]
     })
 
@@ -83,9 +118,52 @@ def display():
     # -----------------------------
     # RESULT SUMMARY
     # -----------------------------
-    if shear_ok and moment_ok:
+    if shear_ok and moment_ok and rotation_ok:
         st.success("✅ Connection design satisfies strength requirements per NSCP 2015 / AISC 360-10.")
     else:
         st.error("❌ Connection design does not satisfy strength requirements.")
 
-    st.caption("Reference: NSCP 2015 / AISC 360-10 — Section Eccentric Braced Frame Design Provisions")
+    # -----------------------------
+    # ALL LINKS OF THE EBF SYSTEM
+    # -----------------------------
+    st.markdown("---")
+    st.markdown("### 📋 EBF system — all links with capacity-design forces")
+    st.markdown(
+        "One row per link (split-K, centred link). Braces and beams outside the link are designed for the adjusted "
+        "link shear 1.25·Ry·Vn (beam at 88 %); columns for Σ 1.1·Ry·Vn of the links at and above each storey."
+    )
+    s1, s2 = st.columns(2)
+    with s1:
+        Ry = st.number_input("Ry (expected / specified yield)", min_value=1.0, value=1.1, step=0.05, key="ebf_ry")
+    with s2:
+        st.caption(f"Fy = {Fy:.0f} MPa, Cd = {Cd:.1f} from above.")
+    links = st.data_editor(
+        pd.DataFrame({
+            "Link": ["L1", "L2", "L3"],
+            "Frame": ["A", "A", "A"],
+            "Storey": [1, 2, 3],
+            "Section": ["W360x57", "W310x60", "W250x49"],
+            "e (mm)": [600.0, 600.0, 900.0],
+            "Bay (mm)": [6000.0] * 3,
+            "h (mm)": [3500.0] * 3,
+            "Δe (mm)": [7.0, 6.5, 5.0],
+            "Vu (kN)": [450.0, 350.0, 200.0],
+            "Pu (kN)": [50.0, 40.0, 20.0],
+            "Brace section": ["W200x46", "W200x46", "HSS150x150x8"],
+        }),
+        num_rows="dynamic", key="ebf_links", use_container_width=True,
+    ).dropna()
+    if len(links) > 0:
+        try:
+            results, lightest = check_links(links, Fy=Fy, Ry=Ry, Cd=Cd)
+        except KeyError as exc:
+            st.error(str(exc))
+        else:
+            st.dataframe(results, use_container_width=True)
+            n_fail = int(np.sum(results["Status"] != "OK"))
+            if n_fail:
+                st.warning(f"{n_fail} link(s) fail shear, rotation, flange compactness or brace strength.")
+            with st.expander("Lightest passing W link per row"):
+                st.dataframe(lightest, use_container_width=True)
+
+    st.caption("Reference: NSCP 2015 / AISC 360-10, AISC 341 F3 — Eccentric Braced Frame Design Provisions")
@@ -1,57 +1,81 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.calculations.steel.endplate import CONFIGS, PHI_N, column_flange_strength, endplate_strength, lever_arms, size_endplate
+from src.components.section_picker import section_picker, prop_default
 
 def display():
     st.header("🔩 Beam-Column Moment Bolted Connection Design (NSCP 2015 / AISC 360-10)")
 
+    st.markdown(r"""
+    Extended end-plate (4E / 4ES / 8ES) design by yield-line analysis (AISC 358 Ch. 6, Design Guide 4):
+    plate \( φM_{pl} = φ_b F_{yp} t_p^2 Y_p \), bolts \( φM_{np} = Σ 2 φF_{nt}A_b Q\,h_i \) with prying \( Q \)
+    (AISC Manual Part 9), column flange \( φM_{cf} = φ_b F_{yc} t_{cf}^2 Y_c \).
+    """)
+
     # -----------------------------
     # INPUT PARAMETERS
     # -----------------------------
     st.subheader("Input Parameters")
-    col1, col2, col3 = st.columns(3)
+    s1, s2 = st.columns(2)
+    with s1:
+        beam, beam_props = section_picker("Beam section (catalogue)", "ep_beam", ["W"], default="W410x60")
+    with s2:
+        column, col_props = section_picker("Column section (catalogue)", "ep_column", ["W"], default="W310x97")
 
+    col1, col2, col3 = st.columns(3)
     with col1:
         M_u = st.number_input("Factored Moment (Mᵤ, kN·m)", value=120.0, key="m_u")
         V_u = st.number_input("Factored Shear (Vᵤ, kN)", value=80.0, key="v_u")
+        config = st.selectbox("End-plate configuration", CONFIGS, key="ep_config")
         bolt_dia = st.number_input("Bolt Diameter (mm)", value=20.0, key="bolt_dia")
-        n_bolts = st.number_input("Number of Bolts", value=4, step=1, key="n_bolts")
-    
+        Fu = st.number_input("Ultimate Strength of Bolt, Fu (MPa)", value=830.0, key="bolted_fu")
+
     with col2:
         Fy = st.number_input("Yield Strength of Plate, Fy (MPa)", value=250.0, key="bolted_fy")
-        Fu = st.number_input("Ultimate Strength of Bolt, Fu (MPa)", value=400.0, key="bolted_fu")
-        edge_dist = st.number_input("Edge Distance (mm)", value=40.0, key="edge_dist")
-        pitch = st.number_input("Bolt Pitch (mm)", value=80.0, key="bolted_pitch")
+        Fup = st.number_input("Ultimate Strength of Plate, Fu (MPa)", value=400.0, key="bolted_fup")
+        plate_thk = st.number_input("End Plate Thickness (mm)", value=20.0, key="bolted_plate_thk")
+        bp = st.number_input("End Plate Width, bp (mm)", value=prop_default(beam_props, "bf", 180.0) + 25.0, key=f"ep_bp_{beam}")
+        g = st.number_input("Bolt Gauge, g (mm)", value=100.0, key="ep_gauge")
 
     with col3:
-        plate_thk = st.number_input("End Plate Thickness (mm)", value=16.0, key="bolted_plate_thk")
-        beam_depth = st.number_input("Beam Depth (mm)", value=400.0, key="bolted_beam_depth")
-        phi = 0.9
+        pf = st.number_input("Bolt to Flange Face, pfo = pfi (mm)", value=45.0, key="ep_pf")
+        edge_dist = st.number_input("Plate Edge Beyond Outer Bolts, de (mm)", value=40.0, key="edge_dist")
+        pb = st.number_input("Bolt Row Pitch, pb (8ES) (mm)", value=80.0, key="ep_pb")
+        beam_depth = st.number_input("Beam Depth (mm)", value=prop_default(beam_props, "d", 400.0), key=f"bolted_beam_depth_{beam}")
+        beam_tf = st.number_input("Beam Flange Thickness (mm)", value=prop_default(beam_props, "tf", 12.0), key=f"ep_tf_{beam}")
+
+    with st.expander("Column flange"):
+        c1, c2, c3, c4 = st.columns(4)
+        with c1:
+            bcf = st.number_input("Column flange width bcf (mm)", value=prop_default(col_props, "bf", 300.0), key=f"ep_bcf_{column}")
+        with c2:
+            tcf = st.number_input("Column flange thickness tcf (mm)", value=prop_default(col_props, "tf", 15.0), key=f"ep_tcf_{column}")
+        with c3:
+            twc = st.number_input("Column web thickness twc (mm)", value=prop_default(col_props, "tw", 10.0), key=f"ep_twc_{column}")
+        with c4:
+            Fyc = st.number_input("Column Fy (MPa)", value=345.0, key="ep_fyc")
 
     # -----------------------------
     # DESIGN CALCULATIONS
     # -----------------------------
-    # st.subheader("Design Calculations")
-
-    # Bolt group geometry
-    lever_arm = (beam_depth - 2 * edge_dist) / 1000  # m
-    T_per_bolt = (M_u * 1e6) / (n_bolts / 2 * lever_arm * 1000) / 1000  # kN per bolt in tension
-    V_per_bolt = V_u / n_bolts  # kN
+    Fnt = 0.75 * Fu   # nominal bolt tensile stress
+    Fnv = 0.45 * Fu   # nominal bolt shear stress, threads included
+    geometry = dict(bp=bp, g=g, pfo=pf, pfi=pf, de=edge_dist, pb=pb, d=beam_depth, tf=beam_tf)
+    res = {k: float(v) for k, v in endplate_strength(config, plate_thk, bolt_dia, **geometry, Fyp=Fy, Fup=Fup, Fnt=Fnt).items()}
+    h = lever_arms(config, beam_depth, beam_tf, pf, pf, pb)
+    n_bolts = 4 * len(h)  # tension rows + the same number at the compression flange
+    phiVn = PHI_N * Fnv * math.pi * bolt_dia ** 2 / 4 / 1000 * (n_bolts / 2)
+    col = column_flange_strength(config, bcf, tcf, twc, Fyc, g, pf, pf, pb, beam_depth, beam_tf, plate_thk)
+    F_flange = M_u * 1000 / (beam_depth - beam_tf)  # kN, beam flange force
 
-    # Bolt nominal tension and shear strength (AISC)
-    Ab = math.pi * (bolt_dia ** 2) / 4 / 100  # mm² to cm²
-    Rn_t = 0.75 * Fu * (math.pi * (bolt_dia**2) / 4) / 1000  # kN nominal tension
-    Rn_v = 0.6 * Fu * (math.pi * (bolt_dia**2) / 4) / 1000  # kN nominal shear
-    phiRn_t = phi * Rn_t
-    phiRn_v = phi * Rn_v
-
-    # Combined tension and shear per bolt (interaction)
-    interaction_ratio = (T_per_bolt / phiRn_t) ** 2 + (V_per_bolt / phiRn_v) ** 2
-
-    # Plate bending capacity check
-    b_eff = pitch * (n_bolts / 2)
-    Mn_plate = (Fy * b_eff * (plate_thk**2) / 4) / 1e6  # kN·m (approx)
-    phiMn_plate = phi * Mn_plate
+    checks = {
+        "End plate yielding": M_u / res["plate"],
+        "Bolt rupture with prying": M_u / res["bolts"],
+        "Bolt shear": V_u / phiVn,
+        "Column flange flexure": M_u / col["flange"],
+        "Column web local yielding": F_flange / float(col["web yielding"]),
+    }
 
     # -------------------------------------------------
     # RESULTS TABLE
@@ -62,41 +86,62 @@ def display():
         "Parameter": [
             "Factored Moment (Mᵤ)",
             "Factored Shear (Vᵤ)",
-            "Bolt Diameter",
-            "No. of Bolts",
-            "Bolt Ultimate Strength (Fu)",
-            "Tension per Bolt (kN)",
-            "Shear per Bolt (kN)",
-            "Design Tension Capacity (φRnₜ, kN)",
-            "Design Shear Capacity (φRnᵥ, kN)",
-            "Interaction Ratio (T/φRnₜ)² + (V/φRnᵥ)²",
-            "Plate Thickness (mm)",
-            "Plate Design Moment Capacity (φMn, kN·m)"
+            "Configuration / No. of Bolts",
+            "Bolt Row Lever Arms hᵢ (mm)",
+            "Plate Yield-Line Parameter Yp (mm)",
+            "Plate Design Moment (φMpl, kN·m)",
+            "Prying Factor Q (governing row)",
+            "Bolt Design Moment, no prying (kN·m)",
+            "Bolt Design Moment with prying (φMnp, kN·m)",
+            "Bolt Shear Capacity (φVn, kN)",
+            "Column Flange Yield-Line Parameter Yc (mm)",
+            "Column Flange Design Moment (φMcf, kN·m)",
+            "Column Web Yielding φRn vs Ffu (kN)",
         ],
         "Value": [
             f"{M_u:.2f} kN·m",
             f"{V_u:.2f} kN",
-            f"{bolt_dia:.0f} mm",
-            f"{n_bolts}",
-            f"{Fu:.2f} MPa",
-            f"{T_per_bolt:.2f}",
-            f"{V_per_bolt:.2f}",
-            f"{phiRn_t:.2f}",
-            f"{phiRn_v:.2f}",
-            f"{interaction_ratio:.2f}",
-            f"{plate_thk:.2f}",
-            f"{phiMn_plate:.2f}"
+            f"{config} / {n_bolts}",
+            ", ".join(f"{x:.0f}" for x in h),
+            f"{res['Yp']:.0f}",
+            f"{res['plate']:.2f}",
+            f"{res['Q']:.3f}",
+            f"{res['bolts (no prying)']:.2f}",
+            f"{res['bolts']:.2f}",
+            f"{phiVn:.2f}",
+            f"{col['Yc']:.0f}",
+            f"{col['flange']:.2f}",
+            f"{float(col['web yielding']):.1f} vs {F_flange:.1f}",
         ]
     })
     st.table(df)
+    st.table(pd.DataFrame({"Check": list(checks), "Ratio": [f"{r:.3f}" for r in checks.values()],
+                           "Status": ["OK" if r <= 1.0 else "FAIL" for r in checks.values()]}))
 
     # -----------------------------
     # SUMMARY
     # -----------------------------
-    if interaction_ratio <= 1.0 and M_u <= phiMn_plate:
+    if all(r <= 1.0 for r in checks.values()):
         st.success("✅ Connection design satisfies NSCP / AISC strength requirements.")
     else:
-        st.error("❌ Connection design does not satisfy NSCP / AISC strength requirements.")
+        failed = ", ".join(k for k, r in checks.items() if r > 1.0)
+        st.error(f"❌ Connection design does not satisfy NSCP / AISC strength requirements ({failed}).")
+
+    # -----------------------------
+    # AUTO-SIZING
+    # -----------------------------
+    st.markdown("---")
+    st.markdown("### ⚙️ Auto-size plate thickness and bolt diameter")
+    grid = size_endplate(M_u, V_u, config, **geometry, Fyp=Fy, Fup=Fup, Fnt=Fnt, Fnv=Fnv)
+    passing = grid[grid["Passes"]]
+    if len(passing):
+        best = passing.iloc[0]
+        st.info(f"Thinnest passing plate: **tp = {best['tp (mm)']:.0f} mm** with **M{best['Bolt Ø (mm)']:.0f}** bolts "
+                f"(ratio {best['Ratio']:.3f}).")
+    else:
+        st.warning("No stocked plate / bolt combination passes — change the configuration or geometry.")
+    with st.expander("All plate × bolt combinations"):
+        st.dataframe(grid, use_container_width=True)
 
     # -----------------------------
     # REFERENCES
@@ -106,5 +151,6 @@ def display():
     **References:**
     - NSCP 2015 Section 505 & 507 (Structural Steel Design)
     - AISC 360-10, Chapter J & J3 (Bolted Moment Connections)
-    - Design assumes double-row tension bolts and end plate bending per AISC provisions.
+    - AISC 358 Chapter 6 and AISC Design Guide 4 (extended end-plate yield-line parameters)
+    - AISC Steel Construction Manual Part 9 (prying action)
     """)
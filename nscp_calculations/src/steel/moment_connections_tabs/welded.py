@@ -1,5 +1,8 @@
 import streamlit as st
 import pandas as pd
+from src.calculations.steel.column_side import check_joints, flange_force_strengths, panel_zone_strength
+from src.calculations.steel.weld_group import shape_coefficient
+from src.components.section_picker import section_picker
 
 def display():
     st.header("🧱 Beam-Column Moment Welded Connection (NSCP 2015)")
@@ -28,17 +31,39 @@ def display():
         tf = st.number_input("Flange Thickness tf (mm)", value=25.0, key="welded_tf")
         Lf = st.number_input("Flange Weld Length (mm)", value=200.0, key="welded_lf")
 
+    st.markdown("**Column (panel zone and flange-force checks)**")
+    p1, p2, p3 = st.columns(3)
+    with p1:
+        column, col_props = section_picker("Column section (catalogue)", "welded_column", ["W"], default="W360x57")
+    with p2:
+        Pu_col = st.number_input("Column Axial Load Pu (kN)", value=500.0, step=50.0, key="welded_pu_col")
+        Vc = st.number_input("Column Storey Shear Vc (kN)", value=50.0, step=10.0, key="welded_vc")
+    with p3:
+        two_sided = st.checkbox("Beams on both sides (equal moments)", value=False, key="welded_two_sided")
+        at_end = st.checkbox("Joint at column top (end)", value=False, key="welded_col_end")
+
     st.divider()
 
     # --- CALCULATIONS ---
     Mu_Nmm = Mu * 1e6  # Convert kN·m to N·mm
     T = Mu_Nmm / (d - tf)  # Flange force in N
-    tw = T / (2 * phi * 0.707 * Lf * FEXX)  # Required weld throat thickness in mm
+    # flange welds (both faces, across the flange) are loaded transversely: K = 1 + 0.5 sin^1.5 90°
+    K_flange = shape_coefficient("Parallel", Lf, tf, 0.0, 90.0)
+    tw = T / (phi * 0.6 * FEXX * K_flange * 2 * Lf)  # Required weld throat thickness in mm
     weld_size = tw / 0.707  # Convert throat to weld leg size (mm)
     V_N = Vu * 1e3  # kN to N
-    web_weld_shear = V_N / (Lf * 2)  # N/mm (approximate)
-    Vp = 0.6 * Fy * (Lf * tf)  # Panel zone nominal shear (simplified)
-    Vn = phi * Vp
+    hw = d - 2 * tf  # web weld length each side (mm)
+    K_web = shape_coefficient("Parallel", hw, 10.0, 0.0, 0.0)  # longitudinal web welds
+    web_weld_shear = V_N / (2 * hw)  # N/mm
+    web_weld_size = V_N / (phi * 0.6 * FEXX * K_web * 2 * hw) / 0.707  # Required web weld leg (mm)
+    # Panel zone: column web shear from the beam flange forces (AISC J10.6)
+    if col_props is not None:
+        Vu_pz = (2 if two_sided else 1) * T - Vc * 1e3  # N
+        Vn = float(panel_zone_strength(col_props, Fy, Pu_col)) * 1e3
+        flange = {k: float(v) for k, v in flange_force_strengths(col_props, tf, Fy, at_end).items()}
+        Rn_flange = min(flange.values()) * 1e3
+    else:
+        Vu_pz, Vn, Rn_flange = 0.0, float("inf"), float("inf")
 
     # --- SUMMARY TABLE ---
     data = {
@@ -47,18 +72,22 @@ def display():
             "2. Flange Force (T)",
             "3. Required Weld Throat Thickness (tw)",
             "4. Equivalent Fillet Weld Size (w)",
-            "5. Web Weld Shear per mm",
-            "6. Panel Zone Shear Strength (φVn)",
+            "5. Web Weld Shear per mm (both sides, h_w = d − 2tf)",
+            "5a. Required Web Fillet Weld Size",
+            "6. Panel Zone Shear Strength (φRv)",
             "7. Check Panel Zone Shear",
+            "8. Column Flange / Web Under Flange Force",
         ],
         "Formula / Reference": [
             "Mu = φMn (NSCP 422.3)",
             "T = Mu / (d - tf)",
-            "tw = T / (2 × φ × 0.707 × Lf × FEXX)",
+            "tw = T / (φ × 0.6FEXX × K × 2Lf), K = 1 + 0.5 sin¹·⁵θ (θ = 90°)",
             "w = tw / 0.707",
-            "V/mm = Vu / (2 × Lf)",
-            "φVn = 0.6FyA_pzφ",
-            "Vu ≤ φVn ?"
+            "V/mm = Vu / (2 × h_w)",
+            "w = Vu / (φ × 0.6FEXX × 0.707 × 2h_w)",
+            "φRv = 0.9 × 0.6Fy·dc·tw (× (1.4 − Pr/Pc) if Pr > 0.4Pc)",
+            "ΣT − Vc ≤ φRv ?",
+            "T ≤ min(φRn FLB, WLY, WC) ?"
         ],
         "Result": [
             f"{Mu:.2f} kN·m",
@@ -66,8 +95,10 @@ def display():
             f"{tw:.2f} mm",
             f"{weld_size:.2f} mm",
             f"{web_weld_shear:.2f} N/mm",
+            f"{web_weld_size:.2f} mm",
             f"{Vn/1e3:.2f} kN",
-            "OK" if V_N <= Vn else "NG"
+            f"{Vu_pz/1e3:.2f} kN → " + ("OK" if Vu_pz <= Vn else "NG (doubler plate)"),
+            f"{Rn_flange/1e3:.2f} kN → " + ("OK" if T <= Rn_flange else "NG (continuity plates)")
         ]
     }
     
@@ -87,10 +118,37 @@ def display():
     - **Flange Force (T):** {T/1e3:.2f} kN  
     - **Required Weld Throat Thickness (tw):** {tw:.2f} mm  
     - **Recommended Fillet Weld Size (w):** {weld_size:.2f} mm  
-    - **Web Weld Shear Intensity:** {web_weld_shear:.2f} N/mm  
-    - **Panel Zone Shear Strength:** {Vn/1e3:.2f} kN  
-    - **Status:** {"🟩 SAFE" if V_N <= Vn else "🟥 NG – Increase weld or flange"}
+    - **Web Weld Shear Intensity:** {web_weld_shear:.2f} N/mm (required leg {web_weld_size:.2f} mm)  
+    - **Panel Zone Shear Strength:** {Vn/1e3:.2f} kN (demand {Vu_pz/1e3:.2f} kN)  
+    - **Status:** {"🟩 SAFE" if Vu_pz <= Vn and T <= Rn_flange else "🟥 NG – add doubler / continuity plates or use a heavier column"}
     """)
 
+    # --- ALL MOMENT-FRAME JOINTS ---
+    st.divider()
+    st.subheader("📋 Column-side checks — all moment-frame joints")
+    st.markdown("Panel-zone shear with the Pr/Pc reduction, flange local bending, web local yielding and crippling; "
+                "doubler and continuity plates are sized from the shortfall. The web and the doubler must each meet "
+                "t ≥ (dz + wz)/90 (AISC 341 E3.6e) unless the doubler is plug-welded to the web.")
+    plug_welded = st.checkbox("Doubler plug-welded to the column web (combined thickness meets (dz + wz)/90)",
+                              value=False, key="welded_plug")
+    joints = st.data_editor(
+        pd.DataFrame({
+            "Joint": ["J1", "J2", "J3"],
+            "Column": ["W360x57", "W310x97", "W310x97"],
+            "Beam": ["W410x60", "W410x60", "W310x60"],
+            "Mu left (kN·m)": [250.0, 250.0, 150.0],
+            "Mu right (kN·m)": [0.0, 250.0, 150.0],
+            "Pu (kN)": [500.0, 900.0, 400.0],
+            "Vc (kN)": [50.0, 60.0, 40.0],
+            "At column end": [False, False, True],
+        }),
+        num_rows="dynamic", key="welded_joints", use_container_width=True,
+    ).dropna()
+    if len(joints) > 0:
+        try:
+            st.dataframe(check_joints(joints, Fyc=Fy, Fyd=Fy, plug_welded=plug_welded), use_container_width=True)
+        except KeyError as exc:
+            st.error(str(exc))
+
     st.divider()
     st.caption("According to NSCP 2015 Section 422 — Structural Steel Connections, Welded Joints, and Moment-Resisting Connections.")
@@ -1,13 +1,16 @@
 import streamlit as st
-from src.steel.simple_connections_tabs import anglecleat, sheartab
+from src.steel.simple_connections_tabs import anglecleat, catalogue, sheartab
 
 def display_tabs():
     st.header("Simple Shear Connections")
     
-    tab1, tab2 = st.tabs(["Angle Cleat", "Shear Tab"])
+    tab1, tab2, tab3 = st.tabs(["Angle Cleat", "Shear Tab", "Catalogue"])
     
     with tab1:
         anglecleat.display()
         
     with tab2:
-        sheartab.display()
\ No newline at end of file
+        sheartab.display()
+
+    with tab3:
+        catalogue.display()
@@ -1,5 +1,7 @@
 import streamlit as st
+import math
 import pandas as pd
+from src.calculations.steel.bolt_group import pattern_coefficient
 
 def display():
     st.header("🧩 Angle Cleat Simple Connection (NSCP 2015 / AISC 360-10)")
@@ -17,12 +19,15 @@ def display():
     with col3:
         bolt_dia = st.number_input("Bolt Diameter (mm)", value=20.0, step=2.0, key="angle_cleat_bolt")
         n_cleats = st.number_input("Number of Cleats", min_value=1, value=2, step=1, key="angle_cleat_cleats")
+        pitch = st.number_input("Bolt Pitch (mm)", value=75.0, step=5.0, key="angle_cleat_pitch")
+        e_bolt = st.number_input("Eccentricity to Bolt Line, e (mm)", value=0.0, step=5.0, key="angle_cleat_e",
+                                 help="Distance from the line of action (e.g. angle heel) to the bolt line; 0 = concentric.")
         phi = 0.9  # Strength reduction factor
 
     # st.subheader("Design Calculations")
 
     # --- 1. Bolt Shear Capacity ---
-    Ab = 3.1416 * (bolt_dia ** 2) / 4  # mm²
+    Ab = math.pi * bolt_dia ** 2 / 4  # mm²
     Rn_bolt = 0.6 * Fu * Ab / 1000  # N → kN
     phiRn_bolt = phi * Rn_bolt
 
@@ -36,8 +41,9 @@ def display():
     Vn_plate = 0.6 * Fy * Aw / 1000  # N → kN
     phiVn_plate = phi * Vn_plate
 
-    # --- 4. Total Capacity ---
-    Vn_total = min(phiRn_bolt * n_bolts * n_cleats, phiRn_bearing * n_bolts * n_cleats, phiVn_plate * n_cleats)
+    # --- 4. Total Capacity (bolt group coefficient C by the ICR method) ---
+    C = pattern_coefficient(n_bolts, 1, pitch, 0.0, e_bolt)
+    Vn_total = min(phiRn_bolt * C * n_cleats, phiRn_bearing * C * n_cleats, phiVn_plate * n_cleats)
     ratio = V_u / Vn_total if Vn_total > 0 else 0
 
     # --- 5. Result Table ---
@@ -48,6 +54,7 @@ def display():
             "Bolt Shear Capacity per Bolt (φRn, kN)",
             "Bearing Capacity per Bolt (φRn, kN)",
             "Cleat Plate Shear Capacity per Cleat (φVn, kN)",
+            "Bolt Group Coefficient C per Cleat (ICR)",
             "Total Connection Capacity (kN)",
             "Applied Shear (kN)",
             "Utilization Ratio (Vᵤ / φVn_total)"
@@ -56,6 +63,7 @@ def display():
             f"{phiRn_bolt:.2f}",
             f"{phiRn_bearing:.2f}",
             f"{phiVn_plate:.2f}",
+            f"{C:.3f} (of n = {n_bolts})",
             f"{Vn_total:.2f}",
             f"{V_u:.2f}",
             f"{ratio:.2f}"
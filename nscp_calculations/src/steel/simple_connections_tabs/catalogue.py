@@ -0,0 +1,59 @@
+import streamlit as st
+import pandas as pd
+from src.calculations.steel.simple_connections import BOLT_GRADES, CONNECTION_TYPES, connection_table, select_connections
+
+def display():
+    st.header("📚 Prequalified Simple Connections (NSCP 2015 / AISC 360-10)")
+
+    st.markdown(r"""
+    Standard shear tabs and bolted double angles (2–10 rows, M16–M24, A325-N / A490-N) with every limit state
+    computed once: bolt shear \( C\,φF_{nv}A_b \), bearing / tearout \( φ\min(1.2l_c t F_u, 2.4dtF_u) \),
+    shear yielding \( φ0.6F_yA_{gv} \), shear rupture \( φ0.6F_uA_{nv} \) and block shear.
+    Each beam end then gets the cheapest configuration that fits its web and carries Vᵤ.
+    """)
+
+    st.subheader("Input Parameters")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        Fy = st.number_input("Plate / Angle Fy (MPa)", value=250.0, step=10.0, key="conn_cat_fy")
+        Fu = st.number_input("Plate / Angle Fu (MPa)", value=400.0, step=10.0, key="conn_cat_fu")
+        Fu_beam = st.number_input("Beam Web Fu (MPa)", value=450.0, step=10.0, key="conn_cat_fu_beam")
+    with col2:
+        pitch = st.number_input("Bolt Pitch (mm)", value=75.0, step=5.0, key="conn_cat_pitch")
+        end_dist = st.number_input("End Distance, Lev (mm)", value=40.0, step=5.0, key="conn_cat_lev")
+        edge_dist = st.number_input("Edge Distance, Leh (mm)", value=40.0, step=5.0, key="conn_cat_leh")
+    with col3:
+        a = st.number_input("Weld to Bolt Line, a (mm)", value=75.0, step=5.0, key="conn_cat_a",
+                            help="Shear tab bolt group eccentricity (Manual Table 10-9): e = a/2 for 2–5 rows, e = a for 6 or more rows.")
+        types = st.multiselect("Connection types", CONNECTION_TYPES, default=list(CONNECTION_TYPES), key="conn_cat_types")
+        grades = st.multiselect("Bolt grades", list(BOLT_GRADES), default=list(BOLT_GRADES), key="conn_cat_grades")
+
+    table = connection_table(Fy, Fu, Fu_beam, pitch, end_dist, edge_dist, a)
+
+    st.markdown("### 📋 Beam end reactions")
+    reactions = st.data_editor(
+        pd.DataFrame({
+            "Mark": ["B1", "B2", "B3", "B4"],
+            "Beam": ["W310x60", "W410x60", "W250x49", "W360x57"],
+            "Vu (kN)": [120.0, 260.0, 90.0, 410.0],
+        }),
+        num_rows="dynamic", key="conn_cat_reactions", use_container_width=True,
+    ).dropna()
+    if len(reactions) > 0:
+        try:
+            selected = select_connections(reactions, table, types, grades)
+        except KeyError as exc:
+            st.error(str(exc.args[0]))
+        else:
+            st.dataframe(selected, use_container_width=True)
+            unresolved = int((selected["Connection"] == "None fits").sum())
+            if unresolved:
+                st.warning(f"{unresolved} beam end(s) exceed every standard configuration that fits the web.")
+            else:
+                st.success("✅ Every beam end has a prequalified connection.")
+
+    with st.expander(f"Connection catalogue ({len(table)} configurations, cheapest first)"):
+        st.dataframe(table.round(2), use_container_width=True)
+
+    st.markdown("---")
+    st.caption("Based on NSCP 2015 §424 and AISC 360-10 J3, J4 (single-plate and double-angle shear connections).")
@@ -1,5 +1,7 @@
 import streamlit as st
+import math
 import pandas as pd
+from src.calculations.steel.bolt_group import check_bolt_groups, elastic_coefficient, pattern_coefficient, rectangular_pattern
 
 def display():
     st.header("🪛 Shear Tab Simple Connection (NSCP 2015 / AISC 360-10)")
@@ -20,12 +22,15 @@ def display():
     with col3:
         bolt_dia = st.number_input("Bolt Diameter (mm)", value=20.0, step=2.0, key="shear_tab_bolt_dia")
         edge_dist = st.number_input("Edge Distance (mm)", value=40.0, step=5.0, key="shear_tab_edge_dist")
+        pitch = st.number_input("Bolt Pitch (mm)", value=75.0, step=5.0, key="shear_tab_pitch")
+        e_bolt = st.number_input("Eccentricity to Bolt Line, e (mm)", value=37.5, step=2.5, key="shear_tab_e",
+                                 help="Conventional shear tab (Manual Table 10-9), a = weld line to bolt line: e = a/2 for 2–5 bolts, e = a for 6–12 bolts in standard holes.")
         phi = 0.9  # strength reduction factor
 
     # st.subheader("🧮 Design Calculations")
 
     # --- 1. Bolt Shear Capacity ---
-    Ab = 3.1416 * (bolt_dia ** 2) / 4  # mm²
+    Ab = math.pi * bolt_dia ** 2 / 4  # mm²
     Rn_bolt = 0.6 * Fu * Ab / 1000     # kN per bolt
     phiRn_bolt = phi * Rn_bolt
 
@@ -38,8 +43,12 @@ def display():
     Vn_plate = 0.6 * Fy * Aw / 1000       # kN
     phiVn_plate = phi * Vn_plate
 
-    # --- 4. Total Capacity ---
-    Vn_total = min(phiRn_bolt * n_bolts, phiRn_bearing * n_bolts, phiVn_plate)
+    # --- 4. Eccentric bolt group (instantaneous centre of rotation) ---
+    C = pattern_coefficient(n_bolts, 1, pitch, 0.0, e_bolt)
+    C_elastic = elastic_coefficient(rectangular_pattern(n_bolts, 1, pitch, 0.0), e_bolt)
+
+    # --- 5. Total Capacity ---
+    Vn_total = min(phiRn_bolt * C, phiRn_bearing * C, phiVn_plate)
     ratio = V_u / Vn_total if Vn_total > 0 else 0
 
     # --- 5. Result Table ---
@@ -48,6 +57,8 @@ def display():
             "Bolt Shear Capacity per Bolt (φRn, kN)",
             "Bearing Capacity per Bolt (φRn, kN)",
             "Shear Tab Plate Capacity (φVn, kN)",
+            "Bolt Group Coefficient C (ICR)",
+            "Bolt Group Coefficient C (elastic, for reference)",
             "Total Connection Capacity (kN)",
             "Applied Shear (Vᵤ, kN)",
             "Utilization Ratio (Vᵤ / φVn_total)"
@@ -56,6 +67,8 @@ def display():
             f"{phiRn_bolt:.2f}",
             f"{phiRn_bearing:.2f}",
             f"{phiVn_plate:.2f}",
+            f"{C:.3f} (of n = {n_bolts})",
+            f"{C_elastic:.3f}",
             f"{Vn_total:.2f}",
             f"{V_u:.2f}",
             f"{ratio:.2f}"
@@ -77,4 +90,24 @@ def display():
     st.latex(r"R_n (\text{bolt shear}) = 0.6 F_u A_b")
     st.latex(r"R_n (\text{bearing}) = 2.4 d t F_u")
     st.latex(r"V_n (\text{plate}) = 0.6 F_y A_w")
+    st.latex(r"\phi R_{n,\text{group}} = C \, \phi r_n, \quad R = R_{ult}\left(1 - e^{-10\Delta}\right)^{0.55}")
     st.caption("Based on NSCP 2015 §424 and AISC 360-10 (Shear Tab Connection Design).")
+
+    # --- 8. Connection schedule (batch ICR check) ---
+    with st.expander("📋 Batch check — eccentric bolt groups (ICR)"):
+        schedule = st.data_editor(
+            pd.DataFrame({
+                "Mark": ["ST1", "ST2", "ST3"],
+                "Rows": [int(n_bolts), 4, 3],
+                "Columns": [1, 1, 2],
+                "Pitch (mm)": [pitch, 75.0, 75.0],
+                "Gauge (mm)": [0.0, 0.0, 75.0],
+                "e (mm)": [e_bolt, 75.0, 150.0],
+                "Angle (deg)": [0.0, 0.0, 15.0],
+                "Vu (kN)": [V_u, 180.0, 220.0],
+                "φRn per bolt (kN)": [min(phiRn_bolt, phiRn_bearing)] * 3,
+            }),
+            num_rows="dynamic", key="shear_tab_schedule", use_container_width=True,
+        ).dropna()
+        if len(schedule) > 0:
+            st.dataframe(check_bolt_groups(schedule), use_container_width=True)
@@ -1,6 +1,10 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.components.section_picker import section_picker, prop_default
+from src.components.frame_forces import frame_member_picker
+from src.calculations.steel.beam_design import select_beams
+from src.calculations.steel.flexure import design_flexural_strength, ltb_curve, moment_gradient_factor, shear_strength
 
 def display():
     st.header("🛠️ Structural Steel Beam — NSCP 2015 (flexure & shear checks)")
@@ -8,21 +12,22 @@ def display():
     st.markdown(r"""
     Quick LRFD-style checks for steel beams following NSCP 2015 Chapter on Structural Steel.
     - Design flexural strength: Φ_b M_n (Φ_b = 0.90 for LRFD)
-    - Nominal Mn from plastic/yielding (M_p = F_y · Z_x) — lateral–torsional buckling may control for long unbraced lengths.
-    - Shear strength (nominal): V_n ≈ 0.6 F_y A_w (AISC/NSCP consistent).
-    **Note:** This tool does NOT perform a full LTB (M_cr) analysis. If Lb (unbraced) is large, provide a reduced Mn or add bracing.
+    - Nominal Mn = min(plastic M_p = F_y · Z_x, lateral–torsional buckling with C_b, flange local buckling).
+    - Shear strength (G2.1): Φ_v V_n = Φ_v · 0.6 F_y A_w C_v1, with Φ_v = 1.00 and C_v1 = 1.0 for stocky rolled I-shapes.
+    **Note:** LTB is evaluated for catalogue sections only; custom sections are checked for yielding.
     """)
 
     st.markdown("### Section / material inputs")
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        section_name = st.text_input("Section name (optional)", value="W250x33", key="ss_section")
-        Zx = st.number_input("Plastic section modulus Zx (mm³)", min_value=0.0, value=60000.0, step=100.0, key="ss_Zx")
-        Sx = st.number_input("Elastic section modulus Sx (mm³) (optional)", min_value=0.0, value=50000.0, step=100.0, key="ss_Sx")
+        section_name, props = section_picker("Section (catalogue)", "ss_section", ["W", "C", "HSS"], default="W250x33")
+        Zx = st.number_input("Plastic section modulus Zx (mm³)", min_value=0.0, value=prop_default(props, "Zx", 60000.0), step=100.0, key=f"ss_Zx_{section_name}")
+        Sx = st.number_input("Elastic section modulus Sx (mm³) (optional)", min_value=0.0, value=prop_default(props, "Sx", 50000.0), step=100.0, key=f"ss_Sx_{section_name}")
     with col2:
-        Ix = st.number_input("Moment of inertia Ix (mm⁴)", min_value=0.0, value=1.2e7, step=1000.0, key="ss_Ix")
-        Aw = st.number_input("Shear area A_w (mm²) (web shear area)", min_value=0.0, value=3000.0, step=10.0, key="ss_Aw")
+        Ix = st.number_input("Moment of inertia Ix (mm⁴)", min_value=0.0, value=prop_default(props, "Ix", 1.2e7), step=1000.0, key=f"ss_Ix_{section_name}")
+        Aw = st.number_input("Shear area A_w (mm²) (web shear area)", min_value=0.0, value=prop_default(props, "Aw", 3000.0), step=10.0, key=f"ss_Aw_{section_name}")
+        h_tw = st.number_input("Web slenderness h/t_w", min_value=1.0, value=float(props["h"] / props["tw"]) if props is not None else 40.0, step=1.0, key=f"ss_htw_{section_name}")
     with col3:
         Fy = st.number_input("Yield strength F_y (MPa)", min_value=200.0, value=250.0, step=5.0, key="ss_Fy")
         E = st.number_input("Elastic modulus E (MPa)", min_value=100000.0, value=200000.0, step=1000.0, key="ss_E")
@@ -31,11 +36,32 @@ def display():
     st.markdown("---")
     st.markdown("### Applied actions (factored)")
 
+    member, actions = frame_member_picker("Member from frame analysis", "ss_frame_member")
     col4, col5 = st.columns(2)
     with col4:
-        Mu = st.number_input("Applied design moment M_u (kN·m)", min_value=0.0, value=50.0, step=1.0, key="ss_Mu")
+        Mu = st.number_input("Applied design moment M_u (kN·m)", min_value=0.0, value=prop_default(actions, "Mu (kN·m)", 50.0), step=1.0, key=f"ss_Mu_{member}")
     with col5:
-        Vu = st.number_input("Applied design shear V_u (kN)", min_value=0.0, value=60.0, step=1.0, key="ss_Vu")
+        Vu = st.number_input("Applied design shear V_u (kN)", min_value=0.0, value=prop_default(actions, "Vu (kN)", 60.0), step=1.0, key=f"ss_Vu_{member}")
+
+    # Moment gradient factor Cb over the unbraced segment
+    cb_mode = st.selectbox("Moment diagram over L_b (for C_b)", [
+        "Uniform moment (Cb = 1.0)",
+        "Uniform load, braced at supports only",
+        "Enter quarter-point moments",
+    ], index=0, key="ss_cb_mode")
+    if cb_mode.startswith("Uniform moment"):
+        Cb = 1.0
+    elif cb_mode.startswith("Uniform load"):
+        Cb = moment_gradient_factor(1.0, 0.75, 1.0, 0.75)
+    else:
+        q1, q2, q3 = st.columns(3)
+        with q1:
+            M_A = st.number_input("|M_A| at L_b/4 (kN·m)", min_value=0.0, value=0.75 * Mu, key="ss_MA")
+        with q2:
+            M_B = st.number_input("|M_B| at L_b/2 (kN·m)", min_value=0.0, value=Mu, key="ss_MB")
+        with q3:
+            M_C = st.number_input("|M_C| at 3L_b/4 (kN·m)", min_value=0.0, value=0.75 * Mu, key="ss_MC")
+        Cb = moment_gradient_factor(max(Mu, M_A, M_B, M_C), M_A, M_B, M_C)
 
     st.markdown("---")
     # ----------------------------
@@ -47,26 +73,26 @@ def display():
     # Convert to kN·m:
     Mp_kNm = Mp_Nmm / 1e6
 
-    # Nominal Mn (basic yielding/plastic) (kN·m)
-    Mn_yield_kNm = Mp_kNm
-
     # LRFD phi for flexure (NSCP LRFD) — use 0.90
     phi_b = 0.90
+
+    # Nominal Mn (kN·m): yielding, capped by LTB/FLB from the cached catalogue curve
+    if props is not None:
+        grid, Mn_curve, Mn_cap, Lp, Lr = ltb_curve(section_name, float(Fy), float(E))
+        Mn_yield_kNm = min(Mp_kNm, design_flexural_strength(section_name, Fy, Lb, Cb, E) / phi_b)
+    else:
+        Lp = Lr = float("nan")
+        Mn_yield_kNm = Mp_kNm
     design_flex_capacity_kNm = phi_b * Mn_yield_kNm
 
-    # Shear nominal capacity: Vn = 0.6 * Fy * Aw  (N)
-    Vn_N = 0.6 * Fy * Aw  # N (since Fy in N/mm2, Aw in mm2 -> N)
-    Vn_kN = Vn_N / 1000.0
-    # Adopt phi for shear conservatively = 0.90 (LRFD flexure/shear grouping)
-    phi_v = 0.90
+    # Shear (G2.1): Vn = 0.6 Fy Aw Cv1, same routine as the design-mode schedule
+    web = {"type": props["type"] if props is not None else "Custom", "h": h_tw, "tw": 1.0, "Aw": Aw}
+    phi_v, Vn_kN = (float(v) for v in shear_strength(web, Fy, E))
     design_shear_capacity_kN = phi_v * Vn_kN
 
-    # Lateral-torsional buckling note:
-    # NSCP (AISC-style) requires LTB check. This helper does NOT calculate M_cr.
-    # We'll warn if unbraced length Lb exceeds a typical compact-section threshold.
+    # Lateral-torsional buckling zone (custom sections: LTB not evaluated)
     Lb_mm = Lb
-    # conservative heuristic threshold: if Lb > 3000 mm, warn user LTB may govern
-    ltb_warning = Lb_mm > 3000.0
+    ltb_warning = props is None and Lb_mm > 3000.0
 
     # Basic utilization ratios
     util_flex = Mu / design_flex_capacity_kNm if design_flex_capacity_kNm > 0 else float("inf")
@@ -81,11 +107,14 @@ def display():
             "Zx (mm³)",
             "Sx (mm³)",
             "Mp (kN·m)",
-            "Nominal Mn (kN·m) [yield-based]",
+            "Lp / Lr (mm)",
+            "Moment gradient factor Cb",
+            "Nominal Mn (kN·m) [yield / LTB / FLB]",
             "Φ_b (flexure, LRFD)",
             "Design flexural capacity ΦMn (kN·m)",
             "Shear area A_w (mm²)",
-            "Nominal shear Vn (kN) (≈0.6 Fy Aw)",
+            "Nominal shear Vn (kN) (0.6 Fy Aw Cv1)",
+            "Φ_v (shear, G2.1)",
             "Design shear capacity ΦVn (kN)",
             "Unbraced length Lb (mm)",
             "Applied M_u (kN·m)",
@@ -98,11 +127,14 @@ def display():
             f"{Zx:,.0f}",
             f"{Sx:,.0f}",
             f"{Mp_kNm:.3f}",
+            f"{Lp:.0f} / {Lr:.0f}",
+            f"{Cb:.3f}",
             f"{Mn_yield_kNm:.3f}",
             f"{phi_b:.2f}",
             f"{design_flex_capacity_kNm:.3f}",
             f"{Aw:,.0f}",
             f"{Vn_kN:.3f}",
+            f"{phi_v:.2f}",
             f"{design_shear_capacity_kN:.3f}",
             f"{Lb_mm:.0f}",
             f"{Mu:.3f}",
@@ -128,15 +160,51 @@ def display():
         st.error(f"Shear FAIL — Vu = {Vu:.2f} kN > ΦVn = {design_shear_capacity_kN:.2f} kN")
 
     if ltb_warning:
-        st.warning("Unbraced length Lb is large — lateral–torsional buckling (LTB) may govern. Perform LTB (M_cr) check per NSCP/AISC or add lateral bracing.")
-    else:
-        st.info("Unbraced length looks moderate; still confirm LTB per code if Lb is near limiting values.")
+        st.warning("Custom section: LTB not evaluated — pick a catalogue section or add lateral bracing.")
+    elif props is not None:
+        zone = "not applicable (no warping/LTB mode)" if props["Cw"] == 0 else "plastic (Lb ≤ Lp)" if Lb_mm <= Lp else ("inelastic LTB (Lp < Lb ≤ Lr)" if Lb_mm <= Lr else "elastic LTB (Lb > Lr)")
+        st.info(f"LTB zone: {zone}.")
+        Lb_plot = grid[grid <= max(2.0 * Lr, 2.0 * Lb_mm, 6000.0)]
+        st.line_chart(pd.DataFrame({
+            "Lb (mm)": Lb_plot,
+            f"ΦMn, Cb = {Cb:.2f} (kN·m)": design_flexural_strength(section_name, Fy, Lb_plot, Cb, E),
+            "ΦMn, Cb = 1.0 (kN·m)": design_flexural_strength(section_name, Fy, Lb_plot, 1.0, E),
+        }).set_index("Lb (mm)"))
 
     st.markdown("---")
     st.markdown("### Notes & references")
     st.markdown(r"""
     - NSCP/LRFD uses: \(\Phi_b = 0.90\) for flexure (LRFD). Nominal Mn may be the lower of yielding/plastic moment and LTB-limited resistance. :contentReference[oaicite:3]{index=3}  
     - Plastic moment (approx): \(M_p = F_y \, Z_x\). Use tabulated Zx for steel shapes (units: N·mm → convert to kN·m). :contentReference[oaicite:4]{index=4}  
-    - Shear nominal strength commonly approximated by \(V_n \approx 0.6 F_y A_w\) (AISC/NSCP-compatible). Confirm with NSCP shear clauses and section compactness checks. :contentReference[oaicite:5]{index=5}
-    - This helper **does not** compute lateral–torsional buckling capacity (M_cr) — for long unbraced lengths, compute M_cr (or use NSCP/AISC procedures) and take ΦMn = Φ·min(M_p, M_LTB).
-    """)
\ No newline at end of file
+    - Shear (G2.1): \(V_n = 0.6 F_y A_w C_{v1}\); rolled I-shapes with \(h/t_w \le 2.24\sqrt{E/F_y}\) take \(\Phi_v = 1.00\), \(C_{v1} = 1.0\); otherwise \(\Phi_v = 0.90\) and \(C_{v1} = 1.10\sqrt{k_v E/F_y}/(h/t_w) \le 1.0\) with \(k_v = 5.34\).
+    - LTB (AISC F2): \(L_p = 1.76 r_y \sqrt{E/F_y}\); inelastic \(M_n = C_b[M_p - (M_p - 0.7F_yS_x)\frac{L_b - L_p}{L_r - L_p}]\); elastic \(F_{cr} = \frac{C_b \pi^2 E}{(L_b/r_{ts})^2}\sqrt{1 + 0.078\frac{Jc}{S_x h_o}(L_b/r_{ts})^2}\). ΦMn = Φ·min(M_p, M_LTB, M_FLB).
+    - \(C_b = \dfrac{12.5 M_{max}}{2.5M_{max} + 3M_A + 4M_B + 3M_C}\).
+    """)
+
+    # ----------------------------
+    # Design mode: lightest W-section for a beam schedule
+    # ----------------------------
+    st.markdown("---")
+    st.markdown("### 🔎 Design mode — lightest W-section")
+    st.markdown(r"""
+    Every catalogue W-section is checked at once for flexure (yielding, LTB and flange local buckling),
+    shear and service deflection (L/360 live, L/240 total) on simply supported spans under
+    \(w_u = \max(1.2D + 1.6L,\; 1.4D)\), including the section self-weight. Edit the schedule to design several beams.
+    """)
+    schedule = st.data_editor(
+        pd.DataFrame({
+            "Beam": ["B1", "B2"],
+            "Span (m)": [6.0, 8.0],
+            "wD (kN/m)": [10.0, 15.0],
+            "wL (kN/m)": [8.0, 12.0],
+            "Lb (mm)": [Lb, Lb],
+            "Cb": [1.0, 1.0],
+        }),
+        num_rows="dynamic", key="ss_schedule", use_container_width=True,
+    ).dropna()
+
+    if len(schedule) > 0:
+        summary, alternatives = select_beams(schedule, Fy=Fy, E=E)
+        st.dataframe(summary, use_container_width=True)
+        pick = st.selectbox("Show ranked alternatives for", list(schedule["Beam"]), key="ss_schedule_pick")
+        st.dataframe(alternatives[list(schedule["Beam"]).index(pick)], use_container_width=True)
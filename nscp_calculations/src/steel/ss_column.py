@@ -1,38 +1,50 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.components.section_picker import section_picker, prop_default
+from src.calculations.steel.compression import PHI_C, column_capacity, critical_stress, select_columns, slenderness_factor
+from src.calculations.steel.beam_column import FORCE_COLUMNS, b1_factor, check_beam_columns, cm_factor, interaction_ratio
+from src.calculations.steel.flexure import design_flexural_strength, minor_axis_strength
+from src.components.frame_forces import frame_forces, frame_member_picker
 
 def display():
     st.header("🏗️ Structural Steel Column — NSCP 2015 (Axial & Combined Checks)")
 
     st.markdown(r"""
     Quick LRFD-style check for steel columns per NSCP 2015 (Section 223 → AISC 360).
-    - **Axial compression:** φ·P<sub>n</sub> = φ·F<sub>cr</sub>·A<sub>g</sub>  
-    - **Flexure + Axial:** simplified interaction check  
-      \( \dfrac{P_u}{\phi P_n} + \dfrac{M_u}{\phi M_n} \le 1.0 \)
+    - **Axial compression:** φ·P<sub>n</sub> = φ·F<sub>cr</sub>·A<sub>g</sub> (slender elements via Q, AISC E7)  
+    - **Flexure + Axial:** biaxial interaction (AISC H1-1a / H1-1b) with B1 amplification  
+      \( \dfrac{P_r}{P_c} + \dfrac{8}{9}\left(\dfrac{M_{rx}}{M_{cx}} + \dfrac{M_{ry}}{M_{cy}}\right) \le 1.0 \) for \( P_r/P_c \ge 0.2 \)
     """)
 
+    member, actions = frame_member_picker("Member from frame analysis", "ss_col_frame_member")
+
     st.header("Section / Material Inputs")
     c1, c2, c3 = st.columns(3)
     with c1:
-        section = st.text_input("Section name (optional)", "W250x33", key="col_section")
-        Ag = st.number_input("Gross area A_g (mm²)", 0.0, 100000.0, 4200.0, 10.0, key="col_Ag")
-        r_x = st.number_input("Radius of gyration r_x (mm)", 0.0, 500.0, 70.0, 1.0, key="col_rx")
+        section, props = section_picker("Section (catalogue)", "col_section", ["W", "HSS", "C", "L"], default="W250x33")
+        Ag = st.number_input("Gross area A_g (mm²)", 0.0, 100000.0, prop_default(props, "A", 4200.0), 10.0, key=f"col_Ag_{section}")
+        r_x = st.number_input("Radius of gyration r_x (mm)", 0.0, 500.0, prop_default(props, "rx", 70.0), 1.0, key=f"col_rx_{section}")
     with c2:
-        r_y = st.number_input("Radius of gyration r_y (mm)", 0.0, 500.0, 40.0, 1.0, key="col_ry")
+        r_y = st.number_input("Radius of gyration r_y (mm)", 0.0, 500.0, prop_default(props, "ry", 40.0), 1.0, key=f"col_ry_{section}")
         Fy = st.number_input("Yield strength F_y (MPa)", 200.0, 600.0, 250.0, 5.0, key="col_Fy")
         E = st.number_input("Elastic modulus E (MPa)", 100000.0, 220000.0, 200000.0, 1000.0, key="col_E")
     with c3:
         Kx = st.number_input("Effective length factor Kx", 0.1, 3.0, 1.0, 0.05, key="col_Kx")
         Ky = st.number_input("Effective length factor Ky", 0.1, 3.0, 1.0, 0.05, key="col_Ky")
-        L = st.number_input("Unbraced length L (mm)", 0.0, 12000.0, 3000.0, 100.0, key="col_L")
+        L = st.number_input("Unbraced length L (mm)", 0.0, 12000.0, min(prop_default(actions, "L (mm)", 3000.0), 12000.0), 100.0, key=f"col_L_{member}")
 
     st.header("Applied Loads")
-    c4, c5 = st.columns(2)
+    c4, c5, c6 = st.columns(3)
     with c4:
-        Pu = st.number_input("Factored axial load P_u (kN)", 0.0, 5000.0, 900.0, 10.0, key="col_Pu")
+        Pu = st.number_input("Factored axial load P_u (kN)", 0.0, 5000.0, min(prop_default(actions, "Pu (kN)", 900.0), 5000.0), 10.0, key=f"col_Pu_{member}")
+        end_ratio = st.number_input("End moment ratio M1/M2 (+ reverse curvature)", -1.0, 1.0, prop_default(actions, "M1/M2", 0.0), 0.1, key=f"col_M1M2_{member}")
     with c5:
-        Mu = st.number_input("Factored moment M_u (kN·m)", 0.0, 1000.0, 60.0, 1.0, key="col_Mu")
+        Mu = st.number_input("Factored moment M_ux (kN·m)", 0.0, 1000.0, min(prop_default(actions, "Mu (kN·m)", 60.0), 1000.0), 1.0, key=f"col_Mu_{member}")
+        Muy = st.number_input("Factored moment M_uy (kN·m)", 0.0, 1000.0, 0.0, 1.0, key="col_Muy")
+    with c6:
+        transverse = st.checkbox("Transverse load between supports (Cm = 1.0)", value=False, key="col_transverse")
+        st.caption("First-order moments of a braced column; sway effects (B2) belong in the member × combination check below.")
 
     # --- Calculations ---
     # slenderness ratios
@@ -42,46 +54,67 @@ def display():
     slender_y = KLy / r_y
     slender = max(slender_x, slender_y)
 
-    # Euler elastic buckling stress Fe (MPa)
-    Fe = (math.pi ** 2 * E) / (slender ** 2)
+    # Euler elastic buckling stress Fe (MPa); KL = 0 → squash load
+    Fe = (math.pi ** 2 * E) / (slender ** 2) if slender > 0 else float("inf")
 
-    # critical stress Fcr (MPa)
+    # critical stress Fcr (MPa) with slender-element factor Q (catalogue sections)
     Fy_val = Fy
-    if (Fy_val / Fe) <= 2.25:
-        Fcr = (0.658 ** (Fy_val / Fe)) * Fy_val
-    else:
-        Fcr = 0.877 * Fe
+    Q = float(slenderness_factor(props, Fy_val, E)) if props is not None else 1.0
+    Fcr = float(critical_stress(Fy_val, Fe, Q))
 
     # nominal and design axial capacities
     Pn_N = Fcr * Ag            # N
-    phi_c = 0.85
+    phi_c = PHI_C
     phiPn_kN = phi_c * Pn_N / 1000.0
+    if props is not None:
+        # precomputed ΦPn–KL table lookup (least radius incl. rz for angles, Q with f = Fcr)
+        phiPn_kN = column_capacity(section, Fy_val, KLx, KLy, E)
+        Fcr = phiPn_kN * 1000.0 / (phi_c * props["A"])
 
-    # design flexural capacity (reuse beam phiMn)
-    Zx = st.number_input("Plastic modulus Zx (mm³)", 0.0, 1e6, 60000.0, 100.0, key="col_Zx")
+    # design flexural capacities: LTB about x over L (Cb = 1), minor-axis yielding / FLB
+    Zx = st.number_input("Plastic modulus Zx (mm³)", 0.0, 1e8, prop_default(props, "Zx", 60000.0), 100.0, key=f"col_Zx_{section}")
+    Zy = st.number_input("Plastic modulus Zy (mm³)", 0.0, 1e8, prop_default(props, "Zy", 30000.0), 100.0, key=f"col_Zy_{section}")
     phi_b = 0.90
-    phiMn_kNm = phi_b * (Fy_val * Zx / 1e6)   # kN·m
+    if props is not None:
+        phiMn_kNm = design_flexural_strength(section, Fy_val, L, 1.0, E)
+        phiMny_kNm = phi_b * float(minor_axis_strength(props, Fy_val, E))
+    else:
+        phiMn_kNm = phi_b * (Fy_val * Zx / 1e6)   # kN·m
+        phiMny_kNm = phi_b * (Fy_val * Zy / 1e6)
 
-    # interaction check
+    # B1 amplification of the braced member (AISC A-8-3, K1 = 1)
+    Cm = 1.0 if transverse else float(cm_factor(end_ratio, 1.0))
+    Pe1x = math.pi ** 2 * E * (Ag * r_x ** 2) / L ** 2 / 1000.0 if L > 0 else float("inf")
+    Pe1y = math.pi ** 2 * E * (Ag * r_y ** 2) / L ** 2 / 1000.0 if L > 0 else float("inf")
+    B1x = float(b1_factor(Cm, Pu, Pe1x))
+    B1y = float(b1_factor(Cm, Pu, Pe1y))
+    Mrx = B1x * Mu
+    Mry = B1y * Muy
+
+    # interaction check (H1-1a / H1-1b)
     ratio_axial = Pu / phiPn_kN if phiPn_kN > 0 else float("inf")
-    ratio_flex  = Mu / phiMn_kNm if phiMn_kNm > 0 else float("inf")
-    interaction = ratio_axial + ratio_flex
+    ratio_flex = Mrx / phiMn_kNm if phiMn_kNm > 0 else float("inf")
+    ratio_flex_y = Mry / phiMny_kNm if phiMny_kNm > 0 else float("inf")
+    interaction, equation = interaction_ratio(ratio_axial, ratio_flex, ratio_flex_y)
+    interaction, equation = float(interaction), str(equation)
 
     # --- Results table ---
     data = {
         "Parameter": [
             "Section", "A_g (mm²)", "r_x (mm)", "r_y (mm)",
-            "Kx·L/r_x", "Ky·L/r_y", "Critical Fe (MPa)", "F_cr (MPa)",
-            "φ_c", "φP_n (kN)", "Φ_bM_n (kN·m)",
-            "P_u (kN)", "M_u (kN·m)",
-            "P_u/ΦP_n", "M_u/ΦM_n", "Interaction Σ"
+            "Kx·L/r_x", "Ky·L/r_y", "Slender-element factor Q", "Critical Fe (MPa)", "F_cr (MPa)",
+            "φ_c", "φP_n (kN)", "Φ_bM_nx (kN·m)", "Φ_bM_ny (kN·m)",
+            "C_m", "B1x", "B1y",
+            "P_u (kN)", "M_rx = B1x·M_ux (kN·m)", "M_ry = B1y·M_uy (kN·m)",
+            "P_u/ΦP_n", "M_rx/ΦM_nx", "M_ry/ΦM_ny", f"Interaction Σ ({equation})"
         ],
         "Value": [
             section, f"{Ag:,.0f}", f"{r_x:.1f}", f"{r_y:.1f}",
-            f"{slender_x:.1f}", f"{slender_y:.1f}", f"{Fe:.2f}", f"{Fcr:.2f}",
-            f"{phi_c:.2f}", f"{phiPn_kN:.2f}", f"{phiMn_kNm:.2f}",
-            f"{Pu:.2f}", f"{Mu:.2f}",
-            f"{ratio_axial:.3f}", f"{ratio_flex:.3f}", f"{interaction:.3f}"
+            f"{slender_x:.1f}", f"{slender_y:.1f}", f"{Q:.3f}", f"{Fe:.2f}", f"{Fcr:.2f}",
+            f"{phi_c:.2f}", f"{phiPn_kN:.2f}", f"{phiMn_kNm:.2f}", f"{phiMny_kNm:.2f}",
+            f"{Cm:.2f}", f"{B1x:.3f}", f"{B1y:.3f}",
+            f"{Pu:.2f}", f"{Mrx:.2f}", f"{Mry:.2f}",
+            f"{ratio_axial:.3f}", f"{ratio_flex:.3f}", f"{ratio_flex_y:.3f}", f"{interaction:.3f}"
         ]
     }
     st.markdown("---")
@@ -95,9 +128,9 @@ def display():
         st.error(f"Axial FAIL (Pu {Pu:.1f} > φPn {phiPn_kN:.1f} kN)")
 
     if interaction <= 1.0:
-        st.success(f"Combined OK → Σ = {interaction:.3f} ≤ 1.0")
+        st.success(f"Combined OK ({equation}) → Σ = {interaction:.3f} ≤ 1.0")
     else:
-        st.error(f"Combined FAIL → Σ = {interaction:.3f} > 1.0")
+        st.error(f"Combined FAIL ({equation}) → Σ = {interaction:.3f} > 1.0")
 
     st.info(f"Slenderness max (KL/r) = {slender:.1f}. Check NSCP λ limits (usually ≤ 200).")
 
@@ -106,7 +139,97 @@ def display():
     **Reference notes**  
     - NSCP 2015 Sec. 223 → AISC 360 Chap. E for compression.  
       \( F_{cr} = 0.658^{F_y/F_e} F_y \) if \( F_y/F_e ≤ 2.25 \), else \( 0.877 F_e \).  
-    - \( φ_c = 0.85 \) for compression, \( φ_b = 0.90 \) for flexure (LRFD).  
-    - Interaction eqn: \( P_u/(φP_n) + M_u/(φM_n) ≤ 1.0 \) (simple case).  
+    - \( φ_c = 0.90 \) for compression, \( φ_b = 0.90 \) for flexure (LRFD).  
+    - Slender elements (AISC 360-10 E7): \( F_{cr} = Q\,0.658^{QF_y/F_e} F_y \), \( Q = Q_s Q_a \).  
+    - Interaction (AISC H1-1a/b): \( P_r/P_c + \tfrac{8}{9}(M_{rx}/M_{cx} + M_{ry}/M_{cy}) ≤ 1.0 \) if \( P_r/P_c ≥ 0.2 \),
+      else \( P_r/(2P_c) + M_{rx}/M_{cx} + M_{ry}/M_{cy} ≤ 1.0 \).  
+    - Amplification (Appendix 8): \( B_1 = C_m/(1 - P_r/P_{e1}) ≥ 1 \), \( C_m = 0.6 - 0.4 M_1/M_2 \);
+      \( M_r = B_1 M_{nt} + B_2 M_{lt} \), \( P_r = P_{nt} + B_2 P_{lt} \).  
     - Units: mm, MPa, kN, kN·m.
-    """)
\ No newline at end of file
+    """)
+
+    # ----------------------------
+    # Column schedule design (table lookup)
+    # ----------------------------
+    st.markdown("---")
+    st.markdown("### 🔎 Column schedule — lightest W-section")
+    st.markdown("Each column is sized from the precomputed ΦPn–KL tables (axial only); refine with the combined check above.")
+    schedule = st.data_editor(
+        pd.DataFrame({
+            "Column": ["C1", "C2", "C3"],
+            "Pu (kN)": [900.0, 1500.0, 2400.0],
+            "KxL (mm)": [Kx * L] * 3,
+            "KyL (mm)": [Ky * L] * 3,
+        }),
+        num_rows="dynamic", key="col_schedule", use_container_width=True,
+    ).dropna()
+    if len(schedule) > 0:
+        summary, alternatives = select_columns(schedule, Fy=Fy, E=E)
+        st.dataframe(summary, use_container_width=True)
+        pick = st.selectbox("Show ranked alternatives for", list(schedule["Column"]), key="col_schedule_pick")
+        st.dataframe(alternatives[list(schedule["Column"]).index(pick)], use_container_width=True)
+
+    # ----------------------------
+    # Members × load combinations (frame-analysis table)
+    # ----------------------------
+    st.markdown("---")
+    st.markdown("### 📋 Beam-column check — members × load combinations")
+    st.markdown("Paste member properties and the force table from the frame analysis (one row per member and combination, compression positive).")
+    frame = frame_forces()
+    if frame is not None and "Section" in frame:
+        # frame-analysis forces: no sway split in a first-order analysis, Cm from the end moments;
+        # second-order forces already contain P-Δ (B2 = 1), B1 still covers P-δ
+        second_order = "B1" in frame
+        st.caption("Tables prefilled from the latest " + ("second-order (P-Δ) " if second_order else "") + "frame analysis (Analysis page).")
+        member_rows = frame.drop_duplicates("Member")
+        member_default = pd.DataFrame({
+            "Member": member_rows["Member"], "Section": member_rows["Section"], "L (mm)": member_rows["L (mm)"],
+            "Kx": Kx, "Ky": Ky,
+        })
+        force_default = pd.DataFrame({
+            "Member": frame["Member"],
+            "Combo": frame["Combo"],
+            **dict(zip(FORCE_COLUMNS, (
+                frame["Pu (kN)"].where(frame["Pu (kN)"] > 0.0, -frame["Tu (kN)"]),
+                0.0, frame["Mu (kN·m)"], 0.0, 0.0, 0.0,
+            ))),
+            "Cmx": frame["Cm"] if second_order else cm_factor(frame["M1/M2"].to_numpy(float), 1.0),
+            "Cmy": 1.0,
+            "B2": 1.0,
+        })
+        table_key = "_frame"
+    else:
+        member_default = pd.DataFrame({
+            "Member": ["C1", "C2"],
+            "Section": ["W250x33", "W310x60"],
+            "L (mm)": [L, L],
+            "Kx": [Kx, Kx],
+            "Ky": [Ky, Ky],
+        })
+        force_default = pd.DataFrame({
+            "Member": ["C1", "C1", "C2", "C2"],
+            "Combo": ["1.2D+1.6L", "1.2D+1.0E+L", "1.2D+1.6L", "1.2D+1.0E+L"],
+            **dict(zip(FORCE_COLUMNS, (
+                [450.0, 320.0, 900.0, 650.0],
+                [0.0, 60.0, 0.0, 90.0],
+                [25.0, 18.0, 60.0, 40.0],
+                [0.0, 35.0, 0.0, 70.0],
+                [4.0, 3.0, 8.0, 6.0],
+                [0.0, 0.0, 0.0, 0.0],
+            ))),
+            "Cmx": [0.6, 0.6, 0.6, 0.6],
+            "Cmy": [0.6, 0.6, 0.6, 0.6],
+            "B2": [1.0, 1.12, 1.0, 1.12],
+        })
+        table_key = ""
+    members = st.data_editor(member_default, num_rows="dynamic", key=f"col_bc_members{table_key}", use_container_width=True).dropna()
+    forces = st.data_editor(force_default, num_rows="dynamic", key=f"col_bc_forces{table_key}", use_container_width=True).dropna()
+    if len(members) > 0 and len(forces) > 0:
+        try:
+            detail, bc_summary = check_beam_columns(members, forces, Fy=Fy, E=E)
+        except KeyError as exc:
+            st.error(str(exc))
+        else:
+            st.dataframe(bc_summary, use_container_width=True)
+            with st.expander("All member × combination results"):
+                st.dataframe(detail, use_container_width=True)
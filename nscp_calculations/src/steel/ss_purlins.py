@@ -1,13 +1,18 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.components.section_picker import section_picker, prop_default
+from src.calculations.steel.flexure import cb_from_diagram, design_flexural_strength
+from src.calculations.steel.purlin_continuous import COMBOS, RESTRAINTS, design_purlin_lines, line_envelope
+from src.calculations.steel.purlin_optimizer import optimize_layout
+import numpy as np
 
 def display():
     st.header("🏗️ Structural Steel Purlin Design (NSCP-style)")
 
     st.markdown(r"""
     Purlin check (LRFD-style): bending, shear, deflection.  
-    You may supply section properties (cold-formed or hot-rolled). The tool warns about lateral-torsional buckling (LTB) when unbraced length is large — purlins commonly rely on roof sheeting or bracing.
+    You may supply section properties (cold-formed or hot-rolled). Lateral-torsional buckling (LTB) is checked for catalogue sections between lateral supports (sag rods / bracing), with C_b from the moment diagram of each segment.
     """)
 
     # ----------------------------
@@ -25,9 +30,9 @@ def display():
         additional_load = st.number_input("Additional line loads (kN/m) (wind/cladding etc.)", min_value=0.0, value=0.0, step=0.1, key="purlin_line")
         deflection_limit_choice = st.selectbox("Deflection limit", ["L/120", "L/180", "L/240"], index=1, key="purlin_def")
     with c3:
-        section_name = st.text_input("Section name (optional)", value="C150x50", key="purlin_name")
-        Sx = st.number_input("Elastic section modulus Sx (mm³)", min_value=0.0, value=20000.0, step=100.0, key="purlin_Sx")
-        Zx = st.number_input("Plastic section modulus Zx (mm³) (optional)", min_value=0.0, value=22000.0, step=100.0, key="purlin_Zx")
+        section_name, props = section_picker("Section (catalogue)", "purlin_name", ["CF-C", "CF-Z", "C"], default="C150x50x20x2.0")
+        Sx = st.number_input("Elastic section modulus Sx (mm³)", min_value=0.0, value=prop_default(props, "Sx", 20000.0), step=100.0, key=f"purlin_Sx_{section_name}")
+        Zx = st.number_input("Plastic section modulus Zx (mm³) (optional)", min_value=0.0, value=prop_default(props, "Zx", 22000.0), step=100.0, key=f"purlin_Zx_{section_name}")
 
     st.markdown("### Material & bracing")
     c4, c5 = st.columns(2)
@@ -35,7 +40,7 @@ def display():
         Fy = st.number_input("Yield strength F_y (MPa)", min_value=200.0, value=250.0, step=5.0, key="purlin_Fy")
         E = st.number_input("Elastic modulus E (MPa)", min_value=100000.0, value=200000.0, step=1000.0, key="purlin_E")
     with c5:
-        Aw = st.number_input("Shear area A_w (mm²) (web shear area)", min_value=0.0, value=1500.0, step=10.0, key="purlin_Aw")
+        Aw = st.number_input("Shear area A_w (mm²) (web shear area)", min_value=0.0, value=prop_default(props, "Aw", 1500.0), step=10.0, key=f"purlin_Aw_{section_name}")
         Lb = st.number_input("Unbraced length L_b (mm) between lateral supports", min_value=0.0, value=1200.0, step=50.0, key="purlin_Lb")
 
     st.markdown("---")
@@ -70,6 +75,26 @@ def display():
     phi_b = 0.90
     phiMn_kNm = phi_b * Mn_nom_kNm
 
+    # Lateral-torsional buckling per unbraced segment (catalogue sections):
+    # Cb of every segment from the wL²/8 diagram, governing segment = highest M/ΦMn
+    Lb_eff = min(Lb, span * 1000.0) if Lb > 0 else span * 1000.0
+    if props is not None:
+        x = np.linspace(0.0, span * 1000.0, 201)
+        M_diagram = w_uniform * (x / 1000.0) * (span - x / 1000.0) / 2.0
+        seg_start = np.arange(0.0, span * 1000.0, Lb_eff)
+        seg_end = np.minimum(seg_start + Lb_eff, span * 1000.0)
+        Cb_seg = np.atleast_1d(cb_from_diagram(x, M_diagram, seg_start, seg_end))
+        phiMn_seg = np.minimum(design_flexural_strength(section_name, Fy, seg_end - seg_start, Cb_seg, E), phiMn_kNm)
+        M_seg = np.array([np.abs(M_diagram[(x >= a) & (x <= b)]).max() for a, b in zip(seg_start, seg_end)])
+        governing = int(np.argmax(M_seg / phiMn_seg))
+        Cb_gov = float(Cb_seg[governing])
+        phiMn_ltb = float(phiMn_seg[governing])
+        # equivalent capacity so that M_max / ΦMn reproduces the governing segment ratio
+        phiMn_kNm = min(phiMn_kNm, M_max * phiMn_ltb / M_seg[governing]) if M_seg[governing] > 0 else phiMn_kNm
+        Mn_nom_kNm = phiMn_kNm / phi_b
+    else:
+        Cb_gov = float("nan")
+
     # Shear nominal: Vn = 0.6 * Fy * Aw (N) -> kN
     Vn_N = 0.6 * Fy * Aw
     Vn_kN = Vn_N / 1000.0
@@ -81,7 +106,7 @@ def display():
     # ----------------------------
     # need moment of inertia to compute deflection. approximate from Sx & section depth if I not provided.
     # If Sx and a guessed neutral axis depth z are given, I = Sx * z. We avoid guessing: ask user to provide I (optional)
-    I_input = st.number_input("Moment of inertia Ix (mm⁴) (optional, 0 to skip)", min_value=0.0, value=0.0, step=1000.0, key="purlin_Ix")
+    I_input = st.number_input("Moment of inertia Ix (mm⁴) (optional, 0 to skip)", min_value=0.0, value=prop_default(props, "Ix", 0.0), step=1000.0, key=f"purlin_Ix_{section_name}")
     if I_input > 0:
         I_m4 = I_input / 1e12  # mm4 -> m4
     else:
@@ -115,7 +140,7 @@ def display():
     # ----------------------------
     # Lateral-torsional buckling (LTB) advisory
     # ----------------------------
-    ltb_warn = Lb > 3000.0  # conservative threshold (mm). Purlins often braced by roof sheeting.
+    ltb_warn = props is None and Lb > 3000.0  # custom sections: LTB not evaluated
 
     # ----------------------------
     # Utilizations & pass/fail
@@ -139,7 +164,7 @@ def display():
             "Nominal shear Vn (kN)", "ΦVn (kN)",
             "Flexure utilization (M_u / ΦMn)", "Shear utilization (V_u / ΦVn)",
             "Deflection (mm)", "Deflection limit (mm)", "Deflection OK?",
-            "Unbraced length Lb (mm)", "LTB advisory"
+            "Unbraced length Lb (mm)", "Cb (governing segment)", "LTB advisory"
         ],
         "Value": [
             str(section_name),
@@ -158,7 +183,8 @@ def display():
             f"{limit_mm:.2f}" if I_m4 is not None else "N/A",
             "PASS" if deflection_ok else ("FAIL" if deflection_ok is False else "N/A"),
             f"{Lb:.0f}",
-            "Check LTB" if ltb_warn else "OK (but verify bracing)"
+            f"{Cb_gov:.3f}" if props is not None else "N/A",
+            "Check LTB" if ltb_warn else ("Included in ΦMn" if props is not None else "OK (but verify bracing)")
         ]
     }
     st.table(pd.DataFrame(results).set_index("Parameter"))
@@ -186,15 +212,112 @@ def display():
         st.info("Deflection not computed (provide Ix to enable deflection check).")
 
     if ltb_warn:
-        st.warning("Unbraced length Lb exceeds conservative threshold — perform LTB check per NSCP/AISC or provide additional bracing.")
+        st.warning("Custom section with large Lb — LTB not evaluated; pick a catalogue section or provide additional bracing.")
+    elif props is not None:
+        st.info(f"LTB included in ΦMn — governing segment C_b = {Cb_gov:.2f} with L_b = {Lb_eff:.0f} mm.")
     else:
         st.info("Unbraced length looks modest; still confirm LTB per code if in doubt.")
 
     st.markdown("---")
     st.markdown("### Notes & references")
     st.markdown(r"""
-    - This module uses a conservative approach: chosen Mn = min(F_y·Z_x, F_y·S_x). Use LTB calculations for long unbraced lengths.  
+    - This module uses a conservative approach: chosen Mn = min(F_y·Z_x, F_y·S_x, M_LTB) with C_b per unbraced segment.  
     - LRFD φ for flexure and shear taken as 0.90. Confirm with NSCP clauses for exact φ values and buckling provisions.  
     - Provide accurate section properties (Sx, Zx, I) where possible for reliable checks.  
     - Purlins are typically supported by sheeting and bracing; ensure adequate lateral restraint to avoid LTB.
     """)
+
+    # ----------------------------
+    # Continuous / lapped purlin lines (whole roof)
+    # ----------------------------
+    st.markdown("---")
+    st.markdown("### 🔗 Continuous & lapped purlin lines — gravity and wind uplift")
+    if props is None:
+        st.info("Pick a catalogue section to run the multi-span purlin check.")
+    else:
+        st.markdown(
+            "Every line is solved as a continuous beam over its bays by superposing per-span influence coefficients "
+            "(live load patterned span by span). Combinations: " + ", ".join(COMBOS) + "."
+        )
+        m1, m2, m3 = st.columns(3)
+        with m1:
+            lap_ratio = st.number_input("Lap length each side of support (× span)", min_value=0.0, max_value=0.3, value=0.1, step=0.01, key="purlin_lap_ratio")
+            lap_stiffness = st.number_input("Lap stiffness factor (EI multiplier)", min_value=1.0, max_value=2.0, value=1.5, step=0.1, key="purlin_lap_EI")
+            lap_capacity = st.number_input("Lap capacity factor (ΦMn, ΦVn multiplier)", min_value=1.0, max_value=2.0, value=1.0, step=0.1, key="purlin_lap_capacity",
+                                           help="1.0 = single section. Up to 2.0 only when the lap bolts are designed to make both nested sections share the moment and shear.")
+        with m2:
+            restraint = st.selectbox("Flange restraint", RESTRAINTS, index=0, key="purlin_restraint")
+            sag_spacing = st.number_input("Sag rod / bridging spacing (mm, 0 = none)", min_value=0.0, value=Lb, step=100.0, key="purlin_sag")
+        with m3:
+            uplift_default = st.number_input("Default net wind uplift (kPa)", min_value=0.0, value=0.8, step=0.05, key="purlin_uplift")
+        defl_den = float(deflection_limit_choice.split("/")[1])
+
+        lines = st.data_editor(
+            pd.DataFrame({
+                "Line": ["Eave", "Interior", "Ridge"],
+                "Bays": [6, 6, 6],
+                "Span (m)": [span] * 3,
+                "Tributary (m)": [spacing / 2.0 + 0.3, spacing, spacing],
+                "Uplift (kPa)": [1.5 * uplift_default, uplift_default, 1.2 * uplift_default],
+            }),
+            num_rows="dynamic", key="purlin_lines", use_container_width=True,
+        ).dropna()
+        if len(lines) > 0:
+            lines = lines.astype({"Bays": int})
+            lines_summary = design_purlin_lines(lines, section_name, Fy=Fy, dead=roof_dead, live=roof_live,
+                                                lap_ratio=lap_ratio, lap_stiffness=lap_stiffness, restraint=restraint,
+                                                sag_spacing=sag_spacing, deflection_limit=defl_den, E=E,
+                                                lap_capacity=lap_capacity)
+            st.dataframe(lines_summary, use_container_width=True)
+            failing = int((lines_summary["Status"] != "OK").sum())
+            if failing:
+                st.error(f"{failing} purlin line(s) fail — increase section, add laps or reduce bay length.")
+            else:
+                st.success("All purlin lines pass flexure, shear and deflection.")
+
+            pick = st.selectbox("Moment envelope of line", list(lines["Line"]), key="purlin_line_pick")
+            row = lines[lines["Line"] == pick].iloc[0]
+            trib = float(row["Tributary (m)"])
+            st.line_chart(line_envelope(int(row["Bays"]), float(row["Span (m)"]),
+                                        roof_dead * trib + props["mass"] * 9.81e-3, roof_live * trib,
+                                        float(row["Uplift (kPa)"]) * trib, lap_ratio, lap_stiffness))
+            st.caption(
+                "Sagging (+) compresses the top flange, hogging (−) the bottom flange. Through-fastened sheeting restrains "
+                "the top flange; bottom-flange compression under uplift uses the AISI R-factor, otherwise LTB over the "
+                "sag-rod spacing (Cb = 1). Capacity within laps is multiplied by the lap capacity factor; the lap ends are "
+                "checked on the single section."
+            )
+
+    # ----------------------------
+    # Layout optimizer (spacing × section × sag rods)
+    # ----------------------------
+    st.markdown("---")
+    st.markdown("### 🧮 Purlin layout optimizer — minimum steel weight")
+    o1, o2, o3 = st.columns(3)
+    with o1:
+        rafter_length = st.number_input("Rafter length along slope (m)", min_value=1.0, value=15.0, step=0.5, key="purlin_opt_rafter")
+        opt_bays = st.number_input("Continuous bays", min_value=1, max_value=20, value=6, step=1, key="purlin_opt_bays")
+    with o2:
+        s_min, s_max = st.slider("Spacing range (m)", 0.4, 3.0, (0.8, 2.0), 0.1, key="purlin_opt_spacing")
+        opt_uplift = st.number_input("Net wind uplift (kPa)", min_value=0.0, value=0.8, step=0.05, key="purlin_opt_uplift")
+    with o3:
+        opt_restraint = st.selectbox("Flange restraint", RESTRAINTS, index=0, key="purlin_opt_restraint")
+        max_sag = st.number_input("Max sag rods per bay", min_value=0, max_value=6, value=3, step=1, key="purlin_opt_sag")
+    if st.button("Run optimizer", key="purlin_opt_run"):
+        grid = optimize_layout(
+            rafter_length, span, int(opt_bays), dead=roof_dead, live=roof_live, uplift=opt_uplift, Fy=Fy,
+            restraint=opt_restraint, spacing_range=(s_min, s_max), sag_counts=tuple(range(int(max_sag) + 1)),
+            deflection_limit=float(deflection_limit_choice.split("/")[1]), E=E,
+        )
+        passing = grid[grid["Passes"]]
+        if passing.empty:
+            st.error("No catalogue section / spacing / sag-rod combination passes — shorten the bays or widen the search.")
+        else:
+            best = passing.iloc[0]
+            st.success(
+                f"Lightest layout: {best['Section']} × {int(best['Purlin lines'])} lines @ {best['Spacing (m)']:.2f} m, "
+                f"{int(best['Sag rods / bay'])} sag rod(s) per bay → {best['Steel mass (kg)']:,.0f} kg "
+                f"(max ratio {best['Max ratio']:.2f})"
+            )
+            st.dataframe(passing.head(15), use_container_width=True)
+        st.caption(f"{len(grid):,} candidates evaluated on one rafter slope ({opt_bays} bays × {span:.2f} m).")
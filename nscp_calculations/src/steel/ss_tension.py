@@ -1,5 +1,8 @@
 import streamlit as st
 import pandas as pd
+from src.calculations.steel.failure_paths import bolt_grid, hole_diameter, plate_tension_check
+from src.components.frame_forces import frame_member_picker
+from src.components.section_picker import prop_default
 
 def display():
     st.header("🛠️ Structural Steel Tension Member Design (NSCP 2015)")
@@ -10,6 +13,8 @@ def display():
     considering both **gross yielding** and **net fracture** limit states.
     """)
 
+    member, actions = frame_member_picker("Member from the Analysis page (truss / frame)", "tension_frame_member")
+
     st.subheader("Input Parameters")
 
     col1, col2, col3 = st.columns(3)
@@ -19,16 +24,46 @@ def display():
         fu = st.number_input("Ultimate Strength Fu (MPa)", value=400.0, key="fu")
     with col3:
         ag = st.number_input("Gross Area Ag (mm²)", value=2000.0, key="ag")
-    col4, col5 = st.columns(2)
-    with col4:
-        an = st.number_input("Net Area An (mm²)", value=1600.0, key="an")
-    with col5:
-        u = st.number_input("Shear Lag Factor U", value=0.9, key="u")
+    from_layout = st.checkbox("Compute Ag, An and block shear from a bolted plate layout", value=False, key="tension_layout")
+    block_phiRn = None
+    if from_layout:
+        l1, l2, l3 = st.columns(3)
+        with l1:
+            t_plate = st.number_input("Plate thickness t (mm)", value=12.0, key="tension_t")
+            d_bolt = st.number_input("Bolt diameter (mm)", value=20.0, key="tension_db")
+            n_lines = st.number_input("Gauge lines across", min_value=1, value=3, step=1, key="tension_lines")
+        with l2:
+            n_per_line = st.number_input("Bolts per gauge line", min_value=1, value=3, step=1, key="tension_per_line")
+            gauge = st.number_input("Gauge g (mm)", value=60.0, key="tension_gauge")
+            pitch = st.number_input("Pitch (mm)", value=70.0, key="tension_pitch")
+        with l3:
+            stagger = st.number_input("Stagger s of alternate lines (mm)", value=35.0, key="tension_stagger")
+            end_dist = st.number_input("End distance (mm)", value=40.0, key="tension_end")
+            edge_dist = st.number_input("Edge distance (mm)", value=40.0, key="tension_edge")
+        xy, width = bolt_grid(int(n_lines), int(n_per_line), pitch, gauge, end_dist, edge_dist, stagger)
+        d_h = hole_diameter(d_bolt)
+        layout = plate_tension_check(xy, width, t_plate, d_h, fy, fu)
+        ag, an = layout["Ag"], layout["An"]
+        block_phiRn = layout["block"]
+        u = 1.0  # plates: all elements connected (AISC Table D3.1 case 1)
+        st.caption(
+            f"Plate width {width:.0f} mm, hole {d_h:.0f} mm (incl. 2 mm damage). Governing net path through "
+            f"{len(layout['path'])} hole(s): An = {an:,.0f} mm². Governing block shear: {layout['block_path']}."
+        )
+        with st.expander("All block-shear tear-outs"):
+            st.dataframe(layout["blocks"], use_container_width=True)
+    else:
+        col4, col5 = st.columns(2)
+        with col4:
+            an = st.number_input("Net Area An (mm²)", value=1600.0, key="an")
+        with col5:
+            u = st.number_input("Shear Lag Factor U", value=0.9, key="u")
     col6, col7 = st.columns(2)
     with col6:
         phi = st.number_input("Resistance Factor φ", value=0.9, key="phi")
     with col7:
-        applied_tension = st.number_input("Applied Tension Load (kN)", value=200.0, key="t_applied")
+        applied_tension = st.number_input("Applied Tension Load (kN)", value=prop_default(actions, "Tu (kN)", 200.0),
+                                          key=f"t_applied_{member}")
 
     # --- Calculations ---
     # Convert MPa × mm² = N → kN
@@ -37,6 +72,8 @@ def display():
 
     design_strength = min(phiPn_yield, phiPn_fracture)
     governing = "Gross Yielding" if phiPn_yield < phiPn_fracture else "Net Fracture"
+    if block_phiRn is not None and block_phiRn < design_strength:
+        design_strength, governing = block_phiRn, "Block Shear"
 
     safety_factor = design_strength / applied_tension if applied_tension > 0 else 0
     status = "✅ Safe" if safety_factor >= 1 else "⚠️ NG (Overstressed)"
@@ -54,6 +91,7 @@ def display():
             "Resistance Factor φ",
             "Design Strength (Yielding) φPn = φFyAg",
             "Design Strength (Fracture) φPn = φFuAnU",
+            "Design Strength (Block Shear) φRn",
             "Governing Limit State",
             "Applied Tension Load (kN)",
             "Safety Ratio (φPn / P)",
@@ -68,6 +106,7 @@ def display():
             f"{phi:.2f}",
             f"{phiPn_yield:.2f}",
             f"{phiPn_fracture:.2f}",
+            f"{block_phiRn:.2f}" if block_phiRn is not None else "N/A (no layout)",
             governing,
             f"{applied_tension:.2f}",
             f"{safety_factor:.2f}",
@@ -1,6 +1,8 @@
 # streamlit_bolted_splice.py
 import streamlit as st
 import math
+from src.calculations.steel.bolt_group import pattern_coefficient
+from src.calculations.steel.failure_paths import bolt_grid, plate_tension_check
 
 def display():
     st.header("🔩 Bolted Splice — NSCP / AISC style calculation template")
@@ -65,12 +67,21 @@ def display():
         st.subheader("Computed geometric values")
         d_hole = bolt_d_nom + hole_d_add
         A_gross = gross_width * thickness
-        A_net = (gross_width - (d_hole * n_bolt_rows)) * thickness
+        # bolt layout of one splice half: rows across the width, columns along the load
+        rows = max(int(n_bolt_rows), 1)
+        cols = max(int(math.ceil(n_bolts_total_each_side / rows)), 1)
+        if rows > 1:
+            layout_xy, _ = bolt_grid(rows, cols, bolt_spacing, (gross_width - 2.0 * edge_distance) / (rows - 1),
+                                     edge_distance, edge_distance)
+        else:
+            layout_xy, _ = bolt_grid(1, cols, bolt_spacing, 0.0, edge_distance, gross_width / 2.0)
+        plate = plate_tension_check(layout_xy, gross_width, thickness, d_hole, Fy, Fu, splice=True)
+        A_net = plate["An"]
         A_bolt_shank = math.pi * (bolt_d_nom ** 2) / 4.0  # mm^2
         n_bolts_each = n_bolts_total_each_side
         st.write(f"- Nominal bolt hole diameter (d0): {d_hole:.1f} mm")
         st.write(f"- Gross area, A_g = {A_gross:.1f} mm²")
-        st.write(f"- Net area (simple deduction), A_n = {A_net:.1f} mm²")
+        st.write(f"- Net area (critical fracture path, ≤ 0.85A_g), A_n = {A_net:.1f} mm²")
         st.write(f"- Bolt cross-sectional area (shank), A_b = {A_bolt_shank:.2f} mm²")
         st.write(f"- Bolts per splice half: {n_bolts_each}, shear planes per bolt: {shear_planes_per_bolt}")
 
@@ -84,10 +95,18 @@ def display():
         phiV = phi_shear
         Vr_per_bolt = phiV * Vn_per_bolt
         total_Vr = Vr_per_bolt * n_bolts_each
+        if V_shear > 0 and M_moment != 0.0:
+            # shear with moment: eccentric bolt group by the instantaneous centre of rotation
+            e_v = abs(M_moment) / V_shear
+            cols = max(int(math.ceil(n_bolts_each / max(n_bolt_rows, 1))), 1)
+            C = pattern_coefficient(max(int(n_bolt_rows), 1), cols, bolt_spacing, bolt_spacing, e_v)
+            C *= n_bolts_each / (max(int(n_bolt_rows), 1) * cols)
+            total_Vr = Vr_per_bolt * C
+            st.write(f"Eccentricity e = M / V = {e_v:.1f} mm → ICR coefficient C = {C:.3f} (of n = {n_bolts_each})")
         st.write(f"Nominal shear per shear plane, Vn_plane = 0.6 * Fub * A_b = {Vn_per_plane_N:.1f} N")
         st.write(f"Nominal shear per bolt (all planes): Vn_bolt = {Vn_per_bolt:.1f} N")
         st.write(f"Design shear per bolt (ΦVn): {Vr_per_bolt:.1f} N")
-        st.write(f"Total design shear resistance (all bolts on one half): {total_Vr:.1f} N")
+        st.write(f"Total design shear resistance (all bolts on one half, C·ΦVn): {total_Vr:.1f} N")
         st.write(f"Applied shear V = {V_shear:.1f} N")
         if total_Vr >= V_shear:
             st.success("Bolt shear capacity OK (resists applied shear).")
@@ -126,22 +145,17 @@ def display():
         else:
             st.error("Tension capacity INSUFFICIENT.")
 
-        st.subheader("Block-shear check (simplified)")
-        # Simple block shear: Rn = 0.6*Fy*(A_gv) + Fu*(A_nt) [this is a simplified form]
-        # User must provide assumed shear path and tension path areas; we estimate from geometry:
-        A_gv = thickness * (edge_distance)  # gross shear area (mm2) - approximate
-        A_nt = thickness * (bolt_spacing * n_bolt_rows)  # net tensile area along tension path - approx
-        Rn_block = 0.6 * Fy * A_gv + Fu * A_nt
-        R_design_block = phi_tension * Rn_block
-        st.write("**(Approximate)** block shear areas used:")
-        st.write(f"- A_gv (gross shear area) ≈ t * edge_distance = {A_gv:.1f} mm²")
-        st.write(f"- A_nt (net tension area) ≈ t * (bolt_spacing * rows) = {A_nt:.1f} mm²")
-        st.write(f"Nominal block-shear Rn ≈ 0.6*Fy*A_gv + Fu*A_nt = {Rn_block:.1f} N")
-        st.write(f"Design block-shear ΦRn = {R_design_block:.1f} N")
+        st.subheader("Block-shear check (AISC J4.3)")
+        # every tear-out of the bolt layout: between gauge lines and from a side edge to a gauge line
+        R_design_block = plate["block"] * 1000.0  # kN -> N
+        st.write(f"Governing block: {plate['block_path']} (of {len(plate['blocks'])} tear-outs checked)")
+        st.write(f"Design block-shear ΦRn = {R_design_block:.1f} N (Φ = 0.75)")
+        with st.expander("All block-shear tear-outs"):
+            st.dataframe(plate["blocks"], use_container_width=True)
         if R_design_block >= N_axial:
             st.success("Block-shear capacity OK for axial transfer.")
         else:
-            st.warning("Block-shear may control; check detailed geometry per code.")
+            st.error("Block-shear capacity INSUFFICIENT for axial transfer.")
 
         st.subheader("Moment transfer (rough check)")
         if M_moment != 0.0 and n_bolts_each > 0:
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.calculations.steel.weld_group import PHI_W, SHAPES, check_weld_groups, elastic_coefficient, shape_coefficient, weld_shape
 
 def display():
     # Header with icon
@@ -18,8 +19,12 @@ def display():
         t = st.number_input("Plate Thickness t (mm)", value=12.0, key="welded_splices_t")
         Lw = st.number_input("Weld Length Lw (mm)", value=200.0, key="welded_splices_lw")
         Fexx = st.number_input("Electrode Strength Fₑₓₓ (MPa)", value=490.0, key="welded_splices_fexx")
+        w = st.number_input("Fillet Weld Leg w (mm)", value=8.0, key="welded_splices_w")
     with col3:
-        theta = st.number_input("Weld Angle θ (degrees)", value=45.0, key="welded_splices_theta")
+        theta = st.number_input("Load Angle to Weld Axis θ (degrees)", min_value=0.0, max_value=90.0, value=45.0, key="welded_splices_theta")
+        shape = st.selectbox("Weld Group Shape", SHAPES, index=0, key="welded_splices_shape")
+        b = st.number_input("Weld Group Width b (mm)", value=100.0, key="welded_splices_b", disabled=shape == "Line")
+        e = st.number_input("Load Eccentricity e (mm)", value=0.0, key="welded_splices_e")
         phi = 0.9
 
     st.divider()
@@ -27,27 +32,34 @@ def display():
     # --- Design Calculations ---
     # st.subheader("Design Calculations")
 
-    # Weld nominal strength (kN/mm)
-    weld_strength_per_mm = 0.707 * t * (Fexx / math.sqrt(3)) / 1000
-    Vn = weld_strength_per_mm * Lw           # Nominal shear strength (kN)
+    # Weld group strength: K from the instantaneous centre method (directional increase included)
+    lines = weld_shape(shape, Lw, b)
+    L_total = sum(math.hypot(x2 - x1, y2 - y1) for (x1, y1), (x2, y2) in lines)
+    K = shape_coefficient(shape, Lw, b, e, theta)
+    K_elastic = elastic_coefficient(lines, e, theta)
+    weld_strength_per_mm = 0.6 * Fexx * 0.707 * w / 1000  # kN/mm (longitudinal)
+    Vn = K * weld_strength_per_mm * L_total  # Nominal weld group strength (kN)
     Pn = 0.75 * Fu * t * Lw / 1000           # Nominal tensile strength (kN)
-    phiVn = phi * Vn                         # Design shear strength (kN)
+    phiVn = PHI_W * Vn                       # Design weld strength (kN)
     phiPn = phi * Pn                         # Design tensile strength (kN)
 
     # --- Results Table ---
     data = {
         "Parameter": [
-            "Nominal Weld Shear Strength (Vn)",
-            "Design Weld Shear Strength (φVn)",
-            "Nominal Plate Tensile Strength (Pn)",
-            "Design Plate Tensile Strength (φPn)"
+            "Total Weld Length ΣL (mm)",
+            "Strength Coefficient K (ICR, incl. 1 + 0.5 sin¹·⁵θ)",
+            "Strength Coefficient K (elastic, for reference)",
+            "Nominal Weld Shear Strength (Vn, kN)",
+            "Design Weld Shear Strength (φVn, kN)",
+            "Nominal Plate Tensile Strength (Pn, kN)",
+            "Design Plate Tensile Strength (φPn, kN)"
         ],
-        "Value (kN)": [Vn, phiVn, Pn, phiPn]
+        "Value": [L_total, K, K_elastic, Vn, phiVn, Pn, phiPn]
     }
 
     st.markdown("### 🧾 Results Summary")
     df = pd.DataFrame(data)
-    st.table(df.style.format({"Value (kN)": "{:.2f}"}))
+    st.table(df.style.format({"Value": "{:.3f}"}))
 
     # --- Design Check ---
     if phiVn >= P_u and phiPn >= P_u:
@@ -55,4 +67,25 @@ def display():
     else:
         st.error("❌ Welded splice connection design **does not satisfy** strength requirements.")
 
-    st.info("All calculations follow NSCP 2015 / AISC 360-10 provisions for welded connections.")
+    st.info("All calculations follow NSCP 2015 / AISC 360-10 provisions for welded connections "
+            f"(φ = {PHI_W} for welds, Rn = K · 0.6 FEXX · 0.707 w · ΣL).")
+
+    # --- Weld schedule (batch ICR check) ---
+    with st.expander("📋 Batch check — eccentric weld groups (ICR)"):
+        schedule = st.data_editor(
+            pd.DataFrame({
+                "Mark": ["W1", "W2", "W3"],
+                "Shape": [shape, "C", "Box"],
+                "L (mm)": [Lw, 250.0, 300.0],
+                "b (mm)": [b, 100.0, 150.0],
+                "w (mm)": [w, 6.0, 8.0],
+                "FEXX (MPa)": [Fexx] * 3,
+                "e (mm)": [e, 150.0, 200.0],
+                "Angle (deg)": [theta, 0.0, 0.0],
+                "Pu (kN)": [P_u, 200.0, 350.0],
+            }),
+            column_config={"Shape": st.column_config.SelectboxColumn(options=list(SHAPES))},
+            num_rows="dynamic", key="welded_splices_schedule", use_container_width=True,
+        ).dropna()
+        if len(schedule) > 0:
+            st.dataframe(check_weld_groups(schedule), use_container_width=True)
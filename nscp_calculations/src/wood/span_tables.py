@@ -0,0 +1,90 @@
+import streamlit as st
+import pandas as pd
+from src.calculations.wood.adjustment import LOAD_DURATION
+from src.calculations.wood.span_tables import LIMIT_STATES, NOMINAL_SIZES, SPACINGS, span_pivot, span_table
+from src.calculations.wood.species import species_names
+from src.calculations.wood.vibration import CRITERIA, SHEATHING_E
+
+def display():
+    st.header("📏 Joist & Beam Span Tables (NSCP 2015 / NDS)")
+
+    st.markdown(r"""
+    Maximum simple spans of uniformly loaded sawn joists and beams over a grid of **species × nominal sizes × spacings × loads**.
+    Each limit state is solved in closed form and the smallest span governs:
+    bending \( \sqrt{8F'_bS/w} \), shear at \( d \) from the support, live / total-load deflection \( \sqrt[3]{384E'I/(5wn)} \)
+    bearing on the support length and, for floors, the vibration criterion (fundamental frequency and 1 kN
+    point-load deflection from the joist and sheathing stiffness). Adjusted values come from the species table and the NDS factors
+    (\( C_r \) up to 610 mm spacing). Tables are cached on disk, so the standard details reload instantly.
+    """)
+
+    # ----------------------------
+    # Grid
+    # ----------------------------
+    c1, c2 = st.columns(2)
+    with c1:
+        species = st.multiselect("Species / grades", species_names(),
+                                 default=["Apitong 80% stress grade", "Tanguile 80% stress grade", "Douglas Fir-Larch No.2"],
+                                 key="span_species")
+        sizes = st.multiselect("Nominal sizes", list(NOMINAL_SIZES), default=list(NOMINAL_SIZES)[:7], key="span_sizes")
+        spacings = st.multiselect("Spacings (mm o.c.)", [300.0, 400.0, 600.0, 800.0, 1200.0], default=list(SPACINGS), key="span_spacings")
+    with c2:
+        loads = st.data_editor(
+            pd.DataFrame({"Dead (kPa)": [0.5, 0.5, 1.0], "Live (kPa)": [1.9, 2.4, 4.8]}),
+            num_rows="dynamic", key="span_loads", use_container_width=True,
+        ).dropna()
+        st.caption("Superimposed loads; the member self-weight (ρ = 1000·G) is added to the dead load.")
+
+    c3, c4, c5 = st.columns(3)
+    with c3:
+        bearing = st.number_input("Bearing length at supports (mm)", min_value=20.0, value=38.0, step=1.0, key="span_bearing")
+        duration = st.selectbox("Load duration (C_D)", list(LOAD_DURATION), index=1, key="span_duration")
+    with c4:
+        live_limit = st.number_input("Live-load deflection limit L/", min_value=120.0, value=360.0, step=30.0, key="span_live_limit")
+        total_limit = st.number_input("Total-load deflection limit L/", min_value=120.0, value=240.0, step=30.0, key="span_total_limit")
+    with c5:
+        wet = st.checkbox("Wet service (C_M)", value=False, key="span_wet")
+        incised = st.checkbox("Incised (C_i)", value=False, key="span_incised")
+
+    c6, c7, c8, c9 = st.columns(4)
+    with c6:
+        vibration = st.selectbox("Floor vibration", ["Not checked (roofs)"] + list(CRITERIA), index=1, key="span_vibration")
+    with c7:
+        sheathing_t = st.number_input("Sheathing thickness (mm)", min_value=6.0, value=18.0, step=1.0, key="span_sheathing_t")
+    with c8:
+        sheathing_E = st.number_input("Sheathing E (MPa)", min_value=1000.0, value=SHEATHING_E, step=500.0, key="span_sheathing_E")
+    with c9:
+        gamma = st.number_input("Composite action γ (0 none – 1 glued)", min_value=0.0, max_value=1.0, value=0.0,
+                                step=0.1, key="span_gamma")
+
+    if not species or not sizes or not spacings or len(loads) == 0:
+        st.info("Select at least one species, size, spacing and load.")
+        return
+
+    table = span_table(tuple(species), tuple(sizes), tuple(sorted(spacings)),
+                       tuple((float(d), float(l)) for d, l in loads[["Dead (kPa)", "Live (kPa)"]].to_numpy(float)),
+                       bearing, live_limit, total_limit, LOAD_DURATION[duration], wet, 38.0, incised,
+                       vibration if vibration in CRITERIA else None, sheathing_t, sheathing_E, gamma)
+    if vibration not in CRITERIA:
+        table = table.drop(columns="Vibration (m)")
+
+    # ----------------------------
+    # Results
+    # ----------------------------
+    st.markdown("---")
+    st.markdown("### 🧾 Span tables (maximum span, m)")
+    st.success(f"✅ {len(table):,} span checks ({len(species)} species × {len(sizes)} sizes × {len(spacings)} spacings × {len(loads)} loads).")
+    for sp in species:
+        st.markdown(f"**{sp}**")
+        tabs = st.tabs([f"D {d:g} + L {l:g} kPa" for d, l in loads[["Dead (kPa)", "Live (kPa)"]].to_numpy(float)])
+        for tab, (d, l) in zip(tabs, loads[["Dead (kPa)", "Live (kPa)"]].to_numpy(float)):
+            with tab:
+                st.dataframe(span_pivot(table, sp, d, l).round(2), use_container_width=True)
+
+    with st.expander("Every grid point with the span of each limit state"):
+        st.dataframe(table.round(3), use_container_width=True)
+    st.caption("Governing limit states: " + ", ".join(f"{k} {v}" for k, v in table["Governs"].value_counts().reindex(LIMIT_STATES).dropna().astype(int).items()))
+    st.download_button("Download span table (CSV)", table.round(3).to_csv(index=False).encode("utf-8"), "span_table.csv", "text/csv")
+
+    st.markdown("---")
+    st.caption("Simple spans with full lateral support from the sheathing (C_L = 1); check concentrated loads and cantilevers separately. "
+               "The vibrating mass is the superimposed dead load plus the joists and sheathing.")
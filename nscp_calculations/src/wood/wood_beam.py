@@ -1,6 +1,11 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.calculations.wood.adjustment import adjust, factor_table, starred
+from src.calculations.wood.species import custom_species
+from src.calculations.wood.stability import BEAM_LOADING, MAX_SLENDERNESS, beam_effective_length, beam_slenderness, beam_stability
+from src.components.section_picker import prop_default
+from src.components.wood_picker import service_conditions, species_picker
 
 def display():
     st.header("🌲 Wood Beam Design (NSCP 2015 Section 611)")
@@ -26,9 +31,32 @@ def display():
         width = st.number_input("Beam Width (mm)", min_value=50.0, value=100.0, step=5.0, key="wood_b")
         depth = st.number_input("Beam Depth (mm)", min_value=100.0, value=300.0, step=5.0, key="wood_d")
     with col3:
-        Fb = st.number_input("Allowable Bending Stress Fb (MPa)", min_value=5.0, value=10.0, step=0.5, key="wood_Fb")
-        Fv = st.number_input("Allowable Shear Stress Fv (MPa)", min_value=0.5, value=1.0, step=0.1, key="wood_Fv")
-        E = st.number_input("Modulus of Elasticity E (MPa)", min_value=5000.0, value=10000.0, step=100.0, key="wood_E")
+        species, ref = species_picker("Species / grade", "wood_species")
+        Fb_ref = st.number_input("Reference Bending Stress Fb (MPa)", min_value=1.0, value=prop_default(ref, "Fb", 10.0), step=0.5, key=f"wood_Fb_{species}")
+        Fv_ref = st.number_input("Reference Shear Stress Fv (MPa)", min_value=0.2, value=prop_default(ref, "Fv", 1.0), step=0.1, key=f"wood_Fv_{species}")
+        E_ref = st.number_input("Reference Modulus of Elasticity E (MPa)", min_value=3000.0, value=prop_default(ref, "E", 10000.0), step=100.0, key=f"wood_E_{species}")
+
+    col4, col5 = st.columns(2)
+    with col4:
+        lu = st.number_input("Unbraced length of compression edge lu (m) — 0 if continuously braced", min_value=0.0,
+                             value=span, step=0.1, key="wood_lu")
+    with col5:
+        loading = st.selectbox("Loading for effective length le (NDS Table 3.3.3)", list(BEAM_LOADING), key="wood_loading")
+
+    st.markdown("#### Service conditions (NDS adjustment factors)")
+    conditions = service_conditions("wood_beam")
+    values = custom_species(Fb_ref, prop_default(ref, "Ft", Fb_ref), Fv_ref, prop_default(ref, "Fc_perp", 0.0),
+                            prop_default(ref, "Fc", 0.0), E_ref, ref["Emin"] * E_ref / ref["E"] if ref else None,
+                            ref["rule"] if ref else "NSCP", species)
+    adjusted = adjust(values, width, depth, **conditions)
+    # Beam stability factor CL (NDS 3.3.3) from Fb* and E'min
+    le = float(beam_effective_length(lu * 1000, depth, loading))
+    RB = float(beam_slenderness(le, width, depth))
+    CL = float(beam_stability(float(starred(adjusted, "Fb")[0]), float(adjusted["adjusted"][0, 6]), RB, width, depth)["CL"])
+    adjusted = adjust(values, width, depth, **conditions, CL=CL)
+    Fb, Fv, E = (float(adjusted["adjusted"][0, i]) for i in (0, 2, 5))
+    with st.expander("Adjusted design values F' = F × C_D·C_M·C_t·C_L·C_F·C_fu·C_i·C_r·C_P"):
+        st.dataframe(factor_table(adjusted).round(3), use_container_width=True)
 
     # ----------------------------
     # CALCULATIONS
@@ -50,10 +78,10 @@ def display():
 
     # Stress calculations
     Fb_actual = (M_max * 1e6) / (S * 1e6) / 1000  # MPa
-    Fv_actual = (1.5 * V_max * 1e3) / (b * d * 1e6) * 1000  # MPa
+    Fv_actual = (1.5 * V_max * 1e3) / (b * d * 1e6)  # MPa
 
     # Deflection (max for uniform load: 5wL⁴ / 384EI)
-    Δ = (5 * (w_total * 1e3) * (span**4)) / (384 * E * I * 1e9)  # meters
+    Δ = (5 * (w_total * 1e3) * (span**4)) / (384 * E * 1e6 * I)  # meters
     Δ_mm = Δ * 1000
 
     # Allowable deflection (L/240 typical)
@@ -79,10 +107,13 @@ def display():
             "Total Load (kN/m)",
             "Max Moment (kN·m)",
             "Max Shear (kN)",
+            "Effective Length le (mm)",
+            "Slenderness RB",
+            "Beam Stability Factor CL",
             "Actual Bending Stress (MPa)",
-            "Allowable Bending Stress (MPa)",
+            "Adjusted Bending Stress F'b (MPa)",
             "Actual Shear Stress (MPa)",
-            "Allowable Shear Stress (MPa)",
+            "Adjusted Shear Stress F'v (MPa)",
             "Deflection (mm)",
             "Allowable Deflection (mm)",
             "Deflection Ratio (Δ / Δ_allow)"
@@ -90,6 +121,7 @@ def display():
         "Value": [
             f"{span:.2f}", f"{spacing:.2f}", f"{load_dead:.2f}", f"{load_live:.2f}",
             f"{w_total:.2f}", f"{M_max:.2f}", f"{V_max:.2f}",
+            f"{le:.0f}", f"{RB:.2f}", f"{CL:.3f}",
             f"{Fb_actual:.2f}", f"{Fb:.2f}", f"{Fv_actual:.2f}", f"{Fv:.2f}",
             f"{Δ_mm:.2f}", f"{Δ_allow:.2f}", f"{ratio_D:.3f}"
         ]
@@ -106,6 +138,9 @@ def display():
     else:
         st.error(f"Bending NG — Utilization: {ratio_M:.2f}")
 
+    if RB > MAX_SLENDERNESS:
+        st.error(f"Slenderness NG — RB = {RB:.1f} > {MAX_SLENDERNESS:.0f} (NDS 3.3.3.7)")
+
     if ratio_V <= 1:
         st.success(f"Shear OK — Utilization: {ratio_V:.2f}")
     else:
@@ -122,8 +157,10 @@ def display():
     st.markdown("---")
     st.subheader("📘 NSCP 2015 References (Section 611)")
     st.markdown(r"""
-    - **Bending:** \( f_b = \frac{M}{S} \leq F_b \)  
-    - **Shear:** \( f_v = \frac{1.5V}{b d} \leq F_v \)  
+    - **Bending:** \( f_b = \frac{M}{S} \leq F'_b \)  
+    - **Shear:** \( f_v = \frac{1.5V}{b d} \leq F'_v \)  
+    - **Adjusted values:** \( F' = F \times C_D C_M C_t C_L C_F C_{fu} C_i C_r \) (NDS Table 4.3.1)  
+    - **Beam stability:** \( C_L = \frac{1 + F_{bE}/F_b^*}{2(0.95)} - \sqrt{\left(\frac{1 + F_{bE}/F_b^*}{2(0.95)}\right)^2 - \frac{F_{bE}/F_b^*}{0.95}} \), \( F_{bE} = \frac{1.20E'_{min}}{R_B^2} \), \( R_B = \sqrt{\frac{l_e d}{b^2}} \leq 50 \) (NDS 3.3.3)  
     - **Deflection:** \( \Delta = \frac{5wL^4}{384EI} \leq L/240 \) (typical)  
     - Based on NSCP 2015 §611 (Wood Design) and NDS-2015.
     """)
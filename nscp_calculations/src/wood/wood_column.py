@@ -1,6 +1,12 @@
 import streamlit as st
 import pandas as pd
 import math
+from src.calculations.wood.adjustment import adjust, factor_table, starred
+from src.calculations.wood.species import custom_species
+from src.calculations.wood.stability import (C_COLUMN, MAX_SLENDERNESS, beam_effective_length, beam_slenderness,
+                                             beam_stability, column_stability, combined_ratio)
+from src.components.section_picker import prop_default
+from src.components.wood_picker import service_conditions, species_picker
 
 def display():
     st.header("🌲 Wood Post Design (NSCP 2015 Section 613)")
@@ -22,14 +28,24 @@ def display():
         width = st.number_input("Column Width (mm)", min_value=75.0, value=150.0, step=5.0, key="wood_col_width")
         depth = st.number_input("Column Depth (mm)", min_value=75.0, value=150.0, step=5.0, key="wood_col_depth")
     with col2:
-        Fc = st.number_input("Allowable Axial Stress Fc (MPa)", min_value=3.0, value=10.0, step=0.5, key="wood_col_Fc")
-        Fb = st.number_input("Allowable Bending Stress Fb (MPa)", min_value=3.0, value=8.0, step=0.5, key="wood_col_Fb")
-        E = st.number_input("Modulus of Elasticity E (MPa)", min_value=5000.0, value=10000.0, step=100.0, key="wood_col_E")
+        species, ref = species_picker("Species / grade", "wood_col_species")
+        Fc_ref = st.number_input("Reference Compression Stress Fc (MPa)", min_value=1.0, value=prop_default(ref, "Fc", 10.0), step=0.5, key=f"wood_col_Fc_{species}")
+        Fb_ref = st.number_input("Reference Bending Stress Fb (MPa)", min_value=1.0, value=prop_default(ref, "Fb", 8.0), step=0.5, key=f"wood_col_Fb_{species}")
+        E_ref = st.number_input("Reference Modulus of Elasticity E (MPa)", min_value=3000.0, value=prop_default(ref, "E", 10000.0), step=100.0, key=f"wood_col_E_{species}")
     with col3:
         axial_load = st.number_input("Axial Load (kN)", min_value=0.0, value=100.0, step=5.0, key="wood_col_P")
         moment = st.number_input("Bending Moment (kN·m)", min_value=0.0, value=5.0, step=0.1, key="wood_col_M")
         K = st.number_input("Effective Length Factor (K)", min_value=0.5, value=1.0, step=0.1, key="wood_col_K")
 
+    st.markdown("#### Service conditions (NDS adjustment factors)")
+    conditions = service_conditions("wood_col")
+    values = custom_species(Fb_ref, prop_default(ref, "Ft", Fb_ref), prop_default(ref, "Fv", 0.0), prop_default(ref, "Fc_perp", 0.0),
+                            Fc_ref, E_ref, ref["Emin"] * E_ref / ref["E"] if ref else None, ref["rule"] if ref else "NSCP", species)
+    adjusted = adjust(values, min(width, depth), max(width, depth), **conditions)
+    Fc = float(starred(adjusted, "Fc")[0])          # Fc* (all factors except C_P)
+    Fb_star = float(starred(adjusted, "Fb")[0])     # Fb* (all factors except C_L, C_fu)
+    Emin = float(adjusted["adjusted"][0, 6])        # E'min for stability
+
     # ----------------------------
     # CALCULATIONS
     # ----------------------------
@@ -41,32 +57,39 @@ def display():
     L = height  # m
 
     A = b * d  # cross-sectional area, m²
-    Imin = (min(b, d) * (max(b, d)**3)) / 12  # m⁴, about minor axis
+    Imin = (max(b, d) * (min(b, d)**3)) / 12  # m⁴, about minor axis
     r = math.sqrt(Imin / A)  # radius of gyration (m)
 
     # Convert to consistent units (N, mm)
     P = axial_load * 1e3
     M = moment * 1e6
 
-    # Slenderness ratio
-    slenderness = (K * L * 1000) / (r * 1000)
+    # Slenderness ratio le/d about each axis (NDS 3.7.1.3); the least dimension governs
+    slenderness = (K * L * 1000) / min(width, depth)
+    stability = column_stability(Fc, Emin, [slenderness, (K * L * 1000) / depth], C_COLUMN["Sawn lumber"])
+    FcE = float(stability["FcE"][0])
+    FcE1 = float(stability["FcE"][1])            # buckling in the plane of bending (about the depth)
 
-    # Critical buckling stress (Euler’s formula)
-    Fe = (math.pi**2 * E) / ((K * L / r)**2)
+    # Column stability factor CP (NDS eq. 3.7-1, c = 0.8 sawn lumber)
+    Cp = float(stability["CP"][0])
 
-    # Column stability factor Cp (approximation)
-    FcE = 0.822 * E / ((K * L / r)**2)
-    Cp = min(1.0, math.sqrt(1 / (1 + Fc / FcE))) if FcE > 0 else 1.0
+    # Beam stability factor CL for bending about the depth, compression edge unbraced over the height
+    RB = float(beam_slenderness(beam_effective_length(L * 1000, depth, "Other (conservative)"), width, depth))
+    CL = float(beam_stability(Fb_star, Emin, RB, width, depth)["CL"])
 
-    # Adjusted compressive stress
-    Fc_adj = Fc * Cp
+    # Adjusted compressive and bending stresses
+    adjusted = adjust(values, min(width, depth), max(width, depth), **conditions, CL=CL, CP=Cp)
+    Fc_adj = float(adjusted["adjusted"][0, 4])
+    Fb = float(adjusted["adjusted"][0, 0])
+    with st.expander("Adjusted design values F' = F × C_D·C_M·C_t·C_L·C_F·C_fu·C_i·C_r·C_P"):
+        st.dataframe(factor_table(adjusted).round(3), use_container_width=True)
 
     # Actual stresses
     fc_actual = (P / (A * 1e6))  # MPa
-    fb_actual = (M / (1e6 * (b * (d**2) / 6)))  # MPa
+    fb_actual = (M / (1e9 * (b * (d**2) / 6)))  # MPa
 
-    # Combined stress check per NDS interaction
-    interaction = (fc_actual / Fc_adj) + (fb_actual / Fb)
+    # Combined stress check per NDS eq. 3.9-3
+    interaction = float(combined_ratio(fc_actual, Fc_adj, fb_actual, Fb, FcE1))
 
     # ----------------------------
     # RESULTS TABLE
@@ -82,17 +105,19 @@ def display():
             "Area (mm²)",
             "Radius of Gyration (mm)",
             "Slenderness Ratio (KL/r)",
-            "Critical Stress Fe (MPa)",
+            "Slenderness Ratio le/d",
+            "Critical Buckling Stress FcE (MPa)",
             "Stability Factor Cp",
+            "Beam Stability Factor CL",
             "Adjusted Fc' (MPa)",
             "Actual Axial Stress (MPa)",
             "Actual Bending Stress (MPa)",
-            "Interaction Ratio (fc/Fc' + fb/Fb)"
+            "Interaction Ratio (NDS 3.9-3)"
         ],
         "Value": [
             f"{height:.2f}", f"{width:.0f}", f"{depth:.0f}",
-            f"{A*1e6:.0f}", f"{r*1000:.2f}", f"{slenderness:.1f}",
-            f"{Fe:.2f}", f"{Cp:.3f}", f"{Fc_adj:.2f}",
+            f"{A*1e6:.0f}", f"{r*1000:.2f}", f"{K * L / r:.1f}", f"{slenderness:.1f}",
+            f"{FcE:.2f}", f"{Cp:.3f}", f"{CL:.3f}", f"{Fc_adj:.2f}",
             f"{fc_actual:.3f}", f"{fb_actual:.3f}", f"{interaction:.3f}"
         ]
     })
@@ -108,6 +133,9 @@ def display():
     else:
         st.error(f"Axial Compression NG — {fc_actual:.2f} > {Fc_adj:.2f} MPa")
 
+    if slenderness > MAX_SLENDERNESS:
+        st.error(f"Slenderness NG — le/d = {slenderness:.1f} > {MAX_SLENDERNESS:.0f} (NDS 3.7.1.4)")
+
     if interaction <= 1.0:
         st.success(f"Combined Stress OK — Interaction = {interaction:.3f} ≤ 1.0")
     else:
@@ -120,8 +148,8 @@ def display():
     st.subheader("📘 NSCP 2015 References (Section 613)")
     st.markdown(r"""
     - **Axial stress:** \( f_c = \frac{P}{A} \leq F'_c \)
-    - **Bending stress:** \( f_b = \frac{M}{S} \leq F_b \)
-    - **Combined stress:** \( \frac{f_c}{F'_c} + \frac{f_b}{F_b} \leq 1.0 \)
-    - **Stability factor:** \( C_P = \sqrt{\frac{1}{1 + F_c / F_{cE}}} \)
-    - **Slenderness check:** \( \frac{KL}{r} \leq 50 \) (typical for wood columns)
+    - **Bending stress:** \( f_b = \frac{M}{S} \leq F'_b \) with \( C_L \) from \( R_B = \sqrt{l_e d / b^2} \), \( F_{bE} = 1.20E'_{min}/R_B^2 \)
+    - **Combined stress:** \( \left(\frac{f_c}{F'_c}\right)^2 + \frac{f_b}{F'_b(1 - f_c/F_{cE})} \leq 1.0 \) (NDS 3.9-3)
+    - **Stability factor:** \( C_P = \frac{1 + F_{cE}/F_c^*}{2c} - \sqrt{\left(\frac{1 + F_{cE}/F_c^*}{2c}\right)^2 - \frac{F_{cE}/F_c^*}{c}} \), \( F_{cE} = \frac{0.822E'_{min}}{(l_e/d)^2} \), \( c = 0.8 \) (NDS 3.7-1)
+    - **Slenderness check:** \( \frac{l_e}{d} \leq 50 \) (NDS 3.7.1.4)
     """)
@@ -1,13 +1,18 @@
 import streamlit as st
 import math
 import pandas as pd
+from src.calculations.wood.adjustment import adjust, factor_table
+from src.calculations.wood.species import custom_species
+from src.calculations.wood.vibration import CRITERIA, SHEATHING_E, floor_stiffness, floor_mass, floor_vibration, vibration_span
+from src.components.section_picker import prop_default
+from src.components.wood_picker import service_conditions, species_picker
 
 def display():
     st.header("🌲 Wood Flooring Design (NSCP 2015 — Wood Provisions)")
 
     st.markdown(r"""
     Design checks for wood floor systems: joist bending, shear, deflection, and bearing.
-    Uses NSCP/NDS-style allowable stresses and common adjustment factors (CD, CM, CL, Ct, Cr).
+    Uses NSCP/NDS reference stresses from the species table and the NDS adjustment factors (CD, CM, Ct, CF, Cfu, Ci, Cr).
     """)
 
     st.markdown("### Inputs — Geometry & Loads")
@@ -24,19 +29,23 @@ def display():
     with col3:
         width_joist = st.number_input("Joist Width (mm)", min_value=25.0, value=45.0, step=5.0, key="wfloor_bw")
         depth_joist = st.number_input("Joist Depth (mm)", min_value=75.0, value=200.0, step=5.0, key="wfloor_d")
-        grade_Fb = st.number_input("Allowable Bending Fb (MPa)", min_value=5.0, value=10.0, step=0.5, key="wfloor_Fb")
+        species, ref = species_picker("Species / grade", "wfloor_species")
 
-    st.markdown("### Material / Adjustment Factors (NDS-style defaults)")
+    st.markdown("### Material / Adjustment Factors (NDS)")
     colA, colB, colC = st.columns(3)
     with colA:
-        Fc = st.number_input("Allowable Compression Fc (MPa)", min_value=2.0, value=6.0, step=0.1, key="wfloor_Fc")
-        Fv = st.number_input("Allowable Shear Fv (MPa)", min_value=0.2, value=1.0, step=0.05, key="wfloor_Fv")
+        grade_Fb = st.number_input("Reference Bending Fb (MPa)", min_value=1.0, value=prop_default(ref, "Fb", 10.0), step=0.5, key=f"wfloor_Fb_{species}")
+        Fc = st.number_input("Reference Compression ⊥ Grain Fc⊥ (MPa)", min_value=0.5, value=prop_default(ref, "Fc_perp", 6.0), step=0.1, key=f"wfloor_Fc_{species}")
     with colB:
-        E = st.number_input("Modulus of Elasticity E (MPa)", min_value=4000.0, value=9000.0, step=100.0, key="wfloor_E")
-        CD = st.number_input("Load Duration Factor, C_D", min_value=0.5, value=1.25, step=0.01, key="wfloor_CD")
+        Fv = st.number_input("Reference Shear Fv (MPa)", min_value=0.2, value=prop_default(ref, "Fv", 1.0), step=0.05, key=f"wfloor_Fv_{species}")
+        E = st.number_input("Reference Modulus of Elasticity E (MPa)", min_value=3000.0, value=prop_default(ref, "E", 9000.0), step=100.0, key=f"wfloor_E_{species}")
+    conditions = service_conditions("wfloor", repetitive=True)
+    values = custom_species(grade_Fb, prop_default(ref, "Ft", grade_Fb), Fv, Fc, prop_default(ref, "Fc", 0.0), E,
+                            ref["Emin"] * E / ref["E"] if ref else None, ref["rule"] if ref else "NSCP", species)
+    adjusted = adjust(values, width_joist, depth_joist, **conditions)
     with colC:
-        CM = st.number_input("Wet Service Factor, C_M", min_value=0.5, value=1.0, step=0.01, key="wfloor_CM")
-        Cr = st.number_input("Repetitive Member Factor, C_r", min_value=0.5, value=1.15, step=0.01, key="wfloor_Cr")
+        with st.expander("Adjusted design values"):
+            st.dataframe(factor_table(adjusted).round(3), use_container_width=True)
 
     # st.markdown("---")
     # st.markdown("### Calculations")
@@ -60,9 +69,8 @@ def display():
     M_Nmm = M_max * 1e6
     V_N = V_max * 1e3
 
-    # Adjust allowable bending using factors: F' = Fb * CD * CM * Cr
-    Fb_adj = grade_Fb * CD * CM * Cr  # MPa (N/mm2)
-    Fv_adj = Fv * CD * CM  # MPa
+    # Adjusted design values: F' = F × CD·CM·Ct·CF·Cfu·Ci·Cr (NDS Table 4.3.1)
+    Fb_adj, Fv_adj, Fc_adj, E_adj = (float(adjusted["adjusted"][0, i]) for i in (0, 2, 3, 5))
 
     # Actual bending stress at extreme fiber: f_b = M / S
     # Convert S (m^3) to mm^3 in formula: use units N·mm and mm^3: S_mm3 = S * 1e9
@@ -76,7 +84,7 @@ def display():
 
     # Deflection: Δ = 5 w L^4 / (384 E I) (units consistent: w in N/m, L in m, E in N/m2, I in m4)
     w_N_per_m = w_per_joist * 1000.0
-    delta_m = (5.0 * w_N_per_m * span**4) / (384.0 * (E * 1e6) * I)  # m
+    delta_m = (5.0 * w_N_per_m * span**4) / (384.0 * (E_adj * 1e6) * I)  # m
     delta_mm = delta_m * 1000.0
 
     # Deflection limit parse
@@ -92,8 +100,7 @@ def display():
     # compute tributary load (kN) on joist = w_per_joist * span
     trib_load_kN = w_per_joist * span
     trib_load_N = trib_load_kN * 1000.0
-    # required bearing length (mm) given allowable compression Fc_adj:
-    Fc_adj = Fc * CD * CM
+    # required bearing length (mm) given the adjusted compression perpendicular to grain Fc⊥':
     if Fc_adj > 0 and b_mm > 0:
         required_bearing_mm = (trib_load_N) / (Fc_adj * 1e6 * b_mm / 1000.0)  # mm
     else:
@@ -199,11 +206,68 @@ def display():
     else:
         st.warning(f"Bearing may be insufficient — required {required_bearing_mm:.1f} mm > provided 100 mm")
 
+    # ----------------------------
+    # Floor vibration
+    # ----------------------------
+    st.markdown("---")
+    st.markdown("### 〰️ Floor Vibration (EC5 7.3 / Hu & Chui)")
+    colV1, colV2, colV3 = st.columns(3)
+    with colV1:
+        sheathing_t = st.number_input("Sheathing thickness (mm)", min_value=6.0, value=18.0, step=1.0, key="wfloor_sheathing_t")
+        sheathing_E = st.number_input("Sheathing E (MPa)", min_value=1000.0, value=SHEATHING_E, step=500.0, key="wfloor_sheathing_E")
+    with colV2:
+        gamma = st.number_input("Composite action γ (0 none – 1 glued)", min_value=0.0, max_value=1.0, value=0.0,
+                                step=0.1, key="wfloor_gamma")
+        G = st.number_input("Specific gravity G (joist mass)", min_value=0.3, max_value=1.2,
+                            value=prop_default(ref, "G", 0.5), step=0.05, key=f"wfloor_G_{species}")
+    with colV3:
+        criterion = st.selectbox("Acceptability criterion", list(CRITERIA), key="wfloor_vib_criterion")
+
+    spacing_mm = spacing * 1000.0
+    permanent = dead_load + finish_dead
+    stiffness = floor_stiffness(E_adj, b_mm, d_mm, spacing_mm, sheathing_t, sheathing_E, gamma)
+    mass = float(floor_mass(b_mm, d_mm, spacing_mm, permanent, G, sheathing_t))
+    vib = floor_vibration(E_adj, b_mm, d_mm, spacing_mm, span * 1000.0, permanent, G, sheathing_t, sheathing_E, gamma)
+    vib_ok = bool(vib[criterion])
+    vib_span = float(vibration_span(E_adj, b_mm, d_mm, spacing_mm, permanent, G, sheathing_t, sheathing_E, gamma, criterion))
+
+    table5 = {
+        "Parameter": [
+            "Floor stiffness along joists EI_l (kN·m²/m)",
+            "Sheathing stiffness across joists EI_b (kN·m²/m)",
+            "Vibrating mass m (kg/m²)",
+            "Fundamental frequency f₁ (Hz)",
+            "1 kN point-load deflection w (mm)",
+            "EC5 limit a (mm/kN)",
+            "Hu & Chui f₁ / w^0.44 (≥ 18.7)",
+            f"Longest span meeting {criterion} (m)",
+            "Vibration check"
+        ],
+        "Value": [
+            f"{float(stiffness['EI_l']) * 1e-9:.1f}",
+            f"{float(stiffness['EI_b']) * 1e-9:.2f}",
+            f"{mass:.1f}",
+            f"{float(vib['f1']):.2f}",
+            f"{float(vib['w']):.3f}",
+            f"{float(vib['limit']):.3f}",
+            f"{float(vib['hu_chui']):.1f}",
+            f"{vib_span:.2f}",
+            "PASS" if vib_ok else "FAIL"
+        ]
+    }
+    st.table(table5)
+    if vib_ok:
+        st.success(f"Vibration OK ({criterion}) — f₁ = {float(vib['f1']):.2f} Hz, w = {float(vib['w']):.3f} mm/kN")
+    else:
+        st.error(f"Vibration NG ({criterion}) — f₁ = {float(vib['f1']):.2f} Hz, w = {float(vib['w']):.3f} mm/kN; "
+                 f"longest acceptable span {vib_span:.2f} m")
+
     st.markdown("---")
     st.subheader("References & Notes")
     st.markdown(r"""
-    - Adjusted allowable stresses follow NDS/NSCP-style factors: \(F_{adj} = F \times C_D \times C_M \times C_r\) (where applicable).  
+    - Adjusted design values follow NDS Table 4.3.1: \(F' = F \times C_D C_M C_t C_F C_{fu} C_i C_r\) (where applicable; \(C_D\) not on \(F_{c\perp}\), E).  
     - Bending: \(f_b = M/S\). Shear: \(f_v = 1.5V/(b d)\). Deflection: \(\Delta = \dfrac{5wL^4}{384EI}\).  
     - Deflection default limit used: L/360 (serviceability) — selected by user.  
+    - Vibration: \(f_1 = \dfrac{\pi}{2L^2}\sqrt{EI_l/m}\) ≥ 8 Hz and \(w = \dfrac{1000\,k_{dist}L^3k_{amp}}{48EI_{joist}} \le a\) (EC5 7.3.3, UK NA), or \(f_1/w^{0.44} \ge 18.7\) (Hu & Chui).  
     - This tool is a design aid. Use actual NSCP/NDS tables and a licensed engineer for final design.
     """)
\ No newline at end of file
@@ -0,0 +1,119 @@
+import streamlit as st
+import pandas as pd
+from src.calculations.wood.adjustment import LOAD_DURATION
+from src.calculations.wood.span_tables import NOMINAL_SIZES
+from src.calculations.wood.species import species_names
+from src.calculations.wood.stability import BEAM_LOADING, C_COLUMN, check_beams, check_columns, stability_curves
+
+def display():
+    st.header("📉 Column & Beam Stability (NDS 3.7.1 / 3.3.3)")
+
+    st.markdown(r"""
+    Exact NDS stability factors, vectorized over slenderness:
+    \( C = \frac{1 + \alpha}{2c} - \sqrt{\left(\frac{1 + \alpha}{2c}\right)^2 - \frac{\alpha}{c}} \) with
+    \( \alpha = F_{cE}/F_c^* \), \( F_{cE} = 0.822E'_{min}/(l_e/d)^2 \) for \( C_P \) (\( c = 0.8 \) sawn lumber) and
+    \( \alpha = F_{bE}/F_b^* \), \( F_{bE} = 1.20E'_{min}/R_B^2 \), \( R_B = \sqrt{l_e d/b^2} \) for \( C_L \) (\( c = 0.95 \)),
+    \( l_e \) from NDS Table 3.3.3. Capacity curves are cached per species / grade, size and service condition.
+    """)
+
+    # ----------------------------
+    # Capacity vs. length
+    # ----------------------------
+    st.markdown("### Capacity vs. length")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        species = st.multiselect("Species / grades", species_names(),
+                                 default=["Apitong 80% stress grade", "Douglas Fir-Larch No.1"], key="stab_species")
+        size = st.selectbox("Section", ["Custom"] + list(NOMINAL_SIZES) + ["4x4", "6x6", "8x8"], index=0, key="stab_size")
+    with c2:
+        if size == "Custom":
+            b = st.number_input("b (mm)", min_value=25.0, value=140.0, step=5.0, key="stab_b")
+            d = st.number_input("d (mm)", min_value=25.0, value=140.0, step=5.0, key="stab_d")
+        else:
+            b, d = {"4x4": (89.0, 89.0), "6x6": (140.0, 140.0), "8x8": (191.0, 191.0)}.get(size) or NOMINAL_SIZES[size]
+            st.caption(f"Dressed size {b:g} × {d:g} mm")
+        max_length = st.number_input("Longest length (m)", min_value=0.5, value=6.0, step=0.5, key="stab_max_length")
+    with c3:
+        K = st.number_input("Column Ke", min_value=0.5, value=1.0, step=0.05, key="stab_K")
+        loading = st.selectbox("Beam loading (le)", list(BEAM_LOADING), key="stab_loading")
+        duration = st.selectbox("Load duration (C_D)", list(LOAD_DURATION), index=1, key="stab_duration")
+        member = st.selectbox("Column material (c)", list(C_COLUMN), key="stab_c")
+
+    if species:
+        curves = {sp: stability_curves(sp, float(b), float(d), float(max_length), float(K), loading,
+                                       LOAD_DURATION[duration], c=C_COLUMN[member]) for sp in species}
+        length = next(iter(curves.values()))["Length (m)"]
+        p1, p2 = st.columns(2)
+        with p1:
+            st.markdown("**Allowable axial load P' (kN)**")
+            st.line_chart(pd.DataFrame({sp: cv["P' (kN)"].to_numpy() for sp, cv in curves.items()}, index=length))
+        with p2:
+            st.markdown("**Allowable moment M' (kN·m)**")
+            st.line_chart(pd.DataFrame({sp: cv["M' (kN·m)"].to_numpy() for sp, cv in curves.items()}, index=length))
+        with st.expander("Curve values"):
+            st.dataframe(pd.concat(curves, names=["Species", "Point"]).round(3), use_container_width=True)
+        st.caption("Curves stop at le/d = 50 and RB = 50; square sections have C_L = 1.")
+    else:
+        st.info("Select at least one species / grade.")
+
+    # ----------------------------
+    # Batch schedules
+    # ----------------------------
+    st.markdown("---")
+    st.markdown("### Post schedule")
+    posts = st.data_editor(
+        pd.DataFrame({
+            "Member": ["P1", "P2", "P3"],
+            "Species": ["Apitong 80% stress grade", "Apitong 80% stress grade", "Douglas Fir-Larch No.2"],
+            "b (mm)": [140.0, 140.0, 89.0],
+            "d (mm)": [140.0, 191.0, 140.0],
+            "Length (m)": [3.0, 3.6, 2.7],
+            "Ke": [1.0, 1.0, 1.0],
+            "P (kN)": [50.0, 60.0, 20.0],
+            "M (kN·m)": [2.0, 5.0, 0.5],
+            "CD": [1.0, 1.0, 1.0],
+        }),
+        num_rows="dynamic", key="stab_posts", use_container_width=True,
+        column_config={"Species": st.column_config.SelectboxColumn(options=species_names())},
+    ).dropna(subset=["Species", "b (mm)", "d (mm)", "Length (m)"])
+
+    st.markdown("### Beam schedule")
+    beams = st.data_editor(
+        pd.DataFrame({
+            "Member": ["B1", "B2", "B3"],
+            "Species": ["Apitong 80% stress grade", "Douglas Fir-Larch No.1", "Douglas Fir-Larch No.2"],
+            "b (mm)": [89.0, 89.0, 38.0],
+            "d (mm)": [286.0, 235.0, 235.0],
+            "lu (m)": [4.0, 1.2, 0.0],
+            "Loading": ["Single span, uniform load", "Single span, concentrated load at midspan", "Single span, uniform load"],
+            "M (kN·m)": [12.0, 8.0, 2.5],
+            "V (kN)": [12.0, 10.0, 3.0],
+            "CD": [1.0, 1.0, 1.0],
+            "Repetitive": [False, False, True],
+        }),
+        num_rows="dynamic", key="stab_beams", use_container_width=True,
+        column_config={"Species": st.column_config.SelectboxColumn(options=species_names()),
+                       "Loading": st.column_config.SelectboxColumn(options=list(BEAM_LOADING))},
+    ).dropna(subset=["Species", "b (mm)", "d (mm)"])
+
+    try:
+        post_checks = check_columns(posts, C_COLUMN[member]) if len(posts) else None
+        beam_checks = check_beams(beams) if len(beams) else None
+    except KeyError as exc:
+        st.error(str(exc.args[0]))
+        return
+
+    st.markdown("### 🧾 Schedule checks")
+    for label, checks in (("Posts", post_checks), ("Beams", beam_checks)):
+        if checks is None:
+            continue
+        failed = checks["Status"] != "OK"
+        if failed.any():
+            st.error(f"{label}: {int(failed.sum())} of {len(checks)} member(s) not adequate.")
+        else:
+            st.success(f"{label}: all {len(checks)} member(s) adequate.")
+        st.dataframe(checks.round(3), use_container_width=True)
+
+    st.markdown("---")
+    st.caption("Posts: NDS 3.9-3 with bending about the strong axis and the compression edge unbraced over the post height. "
+               "Beams: F'b = Fb·CD·CM·Ct·CF·Ci·Cr·CL; combine with axial load in the post schedule.")
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from src.calculations.wood.adjustment import FACTORS, adjust, starred
+from src.calculations.wood.species import PROPERTIES, custom_species, species_rows
+
+FB, FT, FC, E = (PROPERTIES.index(p) for p in ("Fb", "Ft", "Fc", "E"))
+CF, CM, CT = (FACTORS.index(f) for f in ("CF", "CM", "Ct"))
+
+
+def factors(name, b, d, **kw):
+    return adjust(species_rows([name]), b, d, **kw)["factors"][0]
+
+
+@pytest.mark.parametrize("d, fb, ft, fc", [(89.0, 1.5, 1.5, 1.15), (140.0, 1.3, 1.3, 1.1), (235.0, 1.1, 1.1, 1.0),
+                                           (286.0, 1.0, 1.0, 1.0), (337.0, 0.9, 0.9, 0.9)])
+def test_dimension_size_factors(d, fb, ft, fc):
+    # NDS Supplement Table 4A, 2" thick
+    C = factors("Douglas Fir-Larch No.2", 38.0, d)
+    assert (C[CF, FB], C[CF, FT], C[CF, FC]) == pytest.approx((fb, ft, fc))
+
+
+@pytest.mark.parametrize("d, fb, fc", [(89.0, 1.1, 1.05), (140.0, 1.0, 1.0)])
+def test_stud_size_factors(d, fb, fc):
+    C = factors("Douglas Fir-Larch Stud", 38.0, d)
+    assert (C[CF, FB], C[CF, FT], C[CF, FC]) == pytest.approx((fb, fb, fc))
+
+
+def test_wide_stud_takes_no3_values():
+    res = adjust(species_rows(["Douglas Fir-Larch Stud"]), 38.0, 184.0)
+    assert res["reference"][0, FB] == pytest.approx(3.62)
+    assert res["factors"][0, CF, FB] == pytest.approx(1.2)
+
+
+def test_repetitive_joist():
+    # 2×10 DF-L No.2 floor joist, normal duration: Fb' = Fb·CF·Cr
+    res = adjust(species_rows(["Douglas Fir-Larch No.2"]), 38.0, 235.0, repetitive=True)
+    assert res["adjusted"][0, FB] == pytest.approx(6.21 * 1.1 * 1.15)
+    assert res["adjusted"][0, E] == pytest.approx(11030.0)
+
+
+def test_load_duration_skips_stiffness():
+    res = adjust(species_rows(["Douglas Fir-Larch No.2"]), 38.0, 235.0, CD=1.6)
+    assert res["adjusted"][0, FB] == pytest.approx(6.21 * 1.1 * 1.6)
+    assert res["adjusted"][0, E] == pytest.approx(11030.0)
+
+
+def test_wet_service():
+    # Fb·CF = 6.83 MPa ≤ 1150 psi keeps CM = 1.0 on Fb; Fc > 750 psi takes 0.8
+    C = factors("Douglas Fir-Larch No.2", 38.0, 235.0, wet=True)
+    assert C[CM, FB] == pytest.approx(1.0)
+    assert C[CM, FC] == pytest.approx(0.8)
+    assert C[CM, E] == pytest.approx(0.9)
+    C = factors("Douglas Fir-Larch Select Structural", 38.0, 235.0, wet=True)
+    assert C[CM, FB] == pytest.approx(0.85)
+
+
+def test_temperature():
+    # Table 2.3.3, 38 °C < T ≤ 52 °C
+    dry = factors("Douglas Fir-Larch No.2", 38.0, 235.0, temperature=50.0)
+    wet = factors("Douglas Fir-Larch No.2", 38.0, 235.0, temperature=50.0, wet=True)
+    assert (dry[CT, FB], dry[CT, FT], dry[CT, E]) == pytest.approx((0.8, 0.9, 0.9))
+    assert wet[CT, FB] == pytest.approx(0.7)
+
+
+def test_timber_depth_effect():
+    # (12/d)^(1/9) on Fb of members deeper than 12"
+    C = factors("Douglas Fir-Larch B&S No.2", 140.0, 400.0)
+    assert C[CF, FB] == pytest.approx((305.0 / 400.0) ** (1 / 9))
+    assert factors("Douglas Fir-Larch B&S No.2", 140.0, 240.0)[CF, FB] == pytest.approx(1.0)
+
+
+def test_starred_values_leave_out_the_stability_factors():
+    res = adjust(custom_species(10.0, 8.0, 1.0, 4.0, 9.0, 10000.0), 100.0, 200.0, CD=1.25, CL=0.7, CP=0.5)
+    assert starred(res, "Fb") == pytest.approx(10.0 * 1.25)
+    assert starred(res, "Fc") == pytest.approx(9.0 * 1.25)
+    assert res["adjusted"][0, FB] == pytest.approx(10.0 * 1.25 * 0.7)
+    assert res["adjusted"][0, FC] == pytest.approx(9.0 * 1.25 * 0.5)
+
+
+def test_members_broadcast():
+    res = adjust(species_rows(["Douglas Fir-Larch No.2"] * 3), 38.0, np.array([89.0, 140.0, 235.0]))
+    assert res["adjusted"][:, FB] == pytest.approx(6.21 * np.array([1.5, 1.3, 1.1]))
@@ -0,0 +1,40 @@
+import pytest
+
+from src.calculations.concrete.bar_schedule import (bar_mass_per_m, optimize_cutting, split_long_piece,
+                                                    stirrup_cut_length)
+
+
+def test_bar_mass_matches_published_unit_masses():
+    # ρ·π·d²/4 with ρ = 7850 kg/m³: 12 mm → 0.888, 16 mm → 1.578, 25 mm → 3.853 kg/m
+    assert bar_mass_per_m(12) == pytest.approx(0.888, abs=1e-3)
+    assert bar_mass_per_m(16) == pytest.approx(1.578, abs=1e-3)
+    assert bar_mass_per_m(25) == pytest.approx(3.853, abs=1e-3)
+
+
+def test_stirrup_cut_length():
+    # 300 × 500 beam, 40 cover, 10 mm stirrup: centreline 2(210 + 410) + two 75 mm hooks
+    assert stirrup_cut_length(300, 500, 40, 10) == pytest.approx(1390.0)
+
+
+def test_split_long_piece_laps():
+    assert split_long_piece(20000, 12000, 640) == [12000, 8640]
+    assert split_long_piece(9000, 12000, 640) == [9000]
+
+
+def test_exact_fit_has_no_waste():
+    plan = optimize_cutting([3000], [8], stock_lengths=(6000, 12000))
+    assert plan == [{"Stock (mm)": 12000.0, "Pattern": {3000.0: 4}, "Bars": 2, "Waste (mm)": 0.0}]
+
+
+def test_every_piece_is_cut():
+    pieces, qty = [5200, 3100, 2450, 900], [7, 11, 5, 13]
+    plan = optimize_cutting(pieces, qty)
+    cut = {}
+    for p in plan:
+        assert sum(L * n for L, n in p["Pattern"].items()) + p["Waste (mm)"] == pytest.approx(p["Stock (mm)"])
+        for L, n in p["Pattern"].items():
+            cut[L] = cut.get(L, 0) + n * p["Bars"]
+    assert cut == {float(L): n for L, n in zip(pieces, qty)}
+    # never more than one stock bar above the material lower bound
+    lower = sum(L * n for L, n in zip(pieces, qty)) / 12000
+    assert sum(p["Bars"] for p in plan) <= int(lower) + 2
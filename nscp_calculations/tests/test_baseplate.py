@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.steel.baseplate import (bearing_stress, rod_strength, size_baseplates, solve_baseplate,
+                                              standard_thickness)
+from src.calculations.steel.sections import get_section
+
+S = get_section("W250x49")
+FP = bearing_stress(21.0)
+B, N, F = 350.0, 500.0, 200.0
+
+
+def solve(Pu, Mu):
+    return solve_baseplate(Pu, Mu, B, N, F, S["d"], S["bf"], S["tf"], FP, 248.0)
+
+
+def test_bearing_stress():
+    assert FP == pytest.approx(0.65 * 0.85 * 21)
+    assert bearing_stress(21.0, 9.0) == pytest.approx(0.65 * 1.7 * 21)
+
+
+def test_small_eccentricity_uniform_bearing():
+    r = solve(800.0, 40.0)
+    e = 40e6 / 800e3
+    assert r["e"] == pytest.approx(e)
+    assert r["Y"] == pytest.approx(N - 2 * e)
+    assert r["fp"] == pytest.approx(800e3 / ((N - 2 * e) * B))
+    assert r["T"] == 0.0
+
+
+@pytest.mark.parametrize("Pu", [300.0, 0.0, -50.0])
+def test_large_eccentricity_satisfies_dg1_equilibrium(Pu):
+    r = solve(Pu, 150.0)
+    assert r["ok"] and not r["rods_only"]
+    q, Y, T = FP * B, r["Y"], r["T"] * 1e3
+    assert q * Y == pytest.approx(Pu * 1e3 + T)                                      # ΣF
+    assert q * Y * (F + N / 2 - Y / 2) == pytest.approx(Pu * 1e3 * F + 150e6)        # ΣM about the rods
+
+
+def test_continuous_through_zero_axial_load():
+    t = [float(solve(p, 80.0)["t_req"]) for p in (-1e-3, 0.0, 1e-3)]
+    assert max(t) - min(t) < 1e-3
+
+
+def test_rods_only_when_plate_in_tension_everywhere():
+    r = solve(-400.0, 20.0)
+    assert r["rods_only"] and r["Y"] == 0.0
+    assert r["T"] == pytest.approx(400 / 2 + 20e3 / (2 * F))
+
+
+def test_stock_thickness_and_rods():
+    assert standard_thickness(20.0) == 20.0
+    assert standard_thickness(20.5) == 25.0
+    assert np.isnan(standard_thickness(150.0))
+    assert rod_strength(20.0) == pytest.approx(0.75 * 0.75 * 400 * np.pi * 100 / 1e3)
+
+
+def test_sized_plate_passes_its_own_check():
+    reactions = pd.DataFrame({"Column": ["C1"], "Section": ["W250x49"], "Pu (kN)": [400.0], "Mu (kN·m)": [90.0]})
+    row = size_baseplates(reactions).iloc[0]
+    r = solve_baseplate(400.0, 90.0, row["B (mm)"], row["N (mm)"], row["N (mm)"] / 2 - 50.0,
+                        S["d"], S["bf"], S["tf"], bearing_stress(21.0), 248.0)
+    assert r["ok"] and r["t_req"] <= row["t (mm)"]
+    assert row["Rods / side"] * rod_strength(row["Rod Ø (mm)"]) >= r["T"]
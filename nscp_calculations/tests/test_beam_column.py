@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.steel.beam_column import (b1_factor, b2_factor, check_beam_columns, cm_factor,
+                                                interaction_ratio, member_capacities)
+from src.calculations.steel.sections import get_section
+
+MEMBERS = pd.DataFrame({"Member": ["C1"], "Section": ["W250x49"], "L (mm)": [4000.0], "Kx": [1.0], "Ky": [1.0]})
+
+
+def test_amplifiers_closed_form():
+    assert cm_factor(-50.0, 100.0) == pytest.approx(0.8)  # single curvature
+    assert b1_factor(1.0, 250.0, 1000.0) == pytest.approx(1 / 0.75)
+    assert b1_factor(0.6, 100.0, 1000.0) == 1.0
+    assert b1_factor(1.0, -300.0, 1000.0) == 1.0  # tension
+    assert np.isinf(b1_factor(1.0, 1200.0, 1000.0))
+    # Pe,story = 0.85·100·3500/10 = 29 750 kN
+    assert b2_factor(5000.0, 100.0, 10.0, 3500.0) == pytest.approx(1 / (1 - 5000 / 29750))
+
+
+def test_interaction_equations():
+    ratio, eq = interaction_ratio(0.5, 0.3, 0.15)
+    assert (float(ratio), str(eq)) == (pytest.approx(0.5 + 8 / 9 * 0.45), "H1-1a")
+    ratio, eq = interaction_ratio(0.1, 0.3, 0.15)
+    assert (float(ratio), str(eq)) == (pytest.approx(0.05 + 0.45), "H1-1b")
+
+
+def test_governing_combination_by_hand():
+    s = get_section("W250x49")
+    forces = pd.DataFrame({
+        "Member": ["C1", "C1"], "Combo": ["1.4D", "1.2D + 1.6L"],
+        "Pnt (kN)": [300.0, 600.0], "Mntx (kN·m)": [40.0, 60.0],
+    })
+    detail, summary = check_beam_columns(MEMBERS, forces)
+    cap = member_capacities(MEMBERS).iloc[0]
+    Pe1x = np.pi ** 2 * 200000 * s["Ix"] / 4000 ** 2 / 1000
+    assert cap["Pe1x (kN)"] == pytest.approx(Pe1x)
+    B1 = 1 / (1 - 600 / Pe1x)
+    expected = 600 / cap["ΦPn (kN)"] + 8 / 9 * B1 * 60 / cap["ΦMnx (kN·m)"]
+    assert summary.at[0, "Governing combo"] == "1.2D + 1.6L"
+    assert summary.at[0, "Ratio"] == pytest.approx(expected, abs=1e-3)
+
+
+def test_unknown_member_raises():
+    with pytest.raises(KeyError):
+        check_beam_columns(MEMBERS, pd.DataFrame({"Member": ["C9"], "Combo": ["x"], "Pnt (kN)": [1.0]}))
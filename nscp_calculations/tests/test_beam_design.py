@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.steel.beam_design import GRAVITY, beam_demands, design_beams, select_beams
+from src.calculations.steel.flexure import PHI_B, flexural_strength, shear_strength
+from src.calculations.steel.sections import get_section
+
+SCHEDULE = pd.DataFrame({
+    "Span (m)": [6.0, 9.0],
+    "wD (kN/m)": [10.0, 15.0],
+    "wL (kN/m)": [8.0, 12.0],
+    "Lb (mm)": [0.0, 3000.0],
+})
+
+
+def test_simple_beam_demands():
+    Mu, Vu, w_total, w_live = beam_demands(6.0, 10.0, 8.0)
+    wu = 1.2 * 10 + 1.6 * 8
+    assert Mu == pytest.approx(wu * 36 / 8)
+    assert Vu == pytest.approx(wu * 3)
+    assert w_total == 18.0 and w_live == 8.0
+    # 1.4D governs when live load is small
+    assert beam_demands(6.0, 10.0, 0.0)[0] == pytest.approx(1.4 * 10 * 36 / 8)
+
+
+def test_rolled_w_shear_is_full_web_yield():
+    s = get_section("W310x39")
+    phi_v, Vn = shear_strength(s, 345.0)
+    assert phi_v == 1.0
+    assert Vn == pytest.approx(0.6 * 345 * s["d"] * s["tw"] / 1000)
+
+
+def test_lightest_section_is_lightest_passing():
+    summary, alternatives = select_beams(SCHEDULE)
+    util, sections, ok = design_beams(SCHEDULE)
+    for i, row in summary.iterrows():
+        name = row["Lightest section"]
+        s = get_section(name)
+        assert s["mass"] == min(sections["mass"][ok[i]])
+        # recheck flexure and total deflection by hand
+        L = SCHEDULE.at[i, "Span (m)"]
+        wD = SCHEDULE.at[i, "wD (kN/m)"] + s["mass"] * GRAVITY
+        wL = SCHEDULE.at[i, "wL (kN/m)"]
+        Mu = max(1.2 * wD + 1.6 * wL, 1.4 * wD) * L ** 2 / 8
+        assert Mu <= PHI_B * float(flexural_strength(s, 345.0, SCHEDULE.at[i, "Lb (mm)"]))
+        defl = 5 * (wD + wL) * (L * 1000) ** 4 / (384 * 200000 * s["Ix"])
+        assert defl <= L * 1000 / 240
+        assert alternatives[i]["Mass (kg/m)"].is_monotonic_increasing
+    assert not np.all(ok)
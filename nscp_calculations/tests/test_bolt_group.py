@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.steel.bolt_group import (DELTA_MAX, check_bolt_groups, elastic_coefficient, icr_coefficients,
+                                               kulak_force, pattern_coefficient, rectangular_pattern)
+
+INCH = 25.4
+
+
+def test_kulak_curve_at_max_deformation():
+    assert kulak_force(DELTA_MAX) == pytest.approx((1 - np.exp(-10 * 0.34016)) ** 0.55)  # Δ = 0.34 in
+    assert kulak_force(0.0) == 0.0
+
+
+def test_concentric_group_is_n():
+    assert pattern_coefficient(4, 2, 75, 75, 0.0) == 8.0
+
+
+@pytest.mark.parametrize("n, ex, C", [(2, 2, 1.18), (3, 3, 1.75), (6, 3, 4.98)])
+def test_single_column_against_aisc_table_7_6(n, ex, C):
+    # AISC Manual Table 7-6, θ = 0°, s = 3 in, one vertical row of n bolts
+    assert pattern_coefficient(n, 1, 3 * INCH, 0.0, ex * INCH) == pytest.approx(C, abs=0.02)
+
+
+def test_pure_moment_limit():
+    # e → ∞: the centre tends to the centroid, so C·e = Σ R(Δmax·d/dmax)·d
+    xy = rectangular_pattern(4, 2, 75, 100)
+    d = np.hypot(*xy.T)
+    e = 1e6
+    assert icr_coefficients([xy], e)[0] * e == pytest.approx(np.sum(kulak_force(DELTA_MAX * d / d.max()) * d), rel=1e-3)
+
+
+def test_icr_exceeds_elastic_method():
+    for e in (50.0, 150.0, 400.0):
+        assert pattern_coefficient(3, 2, 75, 100, e) > elastic_coefficient(rectangular_pattern(3, 2, 75, 100), e)
+
+
+def test_schedule_ratio():
+    schedule = pd.DataFrame({"Rows": [3], "Columns": [1], "Pitch (mm)": [76.2], "Gauge (mm)": [0.0],
+                             "e (mm)": [76.2], "Vu (kN)": [100.0], "φRn per bolt (kN)": [80.0]})
+    out = check_bolt_groups(schedule)
+    assert out.at[0, "Ratio"] == pytest.approx(100 / (80 * pattern_coefficient(3, 1, 76.2, 0, 76.2)), abs=1e-3)
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.steel.baseplate import PLATE_THICKNESSES
+from src.calculations.steel.brace_design import (WHITMORE_TAN, brace_capacities, brace_envelope, design_braces,
+                                                 gusset_thickness)
+from src.calculations.steel.sections import get_section
+
+FY, FU, RY = 345.0, 450.0, 1.4
+
+
+def test_envelope_picks_worst_compression_and_tension():
+    forces = pd.DataFrame({"Brace": ["B1"] * 3, "Combo": ["a", "b", "c"], "Pu (kN)": [120.0, -300.0, 80.0]})
+    env = brace_envelope(forces).loc["B1"]
+    assert (env["Pc (kN)"], env["Combo (C)"], env["Pt (kN)"], env["Combo (T)"]) == (120.0, "a", 300.0, "b")
+
+
+def test_hss_slotted_net_section():
+    s = get_section("HSS100x100x6")
+    caps = brace_capacities(s, FY, FU, RY, 3000.0, 200.0, t_gusset=12.0)
+    x_bar = (100 ** 2 + 2 * 100 * 100) / (4 * 200)       # 37.5 mm, AISC Table D3.1 case 6
+    An = s["A"] - 2 * s["tw"] * 12.0
+    assert caps["tension"] == pytest.approx(min(0.9 * FY * s["A"], 0.75 * FU * (1 - x_bar / 200) * An) / 1000)
+    assert caps["expected tension"] == pytest.approx(RY * FY * s["A"] / 1000)
+
+
+def test_whitmore_gusset():
+    t, Ww = gusset_thickness(100.0, 200.0, 150.0, 250.0, 900.0, 0.0)
+    assert Ww == pytest.approx(100 + 2 * 200 * WHITMORE_TAN)
+    assert 0.9 * 250 * Ww * t / 1000 >= 900.0
+    thinner = PLATE_THICKNESSES[PLATE_THICKNESSES < t]
+    assert not thinner.size or 0.9 * 250 * Ww * thinner[-1] / 1000 < 900.0
+
+
+def test_lightest_brace_meets_every_limit():
+    braces = pd.DataFrame({"Brace": ["B1"], "L (mm)": [4000.0]})
+    forces = pd.DataFrame({"Brace": ["B1", "B1"], "Combo": ["E+", "E−"], "Pu (kN)": [150.0, -150.0]})
+    row = design_braces(braces, forces, system="OCBF", kinds=("HSS",)).iloc[0]
+    s = get_section(row["Lightest section"])
+    assert row["Ratio"] <= 1.0 and row["KL/r"] <= 200.0
+    assert row["ΦPn (kN)"] >= 150.0 and row["ΦtPn (kN)"] >= 150.0
+    assert (max(s["d"], s["bf"]) - 3 * s["tw"]) / s["tw"] <= 0.76 * np.sqrt(200000 / (RY * FY))
+
+
+def test_unknown_brace_raises():
+    with pytest.raises(KeyError):
+        design_braces(pd.DataFrame({"Brace": ["B1"], "L (mm)": [5000.0]}),
+                      pd.DataFrame({"Brace": ["B9"], "Combo": ["x"], "Pu (kN)": [1.0]}))
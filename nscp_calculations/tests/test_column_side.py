@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.steel.column_side import check_joints, flange_force_strengths, panel_zone_strength
+from src.calculations.steel.sections import get_section
+
+FY = 345.0
+
+
+def joint(column, beam, Mu, Pu=0.0, Vc=0.0):
+    return pd.DataFrame({"Joint": ["J1"], "Column": [column], "Beam": [beam], "Mu left (kN·m)": [Mu],
+                         "Mu right (kN·m)": [Mu], "Pu (kN)": [Pu], "Vc (kN)": [Vc]})
+
+
+def test_flange_force_strengths_j10():
+    c = get_section("W250x73")
+    tb = 10.0
+    s = flange_force_strengths(c, tb, FY)
+    assert s["FLB"] == pytest.approx(0.9 * 6.25 * FY * c["tf"] ** 2 / 1e3)
+    assert s["WLY"] == pytest.approx(FY * c["tw"] * (5 * c["tf"] + tb) / 1e3)
+    crip = 0.8 * c["tw"] ** 2 * (1 + 3 * tb / c["d"] * (c["tw"] / c["tf"]) ** 1.5) * np.sqrt(200000 * FY * c["tf"] / c["tw"])
+    assert s["WC"] == pytest.approx(0.75 * crip / 1e3)
+    assert flange_force_strengths(c, tb, FY, at_end=True)["FLB"] == pytest.approx(s["FLB"] / 2)
+
+
+def test_panel_zone_axial_reduction():
+    c = get_section("W250x73")
+    phiRv = 0.9 * 0.6 * FY * c["d"] * c["tw"] / 1e3
+    assert panel_zone_strength(c, FY, 0.0) == pytest.approx(phiRv)
+    assert panel_zone_strength(c, FY, 0.6 * FY * c["A"] / 1e3) == pytest.approx(0.8 * phiRv)
+
+
+def test_panel_demand_and_doubler():
+    b, c = get_section("W310x39"), get_section("W250x73")
+    out = check_joints(joint("W250x73", "W310x39", 120.0, Vc=40.0)).iloc[0]
+    V = 240.0 * 1e3 / (b["d"] - b["tf"]) - 40.0
+    assert out["Vpz (kN)"] == pytest.approx(V, abs=0.01)
+    td = max((V - out["φRv (kN)"]) * 1e3 / (0.9 * 0.6 * FY * c["d"]),
+             (b["d"] - 2 * b["tf"] + c["d"] - 2 * c["tf"]) / 90)
+    assert out["Doubler t (mm)"] >= td
+
+
+def test_thin_web_limit_web_and_doubler_separately():
+    b, c = get_section("W310x39"), get_section("W200x15")
+    t_limit = (b["d"] - 2 * b["tf"] + c["d"] - 2 * c["tf"]) / 90
+    assert c["tw"] < t_limit
+    out = check_joints(joint("W200x15", "W310x39", 5.0)).iloc[0]
+    assert out["(dz + wz)/90 (mm)"] == pytest.approx(t_limit, abs=0.01)
+    assert out["Status"] == "Web thinner than (dz + wz)/90"
+    # plug-welded: web + doubler together meet the limit, even without a shear shortfall
+    plug = check_joints(joint("W200x15", "W310x39", 5.0), plug_welded=True).iloc[0]
+    assert plug["Doubler t (mm)"] >= t_limit - c["tw"] and plug["Status"] == "OK with plates"
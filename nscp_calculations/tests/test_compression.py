@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.steel.compression import (KL_GRID, PHI_C, column_capacity, compressive_strength,
+                                                critical_stress, select_columns, slenderness_factor)
+from src.calculations.steel.sections import get_section
+
+E, FY = 200000.0, 345.0
+
+
+def hand_phiPn(s, KL):
+    """AISC E3 for a compact section buckling about its weak axis."""
+    Fe = np.pi ** 2 * E / (KL / s["ry"]) ** 2
+    Fcr = 0.658 ** (FY / Fe) * FY if FY / Fe <= 2.25 else 0.877 * Fe
+    return PHI_C * Fcr * s["A"] / 1000
+
+
+def test_critical_stress_branches():
+    assert critical_stress(345.0, 345.0) == pytest.approx(0.658 * 345)
+    assert critical_stress(345.0, 100.0) == pytest.approx(87.7)
+
+
+@pytest.mark.parametrize("KL", [50.0, 2500.0, 3525.0, 6000.0, 12000.0])
+def test_table_lookup_matches_e3(KL):
+    s = get_section("W200x46")
+    assert slenderness_factor(s, FY, E) == 1.0
+    assert column_capacity("W200x46", FY, KL, KL) == pytest.approx(hand_phiPn(s, KL), rel=2e-3)
+
+
+def test_closed_form_beyond_the_grid():
+    s = get_section("W200x46")
+    KL = KL_GRID[-1] + 5000.0
+    assert column_capacity("W200x46", FY, KL, KL) == pytest.approx(hand_phiPn(s, KL), rel=1e-6)
+
+
+def test_slender_web_reduces_strength():
+    s = get_section("W310x39")
+    Q = slenderness_factor(s, FY, E)
+    assert 0.0 < Q < 1.0
+    assert float(compressive_strength(s, FY, 0.0)) == pytest.approx(Q * FY * s["A"] / 1000)
+
+
+def test_select_columns_lightest_passing():
+    schedule = pd.DataFrame({"Pu (kN)": [800.0], "KxL (mm)": [4000.0], "KyL (mm)": [4000.0]})
+    summary, alternatives = select_columns(schedule, FY)
+    best = summary.at[0, "Lightest section"]
+    assert column_capacity(best, FY, 4000.0, 4000.0) >= 800.0
+    assert alternatives[0]["Mass (kg/m)"].is_monotonic_increasing
@@ -0,0 +1,47 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.calculations.concrete.development_length import (compression_development_length, compression_lap_length,
+                                                          confinement_term, development_length,
+                                                          hooked_development_length, tension_lap_length)
+
+SQRT_28 = math.sqrt(28.0)
+
+
+def test_straight_bar_hand_calculation():
+    # 25 mm bar, fy 420, f'c 28, (cb + Ktr)/db = 2.5: ld = 420/(1.1·√28)/2.5·25
+    assert development_length(25, 420, 28, cb_ktr_db=2.5) == pytest.approx(420 / (1.1 * SQRT_28) / 2.5 * 25)
+    # top bar ψt = 1.3 and ψs = 0.8 for a 16 mm bar
+    assert development_length(16, 420, 28, position=1, cb_ktr_db=2.5) == pytest.approx(
+        420 / (1.1 * SQRT_28) * 1.3 * 0.8 / 2.5 * 16)
+
+
+def test_psi_t_psi_e_product_is_capped():
+    ld = development_length(25, 420, 28, position=1, coating=2, cb_ktr_db=2.5)
+    assert ld == pytest.approx(420 / (1.1 * SQRT_28) * 1.7 / 2.5 * 25)
+
+
+def test_minimum_length():
+    assert development_length(10, 275, 28, cb_ktr_db=2.5) == 300.0
+
+
+def test_confinement_term():
+    # two 10 mm legs at 150 mm around 3 bars: Ktr = 40·157/(150·3) = 13.96 mm
+    Atr = 2 * math.pi * 10 ** 2 / 4
+    assert confinement_term(25, 40, Atr, 150, 3) == pytest.approx((40 + 40 * Atr / 450) / 25)
+    assert confinement_term(25, 60, Atr, 150, 3) == 2.5
+
+
+def test_hooks_and_compression():
+    assert hooked_development_length(25, 420, 28) == pytest.approx(0.24 * 420 / SQRT_28 * 25)
+    assert compression_development_length(25, 420, 28) == pytest.approx(0.24 * 420 / SQRT_28 * 25)
+    assert compression_lap_length(25, 420, 28) == pytest.approx(0.071 * 420 * 25)
+    assert compression_lap_length(25, 520, 28) == pytest.approx((0.13 * 520 - 24) * 25)
+
+
+def test_class_b_lap_and_broadcasting():
+    bars = np.array([16.0, 25.0])
+    ld = development_length(bars, 420, 28, cb_ktr_db=2.5)
+    np.testing.assert_allclose(tension_lap_length(bars, 420, 28, cb_ktr_db=2.5), np.maximum(1.3 * ld, 300.0))
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.steel.ebf import check_links, link_class, link_rotation_limit, link_strength
+from src.calculations.steel.sections import get_section
+
+FY = 345.0
+S = get_section("W310x39")
+
+
+def link_row(**kw):
+    row = {"Link": "L1", "Frame": "A", "Storey": 1, "Section": "W310x39", "e (mm)": 600.0, "Bay (mm)": 6000.0,
+           "h (mm)": 3500.0, "Δe (mm)": 5.0, "Vu (kN)": 150.0, "Pu (kN)": 0.0}
+    row.update(kw)
+    return pd.DataFrame([row])
+
+
+def test_plastic_shear_and_moment():
+    s = link_strength(S, FY)
+    assert s["Vp"] == pytest.approx(0.6 * FY * (S["d"] - 2 * S["tf"]) * S["tw"] / 1000)
+    assert s["Mp"] == pytest.approx(FY * S["Zx"] / 1e6)
+    # AISC 341 F3-3 / F3-4 axial reduction above Pr/Pc = 0.15
+    P = 0.3 * FY * S["A"] / 1000
+    r = link_strength(S, FY, P)
+    assert r["Vp"] == pytest.approx(s["Vp"] * np.sqrt(1 - 0.09))
+    assert r["Mp"] == pytest.approx(s["Mp"] * 0.7 / 0.85)
+
+
+def test_rotation_limit_and_class():
+    assert link_rotation_limit(1.0, 1.0) == 0.08
+    assert link_rotation_limit(2.1, 1.0) == pytest.approx(0.05)
+    assert link_rotation_limit(3.0, 1.0) == 0.02
+    assert list(link_class([1.0, 2.0, 3.0], 1.0)) == ["Shear", "Intermediate", "Flexural"]
+
+
+def test_rotation_and_capacity_design_by_hand():
+    out, lightest = check_links(link_row(), Fy=FY, Ry=1.1, Cd=4.0)
+    r = out.iloc[0]
+    assert r["γp (rad)"] == pytest.approx(6000 / 600 * 4 * 5 / 3500, abs=1e-3)
+    s = link_strength(S, FY)
+    Vn = min(s["Vp"], 2 * s["Mp"] / 0.6)
+    V_adj = 1.25 * 1.1 * Vn
+    alpha = np.arctan2(3500, 2700)
+    assert r["Brace Pu (kN)"] == pytest.approx(V_adj / np.sin(alpha), abs=1e-3)
+    assert r["Beam Mu (kN·m)"] == pytest.approx(0.88 * V_adj * 0.3, abs=1e-3)
+    assert r["Column Pu,E (kN)"] == pytest.approx(1.1 * 1.1 * Vn, abs=1e-3)
+
+
+def test_column_force_sums_links_above():
+    links = pd.concat([link_row(Link="L1", Storey=1), link_row(Link="L2", Storey=2)], ignore_index=True)
+    out, _ = check_links(links, Fy=FY)
+    assert out.at[0, "Column Pu,E (kN)"] == pytest.approx(2 * out.at[1, "Column Pu,E (kN)"], abs=1e-3)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from src.calculations.steel.endplate import (column_flange_strength, endplate_strength, lever_arms,
+                                             plate_yield_line, prying_factor, size_endplate)
+
+# W460x74-ish beam with a 4E plate: bp 200, g 110, pfo = pfi = 50, de 45
+D, TF, BP, G, PF, DE = 457.0, 14.5, 200.0, 110.0, 50.0, 45.0
+
+
+def test_lever_arms():
+    h0, h1 = lever_arms("4E", D, TF, PF, PF)
+    assert (h0, h1) == (pytest.approx(D - TF / 2 + PF), pytest.approx(D - 1.5 * TF - PF))
+
+
+def test_4e_yield_line_against_aisc_358_table_6_2():
+    h0, h1 = lever_arms("4E", D, TF, PF, PF)
+    s = 0.5 * np.sqrt(BP * G)
+    Yp = BP / 2 * (h1 * (1 / PF + 1 / s) + h0 / PF - 0.5) + 2 / G * h1 * (PF + s)
+    assert plate_yield_line("4E", BP, G, PF, PF, DE, 0.0, D, TF) == pytest.approx(Yp)
+
+
+def test_4es_yield_line_with_short_edge():
+    h0, h1 = lever_arms("4ES", D, TF, PF, PF)
+    s = 0.5 * np.sqrt(BP * G)
+    de = 40.0
+    assert de <= s
+    Yp = BP / 2 * (h1 * (1 / PF + 1 / s) + h0 * (1 / PF + 1 / (2 * de))) + 2 / G * (h1 * (PF + s) + h0 * (de + PF))
+    assert plate_yield_line("4ES", BP, G, PF, PF, de, 0.0, D, TF) == pytest.approx(Yp)
+
+
+def test_plate_and_bolt_moments():
+    res = endplate_strength("4E", 40.0, 24.0, BP, G, PF, PF, DE, 0.0, D, TF, 250.0, 400.0, 620.0)
+    Yp = plate_yield_line("4E", BP, G, PF, PF, DE, 0.0, D, TF)
+    assert res["plate"] == pytest.approx(0.9 * 250 * 40 ** 2 * Yp / 1e6)
+    Pt = 0.75 * 620 * np.pi * 24 ** 2 / 4 / 1e3
+    assert res["bolts (no prying)"] == pytest.approx(2 * Pt * sum(lever_arms("4E", D, TF, PF, PF)) / 1e3)
+    # a 40 mm plate is thick enough that there is no prying: φMnp = 2Pt(h0 + h1)
+    assert float(res["Q"]) == 1.0
+    assert res["bolts"] == pytest.approx(res["bolts (no prying)"])
+
+
+def test_thin_plate_pries():
+    Q = prying_factor(10.0, 24.0, PF, DE, BP / 2, 400.0, 0.75 * 620 * np.pi * 24 ** 2 / 4 / 1e3)
+    assert 0.0 < Q < 1.0
+
+
+def test_column_flange_and_web_yielding():
+    res = column_flange_strength("4E", 250.0, 17.0, 9.0, 345.0, G, PF, PF, 0.0, D, TF, 25.0)
+    assert res["web yielding"] == pytest.approx(345 * 9 * (6 * 17 + TF + 2 * 25) / 1e3)
+    assert res["flange"] == pytest.approx(0.9 * 345 * 17 ** 2 * res["Yc"] / 1e6)
+
+
+def test_sizing_returns_thinnest_passing_plate():
+    grid = size_endplate(200.0, 150.0, "4E", BP, G, PF, PF, DE, 0.0, D, TF, 250.0, 400.0, 620.0, 372.0)
+    best = grid.iloc[0]
+    assert best["Passes"]
+    assert grid[grid["Passes"]]["tp (mm)"].min() == best["tp (mm)"]
+    assert min(best["φMpl (kN·m)"], best["φMnp (kN·m)"]) >= 200.0
@@ -0,0 +1,56 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from src.calculations.steel.failure_paths import (block_shear_paths, bolt_grid, critical_net_width, hole_diameter,
+                                                  plate_tension_check)
+
+
+def brute_force_net_width(xy, width, d):
+    """Every path through holes of increasing y, by enumeration."""
+    best = d
+    order = np.argsort(xy[:, 1])
+    for k in range(2, len(xy) + 1):
+        for combo in itertools.combinations(order, k):
+            pts = xy[list(combo)]
+            if np.any(np.diff(pts[:, 1]) <= 0):
+                continue
+            best = max(best, k * d - np.sum(np.diff(pts[:, 0]) ** 2 / (4 * np.diff(pts[:, 1]))))
+    return width - best
+
+
+def test_hole_diameter():
+    assert hole_diameter(20) == 24.0
+    assert hole_diameter(24) == 29.0
+
+
+def test_staggered_pair_closed_form():
+    xy, width = bolt_grid(2, 1, 75, 60, 40, 40, stagger=50)
+    assert critical_net_width(xy, width, 24.0)[0] == pytest.approx(width - 2 * 24 + 50 ** 2 / (4 * 60))
+    xy, width = bolt_grid(2, 1, 75, 60, 40, 40, stagger=80)
+    assert critical_net_width(xy, width, 24.0)[0] == pytest.approx(width - 24)  # one hole governs
+
+
+def test_dynamic_programme_matches_enumeration():
+    xy, width = bolt_grid(4, 3, 70, 55, 40, 35, stagger=35)
+    assert critical_net_width(xy, width, 24.0)[0] == pytest.approx(brute_force_net_width(xy, width, 24.0))
+
+
+def test_block_shear_hand_calculation():
+    # one gauge line of 3 bolts at 75 mm, 40 mm end distance, 50 mm edge: edge block, 10 mm plate
+    xy, width = bolt_grid(1, 3, 75, 0, 40, 50)
+    t, d, Fy, Fu = 10.0, 24.0, 250.0, 400.0
+    blocks = block_shear_paths(xy, 100.0, t, d, Fy, Fu)
+    Agv = 190 * t
+    Anv = (190 - 2.5 * d) * t
+    Ant = (50 - 0.5 * d) * t
+    expected = 0.75 * min(0.6 * Fu * Anv + Fu * Ant, 0.6 * Fy * Agv + Fu * Ant) / 1000
+    assert blocks["φRn (kN)"].iloc[0] == pytest.approx(expected, abs=0.06)  # table rounded to 0.1 kN
+
+
+def test_splice_plate_net_area_cap():
+    xy, width = bolt_grid(2, 2, 75, 100, 40, 40)
+    res = plate_tension_check(xy, width, 10.0, 24.0, 250.0, 400.0, splice=True)
+    assert res["An"] == pytest.approx(min((width - 48) * 10, 0.85 * width * 10))
+    assert res["yield"] == pytest.approx(0.9 * 250 * width * 10 / 1000)
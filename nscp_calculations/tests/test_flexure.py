@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from src.calculations.steel.flexure import (cb_from_diagram, design_flexural_strength, ltb_moment, ltb_parameters,
+                                            moment_gradient_factor)
+from src.calculations.steel.sections import get_section
+
+E, FY = 200000.0, 345.0
+
+
+def test_lp_and_plastic_plateau():
+    s = get_section("W310x39")
+    p = ltb_parameters(s, FY, E)
+    assert p["Lp"] == pytest.approx(1.76 * s["ry"] * np.sqrt(E / FY))
+    assert ltb_moment(s, FY, 0.0) == pytest.approx(FY * s["Zx"])
+    assert ltb_moment(s, FY, p["Lr"]) == pytest.approx(0.7 * FY * s["Sx"])
+
+
+def test_elastic_ltb_matches_f2_4():
+    s = get_section("W310x39")
+    p = ltb_parameters(s, FY, E)
+    Lb = 3.0 * p["Lr"]
+    slender = (Lb / p["rts"]) ** 2
+    Fcr = np.pi ** 2 * E / slender * np.sqrt(1 + 0.078 * p["jc"] * slender)
+    assert ltb_moment(s, FY, Lb) == pytest.approx(Fcr * s["Sx"])
+
+
+def test_cb_closed_form_cases():
+    assert moment_gradient_factor(1, 1, 1, 1) == pytest.approx(1.0)
+    # simply supported span under UDL, braced at the ends only: Cb = 1.14
+    x = np.linspace(0, 1, 201)
+    assert cb_from_diagram(x, x * (1 - x), 0.0, 1.0) == pytest.approx(12.5 / (2.5 + 3 * 0.75 + 4 + 3 * 0.75))
+    # linear moment from M at one end to zero: Cb = 1.67
+    assert cb_from_diagram(x, 1 - x, 0.0, 1.0) == pytest.approx(12.5 / (2.5 + 3 * 0.75 + 4 * 0.5 + 3 * 0.25))
+
+
+def test_cached_curve_matches_exact_strength():
+    s = get_section("W310x39")
+    Lb = np.array([0.0, 1500.0, 4000.0, 9000.0, 80000.0])
+    exact = 0.9 * np.minimum(ltb_moment(s, FY, Lb) / 1e6, design_flexural_strength("W310x39", FY, 0.0) / 0.9)
+    np.testing.assert_allclose(design_flexural_strength("W310x39", FY, Lb), exact, rtol=2e-3)
+    # Cb scales the curve up to the plastic / FLB cap
+    assert design_flexural_strength("W310x39", FY, 4000.0, 1.3) == pytest.approx(
+        min(1.3 * design_flexural_strength("W310x39", FY, 4000.0), design_flexural_strength("W310x39", FY, 0.0)))
@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+
+from src.calculations.analysis.frame_2d import analyse_frame, fixed_end_forces, member_envelope
+
+EI = 200000e3 * 1e8 * 1e-12  # kN·m² for I = 1e8 mm⁴
+
+
+def members(pairs, **extra):
+    df = pd.DataFrame({"Member": [f"M{i + 1}" for i in range(len(pairs))], "Start": [p[0] for p in pairs],
+                       "End": [p[1] for p in pairs], "A (mm²)": 1e4, "I (mm⁴)": 1e8})
+    return df.assign(**extra)
+
+
+def udl(member_ids, w, case="D"):
+    return pd.DataFrame({"Case": case, "Member": member_ids, "Type": "UDL", "Direction": "Global Y", "w or P": w})
+
+
+def test_fixed_end_forces():
+    q = fixed_end_forces(6.0, 0.0, -10.0, 0.0, 0.0, 0.0)
+    assert q[1] == pytest.approx(30.0) and q[2] == pytest.approx(30.0) and q[5] == pytest.approx(-30.0)
+
+
+def test_two_span_continuous_beam():
+    w, L = 10.0, 6.0
+    nodes = pd.DataFrame({"Node": ["A", "B", "C"], "X (m)": [0.0, L, 2 * L], "Y (m)": 0.0,
+                          "Support": ["Pinned", "Roller", "Roller"]})
+    res = analyse_frame(nodes, members([("A", "B"), ("B", "C")]), member_loads=udl(["M1", "M2"], -w))
+    R = res["reactions"].set_index("Node")["Ry (kN)"]
+    assert R["A"] == pytest.approx(3 * w * L / 8)
+    assert R["B"] == pytest.approx(10 * w * L / 8)
+    end = res["end_forces"].set_index("Member")
+    assert end.at["M1", "Mj (kN·m)"] == pytest.approx(-w * L ** 2 / 8)  # hogging −wL²/8 over B (sagging +)
+    design = res["design"].set_index("Member")
+    assert design.at["M1", "Mu (kN·m)"] == pytest.approx(w * L ** 2 / 8)
+    assert design.at["M1", "Vu (kN)"] == pytest.approx(5 * w * L / 8)
+
+
+def test_cantilever_tip_load():
+    P, L = 20.0, 3.0
+    nodes = pd.DataFrame({"Node": ["A", "B"], "X (m)": [0.0, L], "Y (m)": 0.0, "Support": ["Fixed", "Free"]})
+    loads = pd.DataFrame({"Case": ["L"], "Node": ["B"], "Fy (kN)": [-P]})
+    res = analyse_frame(nodes, members([("A", "B")]), nodal_loads=loads)
+    tip = res["displacements"].set_index("Node").loc["B"]
+    assert tip["uy (mm)"] == pytest.approx(-P * L ** 3 / (3 * EI) * 1e3)
+    assert tip["rz (rad)"] == pytest.approx(-P * L ** 2 / (2 * EI))
+    assert res["reactions"].set_index("Node").at["A", "Mz (kN·m)"] == pytest.approx(P * L)
+
+
+def test_released_beam_is_simply_supported():
+    w, L = 10.0, 6.0
+    nodes = pd.DataFrame({"Node": ["A", "B"], "X (m)": [0.0, L], "Y (m)": 0.0, "Support": ["Fixed", "Fixed"]})
+    res = analyse_frame(nodes, members([("A", "B")], **{"Release start": True, "Release end": True}),
+                        member_loads=udl(["M1"], -w))
+    assert res["design"].at[0, "Mu (kN·m)"] == pytest.approx(w * L ** 2 / 8)
+    assert res["design"].at[0, "M2 (kN·m)"] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_fixed_portal_sway_and_combinations():
+    H, h = 10.0, 4.0
+    nodes = pd.DataFrame({"Node": ["A", "B", "C", "D"], "X (m)": [0.0, 0.0, 6.0, 6.0], "Y (m)": [0.0, h, h, 0.0],
+                          "Support": ["Fixed", "Free", "Free", "Fixed"]})
+    frame = members([("A", "B"), ("B", "C"), ("C", "D")])
+    frame.loc[1, "I (mm⁴)"] = 1e12  # rigid beam: each column is fixed-fixed with sway
+    frame.loc[:, "A (mm²)"] = 1e8
+    loads = pd.DataFrame({"Case": ["W"], "Node": ["B"], "Fx (kN)": [H]})
+    res = analyse_frame(nodes, frame, nodal_loads=loads, combos={"1.6W": {"W": 1.6}})
+    drift = res["displacements"].set_index("Node").at["B", "ux (mm)"]
+    assert drift == pytest.approx(1.6 * (H / 2) * h ** 3 / (12 * EI) * 1e3, rel=1e-4)
+    env = member_envelope(res["design"]).set_index("Member")
+    assert env.at["M1", "Mu (kN·m)"] == pytest.approx(1.6 * (H / 2) * h / 2, rel=1e-4)
+
+
+def test_unstable_frame_raises():
+    nodes = pd.DataFrame({"Node": ["A", "B"], "X (m)": [0.0, 6.0], "Y (m)": 0.0, "Support": ["Roller", "Roller"]})
+    with pytest.raises(ValueError):
+        analyse_frame(nodes, members([("A", "B")]), member_loads=udl(["M1"], -10.0))
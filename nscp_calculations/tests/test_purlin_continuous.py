@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from src.calculations.steel.purlin_continuous import (ELEMENTS_PER_SPAN, check_continuous, hogging_length,
+                                                      influence_coefficients)
+
+
+def test_single_span_closed_form():
+    inf = influence_coefficients(1)
+    assert inf["M"].max() == pytest.approx(1 / 8)
+    assert inf["defl"].max() == pytest.approx(5 / 384)
+    assert hogging_length(inf) == 0.0
+
+
+def test_continuous_support_moments():
+    two = influence_coefficients(2)["M"].sum(axis=0)
+    assert two.min() == pytest.approx(-1 / 8)       # −wL²/8 over the middle support
+    assert two.max() == pytest.approx(9 / 128)      # sagging at 3L/8
+    assert influence_coefficients(3)["M"].sum(axis=0).min() == pytest.approx(-1 / 10)
+
+
+def test_hogging_length_reaches_inflection_point():
+    # two equal spans: M = 0 at L/4 from the middle support (one element of resolution on the long side)
+    hog = hogging_length(influence_coefficients(2))
+    assert 0.25 <= hog <= 0.25 + 1 / ELEMENTS_PER_SPAN
+
+
+def test_lap_capacity_only_acts_in_laps():
+    inf = influence_coefficients(2, 0.1, 1.0)
+    caps = {k: [50.0] for k in ("top", "bottom_gravity", "bottom_uplift", "shear")}
+    args = (inf, [6.0], [2.0], [0.0], [0.0], caps, [500.0])
+    single = check_continuous(*args)
+    doubled = check_continuous(*args, lap_capacity=2.0)
+    assert single["flexure"][0] == pytest.approx(single["M max"][0] / 50.0)
+    assert doubled["flexure"][0] < single["flexure"][0]
+    # the lap end, on the single section, still governs the doubled case
+    M_lap_end = np.abs(1.4 * 2.0 * 36 * inf["M"].sum(axis=0)[~inf["lap"]]).max()
+    assert doubled["flexure"][0] == pytest.approx(M_lap_end / 50.0)
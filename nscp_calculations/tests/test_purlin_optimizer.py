@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from src.calculations.steel import purlin_optimizer
+from src.calculations.steel.purlin_continuous import design_purlin_lines
+from src.calculations.steel.sections import get_section
+
+
+def test_pool_matches_serial(monkeypatch):
+    serial = purlin_optimizer.optimize_layout(8.0, 6.0, 4, workers=1)
+    monkeypatch.setattr(purlin_optimizer, "POOL_STARTUP", {"fork": 0.0})
+    monkeypatch.setattr(purlin_optimizer.multiprocessing, "get_start_method", lambda: "fork")
+    calls = []
+    real_pool = purlin_optimizer.ProcessPoolExecutor
+
+    def pool(*args, **kwargs):
+        calls.append(kwargs)
+        return real_pool(*args, **kwargs)
+
+    monkeypatch.setattr(purlin_optimizer, "ProcessPoolExecutor", pool)
+    parallel = purlin_optimizer.optimize_layout(8.0, 6.0, 4, workers=3)
+    assert calls
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_serial_when_pool_too_costly(monkeypatch):
+    monkeypatch.setattr(purlin_optimizer, "POOL_STARTUP", {"fork": 1e9, "spawn": 1e9, "forkserver": 1e9})
+    monkeypatch.setattr(purlin_optimizer, "ProcessPoolExecutor", None)
+    grid = purlin_optimizer.optimize_layout(8.0, 6.0, 4, workers=3)
+    assert len(grid) == len(purlin_optimizer.optimize_layout(8.0, 6.0, 4, workers=1))
+
+
+def test_best_layout_rechecks_as_a_purlin_line():
+    grid = purlin_optimizer.optimize_layout(8.0, 6.0, 4, sag_counts=(0,), workers=1)
+    best = grid.iloc[0]
+    assert best["Passes"]
+    lines = pd.DataFrame({"Line": ["Interior"], "Bays": [4], "Span (m)": [6.0],
+                          "Tributary (m)": [best["Spacing (m)"]], "Uplift (kPa)": [0.8]})
+    line = design_purlin_lines(lines, best["Section"], dead=0.25, live=0.5)
+    assert line.at[0, "Status"] == "OK"
+    assert line.at[0, "Flexure ratio"] == pytest.approx(best["Flexure ratio"], abs=1e-3)
+    # spacing is rafter / (lines − 1) and the mass counts laps and every line
+    assert best["Spacing (m)"] == pytest.approx(8.0 / (best["Purlin lines"] - 1), abs=1e-3)
+    lapped = 4 * 6.0 * (1 + 2 * 0.1 * 3 / 4)
+    assert best["Steel mass (kg)"] == pytest.approx(best["Purlin lines"] * lapped * get_section(best["Section"])["mass"],
+                                                    abs=1e-2)
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.analysis.second_order import analyse_second_order
+
+L = 4.0
+EI = 200000e3 * 1e8 * 1e-12  # kN·m²
+PE = np.pi ** 2 * EI / (4 * L ** 2)  # cantilever, K = 2
+
+NODES = pd.DataFrame({"Node": ["A", "B"], "X (m)": [0.0, 0.0], "Y (m)": [0.0, L], "Support": ["Fixed", "Free"]})
+MEMBERS = pd.DataFrame({"Member": ["C1"], "Start": ["A"], "End": ["B"], "A (mm²)": [1e4], "I (mm⁴)": [1e8]})
+
+
+def cantilever(P, H=1.0):
+    loads = pd.DataFrame({"Case": ["G", "G"], "Node": ["B", "B"], "Fx (kN)": [H, 0.0], "Fy (kN)": [0.0, -P]})
+    return analyse_second_order(NODES, MEMBERS, nodal_loads=loads)
+
+
+@pytest.mark.parametrize("ratio", [0.1, 0.3, 0.5])
+def test_cantilever_sway_amplification(ratio):
+    res = cantilever(ratio * PE)
+    assert res["status"].at[0, "Status"].startswith("Converged")
+    d1 = res["first_order"]["displacements"].set_index("Node").at["B", "ux (mm)"]
+    d2 = res["displacements"].set_index("Node").at["B", "ux (mm)"]
+    assert d1 == pytest.approx(L ** 3 / (3 * EI) * 1e3)
+    # AISC B2-type estimate 1/(1 − P/Pe) and the exact beam-column solution
+    assert d2 / d1 == pytest.approx(1 / (1 - ratio), rel=0.03)
+    k = np.sqrt(ratio * PE / EI)
+    exact = (np.tan(k * L) - k * L) / (k ** 3 * EI) * 1e3
+    assert d2 == pytest.approx(exact, rel=0.01)
+
+
+def test_base_moment_includes_p_delta():
+    P = 0.3 * PE
+    res = cantilever(P)
+    d2 = res["displacements"].set_index("Node").at["B", "ux (mm)"] / 1e3
+    assert abs(res["reactions"].at[0, "Mz (kN·m)"]) == pytest.approx(1.0 * L + P * d2, rel=1e-3)
+
+
+def test_beyond_critical_load_is_unstable():
+    assert cantilever(1.1 * PE)["status"].at[0, "Status"].startswith("Unstable")
+
+
+def test_no_axial_load_is_first_order():
+    res = cantilever(0.0)
+    assert res["design"].at[0, "Amplification"] == pytest.approx(1.0)
+    assert res["design"].at[0, "B1"] == pytest.approx(1.0)
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from src.calculations.steel.sections import get_section, load_catalogue, query, section_properties
+
+
+def test_i_section_closed_form():
+    d, bf, tw, tf = 310.0, 165.0, 5.8, 9.7
+    p = section_properties("W", "W310x39", d, bf, tw, tf)
+    hw = d - 2 * tf
+    assert p["A"] == pytest.approx(2 * bf * tf + hw * tw)
+    assert p["Ix"] == pytest.approx(bf * d ** 3 / 12 - (bf - tw) * hw ** 3 / 12)
+    assert p["Zx"] == pytest.approx(bf * tf * (d - tf) + tw * hw ** 2 / 4)
+    assert p["Cw"] == pytest.approx(p["Iy"] * (d - tf) ** 2 / 4)
+
+
+def test_w310x39_against_published_properties():
+    # CISC Handbook W310x39 (fillets included): A 4930 mm², Ix 85.1e6 mm⁴, Sx 549e3, Zx 610e3 mm³
+    s = get_section("W310x39")
+    assert s["mass"] == 39.0
+    assert s["A"] == pytest.approx(4930, rel=0.05)
+    assert s["Ix"] == pytest.approx(85.1e6, rel=0.05)
+    assert s["Sx"] == pytest.approx(549e3, rel=0.05)
+    assert s["Zx"] == pytest.approx(610e3, rel=0.05)
+
+
+def test_hss_uses_design_wall_thickness():
+    s = get_section("HSS100x100x6")
+    assert s["tw"] == pytest.approx(0.93 * 6)
+
+
+def test_query_matches_brute_force():
+    table = load_catalogue()
+    rows = query(["W"], Zx_min=5e5, d_max=400)
+    mask = (table["type"] == "W") & (table["Zx"] >= 5e5) & (table["d"] <= 400)
+    assert sorted(rows["name"]) == sorted(table["name"][mask])
+    assert np.all(np.diff(rows["mass"]) >= 0)
+
+
+def test_unknown_section():
+    with pytest.raises(KeyError):
+        get_section("W999x999")
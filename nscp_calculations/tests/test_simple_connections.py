@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.steel.bolt_group import pattern_coefficient
+from src.calculations.steel.sections import get_section
+from src.calculations.steel.simple_connections import connection_table, select_connections, tab_eccentricity
+
+
+def row(table, kind, d, n, t, grade="A325-N"):
+    sel = table[(table["Type"] == kind) & (table["Grade"] == grade) & (table["Bolt Ø (mm)"] == d)
+                & (table["Rows"] == n) & (table["t (mm)"] == t)]
+    assert len(sel) == 1
+    return sel.iloc[0]
+
+
+def test_table_10_9_eccentricity():
+    assert list(tab_eccentricity([2, 5, 6, 9], 75.0)) == [37.5, 37.5, 75.0, 75.0]
+    assert float(tab_eccentricity(8, 75.0, slotted=True)) == 37.5
+
+
+def test_double_angle_limit_states_by_hand():
+    r = row(connection_table(), "Double angle", 20.0, 3, 8.0)
+    Ab = np.pi * 20 ** 2 / 4
+    assert r["Bolt shear (kN)"] == pytest.approx(0.75 * 372 * Ab * 2 * 3 / 1e3)
+    L = 2 * 75 + 2 * 40
+    assert r["L (mm)"] == L
+    assert r["Shear yield (kN)"] == pytest.approx(0.6 * 250 * L * 8 * 2 / 1e3)
+    assert r["Shear rupture (kN)"] == pytest.approx(0.75 * 0.6 * 400 * (L - 3 * 22) * 8 * 2 / 1e3)
+
+
+def test_shear_tab_uses_eccentric_bolt_group():
+    r = row(connection_table(), "Shear tab", 20.0, 4, 10.0)
+    C = pattern_coefficient(4, 1, 75.0, 0.0, 37.5)
+    assert r["C"] == pytest.approx(C)
+    assert r["Bolt shear (kN)"] == pytest.approx(0.75 * 372 * np.pi * 100 * C / 1e3)
+    # bearing / tearout: end bolt on lc = 40 − 11, the others on lc = 75 − 22, each ≤ 2.4dtFu
+    per = [min(1.2 * 29, 48) * 10 * 400, min(1.2 * 53, 48) * 10 * 400]
+    assert r["Bearing (kN)"] == pytest.approx(0.75 * (per[0] + 3 * per[1]) * C / 4 / 1e3)
+
+
+def test_selection_is_cheapest_adequate_fit():
+    table = connection_table()
+    reactions = pd.DataFrame({"Mark": ["B1", "B2"], "Beam": ["W310x39", "W410x54"], "Vu (kN)": [120.0, 260.0]})
+    out = select_connections(reactions, table)
+    for i, beam in enumerate(reactions["Beam"]):
+        s = get_section(beam)
+        cap = np.minimum(table["φRn (kN)"], table["Web bearing (kN/mm)"] * s["tw"])
+        ok = (table["L (mm)"] <= s["h"]) & (cap >= reactions.at[i, "Vu (kN)"])
+        assert out.at[i, "Cost index"] == pytest.approx(table.loc[ok, "Cost index"].min(), abs=1e-3)
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from src.calculations.wood import span_tables
+from src.calculations.wood.span_tables import LIMIT_STATES, WOOD_UNIT_WEIGHT, max_spans, span_grid
+from src.calculations.wood.species import species_rows
+
+B, D, S = 38.0, 235.0, 400.0   # 2×10 at 400 mm
+DEAD, LIVE = 0.5, 1.9
+REF = species_rows(["Douglas Fir-Larch No.2"])
+
+
+def spans(**kw):
+    return dict(zip(LIMIT_STATES, max_spans(REF, B, D, S, DEAD, LIVE, vibration=None, **kw)[0] * 1000.0))
+
+
+def loads():
+    w_self = 1000.0 * 0.5 * WOOD_UNIT_WEIGHT * B * D * 1e-6
+    return (DEAD + LIVE) * S / 1000.0 + w_self, LIVE * S / 1000.0   # N/mm
+
+
+def test_bending_span_reaches_the_allowable_stress():
+    # M = wL²/8 = F'b·S with F'b = Fb·CF·Cr
+    w, _ = loads()
+    L = spans()["Bending"]
+    assert w * L ** 2 / 8.0 / (B * D ** 2 / 6.0) == pytest.approx(6.21 * 1.1 * 1.15)
+
+
+def test_shear_span():
+    # V at d from the support = w(L/2 − d) = F'v·bd/1.5
+    w, _ = loads()
+    L = spans()["Shear"]
+    assert w * (L / 2.0 - D) == pytest.approx(1.24 * B * D / 1.5)
+
+
+@pytest.mark.parametrize("state, limit", [("Deflection (live)", 360.0), ("Deflection (total)", 240.0)])
+def test_deflection_spans_reach_the_limit(state, limit):
+    w_total, w_live = loads()
+    w = w_live if state == "Deflection (live)" else w_total
+    L = spans()[state]
+    assert 5.0 * w * L ** 4 / (384.0 * 11030.0 * B * D ** 3 / 12.0) == pytest.approx(L / limit)
+
+
+def test_bearing_span():
+    w, _ = loads()
+    assert w * spans(bearing=50.0)["Bearing"] / 2.0 == pytest.approx(4.31 * B * 50.0)
+
+
+def test_wide_spacing_loses_the_repetitive_factor():
+    near = max_spans(REF, B, D, 600.0, DEAD, LIVE, vibration=None)[0, 0]
+    far = max_spans(REF, B, D, 800.0, DEAD, LIVE, vibration=None)[0, 0]
+    w = lambda s: (DEAD + LIVE) * s / 1000.0 + 1000.0 * 0.5 * WOOD_UNIT_WEIGHT * B * D * 1e-6
+    assert (near / far) ** 2 == pytest.approx(1.15 * w(800.0) / w(600.0))
+
+
+def test_grid_cache_is_keyed_by_the_code_stamp(monkeypatch, tmp_path):
+    monkeypatch.setattr(span_tables, "DATA_DIR", tmp_path)
+    args = (("Douglas Fir-Larch No.2",), ("2x8", "2x10"), (400.0, 600.0), ((0.5, 1.9),))
+    first = span_grid(*args)
+    assert len(list(tmp_path.glob("span_table_*.npy"))) == 1
+    np.testing.assert_allclose(span_grid(*args), first)
+    monkeypatch.setattr(span_tables, "CODE_STAMP", "changed")
+    span_grid(*args)
+    assert len(list(tmp_path.glob("span_table_*.npy"))) == 2
+    assert first.shape == (1, 2, 2, 1, len(LIMIT_STATES))
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.wood.stability import (beam_effective_length, beam_stability, check_beams, check_columns,
+                                             column_stability, combined_ratio, stability_curves, stability_factor)
+
+
+def nds_factor(F_star, F_E, c):
+    """NDS Eq. 3.7-1 written out."""
+    a = F_E / F_star
+    return (1 + a) / (2 * c) - np.sqrt(((1 + a) / (2 * c)) ** 2 - a / c)
+
+
+def test_stability_factor_hand_value():
+    # α = 0.5, c = 0.8: 0.9375 − √(0.9375² − 0.625)
+    assert stability_factor(10.0, 5.0, 0.8) == pytest.approx(0.433609, abs=1e-6)
+    assert stability_factor(10.0, 1e6, 0.8) == pytest.approx(1.0, abs=1e-4)
+    assert stability_factor(10.0, 0.01, 0.8) == pytest.approx(0.001, rel=1e-3)   # Euler for slender members
+    assert stability_factor(0.0, 5.0, 0.8) == 1.0
+
+
+def test_column_stability_of_a_4x4_post():
+    # DF-L No.2 4×4 (89 × 89), 3 m pinned: Fc* = 9.31·1.15, FcE = 0.822·Emin/(le/d)²
+    Fc_star, Emin, le_d = 9.31 * 1.15, 4000.0, 3000.0 / 89.0
+    FcE = 0.822 * Emin / le_d ** 2
+    CP = nds_factor(Fc_star, FcE, 0.8)
+    res = column_stability(Fc_star, Emin, le_d)
+    assert (res["FcE"], res["CP"]) == pytest.approx((FcE, CP))
+    schedule = pd.DataFrame({"Member": ["P1"], "Species": ["Douglas Fir-Larch No.2"], "b (mm)": [89.0], "d (mm)": [89.0],
+                             "Length (m)": [3.0], "Ke": [1.0], "P (kN)": [20.0]})
+    row = check_columns(schedule).iloc[0]
+    assert row["P' (kN)"] == pytest.approx(CP * Fc_star * 89.0 ** 2 / 1000.0)
+    assert row["Ratio (NDS 3.9-3)"] == pytest.approx((20e3 / 89.0 ** 2 / (CP * Fc_star)) ** 2)
+
+
+def test_combined_ratio():
+    # NDS 3.9-3: (fc/F'c)² + fb / [F'b (1 − fc/FcE)]
+    assert combined_ratio(3.0, 6.0, 4.0, 10.0, 12.0) == pytest.approx(0.25 + 4.0 / (10.0 * 0.75))
+    assert combined_ratio(12.0, 6.0, 4.0, 10.0, 12.0) == np.inf
+
+
+@pytest.mark.parametrize("lu, le", [(1000.0, 2.06 * 1000.0), (2000.0, 1.63 * 2000.0 + 3 * 235.0),
+                                    (5000.0, 1.63 * 5000.0 + 3 * 235.0)])
+def test_beam_effective_length_uniform_load(lu, le):
+    # NDS Table 3.3.3, d = 235 mm: lu/d < 7, 7 ≤ lu/d ≤ 14.3, > 14.3
+    assert beam_effective_length(lu, 235.0) == pytest.approx(le)
+
+
+def test_beam_effective_length_other_loading():
+    assert beam_effective_length(5000.0, 235.0, "Other (conservative)") == pytest.approx(1.84 * 5000.0)
+    with pytest.raises(KeyError):
+        beam_effective_length(5000.0, 235.0, "Three-span")
+
+
+def test_beam_stability():
+    # FbE = 1.20·Emin/RB², c = 0.95; d ≤ b does not buckle laterally
+    res = beam_stability(8.0, 4000.0, 20.0)
+    assert res["FbE"] == pytest.approx(1.2 * 4000.0 / 400.0)
+    assert res["CL"] == pytest.approx(nds_factor(8.0, 12.0, 0.95))
+    assert beam_stability(8.0, 4000.0, 20.0, b=140.0, d=140.0)["CL"] == 1.0
+
+
+def test_check_beams_hand_example():
+    # DF-L No.2 2×10, 3 m unbraced, uniform load: le = 1.63·lu + 3d, RB = √(le·d/b²)
+    b, d, lu = 38.0, 235.0, 3000.0
+    Fb_star, Emin = 6.21 * 1.1, 4000.0
+    RB = np.sqrt((1.63 * lu + 3 * d) * d / b ** 2)
+    CL = nds_factor(Fb_star, 1.2 * Emin / RB ** 2, 0.95)
+    schedule = pd.DataFrame({"Member": ["J1"], "Species": ["Douglas Fir-Larch No.2"], "b (mm)": [b], "d (mm)": [d],
+                             "lu (m)": [3.0], "Loading": ["Single span, uniform load"], "M (kN·m)": [2.0], "V (kN)": [5.0]})
+    row = check_beams(schedule).iloc[0]
+    assert (row["RB"], row["CL"]) == pytest.approx((RB, CL))
+    assert row["Ratio"] == pytest.approx(2e6 / (b * d ** 2 / 6.0) / (CL * Fb_star))
+
+
+def test_curves_start_at_the_squash_load_and_return_fresh_frames():
+    curves = stability_curves("Douglas Fir-Larch No.2", 89.0, 89.0)
+    assert curves.at[0, "CP"] == pytest.approx(1.0)
+    assert curves.at[0, "P' (kN)"] == pytest.approx(9.31 * 1.15 * 89.0 ** 2 / 1000.0)
+    assert curves["P' (kN)"].dropna().is_monotonic_decreasing
+    curves.loc[:, "CP"] = 0.0
+    assert stability_curves("Douglas Fir-Larch No.2", 89.0, 89.0).at[0, "CP"] == pytest.approx(1.0)
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.analysis.truss_3d import (GRAVITY, analyse_truss, double_layer_grid, member_strengths,
+                                                member_unit_masses)
+from src.calculations.steel.sections import STEEL_DENSITY, load_catalogue, name_index
+
+EA = 200000e3 * 1e3 * 1e-6  # kN for A = 1000 mm²
+
+
+def load(node, fz, case="D"):
+    return pd.DataFrame({"Case": [case], "Node": [node], "Fx (kN)": [0.0], "Fy (kN)": [0.0], "Fz (kN)": [fz]})
+
+
+def test_planar_two_bar_truss():
+    # symmetric V in the XZ plane: N = −P/(2 sinθ), δ = PL/(2EA sin²θ)
+    a, h, P = 3.0, 4.0, 100.0
+    nodes = pd.DataFrame({"Node": ["A", "B", "C"], "X (m)": [0.0, 2 * a, a], "Y (m)": 0.0, "Z (m)": [0.0, 0.0, h],
+                          "Support": ["Pinned", "Pinned", "Free"]})
+    members = pd.DataFrame({"Member": ["M1", "M2"], "Start": ["A", "B"], "End": ["C", "C"], "A (mm²)": 1000.0})
+    res = analyse_truss(nodes, members, load("C", -P))
+    L, sin = 5.0, h / 5.0
+    assert res["forces"]["N (kN)"].to_numpy() == pytest.approx([-P / (2 * sin)] * 2)
+    uz = res["displacements"].set_index("Node").at["C", "uz (mm)"]
+    assert uz == pytest.approx(-P * L / (2 * EA * sin ** 2) * 1e3)
+    R = res["reactions"].set_index("Node")
+    assert R["Rz (kN)"].sum() == pytest.approx(P)
+    assert R.at["A", "Rx (kN)"] == pytest.approx(P / 2 * a / h)
+
+
+def test_space_tripod():
+    # three legs at 120° share the load equally: N = −P/(3 cosφ)
+    r, h, P = 2.0, 3.0, 90.0
+    angles = np.radians([90.0, 210.0, 330.0])
+    nodes = pd.DataFrame({"Node": ["A", "B", "C", "D"], "X (m)": [*r * np.cos(angles), 0.0],
+                          "Y (m)": [*r * np.sin(angles), 0.0], "Z (m)": [0.0, 0.0, 0.0, h],
+                          "Support": ["Pinned", "Pinned", "Pinned", "Free"]})
+    members = pd.DataFrame({"Member": ["M1", "M2", "M3"], "Start": ["A", "B", "C"], "End": "D", "A (mm²)": 1000.0})
+    res = analyse_truss(nodes, members, load("D", -P))
+    cos = h / np.hypot(r, h)
+    assert res["forces"]["N (kN)"].to_numpy() == pytest.approx([-P / (3 * cos)] * 3)
+    assert res["reactions"]["Rz (kN)"].sum() == pytest.approx(P)
+
+
+def test_grid_reactions_equal_the_roof_load():
+    q, Lx, Ly = 2.0, 12.0, 9.0
+    nodes, members, loads = double_layer_grid(Lx, Ly, 4, 3, 1.5, "L50x50x5", "L50x50x5", "L50x50x5", {"D": q})
+    res = analyse_truss(nodes, members, loads)
+    assert res["reactions"]["Rz (kN)"].sum() == pytest.approx(q * Lx * Ly)
+    assert res["reactions"]["Rx (kN)"].sum() == pytest.approx(0.0, abs=1e-9)
+
+
+def test_self_weight_uses_the_catalogue_mass():
+    nodes, members, loads = double_layer_grid(6.0, 6.0, 2, 2, 1.0, "L50x50x5", "L50x50x5", "L50x50x5", {"D": 1.0})
+    res = analyse_truss(nodes, members, loads, combos={"1.2D": {"D": 1.2, "SW": 1.2}}, self_weight=True)
+    catalogue_mass = load_catalogue()["mass"][name_index()["L50x50x5"]]
+    length = res["envelope"]["L (mm)"].sum() / 1e3
+    assert res["stats"]["mass"] == pytest.approx(catalogue_mass * length)
+    assert res["reactions"]["Rz (kN)"].sum() == pytest.approx(1.2 * (36.0 + catalogue_mass * length * GRAVITY))
+
+
+def test_self_weight_must_be_combined():
+    nodes, members, loads = double_layer_grid(6.0, 6.0, 2, 2, 1.0, "L50x50x5", "L50x50x5", "L50x50x5", {"D": 1.0})
+    with pytest.raises(ValueError, match="SW"):
+        analyse_truss(nodes, members, loads, combos={"1.4D": {"D": 1.4}}, self_weight=True)
+
+
+def test_unit_mass_of_a_given_area():
+    members = pd.DataFrame({"Member": ["M1", "M2"], "Section": ["", "L50x50x5"], "A (mm²)": [1000.0, np.nan]})
+    unit = member_unit_masses(members, np.array([1000.0, 475.0]))
+    assert unit[0] == pytest.approx(1000.0 * 1e-6 * STEEL_DENSITY)
+    assert unit[1] == pytest.approx(load_catalogue()["mass"][name_index()["L50x50x5"]])
+
+
+def test_mechanism_is_reported():
+    # a tripod with one leg missing swings out of the plane of the other two
+    nodes = pd.DataFrame({"Node": ["A", "B", "C", "D"], "X (m)": [0.0, 4.0, 2.0, 2.0], "Y (m)": [0.0, 0.0, 3.0, 1.0],
+                          "Z (m)": [0.0, 0.0, 0.0, 3.0], "Support": ["Pinned", "Pinned", "Pinned", "Free"]})
+    members = pd.DataFrame({"Member": ["M1", "M2"], "Start": ["A", "B"], "End": ["D", "D"], "A (mm²)": 1000.0})
+    with pytest.raises(ValueError, match="mechanism"):
+        analyse_truss(nodes, members, load("D", -10.0))
+
+
+def test_tension_strength():
+    # min(0.90 Fy Ag, 0.75 Fu U Ag)
+    row = name_index()["L50x50x5"]
+    sec = load_catalogue()[[row]]
+    caps = member_strengths(sec, np.array([row]), np.array([2000.0]), 345.0, 450.0, U=0.85)
+    A = sec["A"][0]
+    assert caps["tension"][0] == pytest.approx(min(0.9 * 345 * A, 0.75 * 450 * 0.85 * A) / 1000)
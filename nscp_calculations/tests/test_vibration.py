@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from src.calculations.wood.vibration import (HU_CHUI, MIN_FREQUENCY, deflection_limit, floor_mass, floor_stiffness,
+                                             floor_vibration, vibration_span)
+
+E, B, D, S, T, ES = 11030.0, 38.0, 235.0, 400.0, 18.0, 7000.0
+DEAD, G = 0.5, 0.5
+
+
+def test_frequency_of_a_simply_supported_floor():
+    # f1 = π/(2L²)·√(EI/m) with the sheathing strip added to the bare joist (γ = 0)
+    L = 4000.0
+    EI = (E * B * D ** 3 / 12.0 + ES * S * T ** 3 / 12.0) * 1000.0 / S * 1e-6    # N·m²/m
+    m = DEAD * 1000.0 / 9.81 + 1000.0 * G * B * D / S * 1e-3 + 600.0 * T * 1e-3
+    assert floor_mass(B, D, S, DEAD, G, T) == pytest.approx(m)
+    res = floor_vibration(E, B, D, S, L, DEAD, G, T, ES)
+    assert res["f1"] == pytest.approx(np.pi / (2.0 * (L / 1000.0) ** 2) * np.sqrt(EI / m))
+
+
+def test_point_load_deflection():
+    # w = k_dist·k_amp·PL³/(48EI), k_dist = max(0.38 − 0.08 ln(14 EI_b / s⁴), 0.30)
+    L = 4000.0
+    EI_b = ES * T ** 3 / 12.0 * 1000.0
+    k_dist = max(0.38 - 0.08 * np.log(14.0 * EI_b / S ** 4), 0.30)
+    w = floor_vibration(E, B, D, S, L, DEAD, G, T, ES)["w"]
+    assert w == pytest.approx(k_dist * 1.05 * 1000.0 * L ** 3 / (48.0 * E * B * D ** 3 / 12.0))
+
+
+def test_glued_sheathing_forms_a_t_section():
+    # γ = 1: transformed-section second moment about the composite centroid
+    EI = floor_stiffness(E, B, D, S, T, ES, gamma=1.0)["EI_l"] * S / 1000.0
+    parts = [(E * B * D, E * B * D ** 3 / 12.0, D / 2.0), (ES * S * T, ES * S * T ** 3 / 12.0, D + T / 2.0)]
+    y = sum(ea * yc for ea, _, yc in parts) / sum(ea for ea, _, _ in parts)
+    assert EI == pytest.approx(sum(ei + ea * (yc - y) ** 2 for ea, ei, yc in parts))
+
+
+def test_deflection_limit_is_continuous_at_4m():
+    assert deflection_limit([3000.0, 4000.0])[0] == pytest.approx(1.8)
+    assert deflection_limit(4000.0) == pytest.approx(16500.0 / 4000.0 ** 1.1, rel=2e-3)
+    assert deflection_limit(5000.0) == pytest.approx(16500.0 / 5000.0 ** 1.1)
+
+
+@pytest.mark.parametrize("d", [140.0, 235.0, 286.0])
+def test_ec5_span_sits_on_the_governing_limit(d):
+    L = vibration_span(E, B, d, S, DEAD, G, T, ES) * 1000.0
+    res = floor_vibration(E, B, d, S, L, DEAD, G, T, ES)
+    on_frequency = np.isclose(res["f1"], MIN_FREQUENCY)
+    on_deflection = np.isclose(res["w"], res["limit"], rtol=1e-6)
+    assert on_frequency or on_deflection
+    assert res["f1"] >= MIN_FREQUENCY * (1 - 1e-9) and res["w"] <= res["limit"] * (1 + 1e-9)
+    assert not floor_vibration(E, B, d, S, 1.01 * L, DEAD, G, T, ES)["EC5 (UK NA)"]
+
+
+def test_hu_chui_span():
+    L = vibration_span(E, B, D, S, DEAD, G, T, ES, criterion="Hu & Chui") * 1000.0
+    assert floor_vibration(E, B, D, S, L, DEAD, G, T, ES)["hu_chui"] == pytest.approx(HU_CHUI)
+
+
+def test_unknown_criterion():
+    with pytest.raises(KeyError):
+        vibration_span(E, B, D, S, DEAD, G, criterion="AISC DG11")
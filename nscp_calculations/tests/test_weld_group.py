@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from src.calculations.steel.weld_group import (_deformations, directional_factor, elastic_coefficient,
+                                               icr_coefficients, shape_coefficient, weld_group_strength, weld_shape)
+
+
+def strength(theta, delta):
+    """AISC J2 commentary element strength per unit length (0.6 FEXX · throat = 1)."""
+    delta_m = 0.209 * (theta + 2.0) ** -0.32
+    p = delta / delta_m
+    return (1 + 0.5 * np.sin(np.radians(theta)) ** 1.5) * (p * (1.9 - 0.9 * p)) ** 0.3
+
+
+def test_directional_factor():
+    assert directional_factor(0.0) == 1.0
+    assert directional_factor(90.0) == pytest.approx(1.5)
+
+
+def test_concentric_longitudinal_and_transverse():
+    # AISC Table 8-4 basis: K = 1.0 for a longitudinal weld, 1.5 for a transverse one
+    # (the J2 commentary curve at Δu is within 0.1 % of its peak)
+    assert shape_coefficient("Line", 200.0, 0.0, 0.0) == pytest.approx(1.0, abs=1e-3)
+    assert shape_coefficient("Line", 200.0, 0.0, 0.0, angle=90.0) == pytest.approx(1.5, abs=2e-3)
+
+
+def test_concentric_box_uses_deformation_compatibility():
+    # transverse legs fracture first at Δu(90°); longitudinal legs then carry R(0°, Δu(90°))
+    L, b = 200.0, 100.0
+    _, delta_u90 = _deformations(90.0)
+    expected = (2 * L * strength(0.0, delta_u90) + 2 * b * strength(90.0, delta_u90)) / (2 * L + 2 * b)
+    assert icr_coefficients([weld_shape("Box", L, b)], 0.0)[0] == pytest.approx(expected, rel=1e-6)
+    # close to AISC J2-10b, which takes 0.85 of the longitudinal strength
+    assert strength(0.0, delta_u90) == pytest.approx(0.85, abs=0.03)
+
+
+def test_line_weld_pure_moment_limit():
+    # e → ∞: rotation about the centroid, every element loaded transversely
+    L, e = 200.0, 1e6
+    y = (np.arange(4000) + 0.5) / 4000 * L - L / 2
+    _, delta_u = _deformations(90.0)
+    M = np.sum(strength(90.0, delta_u * np.abs(y) / (L / 2)) * np.abs(y)) * L / 4000
+    assert icr_coefficients([weld_shape("Line", L)], e)[0] * e * L == pytest.approx(M, rel=5e-3)
+
+
+def test_icr_exceeds_elastic_method():
+    for kind, b in (("Line", 0.0), ("C", 100.0)):
+        lines = weld_shape(kind, 200.0, b)
+        assert shape_coefficient(kind, 200.0, b, 100.0) > elastic_coefficient(lines, 100.0)
+
+
+def test_design_strength():
+    # 6 mm E70 line weld, 200 mm long, concentric: φ·0.6·482·0.707·6·200
+    assert weld_group_strength("Line", 200.0, 0.0, 6.0, 482.0) == pytest.approx(
+        0.75 * 0.6 * 482 * 0.707 * 6 * 200 / 1000, rel=1e-3)